@@ -13,17 +13,22 @@ This package provides AI-powered features including:
 """
 
 from .agent import AIAgent, AIResponse
+from .chat_scheduler import ChatScheduler, FairLimiter
 from .commands import CommandHandler, CommandResult
 from .config import (
     AIConfig,
+    ChatConcurrencyConfig,
+    ContextWindowConfig,
     ConversationPersistenceConfig,
     MCPConfig,
     ModelProviderConfig,
     MultiAgentConfig,
+    ResponseCacheConfig,
     SearchProviderConfig,
     StreamingConfig,
     WebSearchConfig,
 )
+from .context_window import ConversationSummarizer, estimate_message_tokens
 from .conversation import ConversationManager, ConversationState
 from .conversation_store import ConversationRecord, MessageRecord, PersistentConversationManager
 from .exceptions import (
@@ -47,6 +52,7 @@ from .multi_agent import (
     SpecializedAgent,
 )  # noqa: This imports from multi_agent/ directory
 from .persona import PersonaConfig, PersonaManager
+from .response_cache import ResponseCache, make_cache_key
 from .retry import CircuitBreaker, retry_with_exponential_backoff
 from .task_integration import AITaskExecutor, AITaskResult, execute_ai_task_action
 from .tools import ToolRegistry
@@ -55,15 +61,24 @@ __all__ = [
     "AIAgent",
     "AIResponse",
     "AIConfig",
+    "ChatConcurrencyConfig",
+    "ContextWindowConfig",
     "ConversationPersistenceConfig",
     "MCPConfig",
     "MultiAgentConfig",
+    "ResponseCacheConfig",
     "SearchProviderConfig",
     "StreamingConfig",
     "WebSearchConfig",
     "ModelProviderConfig",
     "ConversationManager",
     "ConversationState",
+    "ConversationSummarizer",
+    "estimate_message_tokens",
+    "ChatScheduler",
+    "FairLimiter",
+    "ResponseCache",
+    "make_cache_key",
     "CommandHandler",
     "CommandResult",
     "PersistentConversationManager",
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import time
 from collections.abc import AsyncIterator, Callable
 from typing import TYPE_CHECKING, Any
 
@@ -11,8 +13,10 @@ from pydantic_ai import Agent, ModelRetry, RunContext
 from pydantic_ai.settings import ModelSettings
 
 from ..core.logger import get_logger
+from .chat_scheduler import ChatScheduler
 from .config import AIConfig
-from .conversation import ConversationManager
+from .context_window import ConversationSummarizer
+from .conversation import ConversationManager, ConversationState
 from .exceptions import (
     AIServiceUnavailableError,
     ModelResponseError,
@@ -21,7 +25,9 @@ from .exceptions import (
 from .mcp_client import MCPClient
 from .multi_agent import AgentOrchestrator
 from .persona import PersonaManager
+from .response_cache import ResponseCache, make_cache_key
 from .retry import CircuitBreaker
+from .search.cache import close_search_cache, configure_search_cache
 from .tools import (
     ToolRegistry,
     calculate,
@@ -32,6 +38,9 @@ from .tools import (
 
 logger = get_logger("ai.agent")
 
+# Conversation key used for one-shot completions, which have no user
+_COMPLETION_USER_ID = "__completion__"
+
 
 if TYPE_CHECKING:
     from .conversation_store import PersistentConversationManager
@@ -123,8 +132,39 @@ class AIAgent:
         self.conversation_store: PersistentConversationManager | None = None
         self._toolsets: list[Any] = []
         self.conversation_manager = ConversationManager(
-            timeout_minutes=config.conversation_timeout_minutes
+            timeout_minutes=config.conversation_timeout_minutes,
+            max_messages_per_user=config.context_window.max_messages_per_user,
+        )
+        # Folds history that no longer fits the token budget into a running summary
+        self.summarizer: ConversationSummarizer | None = None
+        if config.context_window.summarization_enabled:
+            self.summarizer = ConversationSummarizer(
+                config.context_window.summary_model or config.model,
+                max_chars=config.context_window.summary_max_chars,
+            )
+        self._summary_tasks: set[asyncio.Task[None]] = set()
+        # Serializes turns per user and caps concurrent model calls across users
+        concurrency = config.concurrency
+        self.chat_scheduler = ChatScheduler(
+            max_concurrent=concurrency.max_concurrent_requests,
+            coalesce_window=concurrency.coalesce_window_ms / 1000.0,
+            max_coalesced=concurrency.max_coalesced_messages,
         )
+        # Caches responses to repeated one-shot prompts (opt-in)
+        self.response_cache: ResponseCache | None = None
+        if config.response_cache.enabled:
+            self.response_cache = ResponseCache(
+                ttl_seconds=config.response_cache.ttl_seconds,
+                max_entries=config.response_cache.max_entries,
+                db_path=config.response_cache.db_path,
+            )
+        # Web search results share one process-wide cache across all search paths
+        if config.web_search_enabled and config.web_search.cache_enabled:
+            configure_search_cache(
+                ttl_minutes=config.web_search.cache_ttl_minutes,
+                max_size=config.web_search.cache_max_size,
+                db_path=config.web_search.cache_db_path,
+            )
         self.tool_registry = ToolRegistry()
 
         # Register default tools
@@ -219,11 +259,14 @@ class AIAgent:
         )
 
         @self._agent.system_prompt
-        def persona_system_prompt(ctx: RunContext[AIAgentDependencies]) -> str:
+        async def persona_system_prompt(ctx: RunContext[AIAgentDependencies]) -> str:
             persona_id = None
             if self.conversation_store is not None:
                 try:
-                    persona_id = self.conversation_store.get_active_persona_id(ctx.deps.user_id)
+                    # Database lookup runs in a worker thread, off the event loop
+                    persona_id = await self.conversation_store.get_active_persona_id_async(
+                        ctx.deps.user_id
+                    )
                 except Exception as exc:
                     logger.error(
                         "Failed to get active persona for user %s: %s",
@@ -455,15 +498,35 @@ class AIAgent:
     async def chat(self, user_id: str, message: str) -> str:
         """Process a chat message and generate a response.
 
+        Turns of the same user run one at a time, in arrival order, and the
+        number of turns calling the model at once is capped across users (see
+        ``AIConfig.concurrency``). With coalescing enabled, messages a user
+        sends within the coalescing window are answered by one model call:
+        the reply goes to the newest message and the others return an empty
+        string.
+
         Args:
             user_id: Unique identifier for the user
             message: User's message
 
         Returns:
-            AI-generated response
+            AI-generated response, or an empty string if the message was
+            answered together with a later one
         """
-        import time
+        return await self.chat_scheduler.run(
+            user_id, message, lambda text: self._chat_turn(user_id, text)
+        )
+
+    async def _chat_turn(self, user_id: str, message: str) -> str:
+        """Run one chat turn against the model.
 
+        Args:
+            user_id: Unique identifier for the user
+            message: Text of the turn
+
+        Returns:
+            AI-generated response
+        """
         start_time = time.time()
 
         logger.info("Processing chat message from user %s: %s", user_id, message[:100])
@@ -499,8 +562,11 @@ class AIAgent:
                 tool_registry=self.tool_registry,
             )
 
-            # Get message history
-            message_history = conversation.get_messages(self.config.max_conversation_turns)
+            # Get message history within the turn limit and token budget
+            message_history = conversation.get_messages(
+                self.config.max_conversation_turns,
+                max_tokens=self.config.context_window.max_history_tokens,
+            )
 
             # Run the agent
             result = await self._agent.run(
@@ -519,6 +585,7 @@ class AIAgent:
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
             )
+            self._schedule_summary(conversation)
 
             # Track metrics
             self._metrics["successful_requests"] += 1
@@ -572,9 +639,124 @@ class AIAgent:
                 "Please try again or contact support if the issue persists."
             )
 
+    async def complete(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        use_cache: bool = True,
+    ) -> str:
+        """Answer a single prompt without conversation history.
+
+        Meant for repeatable work such as task prompts, article summaries and
+        reports. With ``AIConfig.response_cache`` enabled, the response is
+        cached under the model, sampling settings, system prompt, normalized
+        prompt and available tools, so repeating the same request does not
+        call the model again.
+
+        Args:
+            prompt: Prompt text
+            system_prompt: System prompt to use instead of the configured one
+            use_cache: Whether to read and store the response cache
+
+        Returns:
+            AI-generated response
+
+        Raises:
+            Exception: Whatever the model call raised; failures are not cached
+        """
+        config = self.config
+        if system_prompt is not None:
+            config = config.model_copy(update={"system_prompt": system_prompt})
+
+        if self.response_cache is None or not use_cache:
+            return await self._complete_turn(prompt, config)
+
+        key = make_cache_key(
+            model=config.model,
+            system_prompt=self.persona_manager.build_system_prompt(config.system_prompt, None),
+            prompt=prompt,
+            tools=self._available_tool_names(),
+            settings={
+                "temperature": config.temperature,
+                "max_tokens": config.max_tokens,
+                "structured_output": config.structured_output_enabled,
+            },
+        )
+        return await self.response_cache.get_or_compute(
+            key, lambda: self._complete_turn(prompt, config)
+        )
+
+    async def _complete_turn(self, prompt: str, config: AIConfig) -> str:
+        """Run a one-shot prompt against the model.
+
+        Args:
+            prompt: Prompt text
+            config: Configuration whose system prompt applies to this call
+
+        Returns:
+            AI-generated response
+        """
+        start_time = time.time()
+        self._metrics["total_requests"] += 1
+
+        try:
+            await self._ensure_mcp_initialized()
+
+            deps = AIAgentDependencies(
+                user_id=_COMPLETION_USER_ID,
+                config=config,
+                conversation_manager=self.conversation_manager,
+                tool_registry=self.tool_registry,
+            )
+            # Counts against the same global request limit as chat turns
+            async with self.chat_scheduler.limiter.slot(_COMPLETION_USER_ID):
+                result = await self._agent.run(prompt, deps=deps)
+        except Exception:
+            self._metrics["failed_requests"] += 1
+            raise
+
+        usage = result.usage()
+        self._metrics["successful_requests"] += 1
+        self._metrics["total_input_tokens"] += usage.input_tokens if usage else 0
+        self._metrics["total_output_tokens"] += usage.output_tokens if usage else 0
+        response_time = time.time() - start_time
+        self._metrics["total_response_time"] += response_time
+        logger.debug("Completed one-shot prompt in %.2fs", response_time)
+
+        if isinstance(result.output, AIResponse):
+            return result.output.message
+        return str(result.output)
+
+    def _available_tool_names(self) -> list[str]:
+        """Get the names of the tools the model may call, for cache keys."""
+        names = list(self.tool_registry.list_tools())
+        if self.config.tools_enabled:
+            names.extend(["current_time", "calculator"])
+            if self.config.web_search_enabled:
+                names.append("search_web")
+        names.extend(type(toolset).__name__ for toolset in self._toolsets)
+        return names
+
     async def chat_stream(self, user_id: str, message: str) -> AsyncIterator[str]:
         """Process a chat message and stream the response.
 
+        Streaming turns are serialized per user and count against the global
+        request limit like ``chat``, but are never coalesced.
+
+        Args:
+            user_id: Unique identifier for the user
+            message: User's message
+
+        Yields:
+            Chunks of the AI-generated response
+        """
+        async with self.chat_scheduler.turn(user_id):
+            async for chunk in self._chat_stream_turn(user_id, message):
+                yield chunk
+
+    async def _chat_stream_turn(self, user_id: str, message: str) -> AsyncIterator[str]:
+        """Run one streaming chat turn against the model.
+
         Args:
             user_id: Unique identifier for the user
             message: User's message
@@ -599,8 +781,11 @@ class AIAgent:
                 tool_registry=self.tool_registry,
             )
 
-            # Get message history
-            message_history = conversation.get_messages(self.config.max_conversation_turns)
+            # Get message history within the turn limit and token budget
+            message_history = conversation.get_messages(
+                self.config.max_conversation_turns,
+                max_tokens=self.config.context_window.max_history_tokens,
+            )
 
             # Stream the agent response
             debounce_seconds = self.config.streaming.debounce_ms / 1000.0
@@ -616,6 +801,7 @@ class AIAgent:
 
                 # After streaming completes, store messages
                 conversation.add_messages(result.new_messages())
+                self._schedule_summary(conversation)
 
                 logger.info(
                     "Completed streaming response for user %s (tokens: in=%d, out=%d)",
@@ -628,6 +814,43 @@ class AIAgent:
             logger.error("Error processing streaming chat message: %s", exc, exc_info=True)
             yield f"I apologize, but I encountered an error: {str(exc)}"
 
+    def _schedule_summary(self, conversation: ConversationState) -> None:
+        """Summarize history that fell out of the context window in the background.
+
+        The summary is produced after the reply has been returned, so the
+        summarization call never adds to response latency.
+
+        Args:
+            conversation: Conversation that just received new messages
+        """
+        summarizer = self.summarizer
+        if summarizer is None:
+            return
+        window = self.config.context_window
+        batch = conversation.begin_summary(
+            self.config.max_conversation_turns,
+            window.max_history_tokens,
+            min_messages=window.summary_min_messages,
+        )
+        if batch is None:
+            return
+
+        async def summarize() -> None:
+            try:
+                summary = await summarizer.summarize(conversation.summary, batch.messages)
+            except asyncio.CancelledError:
+                conversation.cancel_summary()
+                raise
+            except Exception as exc:
+                conversation.cancel_summary()
+                logger.warning("Failed to summarize conversation %s: %s", conversation.user_id, exc)
+                return
+            conversation.apply_summary(batch, summary)
+
+        task = asyncio.create_task(summarize())
+        self._summary_tasks.add(task)
+        task.add_done_callback(self._summary_tasks.discard)
+
     async def _ensure_mcp_initialized(self) -> None:
         """Ensure MCP client is initialized and servers are registered as toolsets.
 
@@ -683,10 +906,21 @@ class AIAgent:
         """Stop the AI agent and cleanup."""
         await self.conversation_manager.stop_cleanup()
 
+        # Abandon summaries still in progress
+        for task in list(self._summary_tasks):
+            task.cancel()
+        if self._summary_tasks:
+            await asyncio.gather(*self._summary_tasks, return_exceptions=True)
+
         # Stop MCP client if started
         if self.mcp_client.is_started():
             await self.mcp_client.stop()
 
+        if self.response_cache is not None:
+            self.response_cache.close()
+        if self.config.web_search_enabled and self.config.web_search.cache_enabled:
+            close_search_cache()
+
         logger.info("AI agent stopped")
 
     async def switch_model(self, model_name: str) -> bool:
@@ -811,4 +1045,10 @@ class AIAgent:
             "conversation_stats": conv_stats,
             "mcp_stats": mcp_stats,
             "orchestrator_stats": orchestrator_stats,
+            "scheduler_stats": self.chat_scheduler.get_stats(),
+            "response_cache_stats": (
+                self.response_cache.get_stats()
+                if self.response_cache is not None
+                else {"enabled": False}
+            ),
         }
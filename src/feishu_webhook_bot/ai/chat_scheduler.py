@@ -0,0 +1,312 @@
+"""Per-conversation serialization and fair concurrency limits for chat turns.
+
+Incoming chat messages are handled by independent tasks, so messages a user
+sends in quick succession would otherwise run through the agent at the same
+time, race on one conversation's history and each cost a model call. This
+module provides:
+
+- ``FairLimiter``, a global cap on in-flight model requests that hands free
+  slots to waiting users in round-robin order
+- ``ChatScheduler``, a per-conversation mailbox that runs turns one at a time
+  in arrival order and can merge a burst of messages into a single turn
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..core.logger import get_logger
+
+logger = get_logger("ai.chat_scheduler")
+
+
+class FairLimiter:
+    """Concurrency limit with round-robin queuing across keys.
+
+    When all slots are taken, waiters are grouped by key and a released slot
+    goes to the oldest waiter of the key served least recently, so one busy
+    user cannot starve the others.
+    """
+
+    def __init__(self, limit: int) -> None:
+        """Initialize the limiter.
+
+        Args:
+            limit: Maximum number of concurrently held slots
+
+        Raises:
+            ValueError: If limit is less than 1
+        """
+        if limit < 1:
+            raise ValueError("limit must be at least 1")
+        self.limit = limit
+        self._active = 0
+        self._waiters: OrderedDict[str, deque[asyncio.Future[None]]] = OrderedDict()
+
+    @property
+    def active(self) -> int:
+        """Number of slots currently held."""
+        return self._active
+
+    @property
+    def waiting(self) -> int:
+        """Number of callers waiting for a slot."""
+        return sum(len(queue) for queue in self._waiters.values())
+
+    async def acquire(self, key: str) -> None:
+        """Wait for a free slot.
+
+        Args:
+            key: Fairness key, e.g. the conversation's user key
+        """
+        if self._active < self.limit and not self._waiters:
+            self._active += 1
+            return
+
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(key, deque()).append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was granted as the caller was cancelled; pass it on
+                self.release()
+            else:
+                self._discard(key, waiter)
+            raise
+
+    def release(self) -> None:
+        """Release a slot and wake the next waiter."""
+        self._active -= 1
+        while self._active < self.limit and self._waiters:
+            key, queue = next(iter(self._waiters.items()))
+            waiter = queue.popleft()
+            if queue:
+                self._waiters.move_to_end(key)
+            else:
+                del self._waiters[key]
+            if waiter.done():
+                continue
+            self._active += 1
+            waiter.set_result(None)
+
+    @contextlib.asynccontextmanager
+    async def slot(self, key: str) -> AsyncIterator[None]:
+        """Hold a slot for the duration of a ``async with`` block.
+
+        Args:
+            key: Fairness key, e.g. the conversation's user key
+        """
+        await self.acquire(key)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _discard(self, key: str, waiter: asyncio.Future[None]) -> None:
+        """Remove a cancelled waiter from its queue."""
+        queue = self._waiters.get(key)
+        if queue is None:
+            return
+        with contextlib.suppress(ValueError):
+            queue.remove(waiter)
+        if not queue:
+            del self._waiters[key]
+
+
+@dataclass
+class _Mailbox:
+    """Pending messages and turn lock of one conversation."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    pending: list[tuple[str, asyncio.Future[str]]] = field(default_factory=list)
+    users: int = 0
+
+
+class ChatScheduler:
+    """Runs chat turns one at a time per conversation under a global limit.
+
+    Each conversation has a mailbox. Turns of the same conversation run in
+    arrival order, never concurrently; turns of different conversations run in
+    parallel up to ``max_concurrent``. With a ``coalesce_window`` the first
+    message of a turn waits that long, and every message of the same
+    conversation that arrived meanwhile is answered by the same model call.
+
+    Example:
+        ```python
+        scheduler = ChatScheduler(max_concurrent=4, coalesce_window=0.5)
+        reply = await scheduler.run("feishu:private:ou_1", "hi", handle_turn)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 8,
+        coalesce_window: float = 0.0,
+        max_coalesced: int = 10,
+        separator: str = "\n",
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrent: Maximum turns running at once across all conversations
+            coalesce_window: Seconds to wait for further messages before a turn
+                starts (0 disables coalescing)
+            max_coalesced: Maximum messages merged into one turn
+            separator: Text placed between merged messages
+
+        Raises:
+            ValueError: If coalesce_window is negative or max_coalesced is less than 1
+        """
+        if coalesce_window < 0:
+            raise ValueError("coalesce_window must be non-negative")
+        if max_coalesced < 1:
+            raise ValueError("max_coalesced must be at least 1")
+        self.limiter = FairLimiter(max_concurrent)
+        self.coalesce_window = coalesce_window
+        self.max_coalesced = max_coalesced
+        self.separator = separator
+        self._mailboxes: dict[str, _Mailbox] = {}
+        self._stats = {"turns": 0, "messages": 0, "coalesced": 0}
+
+    async def run(
+        self,
+        key: str,
+        message: str,
+        handler: Callable[[str], Awaitable[str]],
+    ) -> str:
+        """Queue a message and wait for the turn that answers it.
+
+        When several messages are merged into one turn, the reply is returned
+        to the caller of the newest message that is still waiting and the
+        others receive an empty string, so exactly one reply is sent per turn.
+
+        Args:
+            key: Conversation key (e.g. user key)
+            message: Incoming message text
+            handler: Coroutine function producing the reply for a turn's text
+
+        Returns:
+            Reply text, or an empty string if the message was answered as part
+            of a later message's turn
+
+        Raises:
+            Exception: Whatever ``handler`` raised for the turn containing the message
+        """
+        mailbox = self._acquire_mailbox(key)
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        mailbox.pending.append((message, future))
+        self._stats["messages"] += 1
+        try:
+            async with mailbox.lock:
+                if not future.done():
+                    await self._run_turn(key, mailbox, handler)
+                return future.result()
+        except asyncio.CancelledError:
+            if not future.done():
+                # Withdraw the message so no later turn answers it
+                with contextlib.suppress(ValueError):
+                    mailbox.pending.remove((message, future))
+                future.cancel()
+            raise
+        finally:
+            self._release_mailbox(key, mailbox)
+
+    @contextlib.asynccontextmanager
+    async def turn(self, key: str) -> AsyncIterator[None]:
+        """Hold a conversation's turn and a concurrency slot without coalescing.
+
+        Used for turns that are not a single request/reply, such as streaming.
+
+        Args:
+            key: Conversation key (e.g. user key)
+        """
+        mailbox = self._acquire_mailbox(key)
+        try:
+            async with mailbox.lock, self.limiter.slot(key):
+                self._stats["turns"] += 1
+                yield
+        finally:
+            self._release_mailbox(key, mailbox)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get scheduler statistics.
+
+        Returns:
+            Dictionary with turn and message counts, merged messages, and
+            current in-flight and waiting turns
+        """
+        return {
+            **self._stats,
+            "in_flight": self.limiter.active,
+            "waiting": self.limiter.waiting,
+            "conversations": len(self._mailboxes),
+            "max_concurrent": self.limiter.limit,
+        }
+
+    async def _run_turn(
+        self,
+        key: str,
+        mailbox: _Mailbox,
+        handler: Callable[[str], Awaitable[str]],
+    ) -> None:
+        """Take the oldest pending messages and answer them with one handler call."""
+        limit = 1
+        if self.coalesce_window > 0:
+            # Messages queued behind a running turn are merged too
+            limit = self.max_coalesced
+            if len(mailbox.pending) < limit:
+                await asyncio.sleep(self.coalesce_window)
+
+        batch = mailbox.pending[:limit]
+        del mailbox.pending[: len(batch)]
+        text = self.separator.join(message for message, _ in batch)
+        self._stats["turns"] += 1
+        if len(batch) > 1:
+            self._stats["coalesced"] += len(batch) - 1
+            logger.debug("Merged %d messages into one turn for %s", len(batch), key)
+
+        try:
+            async with self.limiter.slot(key):
+                reply = await handler(text)
+        except asyncio.CancelledError:
+            # Only the caller running the turn was cancelled: put the other
+            # messages back so the next caller waiting for the lock runs them
+            mailbox.pending[:0] = [item for item in batch if not item[1].done()]
+            raise
+        except Exception as exc:
+            # Every caller of the turn, including this one, re-raises from its future
+            for future in self._live_futures(batch):
+                future.set_exception(exc)
+            return
+
+        # The newest caller still waiting gets the reply
+        live = self._live_futures(batch)
+        for future in live[:-1]:
+            future.set_result("")
+        if live:
+            live[-1].set_result(reply)
+
+    @staticmethod
+    def _live_futures(batch: list[tuple[str, asyncio.Future[str]]]) -> list[asyncio.Future[str]]:
+        """Futures of a turn's callers that were not cancelled while it ran."""
+        return [future for _, future in batch if not future.done()]
+
+    def _acquire_mailbox(self, key: str) -> _Mailbox:
+        """Get or create a conversation's mailbox and register a user of it."""
+        mailbox = self._mailboxes.get(key)
+        if mailbox is None:
+            mailbox = self._mailboxes[key] = _Mailbox()
+        mailbox.users += 1
+        return mailbox
+
+    def _release_mailbox(self, key: str, mailbox: _Mailbox) -> None:
+        """Drop a conversation's mailbox once nobody uses it."""
+        mailbox.users -= 1
+        if mailbox.users == 0 and self._mailboxes.get(key) is mailbox:
+            del self._mailboxes[key]
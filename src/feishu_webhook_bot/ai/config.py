@@ -100,8 +100,13 @@ class WebSearchConfig(BaseModel):
         max_results: Maximum number of search results
         cache_enabled: Whether to cache search results
         cache_ttl_minutes: Cache TTL in minutes
+        cache_max_size: Maximum number of cached search results
+        cache_db_path: SQLite file keeping cached results across restarts
         enable_failover: Whether to failover to backup providers
         concurrent_search: Whether to search multiple providers concurrently
+        hedged_search: Whether to start the next provider when the current one is slow
+        hedge_percentile: Provider latency percentile after which the next provider starts
+        hedge_delay_ms: Hedge delay used until a provider has enough latency samples
         providers: List of search provider configurations
     """
 
@@ -126,6 +131,15 @@ class WebSearchConfig(BaseModel):
         le=1440,
         description="Cache TTL in minutes",
     )
+    cache_max_size: int = Field(
+        default=500,
+        ge=1,
+        description="Maximum number of cached search results",
+    )
+    cache_db_path: str | None = Field(
+        default=None,
+        description="SQLite file keeping cached search results across restarts",
+    )
     enable_failover: bool = Field(
         default=True,
         description="Failover to backup providers on failure",
@@ -134,6 +148,21 @@ class WebSearchConfig(BaseModel):
         default=False,
         description="Search multiple providers concurrently",
     )
+    hedged_search: bool = Field(
+        default=False,
+        description="Start the next provider when the current one is slower than usual",
+    )
+    hedge_percentile: float = Field(
+        default=95.0,
+        ge=50.0,
+        le=99.9,
+        description="Provider latency percentile after which the next provider starts",
+    )
+    hedge_delay_ms: float = Field(
+        default=1000.0,
+        ge=10.0,
+        description="Hedge delay used until a provider has enough latency samples",
+    )
     providers: list[SearchProviderConfig] = Field(
         default_factory=lambda: [
             SearchProviderConfig(provider="duckduckgo", priority=0),
@@ -429,6 +458,107 @@ class StreamingConfig(BaseModel):
     )
 
 
+class ChatConcurrencyConfig(BaseModel):
+    """Configuration for scheduling chat turns.
+
+    Attributes:
+        max_concurrent_requests: Maximum chat turns calling the model at once
+        coalesce_window_ms: Milliseconds to wait for further messages from the same
+            conversation before answering them together (0 disables coalescing)
+        max_coalesced_messages: Maximum messages answered by one model call
+    """
+
+    max_concurrent_requests: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum chat turns calling the model at once across all users",
+    )
+    coalesce_window_ms: int = Field(
+        default=0,
+        ge=0,
+        le=10000,
+        description="Wait this long for more messages from a conversation and answer them "
+        "with one model call (0 to disable)",
+    )
+    max_coalesced_messages: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum messages answered by one model call",
+    )
+
+
+class ResponseCacheConfig(BaseModel):
+    """Configuration for caching one-shot model responses.
+
+    Attributes:
+        enabled: Whether responses of ``AIAgent.complete`` are cached
+        ttl_seconds: Seconds a cached response stays valid
+        max_entries: Maximum responses kept in memory (least recently used evicted first)
+        db_path: Optional SQLite file that keeps responses across restarts
+    """
+
+    enabled: bool = Field(
+        default=False,
+        description="Cache responses to repeated one-shot prompts (tasks, summaries, reports)",
+    )
+    ttl_seconds: int = Field(
+        default=3600,
+        ge=1,
+        description="Seconds a cached response stays valid",
+    )
+    max_entries: int = Field(
+        default=512,
+        ge=1,
+        description="Maximum responses kept in memory; least recently used are evicted",
+    )
+    db_path: str | None = Field(
+        default=None,
+        description="SQLite file backing the cache across restarts (None for memory only)",
+    )
+
+
+class ContextWindowConfig(BaseModel):
+    """Configuration for the conversation history sent to the model.
+
+    Attributes:
+        max_history_tokens: Token budget for history sent with each request
+        max_messages_per_user: Maximum messages kept in memory per conversation
+        summarization_enabled: Whether to fold turns beyond the budget into a running summary
+        summary_model: Model used for summaries (defaults to the chat model)
+        summary_min_messages: Messages beyond the budget needed before a summary is made
+        summary_max_chars: Maximum length of the running summary
+    """
+
+    max_history_tokens: int | None = Field(
+        default=8000,
+        ge=1,
+        description="Token budget for conversation history per request (None for unlimited)",
+    )
+    max_messages_per_user: int = Field(
+        default=200,
+        ge=2,
+        description="Maximum messages kept in memory per conversation; oldest turns drop first",
+    )
+    summarization_enabled: bool = Field(
+        default=False,
+        description="Summarize turns that no longer fit the token budget in the background",
+    )
+    summary_model: str | None = Field(
+        default=None,
+        description="Model used for summaries (format: 'provider:model-name'; default: chat model)",
+    )
+    summary_min_messages: int = Field(
+        default=6,
+        ge=1,
+        description="Messages outside the context window needed before summarizing them",
+    )
+    summary_max_chars: int = Field(
+        default=2000,
+        ge=100,
+        description="Maximum length of the running summary in characters",
+    )
+
+
 class ConversationPersistenceConfig(BaseModel):
     """Configuration for conversation persistence.
 
@@ -438,6 +568,7 @@ class ConversationPersistenceConfig(BaseModel):
         max_history_days: Days to keep conversation history
         auto_cleanup: Whether to automatically cleanup old conversations
         cleanup_interval_hours: Hours between cleanup runs
+        history_cache_size: Recent messages cached in memory per conversation
     """
 
     enabled: bool = Field(default=False, description="Enable conversation persistence")
@@ -461,6 +592,11 @@ class ConversationPersistenceConfig(BaseModel):
         le=168,
         description="Hours between cleanup runs",
     )
+    history_cache_size: int = Field(
+        default=50,
+        ge=0,
+        description="Recent messages cached in memory per conversation (0 to disable)",
+    )
 
 
 class AIConfig(BaseModel):
@@ -487,6 +623,9 @@ class AIConfig(BaseModel):
         mcp: MCP configuration
         multi_agent: Multi-agent configuration
         streaming: Streaming configuration
+        context_window: Token budget and summarization of conversation history
+        concurrency: Per-conversation serialization and global model request limit
+        response_cache: Cache for responses to repeated one-shot prompts
         personas: Persona presets
         default_persona: Default persona id
     """
@@ -593,6 +732,18 @@ class AIConfig(BaseModel):
         default_factory=StreamingConfig,
         description="Streaming configuration",
     )
+    context_window: ContextWindowConfig = Field(
+        default_factory=ContextWindowConfig,
+        description="Token budget and summarization of conversation history",
+    )
+    concurrency: ChatConcurrencyConfig = Field(
+        default_factory=ChatConcurrencyConfig,
+        description="Per-conversation serialization and global model request limit",
+    )
+    response_cache: ResponseCacheConfig = Field(
+        default_factory=ResponseCacheConfig,
+        description="Cache for responses to repeated one-shot prompts",
+    )
     conversation_persistence: ConversationPersistenceConfig | None = Field(
         default=None,
         description="Conversation persistence configuration",
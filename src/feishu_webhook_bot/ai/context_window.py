@@ -0,0 +1,200 @@
+"""Token accounting and summarization for conversation context windows.
+
+``ConversationState`` keeps the message history of a conversation in memory.
+This module supplies the pieces it needs to keep that history within a token
+budget:
+
+- ``estimate_message_tokens`` approximates the token count of a message once,
+  when it is added, so budgets are enforced without re-tokenizing history;
+  ASCII text is counted at about four characters per token and CJK text at
+  about one character per token
+- ``ConversationSummarizer`` folds turns that fell out of the budget into a
+  running summary using a (typically small, cheap) model
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from pydantic_ai import Agent, ModelMessage
+from pydantic_ai.messages import (
+    ModelRequest,
+    SystemPromptPart,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+from pydantic_ai.models import Model
+
+from ..core.logger import get_logger
+
+logger = get_logger("ai.context_window")
+
+# Roughly four characters per token for English text with common BPE tokenizers;
+# CJK and other non-ASCII characters are counted as about one token each
+CHARS_PER_TOKEN = 4
+# Per-message framing (role markers, separators) added by chat completion APIs
+MESSAGE_OVERHEAD_TOKENS = 4
+# Longest tool result quoted verbatim in a summarization transcript
+_TOOL_RESULT_CHARS = 500
+
+_SUMMARY_INSTRUCTIONS = (
+    "You maintain a running summary of a chat between a user and an AI assistant. "
+    "Merge the previous summary with the new messages into one concise summary in the "
+    "conversation's language. Keep facts, decisions, names, preferences and open "
+    "questions; drop greetings and small talk. Reply with the summary only."
+)
+
+
+def _part_text(part: Any) -> str:
+    """Get the text a message part contributes to the prompt."""
+    content = getattr(part, "content", None)
+    if isinstance(part, ToolCallPart):
+        content = part.args
+    if content is None:
+        return ""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, Sequence):
+        return "".join(item for item in content if isinstance(item, str))
+    try:
+        return json.dumps(content, ensure_ascii=False, default=str)
+    except (TypeError, ValueError):
+        return str(content)
+
+
+def estimate_text_tokens(text: str) -> int:
+    """Approximate the number of tokens of a text.
+
+    ASCII characters are counted at ``CHARS_PER_TOKEN`` per token. Other
+    characters, such as Chinese, are counted as one token each, since
+    common tokenizers rarely merge them.
+
+    Args:
+        text: Text to estimate
+
+    Returns:
+        Estimated token count
+    """
+    ascii_chars = len(text.encode("ascii", "ignore"))
+    return (ascii_chars + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN + len(text) - ascii_chars
+
+
+def estimate_message_tokens(message: ModelMessage) -> int:
+    """Approximate the number of prompt tokens a message occupies.
+
+    Uses a character-based estimate (see ``estimate_text_tokens``), which is
+    close enough to budget history without depending on a model-specific
+    tokenizer.
+
+    Args:
+        message: A pydantic-ai request or response message
+
+    Returns:
+        Estimated token count (at least ``MESSAGE_OVERHEAD_TOKENS``)
+    """
+    parts = getattr(message, "parts", None)
+    if not isinstance(parts, Sequence):
+        return MESSAGE_OVERHEAD_TOKENS
+    texts = [_part_text(part) for part in parts]
+    texts.extend(part.tool_name for part in parts if isinstance(part, ToolCallPart))
+    return MESSAGE_OVERHEAD_TOKENS + estimate_text_tokens("".join(texts))
+
+
+def is_turn_start(message: ModelMessage) -> bool:
+    """Check whether a message opens a new user turn.
+
+    History may only be cut in front of such a message: cutting elsewhere can
+    separate a tool call from its result, which model APIs reject.
+
+    Args:
+        message: A pydantic-ai message
+
+    Returns:
+        True if the message is a request carrying a user prompt
+    """
+    return isinstance(message, ModelRequest) and any(
+        isinstance(part, UserPromptPart) for part in message.parts
+    )
+
+
+def render_transcript(messages: Sequence[ModelMessage]) -> str:
+    """Render messages as a plain-text transcript for summarization.
+
+    System prompts are skipped and long tool results are shortened.
+
+    Args:
+        messages: Messages to render, oldest first
+
+    Returns:
+        One line per user prompt, assistant reply, tool call and tool result
+    """
+    lines: list[str] = []
+    for message in messages:
+        for part in getattr(message, "parts", ()):
+            if isinstance(part, SystemPromptPart):
+                continue
+            if isinstance(part, UserPromptPart):
+                lines.append(f"User: {_part_text(part)}")
+            elif isinstance(part, TextPart):
+                lines.append(f"Assistant: {part.content}")
+            elif isinstance(part, ToolCallPart):
+                lines.append(f"Assistant called {part.tool_name}({_part_text(part)})")
+            elif isinstance(part, ToolReturnPart):
+                result = _part_text(part)
+                if len(result) > _TOOL_RESULT_CHARS:
+                    result = result[:_TOOL_RESULT_CHARS] + "..."
+                lines.append(f"Tool {part.tool_name} returned: {result}")
+    return "\n".join(lines)
+
+
+class ConversationSummarizer:
+    """Maintains a running conversation summary with a language model.
+
+    Example:
+        ```python
+        summarizer = ConversationSummarizer("openai:gpt-4o-mini")
+        summary = await summarizer.summarize(state.summary, old_messages)
+        ```
+    """
+
+    def __init__(self, model: str | Model, max_chars: int = 2000) -> None:
+        """Initialize the summarizer.
+
+        Args:
+            model: Model name (``provider:model``) or pydantic-ai model instance
+            max_chars: Maximum length of the summary kept in memory and in prompts
+        """
+        self.model = model
+        self.max_chars = max_chars
+        self._agent: Agent[None, str] | None = None
+
+    def _get_agent(self) -> Agent[None, str]:
+        """Create the summarization agent on first use."""
+        if self._agent is None:
+            self._agent = Agent(self.model, output_type=str, instructions=_SUMMARY_INSTRUCTIONS)
+        return self._agent
+
+    async def summarize(self, previous: str | None, messages: Sequence[ModelMessage]) -> str:
+        """Fold messages into the previous summary.
+
+        Args:
+            previous: Current summary, or None for the first summary
+            messages: Messages to fold in, oldest first
+
+        Returns:
+            Updated summary, at most ``max_chars`` characters
+        """
+        prompt = (
+            f"Previous summary:\n{previous or '(none)'}\n\n"
+            f"New messages:\n{render_transcript(messages)}"
+        )
+        result = await self._get_agent().run(prompt)
+        summary = str(result.output).strip()
+        if len(summary) > self.max_chars:
+            summary = summary[: self.max_chars].rstrip() + "..."
+        logger.debug("Summarized %d messages into %d characters", len(messages), len(summary))
+        return summary
@@ -1,20 +1,46 @@
-"""Conversation state management for multi-turn dialogues."""
+"""Conversation state management for multi-turn dialogues.
+
+Each message's token count is estimated once, when it is added, so the history
+sent to the model can be cut to a token budget cheaply. Turns that fall out of
+the budget can be folded into a running summary in the background
+(``begin_summary``/``apply_summary``), and the number of messages held in
+memory per conversation is capped.
+"""
 
 from __future__ import annotations
 
 import asyncio
 import contextlib
 import json
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 from pydantic_ai import ModelMessage
+from pydantic_ai.messages import ModelRequest, SystemPromptPart
 
 from ..core.logger import get_logger
+from .context_window import estimate_message_tokens, is_turn_start
 
 logger = get_logger("ai.conversation")
 
 
+@dataclass(frozen=True)
+class PendingSummary:
+    """Messages handed to a summarizer, and where they sit in the conversation.
+
+    Attributes:
+        messages: Messages to fold into the summary, oldest first
+        end: Position just past the last of them, counted from the start of the conversation
+        epoch: Conversation epoch when the batch was taken; a clear invalidates it
+    """
+
+    messages: list[ModelMessage]
+    end: int
+    epoch: int
+
+
 class ConversationState:
     """State for a single conversation with analytics and summarization.
 
@@ -28,13 +54,23 @@ class ConversationState:
         output_tokens: Total output tokens used
         summary: Optional conversation summary for long conversations
         message_count: Total number of messages
+        max_messages: Maximum messages kept in memory (None for unlimited)
     """
 
-    def __init__(self, user_id: str) -> None:
+    def __init__(
+        self,
+        user_id: str,
+        max_messages: int | None = None,
+        token_counter: Callable[[ModelMessage], int] | None = None,
+    ) -> None:
         """Initialize conversation state.
 
         Args:
             user_id: Unique identifier for the user
+            max_messages: Maximum messages kept in memory; the oldest turns are
+                dropped beyond it (None for unlimited)
+            token_counter: Function estimating a message's tokens
+                (defaults to ``estimate_message_tokens``)
         """
         self.user_id = user_id
         self.messages: list[ModelMessage] = []
@@ -45,6 +81,21 @@ class ConversationState:
         self.output_tokens = 0
         self.summary: str | None = None
         self.message_count = 0
+        self.max_messages = max_messages
+        self._count_tokens = token_counter or estimate_message_tokens
+        # Token estimate of each entry in ``messages``, computed once on add
+        self._token_counts: list[int] = []
+        # Messages dropped from the front of ``messages`` since the last clear
+        self._dropped = 0
+        # System prompt of the first request, re-attached when that request is cut
+        self._system_parts: list[SystemPromptPart] = []
+        self._epoch = 0
+        self._summarizing = False
+
+    @property
+    def history_tokens(self) -> int:
+        """Estimated tokens of all messages held in memory."""
+        return sum(self._token_counts)
 
     def add_messages(
         self,
@@ -59,8 +110,16 @@ class ConversationState:
             input_tokens: Number of input tokens used
             output_tokens: Number of output tokens used
         """
+        for message in messages:
+            if not self._system_parts and isinstance(message, ModelRequest):
+                self._system_parts = [
+                    part for part in message.parts if isinstance(part, SystemPromptPart)
+                ]
+            self._token_counts.append(self._count_tokens(message))
         self.messages.extend(messages)
         self.message_count += len(messages)
+        if self.max_messages is not None and len(self.messages) > self.max_messages:
+            self._enforce_max_messages(self.max_messages)
         self.input_tokens += input_tokens
         self.output_tokens += output_tokens
         self.last_activity = datetime.now(UTC)
@@ -74,30 +133,142 @@ class ConversationState:
             self.output_tokens,
         )
 
-    def get_messages(self, max_turns: int | None = None) -> list[ModelMessage]:
+    def get_messages(
+        self, max_turns: int | None = None, max_tokens: int | None = None
+    ) -> list[ModelMessage]:
         """Get conversation messages.
 
+        With ``max_tokens`` the oldest turns are left out until the rest fit the
+        budget; history is only cut in front of a user prompt, so tool calls stay
+        paired with their results. When the first request has been cut, its
+        system prompt and the running summary are attached to the first message
+        returned.
+
         Args:
             max_turns: Maximum number of recent turns to return (None for all)
+            max_tokens: Token budget for the returned messages (None for unlimited)
 
         Returns:
             List of messages
         """
-        if max_turns is None:
-            return self.messages.copy()
-
-        # Keep the most recent messages up to max_turns
-        # Each turn typically has a request and response
-        max_messages = max_turns * 2
-        return (
-            self.messages[-max_messages:]
-            if len(self.messages) > max_messages
-            else self.messages.copy()
+        start = self._window_start(max_turns, max_tokens)
+        window = self.messages[start:]
+        if window and (start > 0 or self._dropped > 0):
+            window[0] = self._with_context(window[0])
+        return window
+
+    def _window_start(self, max_turns: int | None, max_tokens: int | None) -> int:
+        """Index of the first message that fits both limits."""
+        start = 0
+        if max_turns is not None:
+            # Each turn typically has a request and response
+            start = max(len(self.messages) - max_turns * 2, 0)
+        if max_tokens is None:
+            return start
+
+        used = 0
+        fitting = len(self.messages)
+        for index in range(len(self.messages) - 1, start - 1, -1):
+            used += self._token_counts[index]
+            if used > max_tokens:
+                break
+            if is_turn_start(self.messages[index]):
+                fitting = index
+        return fitting
+
+    def _with_context(self, message: ModelMessage) -> ModelMessage:
+        """Attach the system prompt and summary to the first message of a cut history."""
+        if not isinstance(message, ModelRequest):
+            return message
+        extra: list[SystemPromptPart] = []
+        if not any(isinstance(part, SystemPromptPart) for part in message.parts):
+            extra.extend(self._system_parts)
+        if self.summary:
+            extra.append(SystemPromptPart(f"Summary of the earlier conversation:\n{self.summary}"))
+        if not extra:
+            return message
+        return replace(message, parts=[*extra, *message.parts])
+
+    def _drop_front(self, count: int) -> None:
+        """Remove the oldest ``count`` messages from memory."""
+        del self.messages[:count]
+        del self._token_counts[:count]
+        self._dropped += count
+
+    def _enforce_max_messages(self, max_messages: int) -> None:
+        """Drop the oldest turns until at most ``max_messages`` messages remain."""
+        excess = len(self.messages) - max_messages
+        cut = next(
+            (
+                index
+                for index in range(excess, len(self.messages))
+                if is_turn_start(self.messages[index])
+            ),
+            excess,
+        )
+        self._drop_front(cut)
+        logger.debug("Dropped %d messages over the limit from conversation %s", cut, self.user_id)
+
+    def begin_summary(
+        self,
+        max_turns: int | None,
+        max_tokens: int | None,
+        min_messages: int = 1,
+    ) -> PendingSummary | None:
+        """Take the messages that no longer fit the context window for summarization.
+
+        Only one summary can be in progress per conversation; finish it with
+        ``apply_summary`` or ``cancel_summary``.
+
+        Args:
+            max_turns: Turn limit used for the context window
+            max_tokens: Token budget used for the context window
+            min_messages: Minimum number of messages worth summarizing
+
+        Returns:
+            Batch to summarize, or None if nothing needs summarizing
+        """
+        if self._summarizing:
+            return None
+        start = self._window_start(max_turns, max_tokens)
+        if start < max(min_messages, 1):
+            return None
+        self._summarizing = True
+        return PendingSummary(self.messages[:start], self._dropped + start, self._epoch)
+
+    def apply_summary(self, batch: PendingSummary, summary: str) -> None:
+        """Store the summary of a batch and drop its messages from memory.
+
+        Messages added while the summary was produced are kept. The summary is
+        discarded if the conversation was cleared in the meantime.
+
+        Args:
+            batch: Batch returned by ``begin_summary``
+            summary: Summary of the previous summary plus the batch's messages
+        """
+        self._summarizing = False
+        if batch.epoch != self._epoch:
+            return
+        self.summary = summary
+        self._drop_front(max(batch.end - self._dropped, 0))
+        logger.debug(
+            "Summarized conversation %s up to message %d (%d messages in memory)",
+            self.user_id,
+            batch.end,
+            len(self.messages),
         )
 
+    def cancel_summary(self) -> None:
+        """Release the summary slot after a failed summarization."""
+        self._summarizing = False
+
     def clear(self) -> None:
         """Clear conversation history."""
         self.messages.clear()
+        self._token_counts.clear()
+        self._system_parts = []
+        self._dropped = 0
+        self._epoch += 1
         self.context.clear()
         self.summary = None
         self.last_activity = datetime.now(UTC)
@@ -155,6 +326,8 @@ class ConversationState:
             "created_at": self.created_at.isoformat(),
             "last_activity": self.last_activity.isoformat(),
             "has_summary": self.summary is not None,
+            "history_tokens": self.history_tokens,
+            "messages_in_memory": len(self.messages),
             "context_keys": list(self.context.keys()),
         }
 
@@ -222,14 +395,24 @@ class ConversationManager:
     - Thread-safe access to conversation data
     """
 
-    def __init__(self, timeout_minutes: int = 30, cleanup_interval_seconds: int = 300) -> None:
+    def __init__(
+        self,
+        timeout_minutes: int = 30,
+        cleanup_interval_seconds: int = 300,
+        max_messages_per_user: int | None = None,
+        token_counter: Callable[[ModelMessage], int] | None = None,
+    ) -> None:
         """Initialize conversation manager.
 
         Args:
             timeout_minutes: Minutes of inactivity before conversation expires
             cleanup_interval_seconds: Seconds between cleanup runs
+            max_messages_per_user: Maximum messages kept in memory per conversation
+            token_counter: Function estimating a message's tokens
         """
         self._conversations: dict[str, ConversationState] = {}
+        self._max_messages = max_messages_per_user
+        self._token_counter = token_counter
         self._timeout_minutes = timeout_minutes
         self._cleanup_interval = cleanup_interval_seconds
         self._lock = asyncio.Lock()
@@ -252,7 +435,11 @@ class ConversationManager:
         async with self._lock:
             if user_id not in self._conversations:
                 logger.debug("Creating new conversation for user: %s", user_id)
-                self._conversations[user_id] = ConversationState(user_id)
+                self._conversations[user_id] = ConversationState(
+                    user_id,
+                    max_messages=self._max_messages,
+                    token_counter=self._token_counter,
+                )
             return self._conversations[user_id]
 
     async def clear_conversation(self, user_id: str) -> None:
@@ -360,6 +547,9 @@ class ConversationManager:
         try:
             data = json.loads(json_data)
             conv = ConversationState.import_from_dict(data)
+            conv.max_messages = self._max_messages
+            if self._token_counter is not None:
+                conv._count_tokens = self._token_counter
 
             async with self._lock:
                 self._conversations[conv.user_id] = conv
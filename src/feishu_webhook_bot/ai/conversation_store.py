@@ -2,11 +2,21 @@
 
 This module provides database-backed conversation persistence with automatic
 cleanup of old data, token tracking, and message history management.
+
+History reads are pushed into SQL: the most recent messages are selected with
+``ORDER BY timestamp DESC LIMIT n`` over a ``(conversation_id, timestamp, id)``
+index, exports page through messages with keyset pagination, and the hot tail
+of recently used conversations is cached in process.
 """
 
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 from typing import Any
@@ -15,11 +25,14 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
+    and_,
     create_engine,
     inspect,
+    or_,
     text,
 )
 from sqlalchemy.orm import DeclarativeBase, Session, relationship
@@ -28,6 +41,16 @@ from ..core.logger import get_logger
 
 logger = get_logger("ai.conversation_store")
 
+# Position of a message in (timestamp, id) order, used as a keyset pagination cursor
+MessageCursor = tuple[datetime, int]
+
+
+def _naive_utc(value: datetime) -> datetime:
+    """Drop the timezone of an aware UTC timestamp, matching what the database returns."""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone(UTC).replace(tzinfo=None)
+
 
 class Base(DeclarativeBase):
     """SQLAlchemy declarative base for ORM models."""
@@ -67,11 +90,12 @@ class ConversationRecord(Base):
     message_count = Column(Integer, default=0)
     active_persona_id = Column(String(255), nullable=True)
 
+    # Loaded only on access; history reads query MessageRecord directly with a LIMIT
     messages = relationship(
         "MessageRecord",
         back_populates="conversation",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        lazy="select",
     )
 
     def to_dict(self) -> dict[str, Any]:
@@ -105,6 +129,9 @@ class MessageRecord(Base):
     """
 
     __tablename__ = "messages"
+    __table_args__ = (
+        Index("ix_messages_conversation_timestamp", "conversation_id", "timestamp", "id"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     conversation_id = Column(
@@ -140,6 +167,47 @@ class MessageRecord(Base):
             "metadata": self.get_metadata(),
         }
 
+    def to_history_dict(self) -> dict[str, Any]:
+        """Convert record to the dictionary returned by ``load_history``.
+
+        Timestamps are naive UTC whether the record was just saved or read
+        back, so cached and database-read history look the same.
+        """
+        return {
+            "role": self.role,
+            "content": self.content,
+            "timestamp": _naive_utc(self.timestamp).isoformat() if self.timestamp else None,
+            "tokens": self.tokens,
+        }
+
+
+@dataclass
+class _HistoryTail:
+    """Cached most recent messages of one conversation.
+
+    ``complete`` is True while ``messages`` holds the conversation's entire
+    history, so requests for more messages than are cached can still be served.
+    """
+
+    messages: deque[dict[str, Any]]
+    complete: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def last(self, count: int) -> list[dict[str, Any]] | None:
+        """Return copies of the last ``count`` messages, or None if not cached."""
+        with self.lock:
+            if len(self.messages) < count and not self.complete:
+                return None
+            items = list(self.messages)
+        return [dict(item) for item in items[-count:]] if count > 0 else []
+
+    def append(self, message: dict[str, Any]) -> None:
+        """Append a newly saved message, dropping the oldest when full."""
+        with self.lock:
+            if len(self.messages) == self.messages.maxlen:
+                self.complete = False
+            self.messages.append(message)
+
 
 class PersistentConversationManager:
     """Database-backed conversation manager.
@@ -168,6 +236,8 @@ class PersistentConversationManager:
         db_url: str | None = None,
         echo: bool = False,
         data_dir: str | None = None,
+        history_cache_size: int = 50,
+        history_cache_conversations: int = 256,
     ) -> None:
         """Initialize the persistent conversation manager.
 
@@ -175,10 +245,20 @@ class PersistentConversationManager:
             db_url: SQLAlchemy database URL. If None, uses SQLite in data_dir.
             echo: Enable SQL logging
             data_dir: Directory for SQLite database (if db_url is None)
+            history_cache_size: Recent messages cached per conversation (0 disables the cache)
+            history_cache_conversations: Maximum conversations whose tail is cached
 
         Raises:
             ValueError: If database cannot be initialized
         """
+        self.history_cache_size = history_cache_size
+        self.history_cache_conversations = history_cache_conversations
+        self._tails: OrderedDict[int, _HistoryTail] = OrderedDict()
+        self._tails_lock = threading.Lock()
+        # Bumped on every message write; a history read only fills the cache if
+        # no write happened while it was querying, so it cannot cache a stale tail
+        self._write_seq = 0
+
         if db_url is None:
             if data_dir is None:
                 data_dir = "data"
@@ -204,6 +284,10 @@ class PersistentConversationManager:
         except Exception:
             return
 
+        # create_all does not add indexes to tables created by older versions
+        for index in MessageRecord.__table__.indexes:
+            index.create(self.engine, checkfirst=True)
+
         if "active_persona_id" not in conv_cols:
             if self.engine.dialect.name == "sqlite":
                 with self.engine.begin() as connection:
@@ -225,10 +309,67 @@ class PersistentConversationManager:
         """
         return Session(self.engine, expire_on_commit=False)
 
+    def _get_tail(self, conversation_id: int) -> _HistoryTail | None:
+        """Get the cached tail of a conversation, marking it recently used."""
+        with self._tails_lock:
+            tail = self._tails.get(conversation_id)
+            if tail is not None:
+                self._tails.move_to_end(conversation_id)
+            return tail
+
+    def _put_tail(
+        self,
+        conversation_id: int,
+        messages: list[dict[str, Any]],
+        complete: bool,
+        write_seq: int | None = None,
+    ) -> None:
+        """Cache the most recent messages of a conversation.
+
+        Args:
+            conversation_id: ID of the conversation
+            messages: Most recent messages, oldest first
+            complete: Whether ``messages`` is the entire history
+            write_seq: ``_write_seq`` observed before reading ``messages``; the
+                cache is left untouched if a write happened since
+        """
+        if self.history_cache_size <= 0:
+            return
+        tail = _HistoryTail(
+            deque((dict(m) for m in messages), maxlen=self.history_cache_size),
+            complete=complete and len(messages) <= self.history_cache_size,
+        )
+        with self._tails_lock:
+            if write_seq is not None and write_seq != self._write_seq:
+                return
+            self._tails[conversation_id] = tail
+            self._tails.move_to_end(conversation_id)
+            while len(self._tails) > self.history_cache_conversations:
+                self._tails.popitem(last=False)
+
+    def _invalidate_tail(self, conversation_id: int | None = None) -> None:
+        """Drop the cached tail of one conversation, or of all conversations."""
+        with self._tails_lock:
+            if conversation_id is None:
+                self._tails.clear()
+            else:
+                self._tails.pop(conversation_id, None)
+
     def get_active_persona_id(self, user_key: str) -> str | None:
         conv = self.get_conversation_by_user(user_key)
         return conv.active_persona_id if conv else None
 
+    async def get_active_persona_id_async(self, user_key: str) -> str | None:
+        """Look up the active persona in a worker thread, keeping the event loop free.
+
+        Args:
+            user_key: Unique user identifier
+
+        Returns:
+            Active persona ID, or None if unset
+        """
+        return await asyncio.to_thread(self.get_active_persona_id, user_key)
+
     def set_active_persona_id(
         self,
         user_key: str,
@@ -367,6 +508,12 @@ class PersistentConversationManager:
             session.commit()
             message_id = message.id
 
+            with self._tails_lock:
+                self._write_seq += 1
+                tail = self._tails.get(conversation_id)
+                if tail is not None:
+                    tail.append(message.to_history_dict())
+
             logger.debug(
                 "Saved message %d to conversation %d (role=%s, tokens=%d)",
                 message_id,
@@ -401,29 +548,35 @@ class PersistentConversationManager:
         Raises:
             ValueError: If conversation not found
         """
+        max_messages = max(max_turns * 2, 0)
+        tail = self._get_tail(conversation_id)
+        if tail is not None:
+            cached = tail.last(max_messages)
+            if cached is not None:
+                return cached
+
+        with self._tails_lock:
+            write_seq = self._write_seq
+
         session = self.get_session()
         try:
-            conv = session.query(ConversationRecord).filter_by(id=conversation_id).first()
+            conv = session.get(ConversationRecord, conversation_id)
             if conv is None:
                 raise ValueError(f"Conversation not found: {conversation_id}")
 
-            # Load messages
-            messages = session.query(MessageRecord).filter_by(conversation_id=conversation_id).all()
-
-            # Limit to max_turns (each turn is roughly 2 messages)
-            max_messages = max_turns * 2
-            if len(messages) > max_messages:
-                messages = messages[-max_messages:]
+            # Newest rows first via the (conversation_id, timestamp, id) index
+            limit = max(max_messages, self.history_cache_size)
+            rows = (
+                session.query(MessageRecord)
+                .filter(MessageRecord.conversation_id == conversation_id)
+                .order_by(MessageRecord.timestamp.desc(), MessageRecord.id.desc())
+                .limit(limit)
+                .all()
+            )
+            messages = [msg.to_history_dict() for msg in reversed(rows)]
+            self._put_tail(conversation_id, messages, len(rows) < limit, write_seq)
 
-            result = [
-                {
-                    "role": msg.role,
-                    "content": msg.content,
-                    "timestamp": msg.timestamp.isoformat() if msg.timestamp else None,
-                    "tokens": msg.tokens,
-                }
-                for msg in messages
-            ]
+            result = messages[-max_messages:] if max_messages > 0 else []
 
             logger.debug(
                 "Loaded %d messages from conversation %d (requested max_turns=%d)",
@@ -441,6 +594,83 @@ class PersistentConversationManager:
             logger.error("Failed to load conversation history: %s", exc, exc_info=True)
             raise
 
+    def get_messages_page(
+        self,
+        conversation_id: int,
+        limit: int = 100,
+        after: MessageCursor | None = None,
+        newest_first: bool = False,
+    ) -> tuple[list[dict[str, Any]], MessageCursor | None]:
+        """Read one page of a conversation's messages using keyset pagination.
+
+        Args:
+            conversation_id: ID of the conversation
+            limit: Maximum messages in the page
+            after: Cursor returned with the previous page (None for the first page)
+            newest_first: Page from the newest message backwards instead of oldest forwards
+
+        Returns:
+            Tuple of message dicts (as ``MessageRecord.to_dict``) and the cursor
+            for the next page, which is None once the last page was returned
+        """
+        session = self.get_session()
+        try:
+            query = session.query(MessageRecord).filter(
+                MessageRecord.conversation_id == conversation_id
+            )
+            if after is not None:
+                timestamp, message_id = after
+                same_time = MessageRecord.timestamp == timestamp
+                if newest_first:
+                    query = query.filter(
+                        or_(
+                            MessageRecord.timestamp < timestamp,
+                            and_(same_time, MessageRecord.id < message_id),
+                        )
+                    )
+                else:
+                    query = query.filter(
+                        or_(
+                            MessageRecord.timestamp > timestamp,
+                            and_(same_time, MessageRecord.id > message_id),
+                        )
+                    )
+            if newest_first:
+                query = query.order_by(MessageRecord.timestamp.desc(), MessageRecord.id.desc())
+            else:
+                query = query.order_by(MessageRecord.timestamp.asc(), MessageRecord.id.asc())
+
+            rows = query.limit(limit).all()
+            session.close()
+
+            next_cursor: MessageCursor | None = None
+            if len(rows) == limit:
+                next_cursor = (rows[-1].timestamp, rows[-1].id)
+            return [row.to_dict() for row in rows], next_cursor
+
+        except Exception as exc:
+            session.rollback()
+            session.close()
+            logger.error("Failed to read conversation messages: %s", exc, exc_info=True)
+            raise
+
+    def iter_messages(self, conversation_id: int, page_size: int = 500) -> Iterator[dict[str, Any]]:
+        """Iterate all messages of a conversation, oldest first, one page at a time.
+
+        Args:
+            conversation_id: ID of the conversation
+            page_size: Messages fetched per query
+
+        Yields:
+            Message dicts (as ``MessageRecord.to_dict``)
+        """
+        cursor: MessageCursor | None = None
+        while True:
+            page, cursor = self.get_messages_page(conversation_id, limit=page_size, after=cursor)
+            yield from page
+            if cursor is None:
+                return
+
     def get_conversation_by_user(
         self,
         user_key: str,
@@ -542,6 +772,9 @@ class PersistentConversationManager:
             conv.last_activity = datetime.now(UTC)
 
             session.commit()
+            with self._tails_lock:
+                self._write_seq += 1
+            self._put_tail(conversation_id, [], complete=True)
 
             logger.info("Cleared conversation %d", conversation_id)
 
@@ -573,6 +806,7 @@ class PersistentConversationManager:
 
             session.delete(conv)
             session.commit()
+            self._invalidate_tail(conversation_id)
 
             logger.info("Deleted conversation %d", conversation_id)
 
@@ -614,6 +848,8 @@ class PersistentConversationManager:
                 session.delete(conv)
 
             session.commit()
+            for conv in old_convs:
+                self._invalidate_tail(conv.id)
 
             logger.info("Cleaned up %d conversations older than %d days", count, days)
 
@@ -643,20 +879,17 @@ class PersistentConversationManager:
         """
         session = self.get_session()
         try:
-            conv = session.query(ConversationRecord).filter_by(id=conversation_id).first()
+            conv = session.get(ConversationRecord, conversation_id)
             if conv is None:
                 raise ValueError(f"Conversation not found: {conversation_id}")
-
-            messages = session.query(MessageRecord).filter_by(conversation_id=conversation_id).all()
+            session.close()
 
             data = {
                 "conversation": conv.to_dict(),
-                "messages": [msg.to_dict() for msg in messages],
+                "messages": list(self.iter_messages(conversation_id)),
             }
 
             logger.info("Exported conversation %d", conversation_id)
-
-            session.close()
             return data
 
         except Exception as exc:
@@ -0,0 +1,243 @@
+"""Content-addressed cache for one-shot model responses.
+
+Scheduled AI tasks, RSS summaries and report generation send the same prompts
+again and again: the same article appears in several feeds, a task prompt is
+rerun on every schedule tick, a report is regenerated on retry. This module
+caches such responses under a hash of everything that determines the answer:
+
+- the model and its sampling settings
+- the effective system prompt
+- the normalized user prompt
+- the set of tools the model may call
+
+Entries are kept in a ``TTLCache``: they expire after a TTL and the least
+recently used entries are evicted once the cache is full. An optional SQLite
+file keeps responses across restarts; entries are read from it on demand.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import re
+from collections.abc import Awaitable, Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from ..core.logger import get_logger
+from ..core.ttl_cache import TTLCache
+
+logger = get_logger("ai.response_cache")
+
+_HORIZONTAL_SPACE = re.compile(r"[ \t\f\v]+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize insignificant whitespace in a prompt.
+
+    Line endings are unified, runs of spaces and tabs collapse to one space,
+    and leading and trailing whitespace is removed from every line and from
+    the prompt. Line breaks themselves are kept.
+
+    Args:
+        prompt: Prompt text
+
+    Returns:
+        Normalized prompt
+    """
+    lines = prompt.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(_HORIZONTAL_SPACE.sub(" ", line).strip() for line in lines).strip()
+
+
+def make_cache_key(
+    model: str,
+    system_prompt: str | None,
+    prompt: str,
+    tools: Iterable[str] = (),
+    settings: dict[str, Any] | None = None,
+) -> str:
+    """Build the content address of a model request.
+
+    Args:
+        model: Model name (``provider:model``)
+        system_prompt: Effective system prompt
+        prompt: User prompt (normalized before hashing)
+        tools: Names of the tools available to the model
+        settings: Other inputs that change the answer, e.g. temperature
+
+    Returns:
+        Hex SHA-256 digest identifying the request
+    """
+    key_data = {
+        "model": model,
+        "system_prompt": system_prompt or "",
+        "prompt": normalize_prompt(prompt),
+        "tools": sorted(set(tools)),
+        "settings": settings or {},
+    }
+    key_str = json.dumps(key_data, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(key_str.encode()).hexdigest()
+
+
+class ResponseCache:
+    """TTL and LRU bounded response cache with optional SQLite backing.
+
+    Concurrent requests for the same key share one computation, so a burst
+    of identical prompts costs a single model call.
+
+    Example:
+        ```python
+        cache = ResponseCache(ttl_seconds=3600, max_entries=512)
+        key = make_cache_key("openai:gpt-4o", system_prompt, prompt)
+        reply = await cache.get_or_compute(key, lambda: run_model(prompt))
+        ```
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 512,
+        db_path: str | Path | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds a cached response stays valid
+            max_entries: Maximum entries kept in memory and in the database
+            db_path: SQLite file backing the cache (None for memory only)
+
+        Raises:
+            ValueError: If ttl_seconds is not positive or max_entries is less than 1
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._cache = TTLCache(
+            "response_cache",
+            ttl_seconds,
+            max_entries,
+            db_path=db_path,
+            warm_start=False,
+            read_through=True,
+        )
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+        self._shared = 0
+        logger.info(
+            "ResponseCache initialized (ttl=%ds, max_entries=%d, db=%s)",
+            ttl_seconds,
+            max_entries,
+            db_path or "none",
+        )
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    async def get(self, key: str) -> str | None:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key from ``make_cache_key``
+
+        Returns:
+            Cached response, or None if absent or expired
+        """
+        return await self._cache.aget(key)
+
+    def set(self, key: str, response: str) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key from ``make_cache_key``
+            response: Response text
+        """
+        self._cache.set(key, response)
+
+    async def get_or_compute(self, key: str, compute: Callable[[], Awaitable[str]]) -> str:
+        """Return the cached response for a key, computing and storing it on a miss.
+
+        Callers asking for a key that is already being computed wait for that
+        computation instead of starting their own. Failed computations are not
+        cached; their exception is raised to every waiting caller.
+
+        Args:
+            key: Cache key from ``make_cache_key``
+            compute: Coroutine function producing the response
+
+        Returns:
+            Cached or freshly computed response
+        """
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._shared += 1
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        # Consume the outcome so an exception nobody waited for is not reported
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._inflight[key] = future
+        try:
+            response = await self._cache.aget(key)
+            if response is None:
+                response = await compute()
+                self.set(key, response)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(response)
+        return response
+
+    def invalidate(self, key: str | None = None) -> int:
+        """Remove one entry or the whole cache.
+
+        Args:
+            key: Key to remove (None removes everything)
+
+        Returns:
+            Number of in-memory entries removed
+        """
+        if key is None:
+            count = self._cache.clear()
+            logger.info("Invalidated all %d cached responses", count)
+            return count
+        return int(self._cache.delete(key))
+
+    def cleanup_expired(self) -> int:
+        """Remove expired entries from memory and the database.
+
+        Returns:
+            Number of in-memory entries removed
+        """
+        count = self._cache.cleanup_expired()
+        if count:
+            logger.debug("Removed %d expired cached responses", count)
+        return count
+
+    def close(self) -> None:
+        """Commit pending database writes and close the database.
+
+        Safe to call more than once; the in-memory cache stays usable.
+        """
+        self._cache.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with size, hits (including those served from the
+            database), misses, shared computations, evictions and hit rate
+        """
+        stats = self._cache.get_stats()
+        stats["shared"] = self._shared
+        stats["max_entries"] = stats.pop("max_size")
+        stats.pop("warm_loaded")
+        return stats
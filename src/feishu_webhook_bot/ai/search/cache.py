@@ -1,24 +1,77 @@
-"""Search result caching for improved performance."""
+"""Search result caching for improved performance.
+
+One ``SearchCache`` instance is shared by ``SearchManager``, the ``web_search``
+tool and its DuckDuckGo fallback, so repeated queries hit the same entries and
+the statistics cover every search path.
+
+Entries are kept in a ``TTLCache``: O(1) least-recently-used eviction, expiry
+checked lazily when an entry is read, and an optional SQLite file that keeps
+results across restarts; unexpired entries are loaded back into memory when
+the cache is created.
+"""
 
 from __future__ import annotations
 
 import hashlib
 import json
-from datetime import UTC, datetime, timedelta
-from typing import Any
+from pathlib import Path
+from typing import Any, NamedTuple
 
 from ...core.logger import get_logger
+from ...core.ttl_cache import SharedCache, TTLCache
 from .base import SearchResponse
 
 logger = get_logger("ai.search.cache")
 
 
+class _CacheEntry(NamedTuple):
+    """Cached value with the query it answers."""
+
+    value: Any
+    query: str
+    provider: str | None
+
+
+def _encode(entry: _CacheEntry) -> str | None:
+    """Serialize a cache entry for the database, or None if it cannot be stored."""
+    value = entry.value
+    if isinstance(value, SearchResponse):
+        kind, payload = "response", value.model_dump_json()
+    elif isinstance(value, str):
+        kind, payload = "text", value
+    else:
+        try:
+            kind, payload = "json", json.dumps(value)
+        except (TypeError, ValueError):
+            return None
+    return json.dumps(
+        {"kind": kind, "payload": payload, "query": entry.query, "provider": entry.provider}
+    )
+
+
+def _decode(data: str) -> _CacheEntry:
+    """Restore an entry serialized by ``_encode``."""
+    record = json.loads(data)
+    kind, payload = record["kind"], record["payload"]
+    if kind == "response":
+        value = SearchResponse.model_validate_json(payload)
+    elif kind == "text":
+        value = payload
+    else:
+        value = json.loads(payload)
+    return _CacheEntry(value, record["query"], record["provider"])
+
+
 class SearchCache:
-    """In-memory cache for search results with TTL support.
+    """LRU cache for search results with TTL and optional SQLite persistence.
+
+    Values are usually ``SearchResponse`` objects; the ``web_search`` fallback
+    stores its formatted JSON text under its own provider name.
 
     Features:
-    - Configurable TTL (time-to-live)
-    - LRU-style eviction when max size reached
+    - Configurable TTL (time-to-live), checked lazily on lookup
+    - O(1) least-recently-used eviction when max size reached
+    - Optional on-disk tier so warm results survive restarts
     - Cache statistics tracking
     - Provider-aware caching
     """
@@ -27,24 +80,33 @@ class SearchCache:
         self,
         ttl_minutes: int = 60,
         max_size: int = 500,
+        db_path: str | Path | None = None,
     ) -> None:
         """Initialize search cache.
 
         Args:
             ttl_minutes: Time-to-live for cached results in minutes
             max_size: Maximum number of cached entries
+            db_path: SQLite file backing the cache (None for memory only)
         """
-        self._cache: dict[str, tuple[SearchResponse, datetime]] = {}
-        self._ttl = timedelta(minutes=ttl_minutes)
-        self._max_size = max_size
-        self._hits = 0
-        self._misses = 0
+        self._cache = TTLCache(
+            "search_cache",
+            ttl_minutes * 60,
+            max_size,
+            db_path=db_path,
+            encode=_encode,
+            decode=_decode,
+        )
         logger.info(
-            "SearchCache initialized (ttl=%d min, max_size=%d)",
+            "SearchCache initialized (ttl=%d min, max_size=%d, db=%s)",
             ttl_minutes,
             max_size,
+            db_path or "none",
         )
 
+    def __len__(self) -> int:
+        return len(self._cache)
+
     def _make_key(
         self,
         query: str,
@@ -78,7 +140,7 @@ class SearchCache:
         max_results: int,
         provider: str | None = None,
         **options: Any,
-    ) -> SearchResponse | None:
+    ) -> Any | None:
         """Get cached result if available and not expired.
 
         Args:
@@ -88,39 +150,22 @@ class SearchCache:
             **options: Additional options
 
         Returns:
-            Cached SearchResponse or None if not found/expired
+            Cached value (a ``SearchResponse`` copy with ``cached`` set, for
+            responses) or None if not found/expired
         """
-        key = self._make_key(query, max_results, provider, **options)
-
-        if key in self._cache:
-            response, timestamp = self._cache[key]
-            if datetime.now(UTC) - timestamp < self._ttl:
-                self._hits += 1
-                logger.debug("Cache hit for query: %s", query[:50])
-                # Return a copy with cached flag set
-                return SearchResponse(
-                    results=response.results,
-                    query=response.query,
-                    provider=response.provider,
-                    total_results=response.total_results,
-                    cached=True,
-                    timestamp=response.timestamp,
-                    search_time_ms=response.search_time_ms,
-                    metadata=response.metadata,
-                )
-            else:
-                # Expired, remove it
-                del self._cache[key]
-                logger.debug("Cache expired for query: %s", query[:50])
-
-        self._misses += 1
-        return None
+        entry = self._cache.get(self._make_key(query, max_results, provider, **options))
+        if entry is None:
+            return None
+        logger.debug("Cache hit for query: %s", query[:50])
+        if isinstance(entry.value, SearchResponse):
+            return entry.value.model_copy(update={"cached": True})
+        return entry.value
 
     def set(
         self,
         query: str,
         max_results: int,
-        response: SearchResponse,
+        response: Any,
         provider: str | None = None,
         **options: Any,
     ) -> None:
@@ -129,27 +174,14 @@ class SearchCache:
         Args:
             query: Search query
             max_results: Maximum results requested
-            response: SearchResponse to cache
+            response: SearchResponse (or formatted result text) to cache
             provider: Provider name (optional)
             **options: Additional options
         """
-        # Evict oldest entry if cache is full
-        if len(self._cache) >= self._max_size:
-            self._evict_oldest()
-
         key = self._make_key(query, max_results, provider, **options)
-        self._cache[key] = (response, datetime.now(UTC))
+        self._cache.set(key, _CacheEntry(response, query, provider))
         logger.debug("Cached result for query: %s", query[:50])
 
-    def _evict_oldest(self) -> None:
-        """Evict the oldest cache entry."""
-        if not self._cache:
-            return
-
-        oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-        del self._cache[oldest_key]
-        logger.debug("Evicted oldest cache entry")
-
     def invalidate(
         self,
         query: str | None = None,
@@ -165,22 +197,21 @@ class SearchCache:
             Number of entries invalidated
         """
         if query is None and provider is None:
-            count = len(self._cache)
-            self._cache.clear()
+            count = self._cache.clear()
             logger.info("Invalidated all %d cache entries", count)
             return count
 
         # Find matching entries
         keys_to_remove = []
-        for key, (response, _) in self._cache.items():
-            if query and query.lower() not in response.query.lower():
+        for key, entry in self._cache.items():
+            if query and query.lower() not in entry.query.lower():
                 continue
-            if provider and response.provider != provider:
+            if provider and self._entry_provider(entry) != provider:
                 continue
             keys_to_remove.append(key)
 
         for key in keys_to_remove:
-            del self._cache[key]
+            self._cache.delete(key)
 
         logger.info("Invalidated %d cache entries", len(keys_to_remove))
         return len(keys_to_remove)
@@ -188,28 +219,26 @@ class SearchCache:
     def clear(self) -> None:
         """Clear all cached results and reset statistics."""
         self._cache.clear()
-        self._hits = 0
-        self._misses = 0
+        self._cache.reset_stats()
         logger.info("Search cache cleared")
 
     def cleanup_expired(self) -> int:
-        """Remove expired entries from cache.
+        """Remove expired entries from memory and the database.
 
         Returns:
-            Number of entries removed
+            Number of in-memory entries removed
         """
-        now = datetime.now(UTC)
-        expired_keys = [
-            key for key, (_, timestamp) in self._cache.items() if now - timestamp >= self._ttl
-        ]
+        count = self._cache.cleanup_expired()
+        if count:
+            logger.info("Cleaned up %d expired cache entries", count)
+        return count
 
-        for key in expired_keys:
-            del self._cache[key]
+    def close(self) -> None:
+        """Commit pending database writes and close the database.
 
-        if expired_keys:
-            logger.info("Cleaned up %d expired cache entries", len(expired_keys))
-
-        return len(expired_keys)
+        Safe to call more than once; the in-memory cache stays usable.
+        """
+        self._cache.close()
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics.
@@ -217,21 +246,33 @@ class SearchCache:
         Returns:
             Dictionary with cache statistics
         """
-        total = self._hits + self._misses
-        hit_rate = (self._hits / total * 100) if total > 0 else 0.0
-
-        return {
-            "size": len(self._cache),
-            "max_size": self._max_size,
-            "hits": self._hits,
-            "misses": self._misses,
-            "hit_rate_percent": round(hit_rate, 2),
-            "ttl_minutes": self._ttl.total_seconds() / 60,
-        }
+        stats = self._cache.get_stats()
+        stats["ttl_minutes"] = self._cache.ttl_seconds / 60
+        return stats
+
+    def matches(self, ttl_minutes: int, max_size: int, db_path: str | Path | None) -> bool:
+        """Check whether the cache was created with the given settings.
+
+        Args:
+            ttl_minutes: Time-to-live in minutes
+            max_size: Maximum number of cached entries
+            db_path: SQLite file backing the cache
+
+        Returns:
+            True if all settings are equal
+        """
+        return self._cache.matches(ttl_minutes * 60, max_size, db_path)
+
+    @staticmethod
+    def _entry_provider(entry: _CacheEntry) -> str | None:
+        """Name of the provider that produced an entry."""
+        if isinstance(entry.value, SearchResponse):
+            return entry.value.provider
+        return entry.provider
 
 
 # Global search cache instance
-_global_cache: SearchCache | None = None
+_shared_cache: SharedCache[SearchCache] = SharedCache(SearchCache)
 
 
 def get_search_cache(
@@ -247,7 +288,29 @@ def get_search_cache(
     Returns:
         SearchCache instance
     """
-    global _global_cache
-    if _global_cache is None:
-        _global_cache = SearchCache(ttl_minutes=ttl_minutes, max_size=max_size)
-    return _global_cache
+    return _shared_cache.get(ttl_minutes=ttl_minutes, max_size=max_size)
+
+
+def configure_search_cache(
+    ttl_minutes: int = 60,
+    max_size: int = 500,
+    db_path: str | Path | None = None,
+) -> SearchCache:
+    """Replace the global search cache unless it already uses these settings.
+
+    The previous cache is closed when it is replaced.
+
+    Args:
+        ttl_minutes: TTL for cache entries
+        max_size: Maximum cache size
+        db_path: SQLite file backing the cache (None for memory only)
+
+    Returns:
+        The global SearchCache instance
+    """
+    return _shared_cache.configure(ttl_minutes=ttl_minutes, max_size=max_size, db_path=db_path)
+
+
+def close_search_cache() -> None:
+    """Close and drop the global search cache, committing pending writes."""
+    _shared_cache.reset()
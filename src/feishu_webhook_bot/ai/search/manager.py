@@ -17,6 +17,109 @@ from .cache import SearchCache, get_search_cache
 
 logger = get_logger("ai.search.manager")
 
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+_LATENCY_BUCKETS_MS = (
+    25,
+    50,
+    100,
+    200,
+    300,
+    500,
+    750,
+    1000,
+    1500,
+    2000,
+    3000,
+    5000,
+    7500,
+    10000,
+    20000,
+    30000,
+)
+
+
+class LatencyHistogram:
+    """Bucketed latency distribution of one search provider.
+
+    Recording and percentile lookups cost O(number of buckets). Once
+    ``window`` samples have accumulated every bucket is halved, so the
+    distribution follows recent behaviour instead of the provider's whole
+    history.
+    """
+
+    def __init__(self, window: int = 1000) -> None:
+        """Initialize the histogram.
+
+        Args:
+            window: Sample count after which older samples are decayed
+        """
+        self.window = window
+        self._counts = [0] * (len(_LATENCY_BUCKETS_MS) + 1)
+        self._total = 0
+        self._max_ms = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of samples currently weighted in the histogram."""
+        return self._total
+
+    def record(self, latency_ms: float) -> None:
+        """Add a latency sample.
+
+        Args:
+            latency_ms: Observed latency in milliseconds
+        """
+        index = len(_LATENCY_BUCKETS_MS)
+        for i, bound in enumerate(_LATENCY_BUCKETS_MS):
+            if latency_ms <= bound:
+                index = i
+                break
+        self._counts[index] += 1
+        self._total += 1
+        self._max_ms = max(self._max_ms, latency_ms)
+        if self._total >= self.window:
+            # Round up so rare slow samples in the tail are not dropped
+            self._counts = [(count + 1) // 2 for count in self._counts]
+            self._total = sum(self._counts)
+
+    def percentile(self, percent: float) -> float | None:
+        """Estimate a latency percentile.
+
+        The estimate is the upper bound of the bucket holding the percentile,
+        so it errs towards waiting slightly longer.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Latency in milliseconds, or None without samples
+        """
+        if self._total == 0:
+            return None
+        rank = max(1, round(self._total * percent / 100))
+        seen = 0
+        for i, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                if i < len(_LATENCY_BUCKETS_MS):
+                    return float(_LATENCY_BUCKETS_MS[i])
+                return self._max_ms
+        return self._max_ms
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get histogram statistics.
+
+        Returns:
+            Dictionary with sample count and p50/p95/p99 estimates
+        """
+        return {
+            "samples": self._total,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": round(self._max_ms, 2),
+        }
+
 
 class SearchManager:
     """Unified search manager supporting multiple providers.
@@ -26,6 +129,9 @@ class SearchManager:
     - Automatic failover to backup providers
     - Result caching
     - Concurrent search across providers (optional)
+    - Hedged search: backup providers start when the primary is slower than
+      its usual latency, and the first good response wins (optional)
+    - Per-provider latency histograms
     - Provider health monitoring
     """
 
@@ -37,6 +143,10 @@ class SearchManager:
         cache_ttl_minutes: int = 60,
         enable_failover: bool = True,
         concurrent_search: bool = False,
+        hedged_search: bool = False,
+        hedge_percentile: float = 95.0,
+        hedge_delay_ms: float = 1000.0,
+        hedge_min_samples: int = 20,
     ) -> None:
         """Initialize the search manager.
 
@@ -47,6 +157,11 @@ class SearchManager:
             cache_ttl_minutes: Cache TTL in minutes
             enable_failover: Whether to failover to backup providers
             concurrent_search: Whether to search all providers concurrently
+            hedged_search: Whether to start the next provider when one is slow
+            hedge_percentile: Latency percentile of a provider after which the
+                next provider is started
+            hedge_delay_ms: Hedge delay used until a provider has enough samples
+            hedge_min_samples: Samples needed before the percentile is trusted
         """
         self._providers: dict[str, SearchProvider] = {}
         self._provider_order: list[str] = []
@@ -54,6 +169,11 @@ class SearchManager:
         self._enable_cache = enable_cache
         self._enable_failover = enable_failover
         self._concurrent_search = concurrent_search
+        self._hedged_search = hedged_search
+        self._hedge_percentile = hedge_percentile
+        self._hedge_delay_ms = hedge_delay_ms
+        self._hedge_min_samples = hedge_min_samples
+        self._latency: dict[str, LatencyHistogram] = {}
 
         # Statistics
         self._total_searches = 0
@@ -61,6 +181,8 @@ class SearchManager:
         self._failed_searches = 0
         self._cache_hits = 0
         self._failover_count = 0
+        self._hedged_requests = 0
+        self._hedge_wins = 0
 
         # Register initial providers
         if providers:
@@ -68,10 +190,11 @@ class SearchManager:
                 self.register_provider(provider)
 
         logger.info(
-            "SearchManager initialized (providers=%d, cache=%s, failover=%s)",
+            "SearchManager initialized (providers=%d, cache=%s, failover=%s, hedged=%s)",
             len(self._providers),
             enable_cache,
             enable_failover,
+            hedged_search,
         )
 
     def register_provider(
@@ -198,6 +321,8 @@ class SearchManager:
             response = await self._search_concurrent(
                 query, max_results, providers_to_try, **options
             )
+        elif self._hedged_search and self._enable_failover and len(providers_to_try) > 1:
+            response = await self._search_hedged(query, max_results, providers_to_try, **options)
         else:
             response = await self._search_sequential(
                 query, max_results, providers_to_try, **options
@@ -246,7 +371,7 @@ class SearchManager:
         for i, provider in enumerate(providers):
             try:
                 logger.debug("Trying provider: %s", provider.name)
-                response = await provider.search(query, max_results, **options)
+                response = await self._timed_search(provider, query, max_results, **options)
 
                 if i > 0:
                     self._failover_count += 1
@@ -292,7 +417,9 @@ class SearchManager:
         Raises:
             SearchError: If all providers fail
         """
-        tasks = [provider.search(query, max_results, **options) for provider in providers]
+        tasks = [
+            self._timed_search(provider, query, max_results, **options) for provider in providers
+        ]
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
@@ -310,6 +437,128 @@ class SearchManager:
         # Merge results from all providers
         return self._merge_responses(query, successful_responses, max_results)
 
+    async def _search_hedged(
+        self,
+        query: str,
+        max_results: int,
+        providers: list[SearchProvider],
+        **options: Any,
+    ) -> SearchResponse:
+        """Search providers in priority order, hedging against slow ones.
+
+        The next provider is started as soon as any running request fails or
+        comes back empty, or when the newest one has not answered within its
+        hedge delay (a percentile of its recent latency). The first response
+        with results wins and every other request still running is cancelled.
+        If no provider returns results, the first successful empty response
+        is returned.
+
+        Args:
+            query: Search query
+            max_results: Maximum results
+            providers: Providers to try, in priority order
+            **options: Additional options
+
+        Returns:
+            SearchResponse from the first provider answering with results
+
+        Raises:
+            SearchError: If all providers fail
+        """
+        pending: dict[asyncio.Task[SearchResponse], SearchProvider] = {}
+        remaining = list(providers)
+        empty_response: SearchResponse | None = None
+        last_error: Exception | None = None
+        # Requests started because the one before them was slow
+        hedge_tasks: set[asyncio.Task[SearchResponse]] = set()
+
+        def launch(hedge: bool = False) -> SearchProvider:
+            provider = remaining.pop(0)
+            logger.debug("Trying provider: %s", provider.name)
+            task = asyncio.create_task(self._timed_search(provider, query, max_results, **options))
+            pending[task] = provider
+            if hedge:
+                hedge_tasks.add(task)
+            return provider
+
+        current = launch()
+        try:
+            while pending:
+                timeout = self._hedge_delay(current) / 1000 if remaining else None
+                done, _ = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+
+                if not done:
+                    # The newest request is slower than usual: hedge with the next provider
+                    self._hedged_requests += 1
+                    logger.info(
+                        "Provider %s slower than %.0fms, hedging with %s",
+                        current.name,
+                        self._hedge_delay(current),
+                        remaining[0].name,
+                    )
+                    current = launch(hedge=True)
+                    continue
+
+                for task in done:
+                    provider = pending.pop(task)
+                    try:
+                        response = task.result()
+                    except Exception as exc:
+                        last_error = exc
+                        logger.warning("Provider %s failed: %s", provider.name, str(exc))
+                    else:
+                        if response.has_results:
+                            if provider is not providers[0]:
+                                self._failover_count += 1
+                                self._hedge_wins += int(task in hedge_tasks)
+                                logger.info("Search answered by backup provider %s", provider.name)
+                            return response
+                        if empty_response is None:
+                            empty_response = response
+
+                    # A request failed or came back empty: replace it immediately,
+                    # even while an earlier hedged request is still running
+                    if remaining:
+                        current = launch()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if empty_response is not None:
+            return empty_response
+
+        self._failed_searches += 1
+        raise SearchError(
+            f"All search providers failed. Last error: {last_error}",
+            provider=providers[-1].name if providers else None,
+        )
+
+    async def _timed_search(
+        self,
+        provider: SearchProvider,
+        query: str,
+        max_results: int,
+        **options: Any,
+    ) -> SearchResponse:
+        """Search one provider and record the latency of successful calls."""
+        start = time.monotonic()
+        response = await provider.search(query, max_results, **options)
+        latency_ms = (time.monotonic() - start) * 1000
+        self._latency.setdefault(provider.name, LatencyHistogram()).record(latency_ms)
+        return response
+
+    def _hedge_delay(self, provider: SearchProvider) -> float:
+        """Milliseconds to wait for a provider before starting the next one."""
+        histogram = self._latency.get(provider.name)
+        if histogram is None or histogram.count < self._hedge_min_samples:
+            return self._hedge_delay_ms
+        delay = histogram.percentile(self._hedge_percentile)
+        return delay if delay is not None else self._hedge_delay_ms
+
     def _merge_responses(
         self,
         query: str,
@@ -394,6 +643,9 @@ class SearchManager:
             "success_rate_percent": round(success_rate, 2),
             "cache_hits": self._cache_hits,
             "failover_count": self._failover_count,
+            "hedged_requests": self._hedged_requests,
+            "hedge_wins": self._hedge_wins,
+            "latency": {name: hist.get_stats() for name, hist in self._latency.items()},
             "provider_count": len(self._providers),
             "configured_providers": len(self.get_configured_providers()),
             "providers": {name: provider.get_stats() for name, provider in self._providers.items()},
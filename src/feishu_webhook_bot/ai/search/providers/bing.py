@@ -16,8 +16,7 @@ import contextlib
 from datetime import datetime
 from typing import Any
 
-import httpx
-
+from ....core.http_pool import get_http_pool
 from ....core.logger import get_logger
 from ..base import (
     SearchAuthenticationError,
@@ -128,30 +127,31 @@ class BingSearchProvider(SearchProvider):
 
         for attempt in range(self.max_retries):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(
-                        BING_WEB_URL,
-                        params=params,
-                        headers=headers,
-                    )
+                client = get_http_pool().async_client()
+                response = await client.get(
+                    BING_WEB_URL,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout,
+                )
 
-                    if response.status_code == 401:
-                        raise SearchAuthenticationError(
-                            "Invalid Bing Search API key",
-                            provider=self.name,
-                        )
-                    elif response.status_code == 429:
-                        raise SearchRateLimitError(
-                            "Bing Search rate limit exceeded",
-                            provider=self.name,
-                        )
-                    elif response.status_code != 200:
-                        raise SearchProviderError(
-                            f"Bing Search API error: {response.status_code} - {response.text}",
-                            provider=self.name,
-                        )
+                if response.status_code == 401:
+                    raise SearchAuthenticationError(
+                        "Invalid Bing Search API key",
+                        provider=self.name,
+                    )
+                elif response.status_code == 429:
+                    raise SearchRateLimitError(
+                        "Bing Search rate limit exceeded",
+                        provider=self.name,
+                    )
+                elif response.status_code != 200:
+                    raise SearchProviderError(
+                        f"Bing Search API error: {response.status_code} - {response.text}",
+                        provider=self.name,
+                    )
 
-                    data = response.json()
+                data = response.json()
 
                 # Convert to SearchResult objects
                 search_results: list[SearchResult] = []
@@ -272,30 +272,31 @@ class BingSearchProvider(SearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    BING_NEWS_URL,
-                    params=params,
-                    headers=headers,
-                )
+            client = get_http_pool().async_client()
+            response = await client.get(
+                BING_NEWS_URL,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+            )
 
-                if response.status_code == 401:
-                    raise SearchAuthenticationError(
-                        "Invalid Bing Search API key",
-                        provider=self.name,
-                    )
-                elif response.status_code == 429:
-                    raise SearchRateLimitError(
-                        "Bing Search rate limit exceeded",
-                        provider=self.name,
-                    )
-                elif response.status_code != 200:
-                    raise SearchProviderError(
-                        f"Bing News API error: {response.status_code}",
-                        provider=self.name,
-                    )
+            if response.status_code == 401:
+                raise SearchAuthenticationError(
+                    "Invalid Bing Search API key",
+                    provider=self.name,
+                )
+            elif response.status_code == 429:
+                raise SearchRateLimitError(
+                    "Bing Search rate limit exceeded",
+                    provider=self.name,
+                )
+            elif response.status_code != 200:
+                raise SearchProviderError(
+                    f"Bing News API error: {response.status_code}",
+                    provider=self.name,
+                )
 
-                data = response.json()
+            data = response.json()
 
             search_results: list[SearchResult] = []
             news_items = data.get("value", [])
@@ -391,30 +392,31 @@ class BingSearchProvider(SearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    BING_IMAGES_URL,
-                    params=params,
-                    headers=headers,
-                )
+            client = get_http_pool().async_client()
+            response = await client.get(
+                BING_IMAGES_URL,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+            )
 
-                if response.status_code == 401:
-                    raise SearchAuthenticationError(
-                        "Invalid Bing Search API key",
-                        provider=self.name,
-                    )
-                elif response.status_code == 429:
-                    raise SearchRateLimitError(
-                        "Bing Search rate limit exceeded",
-                        provider=self.name,
-                    )
-                elif response.status_code != 200:
-                    raise SearchProviderError(
-                        f"Bing Images API error: {response.status_code}",
-                        provider=self.name,
-                    )
+            if response.status_code == 401:
+                raise SearchAuthenticationError(
+                    "Invalid Bing Search API key",
+                    provider=self.name,
+                )
+            elif response.status_code == 429:
+                raise SearchRateLimitError(
+                    "Bing Search rate limit exceeded",
+                    provider=self.name,
+                )
+            elif response.status_code != 200:
+                raise SearchProviderError(
+                    f"Bing Images API error: {response.status_code}",
+                    provider=self.name,
+                )
 
-                data = response.json()
+            data = response.json()
 
             images = [
                 {
@@ -493,30 +495,31 @@ class BingSearchProvider(SearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    BING_VIDEOS_URL,
-                    params=params,
-                    headers=headers,
-                )
+            client = get_http_pool().async_client()
+            response = await client.get(
+                BING_VIDEOS_URL,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+            )
 
-                if response.status_code == 401:
-                    raise SearchAuthenticationError(
-                        "Invalid Bing Search API key",
-                        provider=self.name,
-                    )
-                elif response.status_code == 429:
-                    raise SearchRateLimitError(
-                        "Bing Search rate limit exceeded",
-                        provider=self.name,
-                    )
-                elif response.status_code != 200:
-                    raise SearchProviderError(
-                        f"Bing Videos API error: {response.status_code}",
-                        provider=self.name,
-                    )
+            if response.status_code == 401:
+                raise SearchAuthenticationError(
+                    "Invalid Bing Search API key",
+                    provider=self.name,
+                )
+            elif response.status_code == 429:
+                raise SearchRateLimitError(
+                    "Bing Search rate limit exceeded",
+                    provider=self.name,
+                )
+            elif response.status_code != 200:
+                raise SearchProviderError(
+                    f"Bing Videos API error: {response.status_code}",
+                    provider=self.name,
+                )
 
-                data = response.json()
+            data = response.json()
 
             videos = [
                 {
@@ -584,30 +587,31 @@ class BingSearchProvider(SearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    BING_ENTITIES_URL,
-                    params=params,
-                    headers=headers,
-                )
+            client = get_http_pool().async_client()
+            response = await client.get(
+                BING_ENTITIES_URL,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+            )
 
-                if response.status_code == 401:
-                    raise SearchAuthenticationError(
-                        "Invalid Bing Search API key",
-                        provider=self.name,
-                    )
-                elif response.status_code == 429:
-                    raise SearchRateLimitError(
-                        "Bing Search rate limit exceeded",
-                        provider=self.name,
-                    )
-                elif response.status_code != 200:
-                    raise SearchProviderError(
-                        f"Bing Entities API error: {response.status_code}",
-                        provider=self.name,
-                    )
+            if response.status_code == 401:
+                raise SearchAuthenticationError(
+                    "Invalid Bing Search API key",
+                    provider=self.name,
+                )
+            elif response.status_code == 429:
+                raise SearchRateLimitError(
+                    "Bing Search rate limit exceeded",
+                    provider=self.name,
+                )
+            elif response.status_code != 200:
+                raise SearchProviderError(
+                    f"Bing Entities API error: {response.status_code}",
+                    provider=self.name,
+                )
 
-                data = response.json()
+            data = response.json()
 
             entities = []
             for entity in data.get("entities", {}).get("value", []):
@@ -690,30 +694,31 @@ class BingSearchProvider(SearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    BING_SUGGESTIONS_URL,
-                    params=params,
-                    headers=headers,
-                )
+            client = get_http_pool().async_client()
+            response = await client.get(
+                BING_SUGGESTIONS_URL,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+            )
 
-                if response.status_code == 401:
-                    raise SearchAuthenticationError(
-                        "Invalid Bing Search API key",
-                        provider=self.name,
-                    )
-                elif response.status_code == 429:
-                    raise SearchRateLimitError(
-                        "Bing Search rate limit exceeded",
-                        provider=self.name,
-                    )
-                elif response.status_code != 200:
-                    raise SearchProviderError(
-                        f"Bing Suggestions API error: {response.status_code}",
-                        provider=self.name,
-                    )
+            if response.status_code == 401:
+                raise SearchAuthenticationError(
+                    "Invalid Bing Search API key",
+                    provider=self.name,
+                )
+            elif response.status_code == 429:
+                raise SearchRateLimitError(
+                    "Bing Search rate limit exceeded",
+                    provider=self.name,
+                )
+            elif response.status_code != 200:
+                raise SearchProviderError(
+                    f"Bing Suggestions API error: {response.status_code}",
+                    provider=self.name,
+                )
 
-                data = response.json()
+            data = response.json()
 
             suggestions = []
             for group in data.get("suggestionGroups", []):
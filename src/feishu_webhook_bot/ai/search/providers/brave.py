@@ -15,8 +15,7 @@ import contextlib
 from datetime import datetime
 from typing import Any
 
-import httpx
-
+from ....core.http_pool import get_http_pool
 from ....core.logger import get_logger
 from ..base import (
     SearchAuthenticationError,
@@ -126,30 +125,31 @@ class BraveSearchProvider(SearchProvider):
 
         for attempt in range(self.max_retries):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(
-                        BRAVE_WEB_URL,
-                        params=params,
-                        headers=headers,
-                    )
+                client = get_http_pool().async_client()
+                response = await client.get(
+                    BRAVE_WEB_URL,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout,
+                )
 
-                    if response.status_code == 401:
-                        raise SearchAuthenticationError(
-                            "Invalid Brave Search API key",
-                            provider=self.name,
-                        )
-                    elif response.status_code == 429:
-                        raise SearchRateLimitError(
-                            "Brave Search rate limit exceeded",
-                            provider=self.name,
-                        )
-                    elif response.status_code != 200:
-                        raise SearchProviderError(
-                            f"Brave Search API error: {response.status_code} - {response.text}",
-                            provider=self.name,
-                        )
+                if response.status_code == 401:
+                    raise SearchAuthenticationError(
+                        "Invalid Brave Search API key",
+                        provider=self.name,
+                    )
+                elif response.status_code == 429:
+                    raise SearchRateLimitError(
+                        "Brave Search rate limit exceeded",
+                        provider=self.name,
+                    )
+                elif response.status_code != 200:
+                    raise SearchProviderError(
+                        f"Brave Search API error: {response.status_code} - {response.text}",
+                        provider=self.name,
+                    )
 
-                    data = response.json()
+                data = response.json()
 
                 # Convert to SearchResult objects
                 search_results: list[SearchResult] = []
@@ -266,30 +266,31 @@ class BraveSearchProvider(SearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    BRAVE_NEWS_URL,
-                    params=params,
-                    headers=headers,
-                )
+            client = get_http_pool().async_client()
+            response = await client.get(
+                BRAVE_NEWS_URL,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+            )
 
-                if response.status_code == 401:
-                    raise SearchAuthenticationError(
-                        "Invalid Brave Search API key",
-                        provider=self.name,
-                    )
-                elif response.status_code == 429:
-                    raise SearchRateLimitError(
-                        "Brave Search rate limit exceeded",
-                        provider=self.name,
-                    )
-                elif response.status_code != 200:
-                    raise SearchProviderError(
-                        f"Brave News API error: {response.status_code}",
-                        provider=self.name,
-                    )
+            if response.status_code == 401:
+                raise SearchAuthenticationError(
+                    "Invalid Brave Search API key",
+                    provider=self.name,
+                )
+            elif response.status_code == 429:
+                raise SearchRateLimitError(
+                    "Brave Search rate limit exceeded",
+                    provider=self.name,
+                )
+            elif response.status_code != 200:
+                raise SearchProviderError(
+                    f"Brave News API error: {response.status_code}",
+                    provider=self.name,
+                )
 
-                data = response.json()
+            data = response.json()
 
             search_results: list[SearchResult] = []
             news_results = data.get("results", [])
@@ -375,30 +376,31 @@ class BraveSearchProvider(SearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    BRAVE_IMAGES_URL,
-                    params=params,
-                    headers=headers,
-                )
+            client = get_http_pool().async_client()
+            response = await client.get(
+                BRAVE_IMAGES_URL,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+            )
 
-                if response.status_code == 401:
-                    raise SearchAuthenticationError(
-                        "Invalid Brave Search API key",
-                        provider=self.name,
-                    )
-                elif response.status_code == 429:
-                    raise SearchRateLimitError(
-                        "Brave Search rate limit exceeded",
-                        provider=self.name,
-                    )
-                elif response.status_code != 200:
-                    raise SearchProviderError(
-                        f"Brave Images API error: {response.status_code}",
-                        provider=self.name,
-                    )
+            if response.status_code == 401:
+                raise SearchAuthenticationError(
+                    "Invalid Brave Search API key",
+                    provider=self.name,
+                )
+            elif response.status_code == 429:
+                raise SearchRateLimitError(
+                    "Brave Search rate limit exceeded",
+                    provider=self.name,
+                )
+            elif response.status_code != 200:
+                raise SearchProviderError(
+                    f"Brave Images API error: {response.status_code}",
+                    provider=self.name,
+                )
 
-                data = response.json()
+            data = response.json()
 
             images = [
                 {
@@ -470,30 +472,31 @@ class BraveSearchProvider(SearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(
-                    BRAVE_VIDEOS_URL,
-                    params=params,
-                    headers=headers,
-                )
+            client = get_http_pool().async_client()
+            response = await client.get(
+                BRAVE_VIDEOS_URL,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+            )
 
-                if response.status_code == 401:
-                    raise SearchAuthenticationError(
-                        "Invalid Brave Search API key",
-                        provider=self.name,
-                    )
-                elif response.status_code == 429:
-                    raise SearchRateLimitError(
-                        "Brave Search rate limit exceeded",
-                        provider=self.name,
-                    )
-                elif response.status_code != 200:
-                    raise SearchProviderError(
-                        f"Brave Videos API error: {response.status_code}",
-                        provider=self.name,
-                    )
+            if response.status_code == 401:
+                raise SearchAuthenticationError(
+                    "Invalid Brave Search API key",
+                    provider=self.name,
+                )
+            elif response.status_code == 429:
+                raise SearchRateLimitError(
+                    "Brave Search rate limit exceeded",
+                    provider=self.name,
+                )
+            elif response.status_code != 200:
+                raise SearchProviderError(
+                    f"Brave Videos API error: {response.status_code}",
+                    provider=self.name,
+                )
 
-                data = response.json()
+            data = response.json()
 
             videos = [
                 {
@@ -560,59 +563,61 @@ class BraveSearchProvider(SearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Get summary key from web search
-                response = await client.get(
-                    BRAVE_WEB_URL,
-                    params=params,
-                    headers=headers,
+            client = get_http_pool().async_client()
+            # Get summary key from web search
+            response = await client.get(
+                BRAVE_WEB_URL,
+                params=params,
+                headers=headers,
+                timeout=self.timeout,
+            )
+
+            if response.status_code != 200:
+                raise SearchProviderError(
+                    f"Brave API error: {response.status_code}",
+                    provider=self.name,
                 )
 
-                if response.status_code != 200:
-                    raise SearchProviderError(
-                        f"Brave API error: {response.status_code}",
-                        provider=self.name,
-                    )
+            data = response.json()
+            summary_key = data.get("summarizer", {}).get("key")
 
-                data = response.json()
-                summary_key = data.get("summarizer", {}).get("key")
-
-                if not summary_key:
-                    return {
-                        "summary": None,
-                        "query": query,
-                        "message": "No summary available for this query",
-                    }
-
-                # Get the actual summary
-                summarizer_headers = {
-                    "X-Subscription-Token": self.api_key,
-                    "Accept": "application/json",
-                    "Api-Version": "2024-04-23",
+            if not summary_key:
+                return {
+                    "summary": None,
+                    "query": query,
+                    "message": "No summary available for this query",
                 }
 
-                summary_response = await client.get(
-                    BRAVE_SUMMARIZER_URL,
-                    params={"key": summary_key, "entity_info": 1},
-                    headers=summarizer_headers,
-                )
-
-                if summary_response.status_code != 200:
-                    return {
-                        "summary": None,
-                        "query": query,
-                        "message": "Failed to get summary",
-                    }
+            # Get the actual summary
+            summarizer_headers = {
+                "X-Subscription-Token": self.api_key,
+                "Accept": "application/json",
+                "Api-Version": "2024-04-23",
+            }
 
-                summary_data = summary_response.json()
+            summary_response = await client.get(
+                BRAVE_SUMMARIZER_URL,
+                params={"key": summary_key, "entity_info": 1},
+                headers=summarizer_headers,
+                timeout=self.timeout,
+            )
 
+            if summary_response.status_code != 200:
                 return {
-                    "summary": summary_data.get("summary", [{}])[0].get("data"),
+                    "summary": None,
                     "query": query,
-                    "title": summary_data.get("title"),
-                    "entities": summary_data.get("entities_info", []),
+                    "message": "Failed to get summary",
                 }
 
+            summary_data = summary_response.json()
+
+            return {
+                "summary": summary_data.get("summary", [{}])[0].get("data"),
+                "query": query,
+                "title": summary_data.get("title"),
+                "entities": summary_data.get("entities_info", []),
+            }
+
         except (SearchAuthenticationError, SearchRateLimitError):
             raise
         except Exception as exc:
@@ -14,8 +14,7 @@ from __future__ import annotations
 import asyncio
 from typing import Any
 
-import httpx
-
+from ....core.http_pool import get_http_pool
 from ....core.logger import get_logger
 from ..base import (
     SearchAuthenticationError,
@@ -129,30 +128,31 @@ class ExaSearchProvider(SearchProvider):
 
         for attempt in range(self.max_retries):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(
-                        EXA_SEARCH_URL,
-                        json=payload,
-                        headers=headers,
-                    )
+                client = get_http_pool().async_client()
+                response = await client.post(
+                    EXA_SEARCH_URL,
+                    json=payload,
+                    headers=headers,
+                    timeout=self.timeout,
+                )
 
-                    if response.status_code == 401:
-                        raise SearchAuthenticationError(
-                            "Invalid Exa API key",
-                            provider=self.name,
-                        )
-                    elif response.status_code == 429:
-                        raise SearchRateLimitError(
-                            "Exa rate limit exceeded",
-                            provider=self.name,
-                        )
-                    elif response.status_code != 200:
-                        raise SearchProviderError(
-                            f"Exa API error: {response.status_code} - {response.text}",
-                            provider=self.name,
-                        )
+                if response.status_code == 401:
+                    raise SearchAuthenticationError(
+                        "Invalid Exa API key",
+                        provider=self.name,
+                    )
+                elif response.status_code == 429:
+                    raise SearchRateLimitError(
+                        "Exa rate limit exceeded",
+                        provider=self.name,
+                    )
+                elif response.status_code != 200:
+                    raise SearchProviderError(
+                        f"Exa API error: {response.status_code} - {response.text}",
+                        provider=self.name,
+                    )
 
-                    data = response.json()
+                data = response.json()
 
                 # Convert to SearchResult objects
                 search_results: list[SearchResult] = []
@@ -259,30 +259,31 @@ class ExaSearchProvider(SearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    EXA_FIND_SIMILAR_URL,
-                    json=payload,
-                    headers=headers,
-                )
+            client = get_http_pool().async_client()
+            response = await client.post(
+                EXA_FIND_SIMILAR_URL,
+                json=payload,
+                headers=headers,
+                timeout=self.timeout,
+            )
 
-                if response.status_code == 401:
-                    raise SearchAuthenticationError(
-                        "Invalid Exa API key",
-                        provider=self.name,
-                    )
-                elif response.status_code == 429:
-                    raise SearchRateLimitError(
-                        "Exa rate limit exceeded",
-                        provider=self.name,
-                    )
-                elif response.status_code != 200:
-                    raise SearchProviderError(
-                        f"Exa API error: {response.status_code}",
-                        provider=self.name,
-                    )
+            if response.status_code == 401:
+                raise SearchAuthenticationError(
+                    "Invalid Exa API key",
+                    provider=self.name,
+                )
+            elif response.status_code == 429:
+                raise SearchRateLimitError(
+                    "Exa rate limit exceeded",
+                    provider=self.name,
+                )
+            elif response.status_code != 200:
+                raise SearchProviderError(
+                    f"Exa API error: {response.status_code}",
+                    provider=self.name,
+                )
 
-                data = response.json()
+            data = response.json()
 
             search_results: list[SearchResult] = []
             for idx, item in enumerate(data.get("results", []), 1):
@@ -361,43 +362,44 @@ class ExaSearchProvider(SearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout * 2) as client:
-                response = await client.post(
-                    EXA_CONTENTS_URL,
-                    json=payload,
-                    headers=headers,
-                )
-
-                if response.status_code == 401:
-                    raise SearchAuthenticationError(
-                        "Invalid Exa API key",
-                        provider=self.name,
-                    )
-                elif response.status_code == 429:
-                    raise SearchRateLimitError(
-                        "Exa rate limit exceeded",
-                        provider=self.name,
-                    )
-                elif response.status_code != 200:
-                    raise SearchProviderError(
-                        f"Exa API error: {response.status_code}",
-                        provider=self.name,
-                    )
+            client = get_http_pool().async_client()
+            response = await client.post(
+                EXA_CONTENTS_URL,
+                json=payload,
+                headers=headers,
+                timeout=self.timeout * 2,
+            )
 
-                data = response.json()
+            if response.status_code == 401:
+                raise SearchAuthenticationError(
+                    "Invalid Exa API key",
+                    provider=self.name,
+                )
+            elif response.status_code == 429:
+                raise SearchRateLimitError(
+                    "Exa rate limit exceeded",
+                    provider=self.name,
+                )
+            elif response.status_code != 200:
+                raise SearchProviderError(
+                    f"Exa API error: {response.status_code}",
+                    provider=self.name,
+                )
 
-                return {
-                    "contents": [
-                        {
-                            "id": r.get("id"),
-                            "url": r.get("url"),
-                            "title": r.get("title"),
-                            "text": r.get("text", ""),
-                            "highlights": r.get("highlights", []),
-                        }
-                        for r in data.get("results", [])
-                    ]
-                }
+            data = response.json()
+
+            return {
+                "contents": [
+                    {
+                        "id": r.get("id"),
+                        "url": r.get("url"),
+                        "title": r.get("title"),
+                        "text": r.get("text", ""),
+                        "highlights": r.get("highlights", []),
+                    }
+                    for r in data.get("results", [])
+                ]
+            }
 
         except (SearchAuthenticationError, SearchRateLimitError):
             raise
@@ -448,43 +450,44 @@ class ExaSearchProvider(SearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout * 2) as client:
-                response = await client.post(
-                    EXA_ANSWER_URL,
-                    json=payload,
-                    headers=headers,
-                )
-
-                if response.status_code == 401:
-                    raise SearchAuthenticationError(
-                        "Invalid Exa API key",
-                        provider=self.name,
-                    )
-                elif response.status_code == 429:
-                    raise SearchRateLimitError(
-                        "Exa rate limit exceeded",
-                        provider=self.name,
-                    )
-                elif response.status_code != 200:
-                    raise SearchProviderError(
-                        f"Exa API error: {response.status_code}",
-                        provider=self.name,
-                    )
+            client = get_http_pool().async_client()
+            response = await client.post(
+                EXA_ANSWER_URL,
+                json=payload,
+                headers=headers,
+                timeout=self.timeout * 2,
+            )
 
-                data = response.json()
+            if response.status_code == 401:
+                raise SearchAuthenticationError(
+                    "Invalid Exa API key",
+                    provider=self.name,
+                )
+            elif response.status_code == 429:
+                raise SearchRateLimitError(
+                    "Exa rate limit exceeded",
+                    provider=self.name,
+                )
+            elif response.status_code != 200:
+                raise SearchProviderError(
+                    f"Exa API error: {response.status_code}",
+                    provider=self.name,
+                )
 
-                return {
-                    "answer": data.get("answer", ""),
-                    "query": query,
-                    "citations": [
-                        {
-                            "url": c.get("url"),
-                            "title": c.get("title"),
-                            "text": c.get("text", "")[:500] if c.get("text") else "",
-                        }
-                        for c in data.get("citations", [])
-                    ],
-                }
+            data = response.json()
+
+            return {
+                "answer": data.get("answer", ""),
+                "query": query,
+                "citations": [
+                    {
+                        "url": c.get("url"),
+                        "title": c.get("title"),
+                        "text": c.get("text", "")[:500] if c.get("text") else "",
+                    }
+                    for c in data.get("citations", [])
+                ],
+            }
 
         except (SearchAuthenticationError, SearchRateLimitError):
             raise
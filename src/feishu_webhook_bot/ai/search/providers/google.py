@@ -5,8 +5,7 @@ from __future__ import annotations
 import asyncio
 from typing import Any
 
-import httpx
-
+from ....core.http_pool import get_http_pool
 from ....core.logger import get_logger
 from ..base import (
     SearchAuthenticationError,
@@ -123,33 +122,33 @@ class GoogleSearchProvider(SearchProvider):
 
         for attempt in range(self.max_retries):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.get(GOOGLE_API_URL, params=params)
+                client = get_http_pool().async_client()
+                response = await client.get(GOOGLE_API_URL, params=params, timeout=self.timeout)
 
-                    if response.status_code == 401:
-                        raise SearchAuthenticationError(
-                            "Invalid Google API key",
-                            provider=self.name,
-                        )
-                    elif response.status_code == 429:
-                        raise SearchRateLimitError(
-                            "Google Custom Search rate limit exceeded",
-                            provider=self.name,
-                        )
-                    elif response.status_code == 403:
-                        error_data = response.json()
-                        error_msg = error_data.get("error", {}).get("message", "Forbidden")
-                        raise SearchAuthenticationError(
-                            f"Google API access denied: {error_msg}",
-                            provider=self.name,
-                        )
-                    elif response.status_code != 200:
-                        raise SearchProviderError(
-                            f"Google Search API error: {response.status_code} - {response.text}",
-                            provider=self.name,
-                        )
+                if response.status_code == 401:
+                    raise SearchAuthenticationError(
+                        "Invalid Google API key",
+                        provider=self.name,
+                    )
+                elif response.status_code == 429:
+                    raise SearchRateLimitError(
+                        "Google Custom Search rate limit exceeded",
+                        provider=self.name,
+                    )
+                elif response.status_code == 403:
+                    error_data = response.json()
+                    error_msg = error_data.get("error", {}).get("message", "Forbidden")
+                    raise SearchAuthenticationError(
+                        f"Google API access denied: {error_msg}",
+                        provider=self.name,
+                    )
+                elif response.status_code != 200:
+                    raise SearchProviderError(
+                        f"Google Search API error: {response.status_code} - {response.text}",
+                        provider=self.name,
+                    )
 
-                    data = response.json()
+                data = response.json()
 
                 # Convert to SearchResult objects
                 search_results: list[SearchResult] = []
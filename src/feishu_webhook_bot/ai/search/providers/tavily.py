@@ -12,8 +12,7 @@ from __future__ import annotations
 import asyncio
 from typing import Any
 
-import httpx
-
+from ....core.http_pool import get_http_pool
 from ....core.logger import get_logger
 from ..base import (
     SearchAuthenticationError,
@@ -122,26 +121,26 @@ class TavilySearchProvider(SearchProvider):
 
         for attempt in range(self.max_retries):
             try:
-                async with httpx.AsyncClient(timeout=self.timeout) as client:
-                    response = await client.post(TAVILY_SEARCH_URL, json=payload)
+                client = get_http_pool().async_client()
+                response = await client.post(TAVILY_SEARCH_URL, json=payload, timeout=self.timeout)
 
-                    if response.status_code == 401:
-                        raise SearchAuthenticationError(
-                            "Invalid Tavily API key",
-                            provider=self.name,
-                        )
-                    elif response.status_code == 429:
-                        raise SearchRateLimitError(
-                            "Tavily rate limit exceeded",
-                            provider=self.name,
-                        )
-                    elif response.status_code != 200:
-                        raise SearchProviderError(
-                            f"Tavily API error: {response.status_code} - {response.text}",
-                            provider=self.name,
-                        )
+                if response.status_code == 401:
+                    raise SearchAuthenticationError(
+                        "Invalid Tavily API key",
+                        provider=self.name,
+                    )
+                elif response.status_code == 429:
+                    raise SearchRateLimitError(
+                        "Tavily rate limit exceeded",
+                        provider=self.name,
+                    )
+                elif response.status_code != 200:
+                    raise SearchProviderError(
+                        f"Tavily API error: {response.status_code} - {response.text}",
+                        provider=self.name,
+                    )
 
-                    data = response.json()
+                data = response.json()
 
                 # Convert to SearchResult objects
                 search_results: list[SearchResult] = []
@@ -246,36 +245,36 @@ class TavilySearchProvider(SearchProvider):
             payload["exclude_domains"] = exclude_domains
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(TAVILY_SEARCH_URL, json=payload)
+            client = get_http_pool().async_client()
+            response = await client.post(TAVILY_SEARCH_URL, json=payload, timeout=self.timeout)
 
-                if response.status_code == 401:
-                    raise SearchAuthenticationError(
-                        "Invalid Tavily API key",
-                        provider=self.name,
-                    )
-                elif response.status_code == 429:
-                    raise SearchRateLimitError(
-                        "Tavily rate limit exceeded",
-                        provider=self.name,
-                    )
-                elif response.status_code != 200:
-                    raise SearchProviderError(
-                        f"Tavily API error: {response.status_code}",
-                        provider=self.name,
-                    )
+            if response.status_code == 401:
+                raise SearchAuthenticationError(
+                    "Invalid Tavily API key",
+                    provider=self.name,
+                )
+            elif response.status_code == 429:
+                raise SearchRateLimitError(
+                    "Tavily rate limit exceeded",
+                    provider=self.name,
+                )
+            elif response.status_code != 200:
+                raise SearchProviderError(
+                    f"Tavily API error: {response.status_code}",
+                    provider=self.name,
+                )
 
-                data = response.json()
+            data = response.json()
 
-                return {
-                    "answer": data.get("answer", ""),
-                    "query": query,
-                    "sources": [
-                        {"title": r.get("title"), "url": r.get("url")}
-                        for r in data.get("results", [])[:3]
-                    ],
-                    "response_time": data.get("response_time"),
-                }
+            return {
+                "answer": data.get("answer", ""),
+                "query": query,
+                "sources": [
+                    {"title": r.get("title"), "url": r.get("url")}
+                    for r in data.get("results", [])[:3]
+                ],
+                "response_time": data.get("response_time"),
+            }
 
         except (SearchAuthenticationError, SearchRateLimitError):
             raise
@@ -321,37 +320,37 @@ class TavilySearchProvider(SearchProvider):
         }
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout * 2) as client:
-                response = await client.post(TAVILY_EXTRACT_URL, json=payload)
-
-                if response.status_code == 401:
-                    raise SearchAuthenticationError(
-                        "Invalid Tavily API key",
-                        provider=self.name,
-                    )
-                elif response.status_code == 429:
-                    raise SearchRateLimitError(
-                        "Tavily rate limit exceeded",
-                        provider=self.name,
-                    )
-                elif response.status_code != 200:
-                    raise SearchProviderError(
-                        f"Tavily extract error: {response.status_code}",
-                        provider=self.name,
-                    )
+            client = get_http_pool().async_client()
+            response = await client.post(TAVILY_EXTRACT_URL, json=payload, timeout=self.timeout * 2)
 
-                data = response.json()
+            if response.status_code == 401:
+                raise SearchAuthenticationError(
+                    "Invalid Tavily API key",
+                    provider=self.name,
+                )
+            elif response.status_code == 429:
+                raise SearchRateLimitError(
+                    "Tavily rate limit exceeded",
+                    provider=self.name,
+                )
+            elif response.status_code != 200:
+                raise SearchProviderError(
+                    f"Tavily extract error: {response.status_code}",
+                    provider=self.name,
+                )
 
-                return {
-                    "results": [
-                        {
-                            "url": r.get("url"),
-                            "raw_content": r.get("raw_content", ""),
-                        }
-                        for r in data.get("results", [])
-                    ],
-                    "failed_results": data.get("failed_results", []),
-                }
+            data = response.json()
+
+            return {
+                "results": [
+                    {
+                        "url": r.get("url"),
+                        "raw_content": r.get("raw_content", ""),
+                    }
+                    for r in data.get("results", [])
+                ],
+                "failed_results": data.get("failed_results", []),
+            }
 
         except (SearchAuthenticationError, SearchRateLimitError):
             raise
@@ -137,7 +137,16 @@ class AITaskExecutor:
 
             try:
                 # Execute AI chat
-                if action.ai_structured_output:
+                if action.ai_cache_response:
+                    # Stateless and repeatable, so identical prompts hit the response cache
+                    response = await self.ai_agent.complete(
+                        prompt, system_prompt=action.ai_system_prompt
+                    )
+                    result = AITaskResult(
+                        success=True,
+                        response=response,
+                    )
+                elif action.ai_structured_output:
                     # Use structured output
                     response = await self.ai_agent.chat(user_id, prompt)
 
@@ -219,7 +228,7 @@ class AITaskExecutor:
 
         original: dict[str, Any] = {}
 
-        if action.ai_system_prompt:
+        if action.ai_system_prompt and not action.ai_cache_response:
             original["system_prompt"] = self.ai_agent.config.system_prompt
             # Note: pydantic-ai Agent doesn't support runtime system_prompt changes
             # This would require recreating the agent, which we'll skip for now
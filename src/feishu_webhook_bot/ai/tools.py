@@ -3,16 +3,16 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import json
 import re
 from collections.abc import Callable
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from duckduckgo_search import DDGS
 
 from ..core.logger import get_logger
+from .search.cache import SearchCache, configure_search_cache, get_search_cache
 
 if TYPE_CHECKING:
     from .config import WebSearchConfig
@@ -53,78 +53,8 @@ def ai_tool(
     return decorator
 
 
-# Search result cache
-class SearchCache:
-    """Simple in-memory cache for search results."""
-
-    def __init__(self, ttl_minutes: int = 60, max_size: int = 100) -> None:
-        """Initialize search cache.
-
-        Args:
-            ttl_minutes: Time-to-live for cached results in minutes
-            max_size: Maximum number of cached entries
-        """
-        self._cache: dict[str, tuple[str, datetime]] = {}
-        self._ttl = timedelta(minutes=ttl_minutes)
-        self._max_size = max_size
-        self._hits = 0
-        self._misses = 0
-
-    def _make_key(self, query: str, max_results: int) -> str:
-        """Create cache key from query and max_results."""
-        key_str = f"{query.lower().strip()}:{max_results}"
-        return hashlib.md5(key_str.encode()).hexdigest()
-
-    def get(self, query: str, max_results: int) -> str | None:
-        """Get cached result if available and not expired."""
-        key = self._make_key(query, max_results)
-        if key in self._cache:
-            result, timestamp = self._cache[key]
-            if datetime.now(UTC) - timestamp < self._ttl:
-                self._hits += 1
-                logger.debug("Cache hit for query: %s", query[:50])
-                return result
-            else:
-                # Expired, remove it
-                del self._cache[key]
-        self._misses += 1
-        return None
-
-    def set(self, query: str, max_results: int, result: str) -> None:
-        """Cache a search result."""
-        # Evict oldest entry if cache is full
-        if len(self._cache) >= self._max_size:
-            oldest_key = min(self._cache.keys(), key=lambda k: self._cache[k][1])
-            del self._cache[oldest_key]
-            logger.debug("Evicted oldest cache entry")
-
-        key = self._make_key(query, max_results)
-        self._cache[key] = (result, datetime.now(UTC))
-        logger.debug("Cached result for query: %s", query[:50])
-
-    def clear(self) -> None:
-        """Clear all cached results."""
-        self._cache.clear()
-        self._hits = 0
-        self._misses = 0
-        logger.info("Search cache cleared")
-
-    def get_stats(self) -> dict[str, Any]:
-        """Get cache statistics."""
-        total = self._hits + self._misses
-        hit_rate = (self._hits / total * 100) if total > 0 else 0
-        return {
-            "size": len(self._cache),
-            "max_size": self._max_size,
-            "hits": self._hits,
-            "misses": self._misses,
-            "hit_rate_percent": round(hit_rate, 2),
-            "ttl_minutes": self._ttl.total_seconds() / 60,
-        }
-
-
-# Global search cache instance (legacy, for backward compatibility)
-_search_cache = SearchCache(ttl_minutes=60, max_size=100)
+# Provider name under which the DuckDuckGo fallback caches its formatted results
+_LEGACY_CACHE_PROVIDER = "duckduckgo-legacy"
 
 # Global search manager instance
 _search_manager: SearchManager | None = None
@@ -191,13 +121,25 @@ def init_search_manager(config: WebSearchConfig) -> SearchManager:
         except Exception as exc:
             logger.error("Failed to initialize provider %s: %s", provider_type, exc)
 
+    cache = None
+    if config.cache_enabled:
+        cache = configure_search_cache(
+            ttl_minutes=config.cache_ttl_minutes,
+            max_size=config.cache_max_size,
+            db_path=config.cache_db_path,
+        )
+
     # Create search manager
     _search_manager = SearchManager(
         providers=providers,
+        cache=cache,
         enable_cache=config.cache_enabled,
         cache_ttl_minutes=config.cache_ttl_minutes,
         enable_failover=config.enable_failover,
         concurrent_search=config.concurrent_search,
+        hedged_search=config.hedged_search,
+        hedge_percentile=config.hedge_percentile,
+        hedge_delay_ms=config.hedge_delay_ms,
     )
 
     logger.info(
@@ -515,10 +457,13 @@ async def _legacy_web_search(
     """Legacy web search using DuckDuckGo directly.
 
     This is the fallback implementation when SearchManager is not initialized.
+    Results are cached in the shared search cache under their own provider name.
     """
+    cache: SearchCache = get_search_cache()
+
     # Check cache first
     if use_cache:
-        cached_result = _search_cache.get(query, max_results)
+        cached_result = cache.get(query, max_results, _LEGACY_CACHE_PROVIDER)
         if cached_result:
             logger.info("Returning cached results for query: %s", query[:50])
             try:
@@ -551,7 +496,7 @@ async def _legacy_web_search(
                     }
                 )
                 if use_cache:
-                    _search_cache.set(query, max_results, result)
+                    cache.set(query, max_results, result, _LEGACY_CACHE_PROVIDER)
                 return result
 
             formatted_results = []
@@ -586,7 +531,7 @@ async def _legacy_web_search(
             )
 
             if use_cache:
-                _search_cache.set(query, max_results, result)
+                cache.set(query, max_results, result, _LEGACY_CACHE_PROVIDER)
 
             return result
 
@@ -866,10 +811,13 @@ async def format_date(date_str: str, output_format: str = "iso") -> str:
 async def get_search_cache_stats() -> str:
     """Get statistics about the search cache.
 
+    The cache is shared by the search manager and the DuckDuckGo fallback,
+    so the statistics cover every web search.
+
     Returns:
         JSON string with cache statistics
     """
-    stats = _search_cache.get_stats()
+    stats = get_search_cache().get_stats()
     return json.dumps(stats, indent=2)
 
 
@@ -879,7 +827,7 @@ async def clear_search_cache() -> str:
     Returns:
         Confirmation message
     """
-    _search_cache.clear()
+    get_search_cache().clear()
     return "Search cache cleared successfully"
 
 
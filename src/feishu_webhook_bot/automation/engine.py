@@ -18,28 +18,31 @@ from functools import partial
 from string import Template
 from typing import TYPE_CHECKING, Any
 
-import httpx
-
 from ..core.config import (
     AutomationActionConfig,
     AutomationRule,
     HTTPClientConfig,
     HTTPRequestConfig,
 )
+from ..core.http_pool import get_http_pool
 from ..core.logger import get_logger
 from ..core.provider import BaseProvider
 from ..core.templates import RenderedTemplate, TemplateRegistry
 from ..scheduler import TaskScheduler
 from .actions import ActionExecutorFactory, ActionResult
+from .rule_index import CompiledCondition, RuleIndex, extract_path
 from .triggers import TriggerRegistry
 from .workflow import WorkflowOrchestrator, create_default_template_registry
 
 if TYPE_CHECKING:
     from ..ai.agent import AIAgent
+    from ..core.event_envelope import EventEnvelope
     from ..plugins.manager import PluginManager
 
 logger = get_logger("automation")
 
+_EVENT_TYPE_PATH = ("header", "event_type")
+
 
 class AutomationEngine:
     """Coordinates automation rules using the scheduler and webhook clients/providers."""
@@ -70,6 +73,7 @@ class AutomationEngine:
         self._registered_jobs: set[str] = set()
         self._execution_history: list[dict[str, Any]] = []
         self._max_history: int = 500
+        self._event_index: RuleIndex[AutomationRule] = RuleIndex()
 
         # Initialize enhanced components
         self._trigger_registry = TriggerRegistry(scheduler)
@@ -88,6 +92,8 @@ class AutomationEngine:
         # Set up nested action executor for complex actions
         self._action_factory.set_action_executor(self._execute_action_config)
 
+        self._rebuild_event_index()
+
     def _send_template_to_targets(
         self,
         template_name: str,
@@ -165,22 +171,39 @@ class AutomationEngine:
     # ------------------------------------------------------------------
     # Event handling
     # ------------------------------------------------------------------
-    def handle_event(self, event_payload: Mapping[str, Any]) -> None:
-        """Dispatch an incoming event to matching automation rules."""
+    def handle_event(
+        self, event_payload: Mapping[str, Any], envelope: EventEnvelope | None = None
+    ) -> None:
+        """Dispatch an incoming event to matching automation rules.
+
+        Args:
+            event_payload: Raw event payload
+            envelope: Shared envelope of the event; its cached event type is
+                used to look up rules instead of re-reading the payload
 
+        Only rules indexed under the event's type or one of its equality
+        condition values are evaluated; see ``reload_rules``.
+        """
+
+        event_type = (
+            envelope.event_type
+            if envelope is not None
+            else extract_path(event_payload, _EVENT_TYPE_PATH)
+        )
+        for rule in self._event_index.match(event_payload, event_type):
+            if rule.enabled:
+                self.execute_rule(rule, event_payload=event_payload)
+
+    def _rebuild_event_index(self) -> None:
+        """Compile event-triggered rules into the index used by ``handle_event``."""
+        index: RuleIndex[AutomationRule] = RuleIndex()
         for rule in self._rules:
-            if not rule.enabled or rule.trigger.type != "event":
-                continue
             event_cfg = rule.trigger.event
-            if not event_cfg:
+            if rule.trigger.type != "event" or not event_cfg:
                 continue
-            if event_cfg.event_type:
-                event_type = self._extract(event_payload, "header.event_type")
-                if event_type != event_cfg.event_type:
-                    continue
-            if not self._conditions_match(event_cfg.conditions, event_payload):
-                continue
-            self.execute_rule(rule, event_payload=event_payload)
+            conditions = [CompiledCondition.from_filter(c) for c in event_cfg.conditions]
+            index.add(rule, event_cfg.event_type, conditions)
+        self._event_index = index
 
     # ------------------------------------------------------------------
     # Core execution
@@ -493,15 +516,19 @@ class AutomationEngine:
                     payload.url,
                     attempt,
                 )
-                with httpx.Client(timeout=timeout_value) as client:
-                    response = client.request(
+                response = (
+                    get_http_pool()
+                    .sync_client()
+                    .request(
                         payload.method,
                         payload.url,
                         headers=payload.headers,
                         params=payload.params,
                         json=payload.json_body,
                         data=payload.data_body,
+                        timeout=timeout_value,
                     )
+                )
                 response.raise_for_status()
                 if "application/json" in response.headers.get("content-type", ""):
                     return response.json()
@@ -564,21 +591,6 @@ class AutomationEngine:
                 return None
         return current
 
-    def _conditions_match(
-        self,
-        conditions: list[Any],
-        payload: Mapping[str, Any],
-    ) -> bool:
-        for condition in conditions:
-            value = self._extract(payload, condition.path)
-            if condition.equals is not None and value != condition.equals:
-                return False
-            if condition.contains is not None and (
-                not isinstance(value, str) or condition.contains not in value
-            ):
-                return False
-        return True
-
     # ------------------------------------------------------------------
     # Rule management and triggering
     # ------------------------------------------------------------------
@@ -604,6 +616,54 @@ class AutomationEngine:
         """
         return list(self._rules)
 
+    def add_rule(self, rule: AutomationRule) -> None:
+        """Add a rule at runtime, registering its schedule if the engine uses one.
+
+        Args:
+            rule: Rule to add
+        """
+        self._rules.append(rule)
+        self._rebuild_event_index()
+        if self._scheduler and rule.enabled and rule.trigger.type == "schedule":
+            self._register_schedule(rule)
+
+    def remove_rule(self, rule_name: str) -> bool:
+        """Remove a rule and its scheduled job.
+
+        Args:
+            rule_name: Name of the rule to remove
+
+        Returns:
+            True if the rule was found and removed
+        """
+        remaining = [r for r in self._rules if r.name != rule_name]
+        if len(remaining) == len(self._rules):
+            return False
+        self._rules = remaining
+        self._rebuild_event_index()
+
+        job_id = f"automation.{rule_name}"
+        if self._scheduler and job_id in self._registered_jobs:
+            try:
+                self._scheduler.remove_job(job_id)
+            except Exception as exc:  # pragma: no cover - defensive cleanup
+                logger.debug("Failed to remove automation job %s: %s", job_id, exc)
+            self._registered_jobs.discard(job_id)
+        return True
+
+    def reload_rules(self, rules: list[AutomationRule] | None = None) -> None:
+        """Replace the rule set and recompile the event index.
+
+        Call this after editing the trigger of an existing rule in place;
+        enabling or disabling a rule does not require a reload.
+
+        Args:
+            rules: New rules, or None to recompile the current ones
+        """
+        if rules is not None:
+            self._rules = list(rules)
+        self._rebuild_event_index()
+
     def trigger_rule(
         self,
         rule_name: str,
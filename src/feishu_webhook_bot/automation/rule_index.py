@@ -0,0 +1,299 @@
+"""Compiled index of event-triggered automation rules.
+
+Matching an event against every rule re-splits each dotted condition path and
+re-compiles each regex on every event. This module compiles rules once, when
+they are loaded or changed, and indexes them so an event only evaluates rules
+that can possibly match:
+
+- ``CompiledCondition`` holds a pre-split path, a precompiled regex and
+  pre-converted numeric bounds
+- ``RuleIndex`` buckets rules in hash maps keyed on their event type or, for
+  rules without one, on the value of an equality condition; rules with neither
+  are kept in a small list that is always evaluated
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+from collections.abc import Hashable, Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..core.logger import get_logger
+
+logger = get_logger("automation.rule_index")
+
+# Marks an operator that is not part of a condition
+_MISSING: Any = object()
+
+
+def split_path(path: str) -> tuple[str, ...]:
+    """Split a dot-separated payload path into its parts.
+
+    Args:
+        path: Path such as ``"event.message.chat_id"``
+
+    Returns:
+        Tuple of path parts
+    """
+    return tuple(path.split("."))
+
+
+def extract_path(payload: Any, parts: tuple[str, ...]) -> Any:
+    """Extract a value from a payload using a pre-split path.
+
+    Args:
+        payload: Event payload
+        parts: Path parts returned by ``split_path``
+
+    Returns:
+        The value at the path, or None if any part is missing
+    """
+    current = payload
+    for part in parts:
+        if isinstance(current, Mapping):
+            current = current.get(part)
+        else:
+            return None
+    return current
+
+
+@dataclass(slots=True)
+class CompiledCondition:
+    """A payload condition compiled for repeated evaluation.
+
+    Operators not used by the condition are left at ``_MISSING``/None.
+    A condition whose regex or numeric bounds are invalid never matches,
+    which mirrors the behaviour of evaluating it on every event.
+    """
+
+    parts: tuple[str, ...]
+    equals: Any = _MISSING
+    contains: str | None = None
+    regex: re.Pattern[str] | None = None
+    exists: bool | None = None
+    greater_than: float | None = None
+    less_than: float | None = None
+    in_list: Any = _MISSING
+    never: bool = False
+
+    @classmethod
+    def from_mapping(cls, condition: Mapping[str, Any]) -> CompiledCondition:
+        """Compile a trigger condition dictionary.
+
+        Args:
+            condition: Mapping with ``path`` and any of ``equals``, ``contains``,
+                ``regex``, ``exists``, ``greater_than``, ``less_than`` and ``in_list``
+
+        Returns:
+            Compiled condition
+        """
+        path = str(condition.get("path", ""))
+        compiled = cls(parts=split_path(path))
+        if "equals" in condition:
+            compiled.equals = condition["equals"]
+        if "contains" in condition:
+            compiled.contains = condition["contains"]
+        if "regex" in condition:
+            try:
+                compiled.regex = re.compile(condition["regex"])
+            except (re.error, TypeError) as exc:
+                logger.warning("Invalid regex in condition on '%s': %s", path, exc)
+                compiled.never = True
+        if "exists" in condition:
+            compiled.exists = bool(condition["exists"])
+        for name in ("greater_than", "less_than"):
+            if name in condition:
+                try:
+                    setattr(compiled, name, float(condition[name]))
+                except (TypeError, ValueError):
+                    compiled.never = True
+        if "in_list" in condition:
+            compiled.in_list = _as_lookup(condition["in_list"])
+        return compiled
+
+    @classmethod
+    def from_filter(cls, condition: Any) -> CompiledCondition:
+        """Compile an ``AutomationEventFilterCondition``.
+
+        Args:
+            condition: Filter condition with ``path``, ``equals`` and ``contains``
+
+        Returns:
+            Compiled condition
+        """
+        compiled = cls(parts=split_path(condition.path), contains=condition.contains)
+        if condition.equals is not None:
+            compiled.equals = condition.equals
+        return compiled
+
+    @property
+    def indexable(self) -> bool:
+        """Whether the ``equals`` operand can serve as a hash-index key."""
+        if self.equals is _MISSING or self.never:
+            return False
+        try:
+            hash(self.equals)
+        except TypeError:
+            return False
+        return True
+
+    def matches(self, payload: Mapping[str, Any], value: Any = _MISSING) -> bool:
+        """Evaluate the condition against a payload.
+
+        Args:
+            payload: Event payload
+            value: Value at the condition path, if already extracted
+
+        Returns:
+            True if every operator of the condition is satisfied
+        """
+        if self.never:
+            return False
+        if value is _MISSING:
+            value = extract_path(payload, self.parts)
+
+        if self.equals is not _MISSING and value != self.equals:
+            return False
+        if self.contains is not None and (not isinstance(value, str) or self.contains not in value):
+            return False
+        if self.regex is not None and (
+            not isinstance(value, str) or self.regex.search(value) is None
+        ):
+            return False
+        if self.exists is not None and (value is not None) != self.exists:
+            return False
+        if self.greater_than is not None or self.less_than is not None:
+            try:
+                number = float(value)
+            except (TypeError, ValueError):
+                return False
+            if self.greater_than is not None and number <= self.greater_than:
+                return False
+            if self.less_than is not None and number >= self.less_than:
+                return False
+        if self.in_list is not _MISSING:
+            try:
+                return value in self.in_list
+            except TypeError:
+                return False
+        return True
+
+
+def _as_lookup(values: Any) -> Any:
+    """Turn an ``in_list`` operand into a set when all its items are hashable."""
+    try:
+        return frozenset(values)
+    except TypeError:
+        return values
+
+
+@dataclass(slots=True)
+class _Entry[T]:
+    """A rule stored in the index with the conditions left to evaluate."""
+
+    seq: int
+    rule: T
+    conditions: tuple[CompiledCondition, ...] = field(default_factory=tuple)
+
+
+class RuleIndex[T]:
+    """Hash index of rules keyed on event type and equality conditions.
+
+    Rules are returned in the order they were added, so dispatch order is
+    the same as scanning the rule list.
+
+    Example:
+        ```python
+        index: RuleIndex[str] = RuleIndex()
+        index.add("greet", "im.message.receive_v1", [])
+        index.match(payload, event_type="im.message.receive_v1")  # ["greet"]
+        ```
+    """
+
+    def __init__(self) -> None:
+        self._by_event_type: dict[Hashable, list[_Entry[T]]] = {}
+        self._by_value: dict[tuple[str, ...], dict[Hashable, list[_Entry[T]]]] = {}
+        self._unindexed: list[_Entry[T]] = []
+        self._size = 0
+
+    def add(
+        self,
+        rule: T,
+        event_type: str | None,
+        conditions: Sequence[CompiledCondition] = (),
+    ) -> None:
+        """Add a rule to the index.
+
+        Args:
+            rule: Rule object returned by ``match``
+            event_type: Event type the rule requires, or None to match any type
+            conditions: Compiled payload conditions that must all hold
+        """
+        seq = self._size
+        self._size += 1
+
+        entry = _Entry(seq, rule, tuple(conditions))
+        if event_type:
+            self._by_event_type.setdefault(event_type, []).append(entry)
+            return
+
+        for condition in entry.conditions:
+            if condition.indexable:
+                table = self._by_value.setdefault(condition.parts, {})
+                table.setdefault(condition.equals, []).append(entry)
+                return
+
+        self._unindexed.append(entry)
+
+    def candidates(self, payload: Mapping[str, Any], event_type: Any = None) -> Iterator[_Entry[T]]:
+        """Iterate the entries that may match an event, in insertion order.
+
+        Args:
+            payload: Event payload
+            event_type: Event type of the payload
+
+        Returns:
+            Iterator over candidate entries
+        """
+        buckets: list[list[_Entry[T]]] = []
+        if event_type is not None and self._by_event_type:
+            try:
+                bucket = self._by_event_type.get(event_type)
+            except TypeError:
+                bucket = None
+            if bucket:
+                buckets.append(bucket)
+        for parts, table in self._by_value.items():
+            try:
+                bucket = table.get(extract_path(payload, parts))
+            except TypeError:
+                continue
+            if bucket:
+                buckets.append(bucket)
+        if self._unindexed:
+            buckets.append(self._unindexed)
+
+        if len(buckets) == 1:
+            return iter(buckets[0])
+        return heapq.merge(*buckets, key=lambda entry: entry.seq)
+
+    def match(self, payload: Mapping[str, Any], event_type: Any = None) -> list[T]:
+        """Find the rules whose event type and conditions match an event.
+
+        Args:
+            payload: Event payload
+            event_type: Event type of the payload
+
+        Returns:
+            Matching rules in insertion order
+        """
+        return [
+            entry.rule
+            for entry in self.candidates(payload, event_type)
+            if all(condition.matches(payload) for condition in entry.conditions)
+        ]
+
+    def __len__(self) -> int:
+        return self._size
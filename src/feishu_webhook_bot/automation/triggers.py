@@ -6,7 +6,6 @@ This module provides various trigger types that can initiate automation workflow
 from __future__ import annotations
 
 import hashlib
-import re
 import threading
 import time
 from abc import ABC, abstractmethod
@@ -17,12 +16,15 @@ from enum import Enum
 from typing import TYPE_CHECKING, Any
 
 from ..core.logger import get_logger
+from .rule_index import CompiledCondition, RuleIndex, extract_path
 
 if TYPE_CHECKING:
     from ..scheduler import TaskScheduler
 
 logger = get_logger("automation.triggers")
 
+_EVENT_TYPE_PATH = ("header", "event_type")
+
 
 class TriggerType(str, Enum):
     """Supported trigger types."""
@@ -210,6 +212,9 @@ class EventTrigger(BaseTrigger):
         super().__init__(rule_name, config, callback)
         self.event_type = config.get("event_type")
         self.conditions = config.get("conditions", [])
+        self.compiled_conditions = tuple(
+            CompiledCondition.from_mapping(condition) for condition in self.conditions
+        )
 
     def start(self) -> None:
         """Event triggers are passive - they respond to events."""
@@ -234,12 +239,12 @@ class EventTrigger(BaseTrigger):
         """
         # Check event type if specified
         if self.event_type:
-            event_type = self._extract(event_payload, "header.event_type")
+            event_type = extract_path(event_payload, _EVENT_TYPE_PATH)
             if event_type != self.event_type:
                 return False
 
         # Check all conditions
-        return all(self._check_condition(condition, event_payload) for condition in self.conditions)
+        return all(condition.matches(event_payload) for condition in self.compiled_conditions)
 
     def handle_event(self, event_payload: Mapping[str, Any]) -> bool:
         """Handle an incoming event if it matches.
@@ -252,7 +257,15 @@ class EventTrigger(BaseTrigger):
         """
         if not self.matches(event_payload):
             return False
+        self.fire(event_payload)
+        return True
+
+    def fire(self, event_payload: Mapping[str, Any]) -> None:
+        """Trigger the rule for an event already known to match.
 
+        Args:
+            event_payload: The incoming event payload
+        """
         context = TriggerContext(
             trigger_type=self.trigger_type,
             trigger_id=f"{self.rule_name}_{int(time.time())}",
@@ -263,7 +276,6 @@ class EventTrigger(BaseTrigger):
             },
         )
         self.trigger(context)
-        return True
 
     def _extract(self, payload: Mapping[str, Any], path: str) -> Any:
         """Extract a value from the payload using dot notation."""
@@ -277,51 +289,7 @@ class EventTrigger(BaseTrigger):
 
     def _check_condition(self, condition: Mapping[str, Any], payload: Mapping[str, Any]) -> bool:
         """Check a single condition against the payload."""
-        path = condition.get("path", "")
-        value = self._extract(payload, path)
-
-        # Check equals
-        if "equals" in condition and value != condition["equals"]:
-            return False
-
-        # Check contains
-        if "contains" in condition and (
-            not isinstance(value, str) or condition["contains"] not in value
-        ):
-            return False
-
-        # Check regex
-        if "regex" in condition:
-            if not isinstance(value, str):
-                return False
-            try:
-                if not re.search(condition["regex"], value):
-                    return False
-            except re.error:
-                return False
-
-        # Check exists
-        if "exists" in condition and (value is not None) != condition["exists"]:
-            return False
-
-        # Check greater_than
-        if "greater_than" in condition:
-            try:
-                if float(value) <= float(condition["greater_than"]):
-                    return False
-            except (TypeError, ValueError):
-                return False
-
-        # Check less_than
-        if "less_than" in condition:
-            try:
-                if float(value) >= float(condition["less_than"]):
-                    return False
-            except (TypeError, ValueError):
-                return False
-
-        # Check in_list
-        return not ("in_list" in condition and value not in condition["in_list"])
+        return CompiledCondition.from_mapping(condition).matches(payload)
 
 
 class WebhookTrigger(BaseTrigger):
@@ -612,6 +580,7 @@ class TriggerRegistry:
         self.scheduler = scheduler
         self._triggers: dict[str, BaseTrigger] = {}
         self._event_triggers: list[EventTrigger] = []
+        self._event_index: RuleIndex[EventTrigger] = RuleIndex()
         self._webhook_triggers: dict[str, WebhookTrigger] = {}
         self._chain_triggers: dict[str, list[ChainTrigger]] = {}
         self._lock = threading.Lock()
@@ -651,6 +620,7 @@ class TriggerRegistry:
             trigger = EventTrigger(rule_name, event_config, callback)
             with self._lock:
                 self._event_triggers.append(trigger)
+                self._event_index.add(trigger, trigger.event_type, trigger.compiled_conditions)
 
         elif trigger_type_enum == TriggerType.WEBHOOK:
             webhook_config = trigger_config.get("webhook", {})
@@ -702,6 +672,7 @@ class TriggerRegistry:
             # Clean up from type-specific registries
             if isinstance(trigger, EventTrigger):
                 self._event_triggers = [t for t in self._event_triggers if t.rule_name != rule_name]
+                self._rebuild_event_index()
             elif isinstance(trigger, WebhookTrigger):
                 self._webhook_triggers = {
                     k: v for k, v in self._webhook_triggers.items() if v.rule_name != rule_name
@@ -728,12 +699,21 @@ class TriggerRegistry:
         Returns:
             List of rule names that were triggered
         """
+        event_type = extract_path(event_payload, _EVENT_TYPE_PATH)
         triggered_rules = []
-        for trigger in self._event_triggers:
-            if trigger.enabled and trigger.handle_event(event_payload):
+        for trigger in self._event_index.match(event_payload, event_type):
+            if trigger.enabled:
+                trigger.fire(event_payload)
                 triggered_rules.append(trigger.rule_name)
         return triggered_rules
 
+    def _rebuild_event_index(self) -> None:
+        """Recompile the event trigger index (caller holds the lock)."""
+        index: RuleIndex[EventTrigger] = RuleIndex()
+        for trigger in self._event_triggers:
+            index.add(trigger, trigger.event_type, trigger.compiled_conditions)
+        self._event_index = index
+
     def handle_webhook(
         self,
         path: str,
@@ -845,6 +825,7 @@ class TriggerRegistry:
                     )
             self._triggers.clear()
             self._event_triggers.clear()
+            self._event_index = RuleIndex()
             self._webhook_triggers.clear()
             self._chain_triggers.clear()
 
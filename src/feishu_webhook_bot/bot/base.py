@@ -14,6 +14,9 @@ if TYPE_CHECKING:
     from ..core import BotConfig, FeishuWebhookClient
     from ..core.config_watcher import ConfigWatcher
     from ..core.event_server import EventServer
+    from ..core.feishu_token import FeishuTokenService
+    from ..core.http_pool import HTTPClientPool
+    from ..core.image_cache import ImageKeyCache
     from ..core.message_bridge import MessageBridgeEngine
     from ..core.message_queue import MessageQueue
     from ..core.message_tracker import MessageTracker
@@ -34,6 +37,15 @@ class BotBase:
     # Configuration
     config: BotConfig
 
+    # Shared HTTP connection pool
+    http_pool: HTTPClientPool | None
+
+    # Shared Feishu tenant token service
+    token_service: FeishuTokenService | None
+
+    # Shared cache of uploaded image keys
+    image_cache: ImageKeyCache | None
+
     # Webhook clients (legacy)
     clients: dict[str, FeishuWebhookClient]
     client: FeishuWebhookClient | None
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Coroutine
 from typing import TYPE_CHECKING, Any
 
 from ..core import get_logger
-from ..core.message_handler import IncomingMessage
+from ..core.event_envelope import EventEnvelope
+from ..core.message_handler import IncomingMessage, MessageParser
 from ..core.message_parsers import FeishuMessageParser, QQMessageParser
 from ..providers.qq_event_handler import QQEventHandler
 
@@ -22,6 +24,11 @@ class EventHandlerMixin:
     # QQ event handler instance (lazily initialized)
     _qq_event_handler: QQEventHandler | None = None
 
+    # Message parsers keyed by the bot identities they were built for
+    _message_parsers: (
+        tuple[tuple[str | None, str | None], FeishuMessageParser, QQMessageParser] | None
+    ) = None
+
     def _get_qq_event_handler(self: BotBase) -> QQEventHandler:
         """Get or create QQ event handler."""
         if self._qq_event_handler is None:
@@ -34,24 +41,49 @@ class EventHandlerMixin:
             self._qq_event_handler = QQEventHandler(bot_qq=bot_qq)
         return self._qq_event_handler
 
+    def _schedule_coroutine(self: BotBase, coro: Coroutine[Any, Any, Any]) -> Any:
+        """Schedule async follow-up work for an event.
+
+        Event handlers may run in the event server's handler thread pool, or
+        in a provider's WebSocket handler threads, where there is no running
+        loop; their coroutines are then submitted to the loop serving the
+        event server or, without one, to a provider's event loop.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            loop = getattr(getattr(self, "event_server", None), "loop", None)
+            if isinstance(loop, asyncio.AbstractEventLoop) and loop.is_running():
+                return asyncio.run_coroutine_threadsafe(coro, loop)
+            for provider in (getattr(self, "providers", None) or {}).values():
+                loop = getattr(provider, "event_loop", None)
+                if isinstance(loop, asyncio.AbstractEventLoop) and loop.is_running():
+                    return asyncio.run_coroutine_threadsafe(coro, loop)
+        return asyncio.create_task(coro)
+
     def _handle_incoming_event(self: BotBase, payload: dict[str, Any]) -> None:
-        """Handle inbound events from the event server."""
-        logger.debug("Handling incoming event: %s", payload.get("type", "unknown"))
+        """Handle inbound events from the event server.
+
+        The payload is wrapped in a single ``EventEnvelope`` shared by every
+        consumer, so it is parsed into an ``IncomingMessage`` at most once.
+        """
+        envelope = self._build_envelope(payload)
+        logger.debug("Handling incoming event: %s", envelope.event_type or "unknown")
 
         # Check for QQ notice/request events
-        provider = payload.get("_provider", "")
+        provider = envelope.provider
         post_type = payload.get("post_type", "")
 
         if provider in ("napcat", "qq") or post_type in ("notice", "request"):
-            asyncio.create_task(self._handle_qq_event(payload))
+            self._schedule_coroutine(self._handle_qq_event(payload))
 
         # Handle AI chat messages via ChatController if available
-        if self.chat_controller and self._is_chat_message(payload):
+        if self.chat_controller and envelope.is_chat_message:
             try:
                 # Parse message from payload and route to chat controller
-                message = self._parse_incoming_message(payload)
+                message = envelope.message
                 if message:
-                    asyncio.create_task(self.chat_controller.handle_incoming(message))
+                    self._schedule_coroutine(self.chat_controller.handle_incoming(message))
                     logger.debug("Message routed to chat controller")
                     # Note: Plugin and automation dispatch still happens below for
                     # backward compatibility and non-message event handling
@@ -60,30 +92,30 @@ class EventHandlerMixin:
             except Exception as exc:
                 logger.error("Chat controller message handling failed: %s", exc, exc_info=True)
         # Fallback to old AI chat handler if no chat controller
-        elif self.ai_agent and self._is_chat_message(payload):
+        elif self.ai_agent and envelope.is_chat_message:
             try:
-                asyncio.create_task(self._handle_ai_chat(payload))
+                self._schedule_coroutine(self._handle_ai_chat(payload))
             except Exception as exc:
                 logger.error("AI chat handling failed: %s", exc, exc_info=True)
 
         if self.plugin_manager:
             try:
-                self.plugin_manager.dispatch_event(payload, context={})
+                self.plugin_manager.dispatch_event(payload, context={"envelope": envelope})
             except Exception as exc:
                 logger.error("Plugin event dispatch failed: %s", exc, exc_info=True)
 
         if self.automation_engine:
             try:
-                self.automation_engine.handle_event(payload)
+                self.automation_engine.handle_event(payload, envelope=envelope)
             except Exception as exc:
                 logger.error("Automation event handling failed: %s", exc, exc_info=True)
 
         # Handle message bridge forwarding
         if self.message_bridge and self.message_bridge.is_running():
             try:
-                message = self._parse_incoming_message(payload)
+                message = envelope.message
                 if message:
-                    asyncio.create_task(self.message_bridge.handle_message(message))
+                    self._schedule_coroutine(self.message_bridge.handle_message(message))
                     logger.debug("Message routed to bridge engine")
             except Exception as exc:
                 logger.error("Message bridge handling failed: %s", exc, exc_info=True)
@@ -264,6 +296,61 @@ class EventHandlerMixin:
             online = status.get("online", False)
             logger.debug("QQ heartbeat: online=%s", online)
 
+    def _get_message_parsers(self: BotBase, provider: str) -> list[MessageParser]:
+        """Get the platform parsers to try for a provider.
+
+        Parser instances are built once and reused until the configured bot
+        identities change.
+
+        Args:
+            provider: Provider marker set by the event server ("" if unknown)
+
+        Returns:
+            Parsers to try in order
+        """
+        # Get bot_open_id from provider config if available
+        bot_open_id = None
+        bot_qq = None
+        for p_config in self.config.providers or []:
+            if p_config.provider_type == "napcat" and bot_qq is None:
+                bot_qq = getattr(p_config, "bot_qq", None)
+            # In a real implementation, bot_open_id would be obtained from the Feishu API
+
+        identities = (bot_open_id, bot_qq)
+        cached = self._message_parsers
+        if cached is None or cached[0] != identities:
+            cached = (
+                identities,
+                FeishuMessageParser(bot_open_id=bot_open_id),
+                QQMessageParser(bot_qq=bot_qq),
+            )
+            self._message_parsers = cached
+        _, feishu_parser, qq_parser = cached
+
+        parsers: list[MessageParser] = []
+        if provider == "feishu" or not provider:
+            parsers.append(feishu_parser)
+        if provider in ("napcat", "qq") or not provider:
+            parsers.append(qq_parser)
+        return parsers
+
+    def _build_envelope(self: BotBase, payload: dict[str, Any]) -> EventEnvelope:
+        """Wrap an inbound payload in an envelope shared by all consumers.
+
+        Args:
+            payload: Event payload from webhook
+
+        Returns:
+            EventEnvelope whose message is parsed on first access
+        """
+        provider = payload.get("_provider", "")
+        return EventEnvelope(
+            payload,
+            parsers=self._get_message_parsers(provider),
+            parse=self._parse_legacy_message,
+            provider=provider,
+        )
+
     def _parse_incoming_message(self: BotBase, payload: dict[str, Any]) -> IncomingMessage | None:
         """Parse event payload into a unified IncomingMessage.
 
@@ -271,6 +358,9 @@ class EventHandlerMixin:
         - FeishuMessageParser for Feishu events
         - QQMessageParser for OneBot11/Napcat events
 
+        Prefer ``_build_envelope`` when the message is needed by more than one
+        consumer.
+
         Args:
             payload: Event payload from webhook
 
@@ -278,43 +368,21 @@ class EventHandlerMixin:
             IncomingMessage instance or None if parsing fails
         """
         try:
-            # Determine platform from payload marker (set by event_server)
-            provider = payload.get("_provider", "")
-
-            # Try Feishu parser
-            if provider == "feishu" or not provider:
-                # Get bot_open_id from provider config if available
-                bot_open_id = None
-                for p_config in self.config.providers or []:
-                    if p_config.provider_type == "feishu":
-                        api_config = getattr(p_config, "api", None)
-                        if api_config:
-                            # In a real implementation, bot_open_id would be obtained from API
-                            pass
-                        break
-
-                feishu_parser = FeishuMessageParser(bot_open_id=bot_open_id)
-                if feishu_parser.can_parse(payload):
-                    message = feishu_parser.parse(payload)
-                    if message:
-                        return message
-
-            # Try QQ parser
-            if provider == "napcat" or provider == "qq" or not provider:
-                # Get bot_qq from provider config
-                bot_qq = None
-                for p_config in self.config.providers or []:
-                    if p_config.provider_type == "napcat":
-                        bot_qq = getattr(p_config, "bot_qq", None)
-                        break
-
-                qq_parser = QQMessageParser(bot_qq=bot_qq)
-                if qq_parser.can_parse(payload):
-                    message = qq_parser.parse(payload)
-                    if message:
-                        return message
-
-            # Fallback: Try basic Feishu structure for backward compatibility
+            return self._build_envelope(payload).message
+        except Exception as e:
+            logger.debug("Failed to parse incoming message: %s", e, exc_info=True)
+            return None
+
+    def _parse_legacy_message(self: BotBase, payload: dict[str, Any]) -> IncomingMessage | None:
+        """Parse the basic Feishu message structure kept for backward compatibility.
+
+        Args:
+            payload: Event payload from webhook
+
+        Returns:
+            IncomingMessage instance or None if the payload is not a basic message
+        """
+        try:
             event_type = payload.get("type")
             if event_type == "message":
                 event = payload.get("event", payload)
@@ -351,22 +419,7 @@ class EventHandlerMixin:
         Returns:
             True if this is a chat message
         """
-        # Check for Feishu message event structure
-        event_type = payload.get("type")
-        if event_type == "message":
-            return True
-
-        # Check for nested event structure (Feishu v2.0)
-        header = payload.get("header", {})
-        if header.get("event_type") == "im.message.receive_v1":
-            return True
-
-        event = payload.get("event", {})
-        if event.get("type") == "message":
-            return True
-
-        # Check for QQ/OneBot11 message event structure
-        return payload.get("post_type") == "message"
+        return EventEnvelope(payload).is_chat_message
 
     async def _handle_ai_chat(self: BotBase, payload: dict[str, Any]) -> None:
         """Handle AI chat message.
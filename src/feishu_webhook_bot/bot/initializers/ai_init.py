@@ -8,6 +8,7 @@ from ...chat.controller import ChatConfig, create_chat_controller
 from ...core import get_logger
 
 if TYPE_CHECKING:
+    from ...providers.feishu.api import FeishuOpenAPI
     from ..base import BotBase
 
 logger = get_logger("bot.init.ai")
@@ -74,6 +75,7 @@ class AIInitializerMixin:
                     conversation_store = PersistentConversationManager(
                         db_url=persistence_config.database_url,
                         echo=False,
+                        history_cache_size=persistence_config.history_cache_size,
                     )
                 except Exception as exc:
                     logger.error(
@@ -89,7 +91,30 @@ class AIInitializerMixin:
                 config=chat_config,
                 available_models=available_models,
                 conversation_store=conversation_store,
+                feishu_api=self._create_feishu_api() if chat_config.stream_replies else None,
             )
             logger.info("Chat controller initialized")
         except Exception as e:
             logger.error("Failed to initialize chat controller: %s", e, exc_info=True)
+
+    def _create_feishu_api(self: BotBase) -> FeishuOpenAPI | None:
+        """Create the Open Platform client used to stream replies into Feishu cards.
+
+        Returns:
+            Client for the first Feishu provider with ``api`` enabled, or None
+        """
+        for provider_config in self.config.providers or []:
+            api_config = provider_config.api
+            if provider_config.provider_type != "feishu" or not api_config:
+                continue
+            if api_config.enabled and api_config.app_id and api_config.app_secret:
+                from ...providers.feishu.api import FeishuOpenAPI
+
+                logger.info("Streaming Feishu replies via app %s", api_config.app_id)
+                return FeishuOpenAPI(api_config.app_id, api_config.app_secret)
+
+        logger.warning(
+            "Streaming replies need a Feishu provider with 'api' enabled; "
+            "Feishu replies will be sent when complete"
+        )
+        return None
@@ -6,7 +6,10 @@ import unittest.mock as _mock
 from typing import TYPE_CHECKING, Any
 
 from ...core import FeishuWebhookClient, get_logger
-from ...core.config import WebhookConfig
+from ...core.config import FeishuTokenConfig, HTTPClientConfig, ImageCacheConfig, WebhookConfig
+from ...core.feishu_token import configure_token_service, get_token_service
+from ...core.http_pool import configure_http_pool, get_http_pool
+from ...core.image_cache import configure_image_key_cache, get_image_key_cache
 
 if TYPE_CHECKING:
     from ..base import BotBase
@@ -17,6 +20,30 @@ logger = get_logger("bot.init.client")
 class ClientInitializerMixin:
     """Mixin for webhook client initialization."""
 
+    def _init_http_pool(self: BotBase) -> None:
+        """Set up the shared HTTP connection pool from the ``http`` section."""
+        http_config = getattr(self.config, "http", None)
+        if isinstance(http_config, HTTPClientConfig):
+            self.http_pool = configure_http_pool(http_config)
+        else:
+            self.http_pool = get_http_pool()
+
+    def _init_token_service(self: BotBase) -> None:
+        """Set up the shared Feishu tenant token service from ``feishu_tokens``."""
+        token_config = getattr(self.config, "feishu_tokens", None)
+        if isinstance(token_config, FeishuTokenConfig):
+            self.token_service = configure_token_service(token_config)
+        else:
+            self.token_service = get_token_service()
+
+    def _init_image_cache(self: BotBase) -> None:
+        """Set up the shared image key cache from ``image_cache``."""
+        cache_config = getattr(self.config, "image_cache", None)
+        if isinstance(cache_config, ImageCacheConfig):
+            self.image_cache = configure_image_key_cache(cache_config)
+        else:
+            self.image_cache = get_image_key_cache()
+
     def _init_clients(self: BotBase) -> None:
         """Initialize webhook clients for all configured webhooks."""
         webhooks = self.config.webhooks or []
@@ -45,6 +72,8 @@ class ClientInitializerMixin:
                     client_kwargs["timeout"] = webhook.timeout
                 if webhook.retry is not None:
                     client_kwargs["retry"] = webhook.retry
+                if self.http_pool is not None:
+                    client_kwargs["http_client"] = self.http_pool.sync_client()
 
                 client_obj = FeishuWebhookClient(webhook, **client_kwargs)
 
@@ -6,8 +6,9 @@ from typing import TYPE_CHECKING
 
 from ...core import get_logger
 from ...core.message_bridge import MessageBridgeEngine
-from ...core.message_queue import MessageQueue
+from ...core.message_queue import DeliveryRateLimiter, MessageQueue
 from ...core.message_tracker import MessageTracker
+from ...core.queue_store import MessageQueueStore
 
 if TYPE_CHECKING:
     from ..base import BotBase
@@ -40,6 +41,8 @@ class MessagingInitializerMixin:
                 max_history=max_history,
                 cleanup_interval=cleanup_interval,
                 db_path=db_path,
+                flush_interval=getattr(tracking_config, "flush_interval", 0.05),
+                max_batch=getattr(tracking_config, "max_batch", 500),
             )
             logger.info(
                 "Message tracker initialized (db_path=%s, max_history=%d)",
@@ -71,17 +74,37 @@ class MessagingInitializerMixin:
             max_batch_size = getattr(queue_config, "max_batch_size", 10)
             retry_delay = getattr(queue_config, "retry_delay", 5.0)
             max_retries = getattr(queue_config, "max_retries", 3)
+            max_concurrency = getattr(queue_config, "max_concurrency", 8)
+            db_path = getattr(queue_config, "db_path", None)
+
+            store = None
+            if db_path:
+                store = MessageQueueStore(
+                    db_path,
+                    flush_interval=getattr(queue_config, "flush_interval", 0.05),
+                    compact_interval=getattr(queue_config, "compact_interval", 300.0),
+                )
+
+            rate_limits = getattr(queue_config, "rate_limits", None)
+            rate_limiter = DeliveryRateLimiter.from_config(rate_limits) if rate_limits else None
 
             self.message_queue = MessageQueue(
                 providers=self.providers,
                 max_batch_size=max_batch_size,
                 retry_delay=retry_delay,
                 max_retries=max_retries,
+                max_concurrency=max_concurrency,
+                store=store,
+                rate_limiter=rate_limiter,
             )
             logger.info(
-                "Message queue initialized (batch_size=%d, max_retries=%d)",
+                "Message queue initialized (batch_size=%d, max_retries=%d, concurrency=%d, "
+                "db_path=%s, rate_limited_providers=%s)",
                 max_batch_size,
                 max_retries,
+                max_concurrency,
+                db_path or "in-memory",
+                sorted(rate_limits or {}),
             )
         except Exception as exc:
             logger.error("Failed to initialize message queue: %s", exc, exc_info=True)
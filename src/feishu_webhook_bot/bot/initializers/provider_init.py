@@ -202,12 +202,16 @@ class ProviderInitializerMixin:
                     # QQ-specific configurations
                     bot_qq=getattr(config, "bot_qq", None),
                     enable_ai_voice=getattr(config, "enable_ai_voice", False),
+                    websocket=getattr(config, "websocket", None),
                 )
                 provider = NapcatProvider(
                     napcat_config,
                     message_tracker=self.message_tracker,
                     circuit_breaker_config=cb_config,
                 )
+                if napcat_config.websocket is not None:
+                    # Events arrive on the WebSocket instead of the event server
+                    provider.set_event_handler(self._handle_incoming_event)
                 logger.info(
                     "NapcatProvider initialized: name=%s, bot_qq=%s",
                     config.name,
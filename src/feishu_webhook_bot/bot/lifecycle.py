@@ -21,14 +21,16 @@ class LifecycleMixin:
     async def _run_message_queue_processor(self: BotBase) -> None:
         """Run message queue processor in background loop.
 
-        This method runs continuously while the bot is running,
-        processing queued messages with error handling and backoff.
+        This method runs continuously while the bot is running. Between runs it
+        sleeps until a message is enqueued or the earliest delayed retry becomes
+        due, rather than polling on a fixed interval.
         """
         while self._running:
             try:
-                if self.message_queue:
-                    await self.message_queue.process_queue()
-                await asyncio.sleep(1.0)  # Process interval
+                if not self.message_queue:
+                    break
+                await self.message_queue.process_queue()
+                await self.message_queue.wait_for_work()
             except asyncio.CancelledError:
                 logger.info("Message queue processor cancelled")
                 break
@@ -317,14 +319,16 @@ class LifecycleMixin:
             if self._message_queue_task:
                 try:
                     self._message_queue_task.cancel()
+                    if self.message_queue:
+                        self.message_queue.close()
                     logger.info("Message queue processor stopped")
                 except Exception as exc:
                     logger.error("Failed to stop message queue: %s", exc, exc_info=True)
 
-            # Stop message tracker cleanup thread
+            # Stop message tracker cleanup thread and commit pending writes
             if self.message_tracker:
                 try:
-                    self.message_tracker.stop_cleanup()
+                    self.message_tracker.close()
                     logger.info("Message tracker stopped")
                 except Exception as exc:
                     logger.error("Failed to stop message tracker: %s", exc, exc_info=True)
@@ -344,6 +348,30 @@ class LifecycleMixin:
                 except Exception as exc:
                     logger.error("Error closing client %s: %s", name, exc, exc_info=True)
 
+            # Stop background token refreshes
+            token_service = getattr(self, "token_service", None)
+            if token_service is not None:
+                try:
+                    token_service.close()
+                except Exception as exc:
+                    logger.error("Error closing token service: %s", exc, exc_info=True)
+
+            # Commit pending image key cache writes
+            image_cache = getattr(self, "image_cache", None)
+            if image_cache is not None:
+                try:
+                    image_cache.close()
+                except Exception as exc:
+                    logger.error("Error closing image key cache: %s", exc, exc_info=True)
+
+            # Close the shared HTTP connection pool
+            http_pool = getattr(self, "http_pool", None)
+            if http_pool is not None:
+                try:
+                    http_pool.close()
+                except Exception as exc:
+                    logger.error("Error closing HTTP connection pool: %s", exc, exc_info=True)
+
         except Exception as exc:
             logger.error("Error stopping bot: %s", exc, exc_info=True)
         finally:
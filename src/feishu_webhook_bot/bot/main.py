@@ -120,6 +120,9 @@ class FeishuBot(
         self._setup_logging()
 
         # Initialize components
+        self.http_pool: Any = None
+        self.token_service: Any = None
+        self.image_cache: Any = None
         self.clients: dict[str, Any] = {}
         self.client: Any = None  # for backward compatibility
         self.providers: dict[str, Any] = {}  # New multi-provider support
@@ -144,6 +147,9 @@ class FeishuBot(
 
         # Eagerly initialize core components
         try:
+            self._init_http_pool()
+            self._init_token_service()
+            self._init_image_cache()
             self._init_clients()
         except Exception as exc:
             logger.error("Failed to initialize webhook clients: %s", exc, exc_info=True)
@@ -9,8 +9,17 @@ Key components:
 - ChatConfig: Configuration for chat behavior
 - ChatContext: Runtime context for a message interaction
 - create_chat_controller: Factory function for creating configured controllers
+- FeishuCardStream / ChunkedTextStream: Progressive delivery of streamed AI replies
 """
 
 from .controller import ChatConfig, ChatController, create_chat_controller
+from .streaming import ChunkedTextStream, FeishuCardStream, ReplyStream
 
-__all__ = ["ChatController", "ChatConfig", "create_chat_controller"]
+__all__ = [
+    "ChatController",
+    "ChatConfig",
+    "create_chat_controller",
+    "ReplyStream",
+    "FeishuCardStream",
+    "ChunkedTextStream",
+]
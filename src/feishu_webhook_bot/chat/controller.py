@@ -15,20 +15,24 @@ Key features:
 from __future__ import annotations
 
 import asyncio
+import logging
+import time
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from pydantic import BaseModel, Field
 
-from ..core.logger import get_logger
+from ..core.logger import get_logger, log_fields
 from ..core.message_handler import IncomingMessage, get_user_key
-from ..core.provider import BaseProvider, SendResult
+from ..core.provider import BaseProvider, SendResult, send_async
+from .streaming import ChunkedTextStream, FeishuCardStream, ReplyStream
 
 if TYPE_CHECKING:
     from ..ai.agent import AIAgent
     from ..ai.commands import CommandHandler
     from ..ai.conversation_store import PersistentConversationManager
+    from ..providers.feishu.api import FeishuOpenAPI
 
 logger = get_logger("chat_controller")
 
@@ -47,6 +51,9 @@ class ChatConfig(BaseModel):
         max_message_length: Maximum length for response messages
         typing_indicator: Send typing indicator while processing (if supported)
         error_message: Default error message to send on failures
+        stream_replies: Show AI replies while they are generated
+        stream_update_interval: Minimum seconds between updates of a streamed Feishu card
+        stream_chunk_chars: Minimum characters per message when streaming to QQ
     """
 
     enabled: bool = Field(default=True, description="Enable chat functionality")
@@ -69,6 +76,21 @@ class ChatConfig(BaseModel):
         default="抱歉，处理您的消息时出现了问题，请稍后重试。",
         description="Error message to send on failure",
     )
+    stream_replies: bool = Field(
+        default=False,
+        description="Stream AI replies: update a Feishu card in place, send QQ replies "
+        "sentence by sentence",
+    )
+    stream_update_interval: float = Field(
+        default=1.0,
+        ge=0.2,
+        description="Minimum seconds between updates of a streamed Feishu card",
+    )
+    stream_chunk_chars: int = Field(
+        default=80,
+        ge=1,
+        description="Minimum characters per message when streaming replies to QQ",
+    )
 
 
 @dataclass
@@ -158,6 +180,7 @@ class ChatController:
         providers: dict[str, BaseProvider] | None = None,
         config: ChatConfig | None = None,
         conversation_store: PersistentConversationManager | None = None,
+        feishu_api: FeishuOpenAPI | None = None,
     ):
         """Initialize chat controller.
 
@@ -167,6 +190,8 @@ class ChatController:
             providers: Dict of platform providers {platform: provider}
             config: Chat configuration
             conversation_store: Persistent conversation storage
+            feishu_api: Feishu Open Platform client, used to stream replies into
+                updatable cards
 
         Raises:
             ValueError: If neither ai_agent nor command_handler is provided
@@ -176,6 +201,7 @@ class ChatController:
         self.providers = providers or {}
         self.config = config or ChatConfig()
         self.conversation_store = conversation_store
+        self.feishu_api = feishu_api
 
         if self.ai_agent is not None and hasattr(self.ai_agent, "set_conversation_store"):
             self.ai_agent.set_conversation_store(conversation_store)
@@ -291,12 +317,16 @@ class ChatController:
             )
             return
 
-        logger.debug(
-            "Handling incoming message: id=%s, platform=%s, from=%s",
-            message.id,
-            message.platform,
-            message.sender_id,
-        )
+        started = time.perf_counter()
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Handling incoming message: id=%s, platform=%s, from=%s",
+                message.id,
+                message.platform,
+                message.sender_id,
+                extra=log_fields(message.platform, message.chat_id, message.id),
+            )
 
         # Check if chat is enabled
         if not self.config.enabled:
@@ -355,9 +385,22 @@ class ChatController:
                 "Error processing message: %s",
                 e,
                 exc_info=True,
+                extra=log_fields(message.platform, message.chat_id, message.id),
             )
             await self._send_error_response(ctx)
 
+        if debug:
+            logger.debug(
+                "Handled incoming message: id=%s",
+                message.id,
+                extra=log_fields(
+                    message.platform,
+                    message.chat_id,
+                    message.id,
+                    (time.perf_counter() - started) * 1000,
+                ),
+            )
+
     async def _process_message(self, ctx: ChatContext) -> None:
         """Process a message through command or AI pipeline.
 
@@ -379,24 +422,110 @@ class ChatController:
 
         # Process with AI agent
         if self.ai_agent:
-            try:
-                response = await self.ai_agent.chat(ctx.user_key, content)
-                if response:
-                    # Truncate if too long
-                    if len(response) > self.config.max_message_length:
-                        response = response[: self.config.max_message_length - 3] + "..."
-                    await self.send_reply(message, response)
-                    logger.debug("AI response sent")
-            except Exception as e:
-                logger.error(
-                    "AI chat error: %s",
-                    e,
-                    exc_info=True,
-                )
-                await self._send_error_response(ctx)
+            stream = self._create_reply_stream(message) if self.config.stream_replies else None
+            if stream is not None:
+                await self._stream_ai_reply(ctx, content, stream)
+            else:
+                await self._chat_ai_reply(ctx, content)
         else:
             logger.warning("No AI agent configured and message is not a command, ignoring")
 
+    async def _chat_ai_reply(self, ctx: ChatContext, content: str) -> None:
+        """Generate a complete AI reply and send it.
+
+        Args:
+            ctx: Chat context with message and configuration
+            content: Message text
+        """
+        try:
+            response = await self.ai_agent.chat(ctx.user_key, content)
+            if response:
+                # Truncate if too long
+                if len(response) > self.config.max_message_length:
+                    response = response[: self.config.max_message_length - 3] + "..."
+                await self.send_reply(ctx.message, response)
+                logger.debug("AI response sent")
+        except Exception as e:
+            logger.error(
+                "AI chat error: %s",
+                e,
+                exc_info=True,
+            )
+            await self._send_error_response(ctx)
+
+    def _create_reply_stream(self, message: IncomingMessage) -> ReplyStream | None:
+        """Create the stream that shows a reply progressively on the message's platform.
+
+        Args:
+            message: Message being answered
+
+        Returns:
+            Reply stream, or None if the platform cannot show partial replies
+        """
+        if message.platform == "feishu" and self.feishu_api is not None:
+            return FeishuCardStream(
+                self.feishu_api,
+                message,
+                update_interval=self.config.stream_update_interval,
+                max_length=self.config.max_message_length,
+            )
+        if message.platform == "qq" and self.has_provider("qq"):
+            max_chars = self.config.max_message_length
+            return ChunkedTextStream(
+                lambda piece: self.send_reply(message, piece),
+                min_chars=min(self.config.stream_chunk_chars, max_chars),
+                max_chars=max_chars,
+            )
+        return None
+
+    async def _stream_ai_reply(
+        self,
+        ctx: ChatContext,
+        content: str,
+        stream: ReplyStream,
+    ) -> None:
+        """Generate an AI reply and show it while it is being generated.
+
+        Args:
+            ctx: Chat context with message and configuration
+            content: Message text
+            stream: Destination for the partial reply
+        """
+        message = ctx.message
+        started = time.monotonic()
+        text = ""
+        try:
+            await stream.start()
+        except Exception as e:
+            logger.warning("Cannot start reply stream, sending a normal reply: %s", e)
+            await self._chat_ai_reply(ctx, content)
+            return
+
+        try:
+            async for chunk in self.ai_agent.chat_stream(ctx.user_key, content):
+                text += chunk
+                await stream.update(text)
+            if not text.strip():
+                text = self.config.error_message
+            delivered = await stream.finish(text)
+        except Exception as e:
+            logger.error("AI streaming error: %s", e, exc_info=True)
+            await self._send_error_response(ctx)
+            return
+
+        if not delivered:
+            # The platform rejected the partial reply; send it the usual way
+            if len(text) > self.config.max_message_length:
+                text = text[: self.config.max_message_length - 3] + "..."
+            await self.send_reply(message, text)
+
+        if stream.first_output_at is not None:
+            logger.debug(
+                "Streamed AI reply: first output after %.2fs, total %.2fs",
+                stream.first_output_at - started,
+                time.monotonic() - started,
+            )
+
     async def send_reply(
         self,
         original: IncomingMessage,
@@ -459,7 +588,9 @@ class ChatController:
                 # Use quote reply if requested and provider supports it
                 if quote_reply and original.id and hasattr(provider, "send_reply"):
                     try:
-                        result = provider.send_reply(int(original.id), reply, target)
+                        result = await send_async(
+                            provider, "send_reply", int(original.id), reply, target
+                        )
                         if result.success:
                             logger.info(
                                 "Quote reply sent successfully: %s",
@@ -481,7 +612,7 @@ class ChatController:
                 original.platform,
                 target,
             )
-            result = provider.send_text(reply, target)
+            result = await send_async(provider, "send_text", reply, target)
             if result.success:
                 logger.info("Reply sent successfully: %s", result.message_id)
             else:
@@ -541,7 +672,9 @@ class ChatController:
                     if hasattr(provider, "send_at"):
                         # Use send_at for @mention
                         at_text = text or ""
-                        result = provider.send_at(
+                        result = await send_async(
+                            provider,
+                            "send_at",
                             int(original.sender_id),
                             target,
                             at_text,
@@ -554,7 +687,9 @@ class ChatController:
 
                 # Send quote reply if requested
                 if quote_reply and original.id and hasattr(provider, "send_reply"):
-                    result = provider.send_reply(
+                    result = await send_async(
+                        provider,
+                        "send_reply",
                         int(original.id),
                         text or "",
                         target,
@@ -565,7 +700,7 @@ class ChatController:
 
                 # Send image if provided
                 if image and hasattr(provider, "send_image"):
-                    img_result = provider.send_image(image, target)
+                    img_result = await send_async(provider, "send_image", image, target)
                     if img_result.success:
                         logger.debug("Image sent successfully")
                     else:
@@ -575,7 +710,7 @@ class ChatController:
 
                 # Send text if not already sent via quote
                 if text and not quote_reply:
-                    return provider.send_text(text, target)
+                    return await send_async(provider, "send_text", text, target)
 
                 return SendResult.ok("rich_reply")
 
@@ -623,16 +758,16 @@ class ChatController:
 
                 # Send caption first if provided
                 if caption:
-                    provider.send_text(caption, target)
+                    await send_async(provider, "send_text", caption, target)
 
                 # Send image
                 if hasattr(provider, "send_image"):
-                    return provider.send_image(image_url, target)
+                    return await send_async(provider, "send_image", image_url, target)
 
             elif original.platform == "feishu":
                 target = original.chat_id or original.sender_id
                 if hasattr(provider, "send_image"):
-                    return provider.send_image(image_url, target)
+                    return await send_async(provider, "send_image", image_url, target)
 
             return SendResult.fail("Image sending not supported for this platform")
 
@@ -723,7 +858,7 @@ class ChatController:
 
             for target in platform_targets:
                 try:
-                    result = provider.send_text(message, target)
+                    result = await send_async(provider, "send_text", message, target)
                     results[platform].append(result)
 
                     if result.success:
@@ -811,7 +946,7 @@ class ChatController:
                 if hasattr(provider, "async_send_text"):
                     return await provider.async_send_text(reply, target)
 
-            # Fallback to sync method
+            # Other platforms: send_reply also uses the async provider path
             return await self.send_reply(original, reply, quote_reply=quote_reply)
 
         except Exception as e:
@@ -855,6 +990,7 @@ def create_chat_controller(
     config: ChatConfig | None = None,
     available_models: list[str] | None = None,
     conversation_store: PersistentConversationManager | None = None,
+    feishu_api: FeishuOpenAPI | None = None,
 ) -> ChatController:
     """Factory function to create a chat controller with command handler.
 
@@ -866,6 +1002,8 @@ def create_chat_controller(
         providers: Platform providers {platform: provider}
         config: Chat configuration
         available_models: Models available for /model command
+        conversation_store: Persistent conversation storage
+        feishu_api: Feishu Open Platform client for streamed card replies
 
     Returns:
         Fully configured ChatController instance with command handler
@@ -915,4 +1053,5 @@ def create_chat_controller(
         providers=providers,
         config=config,
         conversation_store=conversation_store,
+        feishu_api=feishu_api,
     )
@@ -0,0 +1,253 @@
+"""Progressive delivery of streamed AI replies.
+
+``ChatController`` feeds the growing text of a streamed reply into a
+``ReplyStream`` so users see output long before generation finishes:
+
+- ``FeishuCardStream`` sends a card right away and patches it in place through
+  the Open Platform message update API, at most once per update interval
+- ``ChunkedTextStream`` sends the reply as consecutive messages, each ending at
+  a sentence boundary (used for QQ, where sent messages cannot be edited)
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from ..core.client import CardBuilder
+from ..core.logger import get_logger
+from ..core.message_handler import IncomingMessage
+
+logger = get_logger("chat.streaming")
+
+# Sentence ends: CJK and ASCII terminators, line breaks, and ASCII punctuation
+# followed by whitespace (so "3.14" and "e.g." inside words do not split)
+_SENTENCE_END = re.compile(r"[。！？；…\n]|[.!?;](?=\s)")
+
+
+def build_stream_card(text: str) -> dict[str, Any]:
+    """Build the card showing a streamed reply.
+
+    The card is shared (``update_multi``), which the message update API
+    requires for cards that are patched after sending.
+
+    Args:
+        text: Reply text (markdown)
+
+    Returns:
+        Card JSON
+    """
+    return (
+        CardBuilder()
+        .set_config(wide_screen_mode=True, update_multi=True)
+        .add_markdown(text)
+        .build()
+    )
+
+
+class ReplyStream(ABC):
+    """Destination for the text of a reply that is still being generated."""
+
+    def __init__(self) -> None:
+        self.first_output_at: float | None = None
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Prepare the destination before the first chunk arrives."""
+
+    @abstractmethod
+    async def update(self, text: str) -> None:
+        """Show the reply generated so far.
+
+        Args:
+            text: Full reply text generated so far
+        """
+
+    @abstractmethod
+    async def finish(self, text: str) -> bool:
+        """Deliver the complete reply.
+
+        Args:
+            text: Full reply text
+
+        Returns:
+            True if the reply was delivered; False if the caller should send
+            it by other means
+        """
+
+    def _mark_output(self) -> None:
+        """Record when the user first saw output."""
+        if self.first_output_at is None:
+            self.first_output_at = time.monotonic()
+
+
+class FeishuCardStream(ReplyStream):
+    """Streams a reply into a Feishu card that is updated in place.
+
+    Updates arriving faster than ``update_interval`` are coalesced: the card
+    always shows the latest text, but is patched at most once per interval so
+    the per-message update rate limit is respected.
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        original: IncomingMessage,
+        update_interval: float = 1.0,
+        placeholder: str = "...",
+        max_length: int = 4000,
+    ) -> None:
+        """Initialize the stream.
+
+        Args:
+            api: Connected or connectable ``FeishuOpenAPI`` client
+            original: Message being answered
+            update_interval: Minimum seconds between card updates
+            placeholder: Text shown until the first chunk arrives
+            max_length: Maximum reply length shown in the card
+        """
+        super().__init__()
+        self.api = api
+        self.original = original
+        self.update_interval = update_interval
+        self.placeholder = placeholder
+        self.max_length = max_length
+        self.message_id: str | None = None
+        self.updates = 0
+        self._shown = placeholder
+        self._last_update = 0.0
+
+    async def start(self) -> None:
+        """Send the placeholder card, as a reply to the original message if possible."""
+        await self.api.connect()
+        card = build_stream_card(self.placeholder)
+        result = None
+        if self.original.id:
+            result = await self.api.reply_message(self.original.id, "interactive", card)
+        if (result is None or not result.success) and self.original.chat_id:
+            result = await self.api.send_message(
+                self.original.chat_id, "chat_id", "interactive", card
+            )
+        if result is not None and result.success and result.message_id:
+            self.message_id = result.message_id
+            self._last_update = time.monotonic()
+            self._mark_output()
+        else:
+            logger.warning("Could not send streaming card for message %s", self.original.id)
+
+    async def update(self, text: str) -> None:
+        """Patch the card if the update interval has passed since the last patch."""
+        if self.message_id is None:
+            return
+        if time.monotonic() - self._last_update < self.update_interval:
+            return
+        await self._patch(text)
+
+    async def finish(self, text: str) -> bool:
+        """Patch the card with the complete reply."""
+        if self.message_id is None:
+            return False
+        return await self._patch(text) or self._shown == self._clip(text)
+
+    def _clip(self, text: str) -> str:
+        """Limit text to the maximum reply length."""
+        if len(text) > self.max_length:
+            return text[: self.max_length - 3] + "..."
+        return text
+
+    async def _patch(self, text: str) -> bool:
+        """Replace the card content; returns True if the card now shows ``text``."""
+        text = self._clip(text)
+        if not text.strip() or text == self._shown:
+            return False
+        self._last_update = time.monotonic()
+        try:
+            updated = await self.api.update_message(
+                self.message_id, "interactive", build_stream_card(text)
+            )
+        except Exception as exc:
+            logger.warning("Failed to update streaming card %s: %s", self.message_id, exc)
+            return False
+        if updated:
+            self._shown = text
+            self.updates += 1
+        return bool(updated)
+
+
+class ChunkedTextStream(ReplyStream):
+    """Streams a reply as consecutive messages split at sentence boundaries.
+
+    A chunk is sent once at least ``min_chars`` characters up to a sentence
+    end are available, or when ``max_chars`` characters accumulate without
+    one.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str], Awaitable[Any]],
+        min_chars: int = 80,
+        max_chars: int = 4000,
+    ) -> None:
+        """Initialize the stream.
+
+        Args:
+            send: Coroutine function sending one chunk
+            min_chars: Minimum characters in a chunk before it is sent
+            max_chars: Maximum characters in one chunk
+
+        Raises:
+            ValueError: If min_chars is less than 1 or greater than max_chars
+        """
+        if min_chars < 1 or min_chars > max_chars:
+            raise ValueError("min_chars must be between 1 and max_chars")
+        super().__init__()
+        self.send = send
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self.chunks = 0
+        self._sent = 0
+
+    async def start(self) -> None:
+        """Nothing is sent before the first sentence is complete."""
+
+    async def update(self, text: str) -> None:
+        """Send every complete chunk that has accumulated."""
+        while True:
+            cut = self._find_cut(text[self._sent :])
+            if cut is None:
+                return
+            await self._send(text[self._sent : self._sent + cut])
+            self._sent += cut
+
+    async def finish(self, text: str) -> bool:
+        """Send the remaining text."""
+        await self.update(text)
+        while self._sent < len(text):
+            piece = text[self._sent : self._sent + self.max_chars]
+            await self._send(piece)
+            self._sent += len(piece)
+        return self.chunks > 0
+
+    def _find_cut(self, pending: str) -> int | None:
+        """Find where the next chunk ends, or None if it is not complete yet."""
+        if len(pending) < self.min_chars:
+            return None
+        cut = None
+        for match in _SENTENCE_END.finditer(pending, self.min_chars - 1, self.max_chars):
+            cut = match.end()
+        if cut is None and len(pending) >= self.max_chars:
+            # No sentence end within the limit: break at the last space, if any
+            space = pending.rfind(" ", self.min_chars, self.max_chars)
+            cut = space + 1 if space > 0 else self.max_chars
+        return cut
+
+    async def _send(self, piece: str) -> None:
+        """Send one chunk, skipping whitespace-only pieces."""
+        if not piece.strip():
+            return
+        await self.send(piece.strip())
+        self.chunks += 1
+        self._mark_output()
@@ -104,6 +104,8 @@ def _cmd_message_queue(args: argparse.Namespace) -> int:
         table.add_row("Max Batch Size", str(config.message_queue.max_batch_size))
         table.add_row("Max Retries", str(config.message_queue.max_retries))
         table.add_row("Retry Delay (s)", str(config.message_queue.retry_delay))
+        table.add_row("Max Concurrency", str(config.message_queue.max_concurrency))
+        table.add_row("Persistence", config.message_queue.db_path or "in-memory")
 
         console.print(table)
         console.print("\n[yellow]Note: Queue size and message count available during runtime.[/]")
@@ -6,7 +6,7 @@ This package contains the core functionality including:
 - Logging utilities
 - Circuit breaker for fault tolerance
 - Message tracking and delivery confirmation
-- Message queue for reliable delivery with retry support
+- Message queue for reliable delivery with retry support and optional durability
 - Multi-provider abstraction layer
 - Unified message handling interface for multi-platform support
 """
@@ -35,7 +35,7 @@ from .image_uploader import (
     FeishuPermissionDeniedError,
     create_image_card,
 )
-from .logger import get_logger, setup_logging
+from .logger import flush_logging, get_logger, setup_logging
 from .message_handler import (
     IncomingMessage,
     MessageHandler,
@@ -49,16 +49,25 @@ from .message_parsers import (
     create_feishu_parser,
     create_qq_parser,
 )
-from .message_queue import MessageQueue, QueuedMessage
+from .message_queue import (
+    DeliveryRateLimiter,
+    MessagePriority,
+    MessageQueue,
+    QueuedMessage,
+    TokenBucket,
+)
 from .message_tracker import MessageStatus, MessageTracker, TrackedMessage
 from .provider import (
+    AsyncBaseProvider,
     BaseProvider,
     Message,
     MessageType,
     ProviderConfig,
     ProviderRegistry,
     SendResult,
+    send_async,
 )
+from .queue_store import MessageQueueStore
 
 __all__ = [
     # Client and card builder
@@ -78,6 +87,7 @@ __all__ = [
     "ProviderConfigBase",
     "CircuitBreakerPolicyConfig",
     # Logging
+    "flush_logging",
     "get_logger",
     "setup_logging",
     # Circuit breaker
@@ -99,17 +109,23 @@ __all__ = [
     "create_feishu_parser",
     "create_qq_parser",
     # Message queue
+    "DeliveryRateLimiter",
+    "MessagePriority",
     "MessageQueue",
+    "MessageQueueStore",
     "QueuedMessage",
+    "TokenBucket",
     # Message tracking
     "MessageStatus",
     "MessageTracker",
     "TrackedMessage",
     # Provider abstraction
     "BaseProvider",
+    "AsyncBaseProvider",
     "ProviderConfig",
     "ProviderRegistry",
     "Message",
     "MessageType",
     "SendResult",
+    "send_async",
 ]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Awaitable, Callable
 from enum import Enum
 from functools import wraps
 from typing import Any, TypeVar
@@ -130,8 +130,8 @@ class CircuitBreaker:
         exc_name = type(exception).__name__
         return exc_name in self.config.excluded_exceptions
 
-    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
-        """Execute function through circuit breaker."""
+    def _raise_if_open(self) -> None:
+        """Raise CircuitBreakerOpen if requests are currently rejected."""
         if not self.should_allow_request():
             remaining = self.config.timeout_seconds
             if self._last_failure_time:
@@ -140,6 +140,10 @@ class CircuitBreaker:
                 )
             raise CircuitBreakerOpen(self.name, remaining)
 
+    def call(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Execute function through circuit breaker."""
+        self._raise_if_open()
+
         try:
             result = func(*args, **kwargs)
             self.record_success()
@@ -148,6 +152,18 @@ class CircuitBreaker:
             self.record_failure(e)
             raise
 
+    async def acall(self, func: Callable[..., Awaitable[Any]], *args: Any, **kwargs: Any) -> Any:
+        """Await a coroutine function through circuit breaker."""
+        self._raise_if_open()
+
+        try:
+            result = await func(*args, **kwargs)
+            self.record_success()
+            return result
+        except Exception as e:
+            self.record_failure(e)
+            raise
+
     def reset(self) -> None:
         """Reset circuit breaker to closed state."""
         with self._lock:
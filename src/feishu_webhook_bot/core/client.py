@@ -68,18 +68,25 @@ class FeishuWebhookClient:
         config: WebhookConfig,
         timeout: float | None = None,
         retry: RetryPolicyConfig | None = None,
+        http_client: httpx.Client | None = None,
     ):
         """Initialize the webhook client.
 
         Args:
             config: Webhook configuration
             timeout: Request timeout in seconds
+            retry: Retry policy (defaults to the webhook's own policy)
+            http_client: Shared HTTP client to send through (e.g. from
+                ``HTTPClientPool.sync_client``); it is not closed by ``close``
         """
         self.config = config
         self.timeout = timeout if timeout is not None else (config.timeout or 10.0)
         self.retry_policy = retry or config.retry or RetryPolicyConfig()
         self._default_headers = {**(config.headers or {})}
-        self._client = httpx.Client(timeout=self.timeout, headers=self._default_headers)
+        self._owns_client = http_client is None
+        self._client = http_client or httpx.Client(
+            timeout=self.timeout, headers=self._default_headers
+        )
 
     def __enter__(self) -> FeishuWebhookClient:
         """Context manager entry."""
@@ -90,8 +97,9 @@ class FeishuWebhookClient:
         self.close()
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
+        """Close the HTTP client, unless it is a shared one."""
+        if self._owns_client:
+            self._client.close()
 
     def is_configured(self) -> bool:
         """Check if the webhook is properly configured.
@@ -200,6 +208,7 @@ class FeishuWebhookClient:
                     self.config.url,
                     json=payload,
                     headers=headers,
+                    timeout=self.timeout,
                 )
                 response.raise_for_status()
 
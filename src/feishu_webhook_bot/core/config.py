@@ -410,6 +410,11 @@ class TaskActionConfig(BaseModel):
     ai_structured_output: bool = Field(
         default=False, description="Use structured output for AI response"
     )
+    ai_cache_response: bool = Field(
+        default=False,
+        description="Answer the prompt without conversation history and reuse cached "
+        "responses for identical prompts (requires ai.response_cache.enabled)",
+    )
 
     parameters: dict[str, Any] = Field(
         default_factory=dict, description="Parameters to pass to the action"
@@ -556,6 +561,19 @@ class CircuitBreakerPolicyConfig(BaseModel):
     )
 
 
+class QueueRateLimitConfig(BaseModel):
+    """Token-bucket limits for queued deliveries through one provider."""
+
+    rate: float | None = Field(
+        default=None, gt=0.0, description="Provider-wide sends per second (None for unlimited)"
+    )
+    burst: int = Field(default=1, ge=1, description="Provider-wide burst size")
+    per_target_rate: float | None = Field(
+        default=None, gt=0.0, description="Sends per second to each target (None for unlimited)"
+    )
+    per_target_burst: int = Field(default=1, ge=1, description="Per-target burst size")
+
+
 class MessageQueueConfig(BaseModel):
     """Configuration for message queue with async delivery and retry support."""
 
@@ -565,6 +583,29 @@ class MessageQueueConfig(BaseModel):
     )
     retry_delay: float = Field(default=5.0, ge=0.0, description="Base delay for retries in seconds")
     max_retries: int = Field(default=3, ge=0, description="Maximum retry attempts per message")
+    max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum concurrent deliveries; distinct targets are sent in parallel",
+    )
+    db_path: str | None = Field(
+        default=None,
+        description="SQLite path for a durable queue that survives restarts (None for in-memory)",
+    )
+    flush_interval: float = Field(
+        default=0.05,
+        ge=0.0,
+        description="Seconds between group commits of the durable queue log",
+    )
+    compact_interval: float = Field(
+        default=300.0,
+        ge=0.0,
+        description="Seconds between durable queue compactions (0 to disable)",
+    )
+    rate_limits: dict[str, QueueRateLimitConfig] = Field(
+        default_factory=dict,
+        description="Token-bucket rate limits keyed by provider name",
+    )
 
 
 class MessageTrackingConfig(BaseModel):
@@ -580,6 +621,14 @@ class MessageTrackingConfig(BaseModel):
     db_path: str | None = Field(
         default=None, description="SQLite database path for persistence (None for in-memory)"
     )
+    flush_interval: float = Field(
+        default=0.05,
+        ge=0.0,
+        description="Maximum seconds a tracking write waits before being group-committed",
+    )
+    max_batch: int = Field(
+        default=500, ge=1, description="Maximum tracking writes committed in one transaction"
+    )
 
 
 class FeishuAPIConfig(BaseModel):
@@ -620,6 +669,65 @@ class ChatConfig(BaseModel):
         default="抱歉，处理您的消息时出现了问题，请稍后重试。",
         description="Error message to send on processing failure",
     )
+    stream_replies: bool = Field(
+        default=False,
+        description="Stream AI replies: update a Feishu card in place (requires a Feishu "
+        "provider with 'api' enabled), send QQ replies sentence by sentence",
+    )
+    stream_update_interval: float = Field(
+        default=1.0,
+        ge=0.2,
+        description="Minimum seconds between updates of a streamed Feishu card",
+    )
+    stream_chunk_chars: int = Field(
+        default=80,
+        ge=1,
+        description="Minimum characters per message when streaming replies to QQ",
+    )
+
+
+class OneBotWebSocketConfig(BaseModel):
+    """OneBot11 WebSocket transport for the Napcat provider.
+
+    In ``forward`` mode the bot connects to Napcat's WebSocket server at ``url``;
+    in ``reverse`` mode it listens on ``host:port`` + ``path`` and Napcat
+    connects to it. Either way one connection carries API calls and events.
+    """
+
+    mode: Literal["forward", "reverse"] = Field(
+        default="forward", description="'forward' (bot connects) or 'reverse' (Napcat connects)"
+    )
+    url: str | None = Field(
+        default=None,
+        description="Napcat WebSocket URL for forward mode (e.g., ws://127.0.0.1:3001)",
+    )
+    host: str = Field(default="0.0.0.0", description="Listen address for reverse mode")
+    port: int = Field(default=8080, ge=0, le=65535, description="Listen port for reverse mode")
+    path: str = Field(default="/onebot/v11/ws", description="Accepted path for reverse mode")
+    request_timeout: float = Field(
+        default=10.0, gt=0.0, description="Seconds to wait for an API response"
+    )
+    heartbeat_timeout: float | None = Field(
+        default=None,
+        gt=0.0,
+        description="Reconnect after this many seconds without a heartbeat "
+        "(default: three heartbeat intervals as reported by Napcat)",
+    )
+    reconnect_initial_delay: float = Field(
+        default=1.0, gt=0.0, description="First reconnect delay in seconds (forward mode)"
+    )
+    reconnect_max_delay: float = Field(
+        default=60.0, gt=0.0, description="Maximum reconnect delay in seconds (forward mode)"
+    )
+
+    @model_validator(mode="after")
+    def validate_mode(self) -> OneBotWebSocketConfig:
+        """Ensure forward mode knows where to connect."""
+        if self.mode == "forward" and not self.url:
+            raise ValueError("Forward WebSocket mode requires 'url'")
+        if self.reconnect_initial_delay > self.reconnect_max_delay:
+            raise ValueError("reconnect_initial_delay must not exceed reconnect_max_delay")
+        return self
 
 
 class ProviderConfigBase(BaseModel):
@@ -655,6 +763,10 @@ class ProviderConfigBase(BaseModel):
         default=None, description="Default target for messages (e.g., 'group:123456')"
     )
     bot_qq: str | None = Field(default=None, description="Bot's QQ number for @mention detection")
+    websocket: OneBotWebSocketConfig | None = Field(
+        default=None,
+        description="Use a OneBot11 WebSocket instead of HTTP for API calls and events",
+    )
 
     # Feishu API configuration (nested)
     api: FeishuAPIConfig | None = Field(
@@ -667,8 +779,8 @@ class ProviderConfigBase(BaseModel):
         if self.provider_type == "feishu":
             if not self.webhook_url:
                 raise ValueError("Feishu provider requires 'webhook_url'")
-        elif self.provider_type == "napcat" and not self.http_url:
-            raise ValueError("Napcat provider requires 'http_url'")
+        elif self.provider_type == "napcat" and not self.http_url and not self.websocket:
+            raise ValueError("Napcat provider requires 'http_url' or 'websocket'")
         return self
 
 
@@ -767,6 +879,37 @@ class LoggingConfig(BaseModel):
     log_file: str | None = Field(default=None, description="Log file path")
     max_bytes: int = Field(default=10485760, description="Max log file size (10MB)")
     backup_count: int = Field(default=5, description="Number of backup files")
+    file_mode: Literal["buffered", "close_on_emit"] = Field(
+        default="buffered",
+        description=(
+            "File logging mode: 'buffered' writes from a background thread through a "
+            "persistent handle; 'close_on_emit' reopens the file for every record "
+            "(avoids held file locks on Windows)"
+        ),
+    )
+    rotation: Literal["size", "time"] = Field(
+        default="size", description="Rotate log files by size (max_bytes) or by time"
+    )
+    rotation_when: str = Field(
+        default="midnight",
+        description="Time rotation unit (S, M, H, D, midnight, W0-W6) when rotation is 'time'",
+    )
+    rotation_interval: int = Field(
+        default=1, ge=1, description="Number of rotation_when units between time rotations"
+    )
+    flush_interval: float = Field(
+        default=1.0, ge=0.0, description="Max seconds buffered log records wait before flushing"
+    )
+    flush_records: int = Field(
+        default=100, ge=1, description="Flush the buffered log file after this many records"
+    )
+    json_format: bool = Field(
+        default=False,
+        description=(
+            "Emit structured JSON lines (with provider, target, message_id and "
+            "latency_ms fields) instead of plain text"
+        ),
+    )
 
 
 class GeneralConfig(BaseModel):
@@ -802,6 +945,27 @@ class NotificationConfig(BaseModel):
     template: str = Field(..., description="Template to use for the notification")
 
 
+class HTTPPoolConfig(BaseModel):
+    """Connection pool shared by all outgoing HTTP requests."""
+
+    max_connections: int = Field(
+        default=100, ge=1, description="Maximum open connections per shared client"
+    )
+    max_keepalive_connections: int = Field(
+        default=20, ge=0, description="Maximum idle connections kept open for reuse"
+    )
+    keepalive_expiry: float = Field(
+        default=30.0, ge=0.0, description="Seconds an idle connection is kept open"
+    )
+    http2: bool = Field(
+        default=False, description="Negotiate HTTP/2 where supported (requires the h2 package)"
+    )
+    per_host_limits: dict[str, int] = Field(
+        default_factory=dict,
+        description="Maximum connections per host, e.g. {'open.feishu.cn': 20}",
+    )
+
+
 class HTTPClientConfig(BaseModel):
     """Default HTTP client configuration."""
 
@@ -810,6 +974,51 @@ class HTTPClientConfig(BaseModel):
         default_factory=RetryPolicyConfig,
         description="Global retry policy for webhook calls",
     )
+    pool: HTTPPoolConfig = Field(
+        default_factory=HTTPPoolConfig,
+        description="Shared connection pool settings",
+    )
+
+
+class ImageCacheConfig(BaseModel):
+    """Cache of uploaded image keys, keyed by image content hash."""
+
+    ttl_seconds: float = Field(
+        default=30 * 24 * 3600.0,
+        gt=0.0,
+        description="Seconds an uploaded image_key is reused (keep below Feishu's retention)",
+    )
+    max_size: int = Field(default=2000, ge=1, description="Maximum number of cached image keys")
+    db_path: str | None = Field(
+        default=None, description="SQLite file keeping image keys across restarts"
+    )
+
+
+class FeishuTokenConfig(BaseModel):
+    """Shared Feishu tenant access token service."""
+
+    refresh_ahead_seconds: float = Field(
+        default=300.0, ge=0.0, description="Refresh tokens this many seconds before expiry"
+    )
+    min_validity_seconds: float = Field(
+        default=60.0,
+        ge=0.0,
+        description="Fetch a new token on the request path if the cached one expires sooner",
+    )
+    proactive_refresh: bool = Field(
+        default=True, description="Refresh tokens in the background before they expire"
+    )
+    persist_path: str | None = Field(
+        default=None,
+        description="SQLite file for sharing tokens between bot processes (disabled if unset)",
+    )
+
+    @model_validator(mode="after")
+    def validate_timing(self) -> FeishuTokenConfig:
+        """Ensure request-path refreshes never start before background ones."""
+        if self.min_validity_seconds > self.refresh_ahead_seconds:
+            raise ValueError("min_validity_seconds must not exceed refresh_ahead_seconds")
+        return self
 
 
 class EventServerConfig(BaseModel):
@@ -848,6 +1057,51 @@ class EventServerConfig(BaseModel):
         description="Bot's QQ number for @mention detection",
     )
 
+    # Ingress pipeline
+    ingress_workers: int = Field(
+        default=4,
+        ge=0,
+        description=(
+            "Workers processing queued events; callbacks are acknowledged before "
+            "processing. 0 processes events inline within the request"
+        ),
+    )
+    ingress_queue_size: int = Field(
+        default=1000, ge=1, description="Maximum events waiting for a worker"
+    )
+    ingress_overflow_status: Literal[429, 503] = Field(
+        default=503, description="HTTP status returned when the event queue is full"
+    )
+    ingress_retry_after: int = Field(
+        default=1, ge=0, description="Retry-After seconds sent with overflow responses"
+    )
+    ingress_offload_sync_handlers: bool = Field(
+        default=True,
+        description=(
+            "Run synchronous event handlers in a thread pool so slow plugins do not "
+            "block the server event loop"
+        ),
+    )
+    ingress_drain_timeout: float = Field(
+        default=5.0, ge=0.0, description="Seconds to finish queued events on shutdown"
+    )
+
+    # Duplicate delivery suppression
+    dedup_enabled: bool = Field(
+        default=True,
+        description="Drop redelivered events (same event ID or message ID) before dispatch",
+    )
+    dedup_ttl: float = Field(
+        default=3600.0, gt=0, description="Seconds an event ID is remembered for deduplication"
+    )
+    dedup_max_entries: int = Field(
+        default=10000, ge=1, description="Maximum event IDs kept in the deduplication index"
+    )
+    dedup_db_path: str | None = Field(
+        default=None,
+        description="SQLite file persisting recent event IDs across restarts (optional)",
+    )
+
     # Legacy alias for backward compatibility
     @property
     def path(self) -> str:
@@ -1032,6 +1286,12 @@ class BotConfig(BaseSettings):
     http: HTTPClientConfig = Field(
         default_factory=HTTPClientConfig, description="Default HTTP client settings"
     )
+    feishu_tokens: FeishuTokenConfig = Field(
+        default_factory=FeishuTokenConfig, description="Shared Feishu tenant token settings"
+    )
+    image_cache: ImageCacheConfig = Field(
+        default_factory=ImageCacheConfig, description="Uploaded image key cache settings"
+    )
     automations: list[AutomationRule] = Field(default_factory=list, description="Automation rules")
     event_server: EventServerConfig = Field(
         default_factory=EventServerConfig, description="Inbound event server settings"
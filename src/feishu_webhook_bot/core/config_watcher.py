@@ -267,10 +267,9 @@ def create_config_watcher(
             if hasattr(bot_instance, "automation_engine") and bot_instance.automation_engine:
                 logger.info("Reloading automations...")
                 try:
-                    # Update automation rules
-                    if hasattr(bot_instance.automation_engine, "_rules"):
-                        bot_instance.automation_engine._rules = new_config.automations
-                    # Restart automation engine
+                    # Replace the rules and recompile the event index
+                    bot_instance.automation_engine.reload_rules(new_config.automations)
+                    # Re-register scheduled rules
                     bot_instance.automation_engine.shutdown()
                     bot_instance.automation_engine.start()
                     components_reloaded.append("automations")
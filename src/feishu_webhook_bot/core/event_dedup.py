@@ -0,0 +1,220 @@
+"""Idempotent event ingestion for provider callbacks.
+
+Feishu redelivers events it considers unacknowledged (same ``header.event_id``)
+and Napcat may resend events after a reconnect. ``EventDeduplicator`` keeps a
+time-bounded index of recently seen event keys so repeated deliveries can be
+dropped before they are parsed or dispatched:
+
+- O(1) lookup and insert backed by an insertion-ordered dict
+- Entries expire after ``ttl`` seconds and the index never exceeds ``max_entries``
+- Optional SQLite persistence so the window survives restarts
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from .logger import get_logger
+from .sqlite_writer import BatchedSQLiteWriter
+
+logger = get_logger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS seen_events (
+        event_key TEXT PRIMARY KEY,
+        seen_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_seen_events_seen_at ON seen_events(seen_at)",
+)
+
+
+def extract_event_key(provider: str, payload: dict[str, Any]) -> str | None:
+    """Derive the idempotency key of a provider callback.
+
+    Uses the Feishu ``header.event_id`` (schema 2.0) or ``uuid`` (schema 1.0),
+    falling back to the message ID; for OneBot11/Napcat uses ``message_id``
+    for message events and ``flag`` for request events.
+
+    Args:
+        provider: Provider name the event was received for
+        payload: Raw event payload
+
+    Returns:
+        Key unique to the event, or None if the event carries no stable ID
+        (e.g. heartbeats), in which case it must not be deduplicated
+    """
+    header = payload.get("header")
+    if isinstance(header, dict) and header.get("event_id"):
+        return f"{provider}:event:{header['event_id']}"
+    if payload.get("uuid"):
+        return f"{provider}:event:{payload['uuid']}"
+
+    post_type = payload.get("post_type")
+    if post_type == "message" and payload.get("message_id") is not None:
+        return f"{provider}:{payload.get('self_id', '')}:msg:{payload['message_id']}"
+    if post_type == "request" and payload.get("flag"):
+        return f"{provider}:{payload.get('self_id', '')}:req:{payload['flag']}"
+
+    event = payload.get("event")
+    if isinstance(event, dict):
+        message = event.get("message")
+        if isinstance(message, dict) and message.get("message_id"):
+            return f"{provider}:msg:{message['message_id']}"
+    return None
+
+
+class EventDeduplicator:
+    """Time-bounded index of recently seen event keys."""
+
+    def __init__(
+        self,
+        ttl: float = 3600.0,
+        max_entries: int = 10000,
+        db_path: str | Path | None = None,
+    ) -> None:
+        """Create the index, restoring unexpired keys from ``db_path`` if given.
+
+        Args:
+            ttl: Seconds an event key is remembered
+            max_entries: Maximum keys kept; the oldest are evicted first
+            db_path: Optional SQLite database persisting the window across restarts
+
+        Raises:
+            ValueError: If ttl is not positive or max_entries is less than 1
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        # key -> wall-clock time first seen; insertion order is age order
+        self._seen: OrderedDict[str, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"checked": 0, "duplicates": 0, "evicted": 0}
+
+        self._writer: BatchedSQLiteWriter | None = None
+        if db_path is not None:
+            self._writer = BatchedSQLiteWriter(db_path, schema=_SCHEMA, name="EventDeduplicator")
+            self._restore()
+
+    def _restore(self) -> None:
+        """Load unexpired keys from the database, oldest first."""
+        assert self._writer is not None
+        cutoff = time.time() - self.ttl
+
+        def load(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            conn.execute("DELETE FROM seen_events WHERE seen_at < ?", (cutoff,))
+            return conn.execute(
+                "SELECT event_key, seen_at FROM seen_events ORDER BY seen_at DESC LIMIT ?",
+                (self.max_entries,),
+            ).fetchall()
+
+        rows = self._writer.query(load)
+        for row in reversed(rows):
+            self._seen[row["event_key"]] = row["seen_at"]
+        if rows:
+            logger.info("Restored %d recent event IDs for deduplication", len(rows))
+
+    def _expire(self, now: float) -> None:
+        """Drop expired keys from the front of the index (caller holds the lock)."""
+        cutoff = now - self.ttl
+        expired = 0
+        while self._seen:
+            seen_at = next(iter(self._seen.values()))
+            if seen_at >= cutoff and len(self._seen) <= self.max_entries:
+                break
+            self._seen.popitem(last=False)
+            expired += 1
+        if expired:
+            self._stats["evicted"] += expired
+            if self._writer is not None:
+                self._writer.execute("DELETE FROM seen_events WHERE seen_at < ?", (cutoff,))
+
+    def contains(self, key: str) -> bool:
+        """Check whether ``key`` was seen within the window.
+
+        Args:
+            key: Event key
+
+        Returns:
+            True if the key is a duplicate
+        """
+        now = time.time()
+        with self._lock:
+            self._stats["checked"] += 1
+            seen_at = self._seen.get(key)
+            duplicate = seen_at is not None and seen_at >= now - self.ttl
+            if duplicate:
+                self._stats["duplicates"] += 1
+            return duplicate
+
+    def add(self, key: str) -> None:
+        """Record ``key`` as seen now.
+
+        Args:
+            key: Event key
+        """
+        now = time.time()
+        with self._lock:
+            self._seen[key] = now
+            self._seen.move_to_end(key)
+            self._expire(now)
+        if self._writer is not None:
+            self._writer.execute(
+                "INSERT OR REPLACE INTO seen_events (event_key, seen_at) VALUES (?, ?)",
+                (key, now),
+            )
+
+    def check_and_add(self, key: str) -> bool:
+        """Record ``key`` and report whether it had already been seen.
+
+        Args:
+            key: Event key
+
+        Returns:
+            True if the key is a duplicate (and was not recorded again)
+        """
+        if self.contains(key):
+            return True
+        self.add(key)
+        return False
+
+    def discard(self, key: str) -> None:
+        """Forget ``key`` so a redelivery is processed again (e.g. after a failure).
+
+        Args:
+            key: Event key
+        """
+        with self._lock:
+            self._seen.pop(key, None)
+        if self._writer is not None:
+            self._writer.execute("DELETE FROM seen_events WHERE event_key = ?", (key,))
+
+    def __len__(self) -> int:
+        return len(self._seen)
+
+    def close(self) -> None:
+        """Flush and close the backing database, if any."""
+        if self._writer is not None:
+            self._writer.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get deduplication statistics.
+
+        Returns:
+            Dictionary with checked, duplicate and evicted counts plus index size
+        """
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+            stats["size"] = len(self._seen)
+        stats["persistent"] = self._writer is not None
+        return stats
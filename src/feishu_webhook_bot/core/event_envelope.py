@@ -0,0 +1,127 @@
+"""Normalized envelope for inbound events.
+
+Every inbound payload is wrapped once in an ``EventEnvelope`` that is shared
+by all consumers (chat controller, message bridge, plugins, automation).
+Derived values are computed on first access and cached, so the payload is
+parsed into an ``IncomingMessage`` at most once and consumers that only need
+the event type never pay for message parsing.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Sequence
+from functools import cached_property
+from typing import Any
+
+from .event_dedup import extract_event_key
+from .logger import get_logger
+from .message_handler import IncomingMessage, MessageParser, get_chat_key, get_user_key
+
+logger = get_logger(__name__)
+
+MessageParseFunc = Callable[[dict[str, Any]], IncomingMessage | None]
+
+
+class EventEnvelope:
+    """One inbound event with lazily computed, cached views of its payload.
+
+    Example:
+        ```python
+        envelope = EventEnvelope(payload, parsers=[FeishuMessageParser()])
+        if envelope.is_chat_message and envelope.message:
+            print(envelope.user_key, envelope.message.content)
+        ```
+    """
+
+    def __init__(
+        self,
+        payload: dict[str, Any],
+        parsers: Sequence[MessageParser] = (),
+        parse: MessageParseFunc | None = None,
+        provider: str | None = None,
+    ) -> None:
+        """Wrap a raw event payload.
+
+        Args:
+            payload: Raw event payload
+            parsers: Parsers tried in order to build ``message``
+            parse: Fallback used when no parser produced a message
+            provider: Provider name (defaults to the ``_provider`` marker set by the event server)
+        """
+        self.payload = payload
+        self.provider: str = provider if provider is not None else payload.get("_provider", "")
+        self.received_at = time.time()
+        self._parsers = parsers
+        self._parse = parse
+
+    @cached_property
+    def event_type(self) -> str:
+        """Event type: Feishu ``header.event_type``, OneBot ``post_type.sub_type`` or ``type``."""
+        header = self.payload.get("header")
+        if isinstance(header, dict) and header.get("event_type"):
+            return str(header["event_type"])
+
+        post_type = self.payload.get("post_type")
+        if post_type:
+            sub_type = self.payload.get(f"{post_type}_type")
+            if post_type == "meta_event":
+                sub_type = self.payload.get("meta_event_type")
+            return f"{post_type}.{sub_type}" if sub_type else str(post_type)
+
+        if self.payload.get("type"):
+            return str(self.payload["type"])
+        event = self.payload.get("event")
+        if isinstance(event, dict) and event.get("type"):
+            return str(event["type"])
+        return ""
+
+    @cached_property
+    def is_chat_message(self) -> bool:
+        """Whether the event is a chat message (Feishu v1/v2 or OneBot11)."""
+        payload = self.payload
+        if payload.get("type") == "message":
+            return True
+
+        header = payload.get("header")
+        if isinstance(header, dict) and header.get("event_type") == "im.message.receive_v1":
+            return True
+
+        event = payload.get("event")
+        if isinstance(event, dict) and event.get("type") == "message":
+            return True
+
+        return payload.get("post_type") == "message"
+
+    @cached_property
+    def message(self) -> IncomingMessage | None:
+        """Parsed message, or None if the payload is not a parseable message."""
+        for parser in self._parsers:
+            try:
+                if parser.can_parse(self.payload):
+                    message = parser.parse(self.payload)
+                    if message is not None:
+                        return message
+            except Exception as exc:
+                logger.debug("Parser %s failed: %s", type(parser).__name__, exc, exc_info=True)
+        if self._parse is not None:
+            return self._parse(self.payload)
+        return None
+
+    @cached_property
+    def event_key(self) -> str | None:
+        """Idempotency key of the event, or None if it has no stable ID."""
+        return extract_event_key(self.provider, self.payload)
+
+    @cached_property
+    def user_key(self) -> str | None:
+        """Conversation key of the sender (see ``get_user_key``)."""
+        return get_user_key(self.message) if self.message is not None else None
+
+    @cached_property
+    def chat_key(self) -> str | None:
+        """Key of the chat the message was sent in (see ``get_chat_key``)."""
+        return get_chat_key(self.message) if self.message is not None else None
+
+    def __repr__(self) -> str:
+        return f"EventEnvelope(provider={self.provider!r}, event_type={self.event_type!r})"
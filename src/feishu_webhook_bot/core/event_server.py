@@ -1,4 +1,13 @@
-"""FastAPI-based event ingestion server for multi-provider webhook callbacks."""
+"""FastAPI-based event ingestion server for multi-provider webhook callbacks.
+
+Callbacks are verified, acknowledged and pushed into a bounded asyncio queue
+that a pool of workers drains, so slow plugins or automations never delay
+the HTTP response (Feishu redelivers callbacks not answered within 3s). When
+the queue is full the server answers 503 (or 429) with ``Retry-After`` so
+senders back off instead of piling up requests. Redelivered events are
+recognised by their event or message ID and acknowledged without being
+dispatched again.
+"""
 
 from __future__ import annotations
 
@@ -6,20 +15,25 @@ import asyncio
 import base64
 import hashlib
 import hmac
+import inspect
 import threading
-from collections.abc import Callable
+import time
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from typing import Any
 
 import uvicorn
 from fastapi import FastAPI, HTTPException, Request
 
 from .config import EventServerConfig
+from .event_dedup import EventDeduplicator, extract_event_key
 from .logger import get_logger
 
 logger = get_logger("event_server")
 
-EventHandler = Callable[[dict[str, Any]], None]
-ProviderEventHandler = Callable[[str, dict[str, Any]], None]
+EventHandler = Callable[[dict[str, Any]], Any]
+ProviderEventHandler = Callable[[str, dict[str, Any]], Any]
 
 
 class EventServer:
@@ -29,6 +43,8 @@ class EventServer:
     - Feishu webhook events (default /feishu/events)
     - Napcat/QQ OneBot11 events (optional /qq/events)
     - Custom provider events via configurable paths
+
+    Handlers may be plain functions or coroutine functions.
     """
 
     def __init__(
@@ -49,10 +65,33 @@ class EventServer:
         self._config = config
         self._handler = handler
         self._provider_handler = provider_handler
-        self._app = FastAPI()
+        self._app = FastAPI(lifespan=self._lifespan)
         self._server: uvicorn.Server | None = None
         self._thread: threading.Thread | None = None
 
+        # Ingress pipeline (created lazily on the serving event loop)
+        self._ingress_workers = getattr(config, "ingress_workers", 0)
+        self._ingress: asyncio.Queue[tuple[str, dict[str, Any], float]] | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._workers: list[asyncio.Task[None]] = []
+        self._executor: ThreadPoolExecutor | None = None
+        self._dedup: EventDeduplicator | None = None
+        if getattr(config, "dedup_enabled", False) is True:
+            self._dedup = EventDeduplicator(
+                ttl=config.dedup_ttl,
+                max_entries=config.dedup_max_entries,
+                db_path=config.dedup_db_path,
+            )
+        self._ingress_stats = {
+            "accepted": 0,
+            "duplicates": 0,
+            "rejected": 0,
+            "processed": 0,
+            "failed": 0,
+            "max_depth": 0,
+            "total_wait": 0.0,
+        }
+
         # Extract QQ access token from providers config if available
         self._qq_access_token: str | None = None
         providers_list = providers_config or getattr(config, "providers", None) or []
@@ -86,17 +125,7 @@ class EventServer:
 
             # Add provider info to payload for routing
             payload["_provider"] = "feishu"
-
-            try:
-                # Call provider handler if available
-                if self._provider_handler:
-                    self._provider_handler("feishu", payload)
-                # Always call legacy handler for backward compatibility
-                self._handler(payload)
-            except Exception as exc:  # pragma: no cover - defensive logging
-                logger.error("Feishu event handler failure: %s", exc, exc_info=True)
-                raise HTTPException(status_code=500, detail="Handler failure") from exc
-
+            await self._submit("feishu", payload)
             return {"status": "ok"}
 
         # QQ/Napcat OneBot11 event endpoint
@@ -129,16 +158,7 @@ class EventServer:
 
             # Add provider info to payload for routing
             payload["_provider"] = "napcat"
-
-            try:
-                # Call provider handler if available
-                if self._provider_handler:
-                    self._provider_handler("napcat", payload)
-                # Also call legacy handler
-                self._handler(payload)
-            except Exception as exc:  # pragma: no cover - defensive logging
-                logger.error("QQ event handler failure: %s", exc, exc_info=True)
-                raise HTTPException(status_code=500, detail="Handler failure") from exc
+            await self._submit("napcat", payload)
 
             # OneBot11 expects empty response or specific format
             return {"status": "ok"}
@@ -152,21 +172,180 @@ class EventServer:
                 raise HTTPException(status_code=400, detail="Invalid JSON") from exc
 
             payload["_provider"] = provider_name
+            await self._submit(provider_name, payload)
+            return {"status": "ok"}
+
+        @self._app.get("/metrics/ingress")
+        async def ingress_metrics() -> dict[str, Any]:
+            return self.get_ingress_stats()
+
+    # ------------------------------------------------------------------
+    # Ingress pipeline
+    # ------------------------------------------------------------------
+    @asynccontextmanager
+    async def _lifespan(self, app: FastAPI) -> AsyncIterator[None]:
+        """Start workers with the server and drain the queue on shutdown."""
+        if self._ingress_workers > 0:
+            self._ensure_workers()
+        try:
+            yield
+        finally:
+            await self._shutdown_workers()
+
+    def _ensure_workers(self) -> asyncio.Queue[tuple[str, dict[str, Any], float]]:
+        """Create the queue and worker tasks on the running loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._ingress is None or self._loop is not loop:
+            self._loop = loop
+            self._ingress = asyncio.Queue(maxsize=self._config.ingress_queue_size)
+            self._workers = [
+                loop.create_task(self._worker(), name=f"event-ingress-{i}")
+                for i in range(self._ingress_workers)
+            ]
+            logger.info(
+                "Event ingress started: workers=%d, queue_size=%d",
+                self._ingress_workers,
+                self._config.ingress_queue_size,
+            )
+        return self._ingress
+
+    async def _submit(self, provider_name: str, payload: dict[str, Any]) -> None:
+        """Queue an event for the workers, or process it inline if none are configured.
+
+        Duplicate deliveries are acknowledged without being dispatched. An
+        event is only remembered once it has been accepted, so a delivery
+        rejected by backpressure or failing inline is processed on retry.
+
+        Raises:
+            HTTPException: 503/429 when the queue is full, or 500 when an
+                inline handler fails
+        """
+        event_key = extract_event_key(provider_name, payload) if self._dedup is not None else None
+        if event_key is not None and self._dedup is not None:
+            if self._dedup.contains(event_key):
+                self._ingress_stats["duplicates"] += 1
+                logger.debug("Dropping duplicate %s event %s", provider_name, event_key)
+                return
+
+        if self._ingress_workers <= 0:
+            if event_key is not None and self._dedup is not None:
+                self._dedup.add(event_key)
+            try:
+                await self._run_handlers(provider_name, payload, offload=False)
+            except Exception as exc:
+                if event_key is not None and self._dedup is not None:
+                    self._dedup.discard(event_key)
+                logger.error("%s event handler failure: %s", provider_name, exc, exc_info=True)
+                raise HTTPException(status_code=500, detail="Handler failure") from exc
+            return
 
+        ingress = self._ensure_workers()
+        try:
+            ingress.put_nowait((provider_name, payload, time.monotonic()))
+        except asyncio.QueueFull:
+            self._ingress_stats["rejected"] += 1
+            logger.warning(
+                "Event queue full (%d events), rejecting %s event", ingress.qsize(), provider_name
+            )
+            raise HTTPException(
+                status_code=self._config.ingress_overflow_status,
+                detail="Event queue full",
+                headers={"Retry-After": str(self._config.ingress_retry_after)},
+            ) from None
+
+        if event_key is not None and self._dedup is not None:
+            self._dedup.add(event_key)
+        self._ingress_stats["accepted"] += 1
+        depth = ingress.qsize()
+        if depth > self._ingress_stats["max_depth"]:
+            self._ingress_stats["max_depth"] = depth
+
+    async def _worker(self) -> None:
+        """Process queued events until cancelled."""
+        ingress = self._ingress
+        assert ingress is not None
+        while True:
+            provider_name, payload, enqueued_at = await ingress.get()
+            self._ingress_stats["total_wait"] += time.monotonic() - enqueued_at
             try:
-                if self._provider_handler:
-                    self._provider_handler(provider_name, payload)
-                self._handler(payload)
+                await self._run_handlers(
+                    provider_name, payload, offload=self._config.ingress_offload_sync_handlers
+                )
+                self._ingress_stats["processed"] += 1
             except Exception as exc:
-                logger.error(
-                    "Provider %s event handler failure: %s",
-                    provider_name,
-                    exc,
-                    exc_info=True,
+                self._ingress_stats["failed"] += 1
+                logger.error("%s event handler failure: %s", provider_name, exc, exc_info=True)
+            finally:
+                ingress.task_done()
+
+    async def _run_handlers(
+        self, provider_name: str, payload: dict[str, Any], offload: bool
+    ) -> None:
+        """Invoke the provider handler (if any) and the legacy handler for one event."""
+        if self._provider_handler:
+            await self._call(self._provider_handler, offload, provider_name, payload)
+        # Always call legacy handler for backward compatibility
+        await self._call(self._handler, offload, payload)
+
+    async def _call(self, handler: Callable[..., Any], offload: bool, *args: Any) -> None:
+        """Await async handlers; run sync ones inline or in the handler thread pool."""
+        if inspect.iscoroutinefunction(handler):
+            await handler(*args)
+        elif offload:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(1, self._ingress_workers),
+                    thread_name_prefix="event-handler",
                 )
-                raise HTTPException(status_code=500, detail="Handler failure") from exc
+            await asyncio.get_running_loop().run_in_executor(self._executor, handler, *args)
+        else:
+            result = handler(*args)
+            if inspect.isawaitable(result):
+                await result
+
+    async def _shutdown_workers(self) -> None:
+        """Give queued events a chance to finish, then stop the workers."""
+        ingress, workers = self._ingress, self._workers
+        if ingress is not None:
+            try:
+                await asyncio.wait_for(ingress.join(), timeout=self._config.ingress_drain_timeout)
+            except TimeoutError:
+                logger.warning(
+                    "Event ingress shut down with %d events unprocessed", ingress.qsize()
+                )
+        for task in workers:
+            task.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+        self._workers = []
+        self._ingress = None
+        self._loop = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def get_ingress_stats(self) -> dict[str, Any]:
+        """Get ingress queue metrics.
+
+        Returns:
+            Dictionary with queue depth and capacity, worker count, and
+            accepted/rejected/processed/failed counters
+        """
+        stats = dict(self._ingress_stats)
+        total_wait = stats.pop("total_wait")
+        handled = stats["processed"] + stats["failed"]
+        stats["avg_wait_ms"] = round(total_wait / handled * 1000, 3) if handled else 0.0
+        stats["queue_depth"] = self._ingress.qsize() if self._ingress is not None else 0
+        stats["queue_size"] = self._config.ingress_queue_size
+        stats["workers"] = len([task for task in self._workers if not task.done()])
+        if self._dedup is not None:
+            stats["dedup"] = self._dedup.get_stats()
+        return stats
 
-            return {"status": "ok"}
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        """Event loop that runs the ingress workers, if started."""
+        return self._loop
 
     # ------------------------------------------------------------------
     # Security helpers
@@ -241,6 +420,8 @@ class EventServer:
         if self._thread:
             self._thread.join(timeout=5)
             self._thread = None
+        if self._dedup is not None:
+            self._dedup.close()
         logger.info("Feishu event server stopped")
 
     @property
@@ -0,0 +1,487 @@
+"""Shared Feishu tenant access token service.
+
+Every component that calls the Open Platform (the API client, the image
+uploader, the calendar plugin) needs a ``tenant_access_token``. Fetching one
+per component wastes requests and refreshing lazily puts the token round trip
+on a user-facing call. ``FeishuTokenService`` keeps one token per ``app_id``:
+
+- Tokens are refreshed in the background ``refresh_ahead`` seconds before
+  they expire, so request paths normally only read the cache
+- Refreshes are single-flight: concurrent callers (threads or coroutines)
+  wait for one request instead of each sending their own
+- With ``persist_path`` set, tokens are shared through SQLite. A process
+  holds the database write lock while it fetches, so processes starting at
+  the same time reuse the first one's token instead of all calling the auth
+  endpoint
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .http_pool import get_http_pool
+from .logger import get_logger
+
+if TYPE_CHECKING:
+    import httpx
+
+    from .config import FeishuTokenConfig
+
+logger = get_logger(__name__)
+
+DEFAULT_BASE_URL = "https://open.feishu.cn/open-apis"
+TENANT_TOKEN_PATH = "/auth/v3/tenant_access_token/internal"
+
+# Seconds between retries after a failed background refresh
+_RETRY_DELAY = 30.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tenant_tokens (
+    app_id TEXT PRIMARY KEY,
+    token TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+class FeishuTokenError(ValueError):
+    """Raised when Feishu rejects a tenant access token request."""
+
+    def __init__(self, code: int, msg: str):
+        self.code = code
+        self.msg = msg
+        super().__init__(f"Failed to get token: {msg} (code {code})")
+
+
+@dataclass
+class _TokenEntry:
+    """Cached token and refresh state of one app."""
+
+    app_secret: str
+    base_url: str
+    token: str = ""
+    expires_at: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    timer: threading.Timer | None = None
+
+
+class FeishuTokenService:
+    """Tenant access tokens shared by all Open Platform callers, keyed by app_id.
+
+    Example:
+        ```python
+        service = get_token_service()
+        token = service.get_token("cli_xxx", "secret")
+        token = await service.aget_token("cli_xxx", "secret")
+        ```
+    """
+
+    def __init__(
+        self,
+        refresh_ahead: float = 300.0,
+        min_validity: float = 60.0,
+        proactive_refresh: bool = True,
+        persist_path: str | Path | None = None,
+        timeout: float = 10.0,
+    ) -> None:
+        """Initialize the service.
+
+        Args:
+            refresh_ahead: Seconds before expiry a token is refreshed in the
+                background
+            min_validity: Tokens expiring sooner than this are refreshed on
+                the request path
+            proactive_refresh: Whether to refresh tokens in the background
+            persist_path: SQLite file shared between processes (disabled if None)
+            timeout: Timeout of token requests in seconds
+
+        Raises:
+            ValueError: If min_validity exceeds refresh_ahead
+        """
+        if min_validity > refresh_ahead:
+            raise ValueError("min_validity must not exceed refresh_ahead")
+        self.refresh_ahead = refresh_ahead
+        self.min_validity = min_validity
+        self.proactive_refresh = proactive_refresh
+        self.persist_path = Path(persist_path) if persist_path else None
+        self.timeout = timeout
+        self._entries: dict[str, _TokenEntry] = {}
+        self._entries_lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._closed = False
+        self._hits = 0
+        self._fetches = 0
+        self._shared = 0
+        self._background_refreshes = 0
+        self._failures = 0
+        if self.persist_path is not None:
+            self._init_db()
+
+    @classmethod
+    def from_config(cls, config: FeishuTokenConfig) -> FeishuTokenService:
+        """Create a service from the ``feishu_tokens`` configuration section.
+
+        Args:
+            config: Token service configuration
+
+        Returns:
+            New FeishuTokenService
+        """
+        return cls(
+            refresh_ahead=config.refresh_ahead_seconds,
+            min_validity=config.min_validity_seconds,
+            proactive_refresh=config.proactive_refresh,
+            persist_path=config.persist_path,
+        )
+
+    @property
+    def closed(self) -> bool:
+        """Whether background refreshes have been stopped."""
+        return self._closed
+
+    def matches(self, other: FeishuTokenService) -> bool:
+        """Check whether another service was created with the same settings.
+
+        Args:
+            other: Service to compare with
+
+        Returns:
+            True if refresh timing and persistence are equal
+        """
+        return (
+            self.refresh_ahead == other.refresh_ahead
+            and self.min_validity == other.min_validity
+            and self.proactive_refresh == other.proactive_refresh
+            and self.persist_path == other.persist_path
+        )
+
+    def get_token(
+        self,
+        app_id: str,
+        app_secret: str,
+        *,
+        base_url: str = DEFAULT_BASE_URL,
+        force_refresh: bool = False,
+        client: httpx.Client | None = None,
+    ) -> str:
+        """Get a valid tenant access token, fetching one only if needed.
+
+        Args:
+            app_id: Feishu application ID
+            app_secret: Feishu application secret
+            base_url: Open Platform base URL
+            force_refresh: Replace the cached token (e.g. after the API
+                rejected it); concurrent forced refreshes still share one
+                request
+            client: HTTP client to fetch with (shared pool client if None)
+
+        Returns:
+            Tenant access token
+
+        Raises:
+            FeishuTokenError: If Feishu rejects the credentials
+            httpx.HTTPError: If the token request fails
+        """
+        entry = self._entry(app_id, app_secret, base_url)
+        seen = entry.token
+        if not force_refresh and self._usable(entry.expires_at, self.min_validity):
+            self._hits += 1
+            return seen
+        return self._refresh(app_id, entry, seen=seen, force=force_refresh, client=client)
+
+    async def aget_token(
+        self,
+        app_id: str,
+        app_secret: str,
+        *,
+        base_url: str = DEFAULT_BASE_URL,
+        force_refresh: bool = False,
+    ) -> str:
+        """Async variant of ``get_token``; fetching runs in a worker thread.
+
+        Args:
+            app_id: Feishu application ID
+            app_secret: Feishu application secret
+            base_url: Open Platform base URL
+            force_refresh: Replace the cached token
+
+        Returns:
+            Tenant access token
+
+        Raises:
+            FeishuTokenError: If Feishu rejects the credentials
+            httpx.HTTPError: If the token request fails
+        """
+        entry = self._entry(app_id, app_secret, base_url)
+        if not force_refresh and self._usable(entry.expires_at, self.min_validity):
+            self._hits += 1
+            return entry.token
+        return await asyncio.to_thread(
+            self.get_token,
+            app_id,
+            app_secret,
+            base_url=base_url,
+            force_refresh=force_refresh,
+        )
+
+    def invalidate(self, app_id: str) -> None:
+        """Drop the cached token of an app; the next call fetches a new one.
+
+        Args:
+            app_id: Feishu application ID
+        """
+        with self._entries_lock:
+            entry = self._entries.pop(app_id, None)
+        if entry is not None and entry.timer is not None:
+            entry.timer.cancel()
+
+    def close(self) -> None:
+        """Stop background refreshes. Safe to call more than once."""
+        self._closed = True
+        with self._entries_lock:
+            entries = list(self._entries.values())
+        for entry in entries:
+            if entry.timer is not None:
+                entry.timer.cancel()
+                entry.timer = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get service statistics.
+
+        Returns:
+            Dictionary with cache hits, token requests, tokens reused from
+            other processes, background refreshes, failures and the seconds
+            until each app's token expires
+        """
+        now = time.time()
+        with self._entries_lock:
+            expires_in = {
+                app_id: round(entry.expires_at - now, 1)
+                for app_id, entry in self._entries.items()
+                if entry.token
+            }
+        return {
+            "apps": len(expires_in),
+            "hits": self._hits,
+            "fetches": self._fetches,
+            "shared": self._shared,
+            "background_refreshes": self._background_refreshes,
+            "failures": self._failures,
+            "expires_in": expires_in,
+            "persistent": self.persist_path is not None,
+        }
+
+    def _entry(self, app_id: str, app_secret: str, base_url: str) -> _TokenEntry:
+        """Get or create the entry of an app, updating changed credentials."""
+        with self._entries_lock:
+            entry = self._entries.get(app_id)
+            if entry is None:
+                entry = _TokenEntry(app_secret=app_secret, base_url=base_url)
+                self._entries[app_id] = entry
+            elif entry.app_secret != app_secret or entry.base_url != base_url:
+                entry.app_secret = app_secret
+                entry.base_url = base_url
+                entry.token = ""
+                entry.expires_at = 0.0
+            return entry
+
+    @staticmethod
+    def _usable(expires_at: float, margin: float) -> bool:
+        """Check whether a token is valid for at least ``margin`` more seconds."""
+        return expires_at - time.time() > margin
+
+    def _refresh(
+        self,
+        app_id: str,
+        entry: _TokenEntry,
+        *,
+        seen: str,
+        force: bool,
+        client: httpx.Client | None = None,
+    ) -> str:
+        """Single-flight refresh of one app's token.
+
+        ``seen`` is the token the caller found in the cache; if another caller
+        replaced it while this one waited for the lock, the new token is used.
+        """
+        with entry.lock:
+            replaced = entry.token != seen
+            if self._usable(entry.expires_at, self.min_validity) and (replaced or not force):
+                self._hits += 1
+                return entry.token
+
+            if self.persist_path is not None:
+                token, expires_at = self._refresh_shared(app_id, entry, seen, client)
+            else:
+                token, expires_at = self._fetch(app_id, entry, client)
+            entry.token = token
+            entry.expires_at = expires_at
+            self._schedule(app_id, entry)
+            return token
+
+    def _fetch(
+        self, app_id: str, entry: _TokenEntry, client: httpx.Client | None
+    ) -> tuple[str, float]:
+        """Request a new token from Feishu.
+
+        Returns:
+            Tuple of (token, expiry as a Unix timestamp)
+        """
+        logger.debug("Requesting tenant_access_token for %s", app_id)
+        http = client or get_http_pool().sync_client()
+        try:
+            response = http.post(
+                entry.base_url.rstrip("/") + TENANT_TOKEN_PATH,
+                json={"app_id": app_id, "app_secret": entry.app_secret},
+                timeout=self.timeout,
+            )
+            response.raise_for_status()
+            data = response.json()
+            if data.get("code") != 0:
+                raise FeishuTokenError(data.get("code", -1), data.get("msg", "Unknown error"))
+        except Exception:
+            self._failures += 1
+            raise
+        self._fetches += 1
+        expire = data.get("expire", 7200)
+        logger.info("Obtained tenant_access_token for %s (expires in %d seconds)", app_id, expire)
+        return data["tenant_access_token"], time.time() + expire
+
+    def _refresh_shared(
+        self, app_id: str, entry: _TokenEntry, seen: str, client: httpx.Client | None
+    ) -> tuple[str, float]:
+        """Reuse a token another process stored, or fetch and store one.
+
+        The database write lock is held during the fetch so that other
+        processes wait for this token instead of requesting their own.
+        """
+        with self._db_lock, contextlib.closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = conn.execute(
+                    "SELECT token, expires_at FROM tenant_tokens WHERE app_id = ?", (app_id,)
+                ).fetchone()
+                if row and row[0] != seen and self._usable(row[1], self.refresh_ahead):
+                    self._shared += 1
+                    logger.debug("Reusing stored tenant_access_token for %s", app_id)
+                    conn.execute("COMMIT")
+                    return row[0], row[1]
+                token, expires_at = self._fetch(app_id, entry, client)
+                conn.execute(
+                    "INSERT INTO tenant_tokens (app_id, token, expires_at, updated_at) "
+                    "VALUES (?, ?, ?, ?) ON CONFLICT(app_id) DO UPDATE SET "
+                    "token = excluded.token, expires_at = excluded.expires_at, "
+                    "updated_at = excluded.updated_at",
+                    (app_id, token, expires_at, time.time()),
+                )
+                conn.execute("COMMIT")
+                return token, expires_at
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _schedule(self, app_id: str, entry: _TokenEntry, delay: float | None = None) -> None:
+        """Schedule the background refresh of an app's token."""
+        if not self.proactive_refresh or self._closed:
+            return
+        if entry.timer is not None:
+            entry.timer.cancel()
+        if delay is None:
+            delay = max(entry.expires_at - time.time() - self.refresh_ahead, _RETRY_DELAY)
+        entry.timer = threading.Timer(delay, self._refresh_in_background, args=(app_id, entry))
+        entry.timer.daemon = True
+        entry.timer.start()
+
+    def _refresh_in_background(self, app_id: str, entry: _TokenEntry) -> None:
+        """Timer callback refreshing a token before it expires."""
+        if self._closed or self._entries.get(app_id) is not entry:
+            return
+        try:
+            self._refresh(app_id, entry, seen=entry.token, force=True)
+            self._background_refreshes += 1
+        except Exception as exc:
+            logger.warning(
+                "Background refresh of tenant_access_token for %s failed: %s", app_id, exc
+            )
+            self._schedule(app_id, entry, delay=_RETRY_DELAY)
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the shared token database."""
+        assert self.persist_path is not None
+        conn = sqlite3.connect(self.persist_path, timeout=30.0, isolation_level=None)
+        conn.execute("PRAGMA busy_timeout = 30000")
+        return conn
+
+    def _init_db(self) -> None:
+        """Create the token database, readable only by the current user."""
+        assert self.persist_path is not None
+        self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+        with contextlib.closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute(_SCHEMA)
+        with contextlib.suppress(OSError):
+            os.chmod(self.persist_path, 0o600)
+
+
+# Global token service instance
+_global_service: FeishuTokenService | None = None
+_global_lock = threading.Lock()
+
+
+def get_token_service() -> FeishuTokenService:
+    """Get or create the global token service.
+
+    A closed service is replaced, so tokens are fetched again after a bot stop.
+
+    Returns:
+        FeishuTokenService instance
+    """
+    global _global_service
+    with _global_lock:
+        if _global_service is None or _global_service.closed:
+            _global_service = FeishuTokenService()
+        return _global_service
+
+
+def configure_token_service(config: FeishuTokenConfig) -> FeishuTokenService:
+    """Replace the global token service unless it already uses these settings.
+
+    Args:
+        config: Token service configuration
+
+    Returns:
+        The global FeishuTokenService
+    """
+    global _global_service
+    candidate = FeishuTokenService.from_config(config)
+    with _global_lock:
+        previous = _global_service
+        if previous is not None and not previous.closed and previous.matches(candidate):
+            return previous
+        _global_service = candidate
+    if previous is not None:
+        previous.close()
+    logger.info(
+        "Feishu token service configured (refresh_ahead=%ds, persist=%s)",
+        config.refresh_ahead_seconds,
+        config.persist_path or "off",
+    )
+    return candidate
+
+
+def reset_token_service() -> None:
+    """Stop and drop the global token service (mainly for tests)."""
+    global _global_service
+    with _global_lock:
+        service, _global_service = _global_service, None
+    if service is not None:
+        service.close()
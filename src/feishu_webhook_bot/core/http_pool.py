@@ -0,0 +1,412 @@
+"""Process-wide pooled HTTP clients.
+
+Creating an ``httpx`` client per request pays TCP and TLS setup on every call
+and never reuses a connection. ``HTTPClientPool`` owns shared clients instead:
+
+- One ``httpx.Client`` for synchronous callers (safe to share across threads)
+- One ``httpx.AsyncClient`` per event loop, since async connections are bound
+  to the loop that opened them
+- Keep-alive pools sized by ``HTTPPoolConfig``, with optional per-host
+  connection limits and optional HTTP/2 (needs the ``h2`` package)
+
+Shared clients carry no default headers or timeout; callers pass both per
+request and must not close the clients they borrow. ``PooledClient`` does this
+for callers that want a base URL, default headers and a timeout of their own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import threading
+import weakref
+from collections import Counter
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from .logger import get_logger
+
+if TYPE_CHECKING:
+    from .config import HTTPClientConfig
+
+logger = get_logger(__name__)
+
+
+def _pool_snapshot(transport: Any) -> dict[str, int]:
+    """Count the connections held by an httpx transport's connection pool."""
+    pool = getattr(transport, "_pool", None)
+    connections = list(getattr(pool, "connections", None) or [])
+    idle = sum(1 for connection in connections if connection.is_idle())
+    return {"connections": len(connections), "idle": idle, "active": len(connections) - idle}
+
+
+def _merge_snapshots(snapshots: list[dict[str, int]]) -> dict[str, int]:
+    """Add up connection counts from several transports."""
+    total = {"connections": 0, "idle": 0, "active": 0}
+    for snapshot in snapshots:
+        for key in total:
+            total[key] += snapshot[key]
+    return total
+
+
+class HTTPClientPool:
+    """Shared keep-alive HTTP clients for providers, plugins and actions.
+
+    Example:
+        ```python
+        pool = get_http_pool()
+        response = pool.sync_client().get("https://example.com", timeout=10.0)
+
+        client = pool.async_client()
+        response = await client.get("https://example.com", timeout=10.0)
+        ```
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = False,
+        per_host_limits: dict[str, int] | None = None,
+        timeout: float = 10.0,
+    ) -> None:
+        """Initialize the pool; clients are created on first use.
+
+        Args:
+            max_connections: Maximum open connections per client
+            max_keepalive_connections: Maximum idle connections kept open
+            keepalive_expiry: Seconds an idle connection is kept open
+            http2: Whether to negotiate HTTP/2 (ignored if ``h2`` is missing)
+            per_host_limits: Maximum connections for specific hosts
+            timeout: Timeout for requests that do not pass their own
+        """
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requested but the 'h2' package is not installed; using HTTP/1.1")
+            http2 = False
+        self.http2 = http2
+        self.timeout = timeout
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.per_host_limits = dict(per_host_limits or {})
+        self._sync_client: httpx.Client | None = None
+        self._async_clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self._requests_by_host: Counter[str] = Counter()
+        self._closed = False
+
+    @classmethod
+    def from_config(cls, config: HTTPClientConfig) -> HTTPClientPool:
+        """Create a pool from the ``http`` configuration section.
+
+        Args:
+            config: HTTP client configuration
+
+        Returns:
+            New HTTPClientPool
+        """
+        pool = config.pool
+        return cls(
+            max_connections=pool.max_connections,
+            max_keepalive_connections=pool.max_keepalive_connections,
+            keepalive_expiry=pool.keepalive_expiry,
+            http2=pool.http2,
+            per_host_limits=pool.per_host_limits,
+            timeout=config.timeout,
+        )
+
+    @property
+    def closed(self) -> bool:
+        """Whether the pool has been closed."""
+        return self._closed
+
+    def matches(self, other: HTTPClientPool) -> bool:
+        """Check whether another pool was created with the same settings.
+
+        Args:
+            other: Pool to compare with
+
+        Returns:
+            True if limits, HTTP/2, per-host limits and timeout are equal
+        """
+        return (
+            self.limits == other.limits
+            and self.http2 == other.http2
+            and self.per_host_limits == other.per_host_limits
+            and self.timeout == other.timeout
+        )
+
+    def sync_client(self) -> httpx.Client:
+        """Get the shared synchronous client.
+
+        Returns:
+            Shared httpx.Client (do not close it)
+
+        Raises:
+            RuntimeError: If the pool has been closed
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("HTTP client pool is closed")
+            if self._sync_client is None or self._sync_client.is_closed:
+                self._sync_client = httpx.Client(
+                    timeout=self.timeout,
+                    transport=httpx.HTTPTransport(limits=self.limits, http2=self.http2),
+                    mounts={
+                        f"all://{host}": httpx.HTTPTransport(
+                            limits=self._host_limits(limit), http2=self.http2
+                        )
+                        for host, limit in self.per_host_limits.items()
+                    },
+                    event_hooks={"request": [self._count_request]},
+                )
+            return self._sync_client
+
+    def async_client(self) -> httpx.AsyncClient:
+        """Get the shared asynchronous client of the running event loop.
+
+        Returns:
+            Shared httpx.AsyncClient (do not close it)
+
+        Raises:
+            RuntimeError: If called outside an event loop or after close
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("HTTP client pool is closed")
+            client = self._async_clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    transport=httpx.AsyncHTTPTransport(limits=self.limits, http2=self.http2),
+                    mounts={
+                        f"all://{host}": httpx.AsyncHTTPTransport(
+                            limits=self._host_limits(limit), http2=self.http2
+                        )
+                        for host, limit in self.per_host_limits.items()
+                    },
+                    event_hooks={"request": [self._count_request_async]},
+                )
+                self._async_clients[loop] = client
+            return client
+
+    def close(self) -> None:
+        """Close the synchronous client and stop handing out clients.
+
+        Async clients are dropped; use ``aclose`` from the event loop to
+        close the loop's client gracefully. Safe to call more than once.
+        """
+        with self._lock:
+            self._closed = True
+            client, self._sync_client = self._sync_client, None
+            self._async_clients.clear()
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """Close the running loop's async client and the synchronous client."""
+        client = self._async_clients.get(asyncio.get_running_loop())
+        self.close()
+        if client is not None:
+            await client.aclose()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get pool statistics.
+
+        Returns:
+            Dictionary with request counts per host, configured limits and
+            current open, idle and active connections
+        """
+        sync_transports: list[Any] = []
+        if self._sync_client is not None:
+            sync_transports = [self._sync_client._transport, *self._sync_client._mounts.values()]
+        async_transports = [
+            transport
+            for client in list(self._async_clients.values())
+            for transport in (client._transport, *client._mounts.values())
+        ]
+        return {
+            "requests": sum(self._requests_by_host.values()),
+            "requests_by_host": dict(self._requests_by_host.most_common(20)),
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "per_host_limits": dict(self.per_host_limits),
+            "sync_pool": _merge_snapshots([_pool_snapshot(t) for t in sync_transports]),
+            "async_clients": len(self._async_clients),
+            "async_pool": _merge_snapshots([_pool_snapshot(t) for t in async_transports]),
+            "closed": self._closed,
+        }
+
+    def _host_limits(self, max_connections: int) -> httpx.Limits:
+        """Limits for a host with its own connection cap."""
+        keepalive = self.limits.max_keepalive_connections
+        return httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=min(max_connections, keepalive or max_connections),
+            keepalive_expiry=self.limits.keepalive_expiry,
+        )
+
+    def _count_request(self, request: httpx.Request) -> None:
+        """Event hook counting requests per host."""
+        self._requests_by_host[request.url.host] += 1
+
+    async def _count_request_async(self, request: httpx.Request) -> None:
+        """Async event hook counting requests per host."""
+        self._count_request(request)
+
+
+# Global HTTP client pool instance
+_global_pool: HTTPClientPool | None = None
+_global_lock = threading.Lock()
+
+
+def get_http_pool() -> HTTPClientPool:
+    """Get or create the global HTTP client pool.
+
+    Returns:
+        HTTPClientPool instance
+    """
+    global _global_pool
+    with _global_lock:
+        if _global_pool is None or _global_pool.closed:
+            _global_pool = HTTPClientPool()
+        return _global_pool
+
+
+class PooledClient:
+    """Request helper sending through the global pool with its own defaults.
+
+    Relative URLs are appended to ``base_url``, and ``headers``, ``timeout``
+    and ``follow_redirects`` apply unless a request passes its own. The shared
+    client is looked up on every request, so a ``PooledClient`` keeps working
+    after the pool is reconfigured or used from another event loop. There is
+    nothing to close.
+
+    Example:
+        ```python
+        client = PooledClient(base_url="http://127.0.0.1:3000", timeout=10.0)
+        response = client.post("/send_group_msg", json=payload)
+
+        api = PooledClient(base_url=BASE_URL, asynchronous=True)
+        response = await api.get("/im/v1/chats")
+        ```
+    """
+
+    def __init__(
+        self,
+        base_url: str | None = None,
+        headers: Mapping[str, str] | None = None,
+        timeout: float | None = None,
+        *,
+        follow_redirects: bool | None = None,
+        asynchronous: bool = False,
+    ) -> None:
+        """Initialize the request defaults.
+
+        Args:
+            base_url: Prefix of relative request URLs
+            headers: Headers sent with every request
+            timeout: Request timeout in seconds (the pool's timeout if None)
+            follow_redirects: Whether to follow redirects (httpx default if None)
+            asynchronous: Send through the async client of the running event
+                loop; request methods then return awaitables
+        """
+        self.base_url = base_url.rstrip("/") if base_url else None
+        self.headers = dict(headers or {})
+        self.timeout = timeout
+        self.follow_redirects = follow_redirects
+        self.asynchronous = asynchronous
+
+    @property
+    def client(self) -> Any:
+        """Shared client requests are currently sent through (do not close it)."""
+        pool = get_http_pool()
+        return pool.async_client() if self.asynchronous else pool.sync_client()
+
+    def request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """Send a request; see ``httpx.Client.request``."""
+        return self.client.request(method, self._url(url), **self._options(kwargs))
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        """Send a GET request."""
+        return self.client.get(self._url(url), **self._options(kwargs))
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        """Send a POST request."""
+        return self.client.post(self._url(url), **self._options(kwargs))
+
+    def put(self, url: str, **kwargs: Any) -> Any:
+        """Send a PUT request."""
+        return self.client.put(self._url(url), **self._options(kwargs))
+
+    def patch(self, url: str, **kwargs: Any) -> Any:
+        """Send a PATCH request."""
+        return self.client.patch(self._url(url), **self._options(kwargs))
+
+    def delete(self, url: str, **kwargs: Any) -> Any:
+        """Send a DELETE request."""
+        return self.client.delete(self._url(url), **self._options(kwargs))
+
+    def _url(self, url: str) -> str:
+        """Resolve a relative URL against ``base_url``."""
+        if self.base_url is None or "://" in url:
+            return url
+        return f"{self.base_url}/{url.lstrip('/')}"
+
+    def _options(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """Apply the default headers, timeout and redirect handling."""
+        if self.headers:
+            kwargs["headers"] = {**self.headers, **(kwargs.get("headers") or {})}
+        if self.timeout is not None:
+            kwargs.setdefault("timeout", self.timeout)
+        if self.follow_redirects is not None:
+            kwargs.setdefault("follow_redirects", self.follow_redirects)
+        return kwargs
+
+
+def configure_http_pool(config: HTTPClientConfig) -> HTTPClientPool:
+    """Replace the global HTTP client pool unless it already uses these settings.
+
+    The previous pool is closed when it is replaced.
+
+    Args:
+        config: HTTP client configuration
+
+    Returns:
+        The global HTTPClientPool
+    """
+    global _global_pool
+    candidate = HTTPClientPool.from_config(config)
+    with _global_lock:
+        previous = _global_pool
+        if previous is not None and not previous.closed and previous.matches(candidate):
+            return previous
+        _global_pool = candidate
+    if previous is not None:
+        previous.close()
+    logger.info(
+        "HTTP client pool configured (max_connections=%d, keepalive=%d, http2=%s, hosts=%d)",
+        config.pool.max_connections,
+        config.pool.max_keepalive_connections,
+        _global_pool.http2,
+        len(config.pool.per_host_limits),
+    )
+    return _global_pool
+
+
+def close_http_pool() -> None:
+    """Close the global HTTP client pool, if one was created."""
+    global _global_pool
+    with _global_lock:
+        pool, _global_pool = _global_pool, None
+    if pool is not None:
+        pool.close()
@@ -0,0 +1,186 @@
+"""Content-addressed cache of uploaded Feishu image keys.
+
+Bots often send the same picture many times: chart snapshots that did not
+change, logos, RSS thumbnails. ``ImageKeyCache`` maps the SHA-256 of the image
+bytes (plus the app and image type, since an ``image_key`` belongs to the app
+that uploaded it) to the ``image_key`` Feishu returned, so identical images are
+uploaded once.
+
+Keys are kept in a ``TTLCache`` with LRU eviction and expire after
+``ttl_seconds``, which should stay below how long Feishu keeps uploaded
+images. An optional SQLite file keeps keys across restarts and lets processes
+sharing the file reuse each other's uploads.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from .logger import get_logger
+from .ttl_cache import SharedCache, TTLCache
+
+if TYPE_CHECKING:
+    from .config import ImageCacheConfig
+
+logger = get_logger("image_cache")
+
+# Default lifetime of cached image keys (30 days)
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600.0
+
+
+class ImageKeyCache:
+    """Thread-safe map from image content hash to Feishu image_key.
+
+    Example:
+        ```python
+        cache = get_image_key_cache()
+        key = cache.make_key("cli_xxx", "message", digest)
+        image_key = cache.get(key)
+        if image_key is None:
+            image_key = upload(...)
+            cache.set(key, image_key)
+        ```
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_size: int = 2000,
+        db_path: str | Path | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl_seconds: Seconds a cached image_key is reused
+            max_size: Maximum number of keys kept in memory and on disk
+            db_path: SQLite file backing the cache (None for memory only)
+        """
+        self._cache = TTLCache(
+            "image_keys", ttl_seconds, max_size, db_path=db_path, read_through=True
+        )
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    @staticmethod
+    def make_key(app_id: str, image_type: str, digest: str) -> str:
+        """Build the cache key of an image.
+
+        Args:
+            app_id: Feishu application that uploads the image
+            image_type: Feishu image type ("message" or "avatar")
+            digest: Hex SHA-256 of the image bytes
+
+        Returns:
+            Cache key string
+        """
+        return f"{app_id}:{image_type}:{digest}"
+
+    def get(self, key: str) -> str | None:
+        """Get a cached image_key.
+
+        Keys missing from memory are looked up in the database, where other
+        processes may have stored them.
+
+        Args:
+            key: Cache key from ``make_key``
+
+        Returns:
+            image_key, or None if not cached or expired
+        """
+        return self._cache.get(key)
+
+    def set(self, key: str, image_key: str) -> None:
+        """Cache the image_key of an uploaded image.
+
+        Args:
+            key: Cache key from ``make_key``
+            image_key: Key returned by Feishu
+        """
+        self._cache.set(key, image_key)
+
+    def invalidate(self, key: str) -> None:
+        """Forget one image, e.g. after Feishu rejected its key.
+
+        Args:
+            key: Cache key from ``make_key``
+        """
+        self._cache.delete(key)
+
+    def clear(self) -> None:
+        """Clear all cached keys and reset statistics."""
+        self._cache.clear()
+        self._cache.reset_stats()
+
+    def close(self) -> None:
+        """Commit pending database writes and close the database.
+
+        Safe to call more than once; the in-memory cache stays usable.
+        """
+        self._cache.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        return self._cache.get_stats()
+
+    def matches(self, ttl_seconds: float, max_size: int, db_path: str | Path | None) -> bool:
+        """Check whether the cache was created with the given settings.
+
+        Args:
+            ttl_seconds: Seconds a cached image_key is reused
+            max_size: Maximum number of cached keys
+            db_path: SQLite file backing the cache
+
+        Returns:
+            True if all settings are equal
+        """
+        return self._cache.matches(ttl_seconds, max_size, db_path)
+
+
+# Global image key cache instance
+_shared_cache: SharedCache[ImageKeyCache] = SharedCache(ImageKeyCache)
+
+
+def get_image_key_cache() -> ImageKeyCache:
+    """Get or create the global image key cache.
+
+    Returns:
+        ImageKeyCache instance
+    """
+    return _shared_cache.get()
+
+
+def configure_image_key_cache(config: ImageCacheConfig) -> ImageKeyCache:
+    """Replace the global image key cache unless it already uses these settings.
+
+    The previous cache is closed when it is replaced.
+
+    Args:
+        config: Image key cache configuration
+
+    Returns:
+        The global ImageKeyCache
+    """
+    previous = _shared_cache.current
+    cache = _shared_cache.configure(
+        ttl_seconds=config.ttl_seconds, max_size=config.max_size, db_path=config.db_path
+    )
+    if cache is previous:
+        return cache
+    logger.info(
+        "Image key cache configured (ttl=%ds, max_size=%d, db=%s)",
+        config.ttl_seconds,
+        config.max_size,
+        config.db_path or "none",
+    )
+    return cache
+
+
+def reset_image_key_cache() -> None:
+    """Close and drop the global image key cache (mainly for tests)."""
+    _shared_cache.reset()
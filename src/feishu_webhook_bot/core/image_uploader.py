@@ -10,17 +10,25 @@ or the base64 fallback methods.
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
 import mimetypes
 import platform
 import subprocess
+import tempfile
 import webbrowser
+from collections.abc import AsyncIterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Literal
+from typing import IO, Any, Literal
 
 import httpx
 
+from .feishu_token import get_token_service
+from .http_pool import PooledClient
+from .image_cache import ImageKeyCache, get_image_key_cache
 from .logger import get_logger
 
 logger = get_logger("image_uploader")
@@ -31,6 +39,17 @@ PERMISSION_DENIED_CODE = 99991672
 INVALID_TOKEN_CODE = 99991663
 INVALID_APP_CODE = 10003
 
+# Bytes read per step when hashing files
+_READ_CHUNK_SIZE = 64 * 1024
+# Base64 characters decoded per step (a multiple of 4)
+_BASE64_CHUNK_CHARS = 64 * 1024
+# Spooled uploads move from memory to a temporary file beyond this size
+_SPOOL_MAX_SIZE = 1024 * 1024
+
+ImageType = Literal["message", "avatar"]
+# A path to an image file or the raw image bytes
+ImageSource = str | Path | bytes
+
 
 @dataclass
 class PermissionError:
@@ -197,7 +216,8 @@ class FeishuImageUploader:
     1. Obtaining tenant_access_token using app credentials
     2. Uploading images to Feishu
     3. Returning image_key for use in messages
-    4. Auto-detecting permission errors and opening config page
+    4. Reusing the image_key of images uploaded before (by content hash)
+    5. Auto-detecting permission errors and opening config page
 
     Example:
         ```python
@@ -207,11 +227,15 @@ class FeishuImageUploader:
             auto_open_auth=True  # Auto-open browser on permission error
         )
 
-        # Upload from file
+        # Upload from file (identical images are uploaded only once)
         image_key = uploader.upload_image("path/to/image.png")
 
         # Use in webhook message
         client.send_image(image_key)
+
+        # Upload several images concurrently for a multi-image card
+        keys = uploader.upload_images(["a.png", "b.png", "c.png", "d.png"])
+        card = CardBuilder().add_image_combination(keys, combination_mode="quad").build()
         ```
 
     Note:
@@ -220,7 +244,8 @@ class FeishuImageUploader:
     """
 
     # Feishu API endpoints
-    TOKEN_URL = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
+    API_BASE = "https://open.feishu.cn/open-apis"
+    TOKEN_URL = f"{API_BASE}/auth/v3/tenant_access_token/internal"
     UPLOAD_URL = "https://open.feishu.cn/open-apis/im/v1/images"
 
     def __init__(
@@ -229,6 +254,8 @@ class FeishuImageUploader:
         app_secret: str,
         timeout: float = 30.0,
         auto_open_auth: bool = False,
+        cache: ImageKeyCache | None = None,
+        use_cache: bool = True,
     ):
         """Initialize the image uploader.
 
@@ -238,13 +265,24 @@ class FeishuImageUploader:
             timeout: HTTP request timeout in seconds
             auto_open_auth: If True, automatically open browser to permission
                            configuration page when permission errors occur
+            cache: Image key cache (the global cache if None)
+            use_cache: If False, every call uploads the image again
         """
         self.app_id = app_id
         self.app_secret = app_secret
         self.timeout = timeout
         self.auto_open_auth = auto_open_auth
+        self.use_cache = use_cache
+        self._cache = cache
         self._token: str | None = None
-        self._client = httpx.Client(timeout=timeout)
+        self._client = PooledClient(timeout=timeout)
+
+    @property
+    def cache(self) -> ImageKeyCache | None:
+        """Image key cache used for uploads, or None if caching is disabled."""
+        if not self.use_cache:
+            return None
+        return self._cache if self._cache is not None else get_image_key_cache()
 
     def __enter__(self) -> FeishuImageUploader:
         """Context manager entry."""
@@ -255,11 +293,10 @@ class FeishuImageUploader:
         self.close()
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
+        """Release resources; uploads use the shared HTTP pool, so nothing is closed."""
 
     def _get_tenant_access_token(self, force_refresh: bool = False) -> str:
-        """Obtain tenant_access_token from Feishu.
+        """Obtain tenant_access_token from the shared token service.
 
         Args:
             force_refresh: Force refresh token even if cached
@@ -268,28 +305,15 @@ class FeishuImageUploader:
             Tenant access token string
 
         Raises:
-            ValueError: If token request fails
+            FeishuTokenError: If token request fails (a ValueError)
         """
-        if self._token and not force_refresh:
-            return self._token
-
-        logger.debug("Requesting tenant_access_token")
-
-        response = self._client.post(
-            self.TOKEN_URL,
-            json={
-                "app_id": self.app_id,
-                "app_secret": self.app_secret,
-            },
+        self._token = get_token_service().get_token(
+            self.app_id,
+            self.app_secret,
+            base_url=self.API_BASE,
+            force_refresh=force_refresh,
+            client=self._client,
         )
-        response.raise_for_status()
-
-        data = response.json()
-        if data.get("code") != 0:
-            raise ValueError(f"Failed to get token: {data.get('msg')}")
-
-        self._token = data["tenant_access_token"]
-        logger.info("Successfully obtained tenant_access_token")
         return self._token
 
     def _handle_api_response(
@@ -419,10 +443,14 @@ class FeishuImageUploader:
     def upload_image(
         self,
         file_path: str | Path,
-        image_type: Literal["message", "avatar"] = "message",
+        image_type: ImageType = "message",
     ) -> str:
         """Upload an image file to Feishu.
 
+        The file is hashed and uploaded in chunks, so it is never read into
+        memory at once. An image uploaded before is not sent again; the cached
+        image_key is returned instead.
+
         Args:
             file_path: Path to the image file
             image_type: Image type - "message" for sending messages,
@@ -440,43 +468,14 @@ class FeishuImageUploader:
         if not path.exists():
             raise FileNotFoundError(f"Image file not found: {file_path}")
 
-        # Determine MIME type
-        mime_type, _ = mimetypes.guess_type(str(path))
-        if not mime_type:
-            mime_type = "application/octet-stream"
-
-        logger.debug("Uploading image: %s (type: %s)", path.name, mime_type)
-
-        # Get token
-        token = self._get_tenant_access_token()
-
-        # Upload image
-        with open(path, "rb") as f:
-            files = {
-                "image": (path.name, f, mime_type),
-            }
-            data = {
-                "image_type": image_type,
-            }
-
-            response = self._client.post(
-                self.UPLOAD_URL,
-                headers={"Authorization": f"Bearer {token}"},
-                files=files,
-                data=data,
-            )
-
-        result = self._handle_api_response(response, f"upload image '{path.name}'")
-        image_key = result["data"]["image_key"]
-        logger.info("Image uploaded successfully: %s -> %s", path.name, image_key)
-        return image_key
+        return self._upload_path(path, image_type)
 
     def upload_image_bytes(
         self,
         image_data: bytes,
         filename: str = "image.png",
         mime_type: str | None = None,
-        image_type: Literal["message", "avatar"] = "message",
+        image_type: ImageType = "message",
     ) -> str:
         """Upload image bytes directly to Feishu.
 
@@ -493,17 +492,218 @@ class FeishuImageUploader:
             FeishuPermissionDeniedError: If app lacks required permissions
             FeishuImageUploaderError: If upload fails
         """
+        mime_type = _guess_mime_type(filename, mime_type)
+        logger.debug("Uploading image bytes: %s (type: %s)", filename, mime_type)
+
+        digest = hashlib.sha256(image_data).hexdigest()
+        return self._upload(
+            image_data, digest, filename, mime_type, image_type, f"upload image bytes '{filename}'"
+        )
+
+    def upload_image_base64(
+        self,
+        base64_data: str,
+        filename: str = "image.png",
+        mime_type: str | None = None,
+        image_type: ImageType = "message",
+    ) -> str:
+        """Upload a base64-encoded image to Feishu.
+
+        The data is decoded in chunks into a spooled temporary file, so large
+        images are not held in memory a second time as bytes.
+
+        Args:
+            base64_data: Base64-encoded image data (without data URI prefix)
+            filename: Filename for the upload
+            mime_type: MIME type (auto-detected if not provided)
+            image_type: Image type - "message" or "avatar"
+
+        Returns:
+            image_key string for use in messages
+
+        Raises:
+            binascii.Error: If the data is not valid base64
+            FeishuPermissionDeniedError: If app lacks required permissions
+            FeishuImageUploaderError: If upload fails
+        """
+        mime_type = _guess_mime_type(filename, mime_type)
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as spool:
+            hasher = hashlib.sha256()
+            for chunk in _iter_base64_chunks(base64_data):
+                hasher.update(chunk)
+                spool.write(chunk)
+            spool.seek(0)
+            return self._upload(
+                spool,
+                hasher.hexdigest(),
+                filename,
+                mime_type,
+                image_type,
+                f"upload image base64 '{filename}'",
+            )
+
+    async def aupload_image_stream(
+        self,
+        source: AsyncIterable[bytes],
+        filename: str = "image.png",
+        mime_type: str | None = None,
+        image_type: ImageType = "message",
+    ) -> str:
+        """Upload an image produced by an async byte source.
+
+        Chunks are hashed and spooled as they arrive (to a temporary file
+        beyond 1 MiB), then uploaded from the spool in a worker thread. Use
+        this for images downloaded or rendered on the fly.
+
+        Args:
+            source: Async iterable of image byte chunks, e.g.
+                ``response.aiter_bytes()``
+            filename: Filename for the upload
+            mime_type: MIME type (auto-detected if not provided)
+            image_type: Image type - "message" or "avatar"
+
+        Returns:
+            image_key string for use in messages
+
+        Raises:
+            FeishuPermissionDeniedError: If app lacks required permissions
+            FeishuImageUploaderError: If upload fails
+        """
+        mime_type = _guess_mime_type(filename, mime_type)
+        with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_SIZE) as spool:
+            hasher = hashlib.sha256()
+            async for chunk in source:
+                hasher.update(chunk)
+                spool.write(chunk)
+            spool.seek(0)
+            return await asyncio.to_thread(
+                self._upload,
+                spool,
+                hasher.hexdigest(),
+                filename,
+                mime_type,
+                image_type,
+                f"upload image stream '{filename}'",
+            )
+
+    def upload_images(
+        self,
+        sources: Sequence[ImageSource],
+        image_type: ImageType = "message",
+        max_concurrency: int = 4,
+    ) -> list[str]:
+        """Upload several images concurrently.
+
+        Identical images are uploaded once and cached images are not uploaded
+        at all. The keys come back in input order, ready for
+        ``CardBuilder.add_image_combination``.
+
+        Args:
+            sources: Image file paths or raw image bytes
+            image_type: Image type - "message" or "avatar"
+            max_concurrency: Maximum uploads in flight
+
+        Returns:
+            image_key for each source, in the same order
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+            FileNotFoundError: If an image file doesn't exist
+            FeishuPermissionDeniedError: If app lacks required permissions
+            FeishuImageUploaderError: If an upload fails
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        digests = [_source_digest(source) for source in sources]
+        unique: dict[str, ImageSource] = {}
+        for digest, source in zip(digests, sources, strict=True):
+            unique.setdefault(digest, source)
+
+        def upload(digest: str) -> str:
+            source = unique[digest]
+            if isinstance(source, bytes):
+                return self._upload(
+                    source, digest, "image.png", "image/png", image_type, "upload image bytes"
+                )
+            return self._upload_path(Path(source), image_type, digest)
+
+        workers = min(max_concurrency, len(unique)) or 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="image-upload") as pool:
+            keys = dict(zip(unique, pool.map(upload, unique), strict=True))
+
+        logger.info("Uploaded %d images (%d unique)", len(digests), len(unique))
+        return [keys[digest] for digest in digests]
+
+    async def aupload_images(
+        self,
+        sources: Sequence[ImageSource],
+        image_type: ImageType = "message",
+        max_concurrency: int = 4,
+    ) -> list[str]:
+        """Async variant of ``upload_images``; uploads run in worker threads.
+
+        Args:
+            sources: Image file paths or raw image bytes
+            image_type: Image type - "message" or "avatar"
+            max_concurrency: Maximum uploads in flight
+
+        Returns:
+            image_key for each source, in the same order
+        """
+        return await asyncio.to_thread(self.upload_images, sources, image_type, max_concurrency)
+
+    def _upload_path(self, path: Path, image_type: ImageType, digest: str | None = None) -> str:
+        """Upload an image file, hashing it first unless the digest is known."""
+        # Determine MIME type
+        mime_type, _ = mimetypes.guess_type(str(path))
         if not mime_type:
-            mime_type, _ = mimetypes.guess_type(filename)
-            if not mime_type:
-                mime_type = "image/png"
+            mime_type = "application/octet-stream"
 
-        logger.debug("Uploading image bytes: %s (type: %s)", filename, mime_type)
+        logger.debug("Uploading image: %s (type: %s)", path.name, mime_type)
+
+        with open(path, "rb") as f:
+            if digest is None:
+                digest = _file_digest(f)
+                f.seek(0)
+            return self._upload(
+                f, digest, path.name, mime_type, image_type, f"upload image '{path.name}'"
+            )
+
+    def _upload(
+        self,
+        content: IO[bytes] | bytes,
+        digest: str,
+        filename: str,
+        mime_type: str,
+        image_type: ImageType,
+        operation: str,
+    ) -> str:
+        """Return the cached image_key of an image, or upload it.
+
+        Args:
+            content: Open binary file (streamed by httpx) or raw bytes
+            digest: Hex SHA-256 of the image bytes
+            filename: Filename for the upload
+            mime_type: MIME type of the image
+            image_type: Image type - "message" or "avatar"
+            operation: Description of the upload for error messages
+
+        Returns:
+            image_key string for use in messages
+        """
+        cache = self.cache
+        cache_key = ImageKeyCache.make_key(self.app_id, image_type, digest)
+        if cache is not None:
+            image_key = cache.get(cache_key)
+            if image_key is not None:
+                logger.debug("Reusing cached image_key for %s: %s", filename, image_key)
+                return image_key
 
         token = self._get_tenant_access_token()
 
         files = {
-            "image": (filename, image_data, mime_type),
+            "image": (filename, content, mime_type),
         }
         data = {
             "image_type": image_type,
@@ -516,32 +716,56 @@ class FeishuImageUploader:
             data=data,
         )
 
-        result = self._handle_api_response(response, f"upload image bytes '{filename}'")
+        result = self._handle_api_response(response, operation)
         image_key = result["data"]["image_key"]
-        logger.info("Image bytes uploaded successfully: %s", image_key)
+        logger.info("Image uploaded successfully: %s -> %s", filename, image_key)
+        if cache is not None:
+            cache.set(cache_key, image_key)
         return image_key
 
-    def upload_image_base64(
-        self,
-        base64_data: str,
-        filename: str = "image.png",
-        mime_type: str | None = None,
-        image_type: Literal["message", "avatar"] = "message",
-    ) -> str:
-        """Upload a base64-encoded image to Feishu.
 
-        Args:
-            base64_data: Base64-encoded image data (without data URI prefix)
-            filename: Filename for the upload
-            mime_type: MIME type (auto-detected if not provided)
-            image_type: Image type - "message" or "avatar"
+def _guess_mime_type(filename: str, mime_type: str | None) -> str:
+    """Use the given MIME type or guess it from the filename (PNG if unknown)."""
+    if mime_type:
+        return mime_type
+    guessed, _ = mimetypes.guess_type(filename)
+    return guessed or "image/png"
 
-        Returns:
-            image_key string for use in messages
-        """
-        # Decode base64
-        image_bytes = base64.b64decode(base64_data)
-        return self.upload_image_bytes(image_bytes, filename, mime_type, image_type)
+
+def _file_digest(f: IO[bytes]) -> str:
+    """Hex SHA-256 of a binary file, read in chunks from its current position."""
+    hasher = hashlib.sha256()
+    while chunk := f.read(_READ_CHUNK_SIZE):
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _source_digest(source: ImageSource) -> str:
+    """Hex SHA-256 of an image given as a path or as bytes."""
+    if isinstance(source, bytes):
+        return hashlib.sha256(source).hexdigest()
+    path = Path(source)
+    if not path.exists():
+        raise FileNotFoundError(f"Image file not found: {source}")
+    with open(path, "rb") as f:
+        return _file_digest(f)
+
+
+def _iter_base64_chunks(data: str) -> Iterator[bytes]:
+    """Decode base64 text piece by piece, ignoring embedded whitespace.
+
+    Raises:
+        binascii.Error: If the data is not valid base64
+    """
+    pending = ""
+    for start in range(0, len(data), _BASE64_CHUNK_CHARS):
+        piece = pending + "".join(data[start : start + _BASE64_CHUNK_CHARS].split())
+        usable = len(piece) - len(piece) % 4
+        pending = piece[usable:]
+        if usable:
+            yield base64.b64decode(piece[:usable])
+    if pending:
+        yield base64.b64decode(pending)
 
 
 def create_image_card(
@@ -2,16 +2,41 @@
 
 This module provides centralized logging configuration with support for:
 - Console and file logging
-- Log rotation
+- Log rotation by size or time
+- Buffered, non-blocking file writes from a background thread
 - Rich formatting for console output
+- Structured JSON lines output (``json_format``)
+
+Hot-path logging convention:
+
+- Pass arguments separately (``logger.debug("Sent %s", msg_id)``) instead of
+  building f-strings, so nothing is formatted when the level is disabled
+- Attach per-message fields with ``extra=log_fields(...)``; they become
+  top-level keys in JSON output
+- Wrap expensive values in ``LazyStr`` so they are only computed when the
+  record is actually emitted
 """
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import queue
+import sys
+import threading
+import time
+from collections.abc import Callable
 from contextlib import suppress
-from logging.handlers import RotatingFileHandler
+from datetime import UTC, datetime
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 from pathlib import Path
+from typing import Any
 
 from rich.console import Console
 from rich.logging import RichHandler
@@ -22,6 +47,8 @@ from .config import LoggingConfig
 _loggers: dict[str, logging.Logger] = {}
 _configured = False
 _current_level: int = logging.INFO
+_listener: _LogListener | None = None
+_atexit_registered = False
 
 console = Console()
 
@@ -45,17 +72,384 @@ class CloseOnEmitFileHandler(RotatingFileHandler):
                 self.close()
 
 
+# Fields always present in JSON log lines (null when not supplied)
+STRUCTURED_FIELDS = ("provider", "target", "message_id", "latency_ms")
+
+# Attributes every LogRecord has; anything else was supplied via ``extra``
+_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None)).keys()
+) | {"message", "asctime", "taskName"}
+
+
+class LazyStr:
+    """Defer building a string until a log record is actually formatted.
+
+    Example:
+        ```python
+        logger.debug("Payload: %s", LazyStr(json.dumps, payload))
+        ```
+    """
+
+    __slots__ = ("_func", "_args", "_kwargs")
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self._func = func
+        self._args = args
+        self._kwargs = kwargs
+
+    def __str__(self) -> str:
+        return str(self._func(*self._args, **self._kwargs))
+
+    __repr__ = __str__
+
+
+def log_fields(
+    provider: str | None = None,
+    target: str | None = None,
+    message_id: str | None = None,
+    latency_ms: float | None = None,
+    **fields: Any,
+) -> dict[str, Any]:
+    """Build the ``extra`` mapping for a structured log record.
+
+    Args:
+        provider: Provider name
+        target: Message target
+        message_id: Message identifier
+        latency_ms: Operation latency in milliseconds
+        **fields: Additional fields to include
+
+    Returns:
+        Dictionary to pass as ``extra`` to a logging call
+    """
+    extra = {
+        "provider": provider,
+        "target": target,
+        "message_id": message_id,
+        "latency_ms": round(latency_ms, 3) if latency_ms is not None else None,
+    }
+    extra.update(fields)
+    return extra
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects.
+
+    Each line has ``ts``, ``level``, ``logger`` and ``message`` plus the
+    ``STRUCTURED_FIELDS``; any other ``extra`` fields are added as-is.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, tz=UTC).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            data[field] = getattr(record, field, None)
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and key not in data:
+                data[key] = value
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exc_info"] = record.exc_text
+        if record.stack_info:
+            data["stack_info"] = self.formatStack(record.stack_info)
+
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class _BufferedWriteMixin:
+    """Batched writes through a persistent file handle.
+
+    Records are written to the open stream as they arrive but only flushed
+    once ``flush_records`` records have accumulated, ``flush_interval``
+    seconds have passed, or a record at ERROR level or above is written.
+    """
+
+    stream: Any
+    terminator: str
+
+    def _init_buffering(self, flush_interval: float, flush_records: int) -> None:
+        self.flush_interval = flush_interval
+        self.flush_records = flush_records
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def _needs_rollover(self, record: logging.LogRecord, msg: str) -> bool:
+        """Hook deciding whether to roll over before ``msg`` is written; never by default."""
+        return False
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            msg = self.format(record) + self.terminator  # type: ignore[attr-defined]
+            if self._needs_rollover(record, msg):
+                self.doRollover()  # type: ignore[attr-defined]
+            if self.stream is None:
+                self.stream = self._open()  # type: ignore[attr-defined]
+            self.stream.write(msg)
+            self._record_written(msg)
+            self._pending += 1
+            if (
+                record.levelno >= logging.ERROR
+                or self._pending >= self.flush_records
+                or time.monotonic() - self._last_flush >= self.flush_interval
+            ):
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)  # type: ignore[attr-defined]
+
+    def _record_written(self, msg: str) -> None:
+        """Hook called after ``msg`` has been written to the stream."""
+
+    def flush(self) -> None:
+        super().flush()  # type: ignore[misc]
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+
+class BufferedRotatingFileHandler(_BufferedWriteMixin, RotatingFileHandler):
+    """Size-rotating file handler that keeps its file open and batches flushes.
+
+    The current file size in bytes is tracked in memory so rollover checks do
+    not need a ``stat``/``seek`` per record.
+    """
+
+    def __init__(
+        self,
+        filename: str | Path,
+        maxBytes: int = 0,
+        backupCount: int = 0,
+        encoding: str | None = "utf-8",
+        flush_interval: float = 1.0,
+        flush_records: int = 100,
+    ) -> None:
+        """Open the log file for appending.
+
+        Args:
+            filename: Log file path
+            maxBytes: Rotate once the file would exceed this size (0 disables rotation)
+            backupCount: Number of rotated files to keep
+            encoding: File encoding
+            flush_interval: Maximum seconds between flushes while records arrive
+            flush_records: Flush after this many records
+        """
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount, encoding=encoding)
+        self._init_buffering(flush_interval, flush_records)
+        self._size = Path(self.baseFilename).stat().st_size
+
+    def _encoded_size(self, msg: str) -> int:
+        """Number of bytes ``msg`` occupies in the file."""
+        if msg.isascii():
+            return len(msg)
+        return len(msg.encode(self.encoding or "utf-8", errors="replace"))
+
+    def _needs_rollover(self, record: logging.LogRecord, msg: str) -> bool:
+        return (
+            self.maxBytes > 0
+            and self._size > 0
+            and self._size + self._encoded_size(msg) >= self.maxBytes
+        )
+
+    def _record_written(self, msg: str) -> None:
+        self._size += self._encoded_size(msg)
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._size = 0
+
+
+class BufferedTimedRotatingFileHandler(_BufferedWriteMixin, TimedRotatingFileHandler):
+    """Time-rotating file handler that keeps its file open and batches flushes."""
+
+    def __init__(
+        self,
+        filename: str | Path,
+        when: str = "midnight",
+        interval: int = 1,
+        backupCount: int = 0,
+        encoding: str | None = "utf-8",
+        flush_interval: float = 1.0,
+        flush_records: int = 100,
+    ) -> None:
+        """Open the log file for appending.
+
+        Args:
+            filename: Log file path
+            when: Rotation unit (S, M, H, D, midnight, W0-W6)
+            interval: Number of ``when`` units between rotations
+            backupCount: Number of rotated files to keep
+            encoding: File encoding
+            flush_interval: Maximum seconds between flushes while records arrive
+            flush_records: Flush after this many records
+        """
+        super().__init__(
+            filename, when=when, interval=interval, backupCount=backupCount, encoding=encoding
+        )
+        self._init_buffering(flush_interval, flush_records)
+
+    def _needs_rollover(self, record: logging.LogRecord, msg: str) -> bool:
+        return record.created >= self.rolloverAt
+
+
+class _FlushRequest:
+    """Queue marker asking the listener to flush its handlers."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+
+
+class _LogQueueHandler(QueueHandler):
+    """QueueHandler that hands records to the background writer cheaply.
+
+    Only the message interpolation (and, for exceptions, the traceback text)
+    happens on the calling thread; the file formatter runs on the listener.
+    """
+
+    _exc_formatter = logging.Formatter()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            # Tracebacks reference live frames; render them before handing off
+            if not record.exc_text:
+                record.exc_text = self._exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+class _LogListener(QueueListener):
+    """QueueListener that flushes idle handlers and answers flush requests."""
+
+    def __init__(
+        self, log_queue: queue.SimpleQueue[Any], handler: logging.Handler, flush_interval: float
+    ) -> None:
+        super().__init__(log_queue, handler, respect_handler_level=True)
+        self.flush_interval = flush_interval
+
+    def dequeue(self, block: bool) -> Any:
+        while True:
+            try:
+                return self.queue.get(block=block, timeout=self.flush_interval or None)
+            except queue.Empty:
+                # Idle: push out whatever the handlers are still buffering
+                self._flush_handlers()
+                if not block:
+                    raise
+
+    def handle(self, record: Any) -> None:
+        if isinstance(record, _FlushRequest):
+            self._flush_handlers()
+            record.done.set()
+            return
+        super().handle(record)
+
+    def _flush_handlers(self) -> None:
+        for handler in self.handlers:
+            with suppress(Exception):
+                handler.flush()
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Wait until every record queued so far has been written and flushed.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+
+        Returns:
+            True if the flush completed within the timeout
+        """
+        if self._thread is None:
+            self._flush_handlers()
+            return True
+        request = _FlushRequest()
+        self.queue.put(request)
+        return request.done.wait(timeout)
+
+    def shutdown(self) -> None:
+        """Stop the writer thread after draining the queue, then close handlers."""
+        if self._thread is not None:
+            self.stop()
+        for handler in self.handlers:
+            with suppress(Exception):
+                handler.flush()
+            with suppress(Exception):
+                handler.close()
+
+
+def _build_file_handler(config: LoggingConfig, log_path: Path) -> logging.Handler:
+    """Create the file handler for the configured mode and rotation."""
+    if config.file_mode == "close_on_emit":
+        # Closes the file between emits to avoid Windows file locking issues,
+        # e.g. in tests using TemporaryDirectory
+        return CloseOnEmitFileHandler(
+            log_path,
+            maxBytes=config.max_bytes,
+            backupCount=config.backup_count,
+            encoding="utf-8",
+            delay=True,
+        )
+    if config.rotation == "time":
+        return BufferedTimedRotatingFileHandler(
+            log_path,
+            when=config.rotation_when,
+            interval=config.rotation_interval,
+            backupCount=config.backup_count,
+            flush_interval=config.flush_interval,
+            flush_records=config.flush_records,
+        )
+    return BufferedRotatingFileHandler(
+        log_path,
+        maxBytes=config.max_bytes,
+        backupCount=config.backup_count,
+        flush_interval=config.flush_interval,
+        flush_records=config.flush_records,
+    )
+
+
+def _stop_listener() -> None:
+    """Stop the background log writer, if running, flushing pending records."""
+    global _listener
+
+    listener, _listener = _listener, None
+    if listener is not None:
+        listener.shutdown()
+
+
+def flush_logging(timeout: float | None = 5.0) -> bool:
+    """Write out any log records still buffered by the background file writer.
+
+    Args:
+        timeout: Seconds to wait (None waits indefinitely)
+
+    Returns:
+        True if all pending records were flushed (or nothing was buffered)
+    """
+    if _listener is None:
+        return True
+    return _listener.flush(timeout)
+
+
 def setup_logging(config: LoggingConfig | None = None) -> None:
     """Setup logging configuration for the entire application.
 
     Args:
         config: LoggingConfig instance. If None, uses defaults.
     """
-    global _configured
+    global _configured, _listener, _atexit_registered
 
     if config is None:
         config = LoggingConfig()
 
+    # Stop a previous background writer so its queued records reach the file
+    _stop_listener()
+
     # Clear any existing handlers (and close them to release resources)
     root_logger = logging.getLogger()
     for handler in list(root_logger.handlers):
@@ -73,16 +467,23 @@ def setup_logging(config: LoggingConfig | None = None) -> None:
     feishu_root.setLevel(level_value)
 
     # Create formatters
-    file_formatter = logging.Formatter(config.format)
-
-    # Add console handler with Rich formatting
-    console_handler = RichHandler(
-        console=console,
-        show_time=True,
-        show_path=True,
-        markup=True,
-        rich_tracebacks=True,
+    file_formatter: logging.Formatter = (
+        JsonFormatter() if config.json_format else logging.Formatter(config.format)
     )
+
+    # Add console handler: JSON lines for log shippers, otherwise Rich formatting
+    console_handler: logging.Handler
+    if config.json_format:
+        console_handler = logging.StreamHandler(sys.stderr)
+        console_handler.setFormatter(JsonFormatter())
+    else:
+        console_handler = RichHandler(
+            console=console,
+            show_time=True,
+            show_path=True,
+            markup=True,
+            rich_tracebacks=True,
+        )
     console_handler.setLevel(getattr(logging, config.level))
     root_logger.addHandler(console_handler)
 
@@ -90,18 +491,22 @@ def setup_logging(config: LoggingConfig | None = None) -> None:
     if config.log_file:
         log_path = Path(config.log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        # Use a handler variant that closes the file between emits to avoid
-        # Windows file locking issues during tests using TemporaryDirectory.
-        file_handler = CloseOnEmitFileHandler(
-            log_path,
-            maxBytes=config.max_bytes,
-            backupCount=config.backup_count,
-            encoding="utf-8",
-            delay=True,
-        )
+        file_handler = _build_file_handler(config, log_path)
         file_handler.setLevel(getattr(logging, config.level))
         file_handler.setFormatter(file_formatter)
-        root_logger.addHandler(file_handler)
+        if config.file_mode == "close_on_emit":
+            root_logger.addHandler(file_handler)
+        else:
+            # Buffered mode: callers only enqueue; a listener thread does the I/O
+            log_queue: queue.SimpleQueue[Any] = queue.SimpleQueue()
+            queue_handler = _LogQueueHandler(log_queue)
+            queue_handler.setLevel(getattr(logging, config.level))
+            root_logger.addHandler(queue_handler)
+            _listener = _LogListener(log_queue, file_handler, config.flush_interval)
+            _listener.start()
+            if not _atexit_registered:
+                atexit.register(_stop_listener)
+                _atexit_registered = True
 
     _configured = True
     _current_level = level_value
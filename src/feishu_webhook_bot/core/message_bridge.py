@@ -7,6 +7,7 @@ different platforms (e.g., QQ ↔ Feishu).
 from __future__ import annotations
 
 import asyncio
+import logging
 import time
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -14,7 +15,8 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Protocol
 
 from .config import MessageBridgeConfig, MessageBridgeRuleConfig
-from .logger import get_logger
+from .logger import get_logger, log_fields
+from .provider import send_async
 
 if TYPE_CHECKING:
     from ..chat.models import IncomingMessage
@@ -368,20 +370,33 @@ class MessageBridgeEngine:
             logger.error("Target provider not found: %s", rule.target_provider)
             return False
 
+        started = time.perf_counter()
         try:
-            # Send the message
-            result = target_provider.send_text(content, rule.target_chat_id)
-
-            # Check result
-            if hasattr(result, "success"):
-                return result.success
-            return True
+            # Send the message without blocking the event loop
+            result = await send_async(target_provider, "send_text", content, rule.target_chat_id)
+            success = result.success if hasattr(result, "success") else True
+
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Bridge rule %s forwarded message: success=%s",
+                    rule.name,
+                    success,
+                    extra=log_fields(
+                        rule.target_provider,
+                        rule.target_chat_id,
+                        getattr(result, "message_id", None),
+                        (time.perf_counter() - started) * 1000,
+                        rule=rule.name,
+                    ),
+                )
+            return success
 
         except Exception as e:
             logger.error(
                 "Failed to forward message to %s: %s",
                 rule.target_provider,
                 e,
+                extra=log_fields(rule.target_provider, rule.target_chat_id, rule=rule.name),
             )
 
             # Retry if configured
@@ -389,7 +404,9 @@ class MessageBridgeEngine:
                 for attempt in range(self.config.max_retries):
                     try:
                         await asyncio.sleep(1.0 * (attempt + 1))
-                        result = target_provider.send_text(content, rule.target_chat_id)
+                        result = await send_async(
+                            target_provider, "send_text", content, rule.target_chat_id
+                        )
                         has_success = hasattr(result, "success")
                         if (has_success and result.success) or not has_success:
                             return True
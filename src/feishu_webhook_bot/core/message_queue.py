@@ -3,17 +3,40 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import inspect
+import itertools
+import time
 import uuid
 from collections import deque
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any
+from enum import IntEnum
+from typing import TYPE_CHECKING, Any
 
-from .logger import get_logger
+from .logger import get_logger, log_fields
 from .provider import BaseProvider, Message, MessageType, SendResult
 
+if TYPE_CHECKING:
+    from .config import QueueRateLimitConfig
+    from .queue_store import MessageQueueStore
+
 logger = get_logger(__name__)
 
+LaneKey = tuple[str, str, int]
+
+
+class MessagePriority(IntEnum):
+    """Delivery priority classes; lower values are delivered first."""
+
+    ALERT = 0
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+    BULK = 4
+
 
 @dataclass
 class QueuedMessage:
@@ -28,6 +51,7 @@ class QueuedMessage:
     max_retries: int = field(default=3)
     error: str | None = field(default=None)
     message_type: MessageType = field(default=MessageType.TEXT)
+    priority: MessagePriority = field(default=MessagePriority.NORMAL)
 
     def __post_init__(self) -> None:
         """Validate message data after initialization."""
@@ -35,24 +59,239 @@ class QueuedMessage:
             raise ValueError("Message target cannot be empty")
         if self.max_retries < 0:
             raise ValueError("max_retries must be non-negative")
+        self.priority = MessagePriority(self.priority)
 
     def is_retryable(self) -> bool:
         """Check if the message can be retried."""
         return self.retry_count < self.max_retries
 
-    def get_retry_delay(self) -> float:
-        """Calculate delay for next retry using exponential backoff."""
+    def get_retry_delay(self, base_delay: float = 1.0) -> float:
+        """Calculate delay for next retry using exponential backoff.
+
+        Args:
+            base_delay: Delay before the first retry (seconds)
+        """
         # Base delay with exponential backoff: 1s, 2s, 4s, 8s...
-        base_delay = 1.0
         return base_delay * (2**self.retry_count)
 
     def increment_retry(self) -> None:
         """Increment the retry count."""
         self.retry_count += 1
 
+    def to_dict(self) -> dict[str, Any]:
+        """Convert message to dictionary for storage."""
+        return {
+            "id": self.id,
+            "content": self.content,
+            "target": self.target,
+            "provider_name": self.provider_name,
+            "created_at": self.created_at.isoformat(),
+            "retry_count": self.retry_count,
+            "max_retries": self.max_retries,
+            "error": self.error,
+            "message_type": self.message_type.value,
+            "priority": int(self.priority),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> QueuedMessage:
+        """Create message from dictionary."""
+        message_type = MessageType(data.get("message_type", MessageType.TEXT.value))
+        content = data.get("content")
+        if message_type == MessageType.RICH_TEXT and isinstance(content, list):
+            # JSON has no tuples; rich text content is (title, content_list[, language])
+            content = tuple(content)
+        return cls(
+            id=data["id"],
+            content=content,
+            target=data["target"],
+            provider_name=data.get("provider_name", "default"),
+            created_at=datetime.fromisoformat(data["created_at"]),
+            retry_count=data.get("retry_count", 0),
+            max_retries=data.get("max_retries", 3),
+            error=data.get("error"),
+            message_type=message_type,
+            priority=MessagePriority(data.get("priority", MessagePriority.NORMAL)),
+        )
+
+    @property
+    def lane_key(self) -> LaneKey:
+        """Key of the delivery lane; messages sharing a lane are sent in order."""
+        return (self.provider_name, self.target, int(self.priority))
+
+
+class TokenBucket:
+    """Token bucket allowing ``rate`` operations per second with bursts of ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int = 1) -> None:
+        """Create a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens (burst size)
+
+        Raises:
+            ValueError: If rate is not positive or capacity is less than 1
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update."""
+        if now > self._updated:
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+    def wait_time(self, now: float | None = None) -> float:
+        """Seconds until one token is available (0.0 if available now)."""
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        if self._tokens >= 1.0:
+            return 0.0
+        return (1.0 - self._tokens) / self.rate
+
+    def consume(self) -> None:
+        """Take one token; callers check ``wait_time`` first."""
+        self._tokens -= 1.0
+
+    @property
+    def is_full(self) -> bool:
+        """Whether the bucket has refilled to capacity (i.e. has been idle)."""
+        self._refill(time.monotonic())
+        return self._tokens >= self.capacity
+
+
+class DeliveryRateLimiter:
+    """Per-provider and per-target token buckets for queued deliveries.
+
+    A send is allowed only when every bucket that applies to it (the
+    provider-wide bucket and the bucket of its target) has a token. Target
+    buckets are created lazily and idle ones are pruned once more than
+    ``max_target_buckets`` exist.
+    """
+
+    def __init__(
+        self,
+        provider_limits: Mapping[str, tuple[float, int]] | None = None,
+        target_limits: Mapping[str, tuple[float, int]] | None = None,
+        max_target_buckets: int = 10000,
+    ) -> None:
+        """Initialize rate limiter.
+
+        Args:
+            provider_limits: Provider name to ``(rate, burst)`` for the provider-wide bucket
+            target_limits: Provider name to ``(rate, burst)`` applied to each of its targets
+            max_target_buckets: Target bucket count that triggers pruning of idle buckets
+        """
+        self._provider_buckets = {
+            name: TokenBucket(rate, burst)
+            for name, (rate, burst) in (provider_limits or {}).items()
+        }
+        self._target_limits = dict(target_limits or {})
+        self._target_buckets: dict[tuple[str, str], TokenBucket] = {}
+        self.max_target_buckets = max_target_buckets
+
+    @classmethod
+    def from_config(cls, rate_limits: Mapping[str, QueueRateLimitConfig]) -> DeliveryRateLimiter:
+        """Build a rate limiter from ``MessageQueueConfig.rate_limits``.
+
+        Args:
+            rate_limits: Provider name to rate limit configuration
+
+        Returns:
+            Configured DeliveryRateLimiter
+        """
+        provider_limits = {
+            name: (limit.rate, limit.burst)
+            for name, limit in rate_limits.items()
+            if limit.rate is not None
+        }
+        target_limits = {
+            name: (limit.per_target_rate, limit.per_target_burst)
+            for name, limit in rate_limits.items()
+            if limit.per_target_rate is not None
+        }
+        return cls(provider_limits, target_limits)
+
+    def _target_bucket(self, provider_name: str, target: str) -> TokenBucket | None:
+        """Get (or lazily create) the bucket for one target."""
+        limit = self._target_limits.get(provider_name)
+        if limit is None:
+            return None
+        key = (provider_name, target)
+        bucket = self._target_buckets.get(key)
+        if bucket is None:
+            if len(self._target_buckets) >= self.max_target_buckets:
+                self._prune_idle()
+            bucket = self._target_buckets[key] = TokenBucket(*limit)
+        return bucket
+
+    def _prune_idle(self) -> None:
+        """Drop target buckets that have refilled completely."""
+        idle = [key for key, bucket in self._target_buckets.items() if bucket.is_full]
+        for key in idle:
+            del self._target_buckets[key]
+
+    def acquire(self, provider_name: str, target: str) -> float:
+        """Try to take a token for one send.
+
+        Tokens are only consumed when every applicable bucket has capacity.
+
+        Args:
+            provider_name: Provider the message is sent through
+            target: Message target
+
+        Returns:
+            0.0 if the send may proceed, otherwise seconds to wait before retrying
+        """
+        buckets = [
+            bucket
+            for bucket in (
+                self._provider_buckets.get(provider_name),
+                self._target_bucket(provider_name, target),
+            )
+            if bucket is not None
+        ]
+        now = time.monotonic()
+        wait = max((bucket.wait_time(now) for bucket in buckets), default=0.0)
+        if wait > 0:
+            return wait
+        for bucket in buckets:
+            bucket.consume()
+        return 0.0
+
 
 class MessageQueue:
-    """Queue for reliable message delivery with retry support."""
+    """Queue for reliable message delivery with retry support.
+
+    Delivery is performed by a bounded pool of workers. Messages are grouped
+    into lanes keyed by ``(provider_name, target, priority)``: a lane is only
+    ever served by one worker at a time, so per-target ordering is preserved
+    within a priority class, while distinct targets are delivered in parallel.
+    Synchronous provider calls run in a dedicated thread pool so a slow
+    endpoint never blocks the event loop.
+
+    Workers send one message per turn and always take the ready lane with the
+    highest priority, so an alert overtakes a backlog of bulk messages as soon
+    as a worker frees up. With a ``DeliveryRateLimiter`` attached, a lane whose
+    provider or target bucket is empty is parked until a token is available
+    and workers move on to the next eligible lane.
+
+    Failed messages are parked in a heap keyed by the time they become
+    eligible again (exponential backoff from ``retry_delay``) instead of being
+    retried immediately. A retried message is re-sent after later messages to
+    the same target that were already queued.
+
+    With a ``MessageQueueStore`` attached, every enqueue, retry and
+    acknowledgement is also written to a durable log, and outstanding
+    messages are replayed when the queue is created.
+    """
 
     def __init__(
         self,
@@ -60,38 +299,103 @@ class MessageQueue:
         max_batch_size: int = 10,
         retry_delay: float = 5.0,
         max_retries: int = 3,
+        max_concurrency: int = 8,
+        store: MessageQueueStore | None = None,
+        rate_limiter: DeliveryRateLimiter | None = None,
     ) -> None:
         """Initialize message queue.
 
         Args:
             providers: Dictionary mapping provider names to BaseProvider instances
             max_batch_size: Maximum messages to process in one batch
-            retry_delay: Base delay for retry attempts (seconds)
+            retry_delay: Delay before the first retry, doubled on each attempt (seconds)
             max_retries: Default maximum retry attempts per message
+            max_concurrency: Maximum number of deliveries in flight at once
+            store: Optional durable store; pending messages in it are replayed
+            rate_limiter: Optional token buckets shaping sends per provider/target
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
         self.providers = providers
         self.max_batch_size = max_batch_size
         self.retry_delay = retry_delay
         self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.store = store
+        self.rate_limiter = rate_limiter
 
         # Thread-safe queue operations
         self._queue: deque[QueuedMessage] = deque()
         self._lock = asyncio.Lock()
 
+        # Delivery engine state. Every lane in ``_lanes`` is in exactly one of:
+        # the ready heap (priority, sequence, key), the throttled heap
+        # (eligible_at, sequence, key), or owned by a running worker.
+        self._lanes: dict[LaneKey, deque[QueuedMessage]] = {}
+        self._ready_lanes: list[tuple[int, int, LaneKey]] = []
+        self._throttled_lanes: list[tuple[float, int, LaneKey]] = []
+        self._lane_sequence = itertools.count()
+        self._workers: set[asyncio.Task[None]] = set()
+        self._executor: ThreadPoolExecutor | None = None
+
+        # Retry backoff: heap of (eligible_at, sequence, message) on the monotonic clock
+        self._delayed: list[tuple[float, int, QueuedMessage]] = []
+        self._delay_sequence = itertools.count()
+        self._work_available = asyncio.Event()
+
         # Statistics tracking
         self._stats = {
             "total_enqueued": 0,
             "total_sent": 0,
             "total_failed": 0,
             "total_retried": 0,
+            "total_throttled": 0,
             "current_size": 0,
         }
 
         logger.info(
             f"MessageQueue initialized with {len(providers)} providers, "
-            f"batch_size={max_batch_size}, max_retries={max_retries}"
+            f"batch_size={max_batch_size}, max_retries={max_retries}, "
+            f"max_concurrency={max_concurrency}"
         )
 
+        if store is not None:
+            self._replay_from_store()
+
+    def _replay_from_store(self) -> None:
+        """Load outstanding messages from the durable store.
+
+        Messages that were waiting for a retry go back into the delay heap with
+        their remaining backoff; the rest are queued in original order. Messages
+        for providers that are no longer registered can never be delivered, so
+        they are removed from the store and counted as failed.
+        """
+        assert self.store is not None
+        replayed = 0
+        now_wall = time.time()
+        for message, not_before in self.store.load_pending():
+            if message.provider_name not in self.providers:
+                self.store.ack(message.id)
+                self._stats["total_failed"] += 1
+                logger.error(
+                    f"Dropping persisted message {message.id} for unknown provider "
+                    f"{message.provider_name}"
+                )
+                continue
+            if not_before is not None and not_before > now_wall:
+                self._schedule_retry(message, not_before - now_wall)
+            else:
+                self._queue.append(message)
+            replayed += 1
+
+        self._stats["current_size"] = len(self._queue)
+        if replayed:
+            logger.info(f"Replayed {replayed} persisted messages into the queue")
+
     async def enqueue(self, message: QueuedMessage) -> None:
         """Add a message to the queue.
 
@@ -106,13 +410,21 @@ class MessageQueue:
         if message.provider_name not in self.providers:
             raise ValueError(f"Unknown provider: {message.provider_name}")
 
+        if self.store is not None:
+            self.store.append(message)
+
         async with self._lock:
             self._queue.append(message)
             self._stats["total_enqueued"] += 1
             self._stats["current_size"] = len(self._queue)
+            self._work_available.set()
             logger.debug(
-                f"Message enqueued: id={message.id}, target={message.target}, "
-                f"provider={message.provider_name}, queue_size={len(self._queue)}"
+                "Message enqueued: id=%s, target=%s, provider=%s, queue_size=%d",
+                message.id,
+                message.target,
+                message.provider_name,
+                len(self._queue),
+                extra=log_fields(message.provider_name, message.target, message.id),
             )
 
     async def enqueue_batch(self, messages: list[QueuedMessage]) -> None:
@@ -130,25 +442,38 @@ class MessageQueue:
             if message.provider_name not in self.providers:
                 raise ValueError(f"Unknown provider: {message.provider_name}")
 
+        if self.store is not None:
+            self.store.append_many(messages)
+
         async with self._lock:
             self._queue.extend(messages)
             self._stats["total_enqueued"] += len(messages)
             self._stats["current_size"] = len(self._queue)
+            self._work_available.set()
             logger.info(
-                f"Batch of {len(messages)} messages enqueued, queue_size={len(self._queue)}"
+                "Batch of %d messages enqueued, queue_size=%d", len(messages), len(self._queue)
             )
 
     async def process_queue(self) -> dict[str, Any]:
         """Process queued messages in batches.
 
-        Processes messages with exponential backoff retry strategy. Messages
-        that exceed max_retries are marked as failed.
+        Batches are dispatched into per-target lanes and delivered by up to
+        ``max_concurrency`` workers, highest priority first. Messages for the
+        same ``(provider_name, target)`` and priority are sent in enqueue order;
+        different targets are sent in parallel. Messages enqueued while workers
+        are busy are dispatched straight away, so a higher-priority message is
+        sent as soon as a worker finishes its current send. Lanes held back by
+        the rate limiter are waited for before returning. Failed messages are
+        scheduled for a delayed retry; retries that
+        become due while processing are picked up in the same call, later ones
+        are left for a subsequent call (see ``wait_for_work``). Messages that
+        exceed max_retries are marked as failed.
 
         Returns:
             Dictionary with keys:
             - sent: Number of successfully sent messages
             - failed: Number of messages that exceeded max retries
-            - retried: Number of messages requeued for retry
+            - retried: Number of messages scheduled for retry
             - batch_count: Number of batches processed
             - processed: Total messages processed
         """
@@ -160,63 +485,298 @@ class MessageQueue:
             "processed": 0,
         }
 
-        while True:
-            # Get next batch of messages
-            batch = await self._get_next_batch()
-            if not batch:
-                break
-
-            results["batch_count"] += 1
-            logger.debug(f"Processing batch {results['batch_count']} with {len(batch)} messages")
-
-            # Process each message in the batch
-            for message in batch:
-                success = await self._send_message(message)
-
-                if success:
-                    results["sent"] += 1
-                    self._stats["total_sent"] += 1
-                    logger.info(
-                        f"Message sent successfully: id={message.id}, target={message.target}"
-                    )
-                elif message.is_retryable():
-                    # Re-queue for retry with exponential backoff
-                    message.increment_retry()
-                    retry_delay = message.get_retry_delay()
-
-                    async with self._lock:
-                        self._queue.append(message)
-
-                    results["retried"] += 1
-                    self._stats["total_retried"] += 1
-                    logger.warning(
-                        f"Message will be retried: id={message.id}, "
-                        f"attempt={message.retry_count}/{message.max_retries}, "
-                        f"delay={retry_delay}s, error={message.error}"
+        try:
+            while True:
+                self._promote_due_retries()
+                self._release_throttled_lanes()
+
+                # Get next batch of messages
+                batch = await self._get_next_batch()
+                if batch:
+                    results["batch_count"] += 1
+                    results["processed"] += len(batch)
+                    logger.debug(
+                        "Dispatching batch %d with %d messages", results["batch_count"], len(batch)
                     )
+                    self._dispatch_batch(batch)
+                    self._spawn_workers(results)
+                    # Let freshly spawned workers start before dequeuing more
+                    await asyncio.sleep(0)
+                    continue
+
+                self._spawn_workers(results)
+                throttle_delay = self._next_throttle_delay()
+                if self._workers:
+                    # Queue drained; wait for in-flight lanes (which may schedule retries)
+                    # or for a new enqueue, whose lane workers pick up on their next turn
+                    await self._wait_for_workers_or_work(throttle_delay)
+                elif throttle_delay is not None:
+                    # Only rate-limited lanes remain; sleep until a token frees up
+                    await asyncio.sleep(throttle_delay)
                 else:
-                    # Message exceeded max retries
-                    results["failed"] += 1
-                    self._stats["total_failed"] += 1
-                    logger.error(
-                        f"Message failed permanently: id={message.id}, "
-                        f"target={message.target}, attempts={message.retry_count}, "
-                        f"error={message.error}"
-                    )
+                    break
+        finally:
+            await self._abort_workers()
 
-            results["processed"] += len(batch)
+        if self.store is not None:
+            self.store.maybe_compact()
 
         async with self._lock:
             self._stats["current_size"] = len(self._queue)
 
         logger.info(
-            f"Queue processing complete: sent={results['sent']}, "
-            f"failed={results['failed']}, retried={results['retried']}, "
-            f"batches={results['batch_count']}"
+            "Queue processing complete: sent=%d, failed=%d, retried=%d, batches=%d",
+            results["sent"],
+            results["failed"],
+            results["retried"],
+            results["batch_count"],
         )
 
         return results
 
+    async def _wait_for_workers_or_work(self, timeout: float | None) -> None:
+        """Wait until a worker exits, a message is enqueued or ``timeout`` elapses.
+
+        Args:
+            timeout: Upper bound on the wait (seconds); None waits indefinitely
+        """
+        self._work_available.clear()
+        work_waiter = asyncio.ensure_future(self._work_available.wait())
+        try:
+            await asyncio.wait(
+                {*self._workers, work_waiter},
+                timeout=timeout,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            work_waiter.cancel()
+
+    def _dispatch_batch(self, batch: list[QueuedMessage]) -> None:
+        """Append a batch to its delivery lanes.
+
+        Args:
+            batch: Messages taken from the head of the queue
+        """
+        for message in batch:
+            key = message.lane_key
+            lane = self._lanes.get(key)
+            if lane is None:
+                self._lanes[key] = deque([message])
+                self._mark_ready(key)
+            else:
+                # Lane is ready, throttled or owned by a worker; it is drained in order
+                lane.append(message)
+
+    def _mark_ready(self, key: LaneKey) -> None:
+        """Put a lane on the ready heap behind lanes of the same priority."""
+        heapq.heappush(self._ready_lanes, (key[2], next(self._lane_sequence), key))
+
+    def _spawn_workers(self, results: dict[str, Any]) -> None:
+        """Start workers for ready lanes, up to ``max_concurrency`` in total.
+
+        Args:
+            results: Result counters shared with the delivery workers
+        """
+        # Finished workers may not have been discarded yet; only count live ones
+        live_workers = sum(1 for task in self._workers if not task.done())
+        for _ in range(min(len(self._ready_lanes), self.max_concurrency - live_workers)):
+            task = asyncio.create_task(self._lane_worker(results))
+            self._workers.add(task)
+            task.add_done_callback(self._workers.discard)
+
+    async def _lane_worker(self, results: dict[str, Any]) -> None:
+        """Serve ready lanes, one message per turn, until none are left.
+
+        Args:
+            results: Result counters for the current ``process_queue`` run
+        """
+        while self._ready_lanes:
+            _, _, key = heapq.heappop(self._ready_lanes)
+            lane = self._lanes[key]
+            message = lane[0]
+
+            if self.rate_limiter is not None:
+                wait = self.rate_limiter.acquire(message.provider_name, message.target)
+                if wait > 0:
+                    self._throttle_lane(key, wait)
+                    continue
+
+            lane.popleft()
+            try:
+                await self._deliver(message, results)
+            except asyncio.CancelledError:
+                # Put the in-flight message back so it is not lost
+                lane.appendleft(message)
+                raise
+
+            if lane:
+                self._mark_ready(key)
+            else:
+                del self._lanes[key]
+
+    def _throttle_lane(self, key: LaneKey, wait: float) -> None:
+        """Park a lane until its rate limit bucket has a token again."""
+        eligible_at = time.monotonic() + wait
+        heapq.heappush(self._throttled_lanes, (eligible_at, next(self._lane_sequence), key))
+        self._stats["total_throttled"] += 1
+
+    def _release_throttled_lanes(self) -> None:
+        """Move lanes whose throttle delay has elapsed back to the ready heap."""
+        now = time.monotonic()
+        while self._throttled_lanes and self._throttled_lanes[0][0] <= now:
+            _, _, key = heapq.heappop(self._throttled_lanes)
+            self._mark_ready(key)
+
+    def _next_throttle_delay(self) -> float | None:
+        """Seconds until the earliest throttled lane may be served, or None."""
+        if not self._throttled_lanes:
+            return None
+        return max(0.0, self._throttled_lanes[0][0] - time.monotonic())
+
+    async def _deliver(self, message: QueuedMessage, results: dict[str, Any]) -> None:
+        """Send one message and account for the outcome.
+
+        Args:
+            message: Message to deliver
+            results: Result counters for the current ``process_queue`` run
+        """
+        started = time.perf_counter()
+        success = await self._send_message(message)
+        fields = log_fields(
+            message.provider_name,
+            message.target,
+            message.id,
+            latency_ms=(time.perf_counter() - started) * 1000,
+        )
+
+        if success:
+            if self.store is not None:
+                self.store.ack(message.id)
+            results["sent"] += 1
+            self._stats["total_sent"] += 1
+            logger.info(
+                "Message sent successfully: id=%s, target=%s",
+                message.id,
+                message.target,
+                extra=fields,
+            )
+        elif message.is_retryable():
+            # Park the message until its exponential backoff has elapsed
+            retry_delay = message.get_retry_delay(self.retry_delay)
+            message.increment_retry()
+            self._schedule_retry(message, retry_delay)
+            if self.store is not None:
+                self.store.requeue(message, time.time() + retry_delay)
+
+            results["retried"] += 1
+            self._stats["total_retried"] += 1
+            logger.warning(
+                "Message will be retried: id=%s, attempt=%d/%d, delay=%ss, error=%s",
+                message.id,
+                message.retry_count,
+                message.max_retries,
+                retry_delay,
+                message.error,
+                extra=fields,
+            )
+        else:
+            # Message exceeded max retries
+            if self.store is not None:
+                self.store.ack(message.id)
+            results["failed"] += 1
+            self._stats["total_failed"] += 1
+            logger.error(
+                "Message failed permanently: id=%s, target=%s, attempts=%d, error=%s",
+                message.id,
+                message.target,
+                message.retry_count,
+                message.error,
+                extra=fields,
+            )
+
+    def _schedule_retry(self, message: QueuedMessage, delay: float) -> None:
+        """Park a message in the delay heap until ``delay`` seconds have passed.
+
+        Args:
+            message: Message to retry
+            delay: Seconds until the message becomes eligible again
+        """
+        eligible_at = time.monotonic() + delay
+        heapq.heappush(self._delayed, (eligible_at, next(self._delay_sequence), message))
+        self._work_available.set()
+
+    def _promote_due_retries(self) -> int:
+        """Move retries whose backoff has elapsed to the tail of the queue.
+
+        Returns:
+            Number of messages promoted
+        """
+        now = time.monotonic()
+        promoted = 0
+        while self._delayed and self._delayed[0][0] <= now:
+            _, _, message = heapq.heappop(self._delayed)
+            self._queue.append(message)
+            promoted += 1
+        return promoted
+
+    def next_retry_delay(self) -> float | None:
+        """Seconds until the earliest delayed retry becomes eligible.
+
+        Returns:
+            Delay in seconds (0.0 if already due), or None if no retries are pending
+        """
+        if not self._delayed:
+            return None
+        return max(0.0, self._delayed[0][0] - time.monotonic())
+
+    async def wait_for_work(self, timeout: float | None = None) -> bool:
+        """Sleep until there is something to deliver.
+
+        Returns immediately if messages are queued or a retry is due; otherwise
+        waits for the next enqueue or for the earliest retry to become eligible,
+        whichever comes first.
+
+        Args:
+            timeout: Upper bound on the wait (seconds); None waits indefinitely
+
+        Returns:
+            True if work is available, False if the wait timed out
+        """
+        delay = self.next_retry_delay()
+        if self._queue or delay == 0.0:
+            return True
+
+        if delay is None or (timeout is not None and timeout < delay):
+            delay = timeout
+
+        self._work_available.clear()
+        try:
+            await asyncio.wait_for(self._work_available.wait(), timeout=delay)
+        except TimeoutError:
+            pass
+        return bool(self._queue) or self.next_retry_delay() == 0.0
+
+    async def _abort_workers(self) -> None:
+        """Cancel outstanding workers and return undelivered messages to the queue.
+
+        Only does work when ``process_queue`` exits early (e.g. cancellation on
+        shutdown); pending lane contents are put back at the head of the queue
+        in their original order.
+        """
+        workers = set(self._workers)
+        for task in workers:
+            task.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        pending = [message for lane in self._lanes.values() for message in lane]
+        self._lanes.clear()
+        self._ready_lanes.clear()
+        self._throttled_lanes.clear()
+        if pending:
+            self._queue.extendleft(reversed(pending))
+            logger.warning(f"Returned {len(pending)} undelivered messages to the queue")
+
     async def _get_next_batch(self) -> list[QueuedMessage]:
         """Get next batch of messages from queue.
 
@@ -255,24 +815,32 @@ class MessageQueue:
             result: SendResult | None = None
 
             if msg.message_type == MessageType.TEXT:
-                result = provider.send_text(str(msg.content), msg.target)
+                result = await self._call_provider(
+                    provider, "send_text", str(msg.content), msg.target
+                )
             elif msg.message_type == MessageType.CARD:
-                result = provider.send_card(msg.content, msg.target)
+                result = await self._call_provider(provider, "send_card", msg.content, msg.target)
             elif msg.message_type == MessageType.RICH_TEXT:
                 # For rich text, content should be tuple of (title, content_list)
                 if isinstance(msg.content, tuple) and len(msg.content) >= 2:
                     title, content = msg.content[0], msg.content[1]
                     language = msg.content[2] if len(msg.content) > 2 else "zh_cn"
-                    result = provider.send_rich_text(title, content, msg.target, language)
+                    result = await self._call_provider(
+                        provider, "send_rich_text", title, content, msg.target, language
+                    )
                 else:
                     msg.error = "Rich text content must be tuple of (title, content_list)"
                     return False
             elif msg.message_type == MessageType.IMAGE:
-                result = provider.send_image(str(msg.content), msg.target)
+                result = await self._call_provider(
+                    provider, "send_image", str(msg.content), msg.target
+                )
             else:
                 # Fallback to generic message
                 message_obj = Message(type=msg.message_type, content=msg.content)
-                result = provider.send_message(message_obj, msg.target)
+                result = await self._call_provider(
+                    provider, "send_message", message_obj, msg.target
+                )
 
             if result and result.success:
                 return True
@@ -282,9 +850,42 @@ class MessageQueue:
 
         except Exception as exc:
             msg.error = f"Exception: {str(exc)}"
-            logger.exception(f"Error sending message {msg.id}", exc_info=exc)
+            logger.exception(
+                "Error sending message %s",
+                msg.id,
+                exc_info=exc,
+                extra=log_fields(msg.provider_name, msg.target, msg.id),
+            )
             return False
 
+    async def _call_provider(
+        self, provider: BaseProvider, method: str, *args: Any
+    ) -> SendResult | None:
+        """Invoke a provider send method without blocking the event loop.
+
+        Providers exposing a native coroutine (``async_<method>``, as the async
+        provider mixins do) are awaited directly. Synchronous methods run in the
+        queue's thread pool, which is sized to ``max_concurrency``.
+
+        Args:
+            provider: Provider to send through
+            method: Name of the synchronous send method (e.g. ``"send_text"``)
+            *args: Positional arguments for the send method
+
+        Returns:
+            SendResult returned by the provider
+        """
+        async_method = getattr(provider, f"async_{method}", None)
+        if async_method is not None and inspect.iscoroutinefunction(async_method):
+            return await async_method(*args)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrency, thread_name_prefix="message-queue"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, getattr(provider, method), *args)
+
     def get_queue_stats(self) -> dict[str, Any]:
         """Get queue statistics.
 
@@ -295,31 +896,65 @@ class MessageQueue:
             - total_sent: Total messages successfully sent
             - total_failed: Total messages permanently failed
             - total_retried: Total retry attempts made
+            - total_throttled: Times a lane was held back by the rate limiter
+            - delayed: Messages waiting for their retry backoff to elapse
+            - next_retry_in: Seconds until the earliest retry is due (None if none)
+            - in_flight: Messages dispatched to delivery lanes but not yet sent
+            - active_lanes: Distinct (provider, target, priority) lanes being delivered
+            - throttled_lanes: Lanes waiting for a rate limit token
+            - active_workers: Delivery workers currently running
+            - persistent: Whether a durable store is attached
+            - store: Store statistics (only when persistent)
         """
         stats = dict(self._stats)
         stats["current_size"] = len(self._queue)
+        stats["delayed"] = len(self._delayed)
+        stats["next_retry_in"] = self.next_retry_delay()
+        stats["in_flight"] = sum(len(lane) for lane in self._lanes.values())
+        stats["active_lanes"] = len(self._lanes)
+        stats["throttled_lanes"] = len(self._throttled_lanes)
+        stats["active_workers"] = len(self._workers)
+        stats["persistent"] = self.store is not None
+        if self.store is not None:
+            stats["store"] = self.store.get_stats()
         return stats
 
     def clear_queue(self) -> int:
-        """Clear all queued messages.
+        """Clear all queued messages, including those awaiting a retry.
 
         Returns:
             Number of messages cleared
         """
-        count = len(self._queue)
+        count = len(self._queue) + len(self._delayed)
         self._queue.clear()
+        self._delayed.clear()
+        if self.store is not None:
+            self.store.clear()
         self._stats["current_size"] = 0
         logger.warning(f"Queue cleared: {count} messages removed")
         return count
 
+    def close(self) -> None:
+        """Release the delivery thread pool and close the durable store.
+
+        Pending messages stay in the store and are replayed by the next queue
+        opened on it. Without a store the queue remains usable; a new pool is
+        created on the next delivery.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        if self.store is not None:
+            self.store.close()
+
     def __len__(self) -> int:
-        """Return current queue size."""
-        return len(self._queue)
+        """Return number of pending messages, including delayed retries."""
+        return len(self._queue) + len(self._delayed)
 
     def __repr__(self) -> str:
         """Return string representation."""
         return (
-            f"<MessageQueue size={len(self._queue)}, "
+            f"<MessageQueue size={len(self)}, "
             f"providers={len(self.providers)}, "
             f"sent={self._stats['total_sent']}, "
             f"failed={self._stats['total_failed']}>"
@@ -2,10 +2,11 @@
 
 This module provides message tracking functionality including:
 - Message status tracking (pending, sent, delivered, read, failed, expired)
-- Duplicate detection based on content hash
-- Automatic cleanup of old messages
+- Duplicate detection based on content hash, indexed by (content hash, target)
+- Automatic cleanup of old messages in amortized O(1) per message
 - Statistics and monitoring
-- SQLite persistence (optional)
+- SQLite persistence (optional), written behind on a dedicated thread and
+  group-committed through ``BatchedSQLiteWriter``
 - Thread-safe operations
 """
 
@@ -15,16 +16,46 @@ import hashlib
 import json
 import sqlite3
 import threading
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from pathlib import Path
 from typing import Any
 
 from .logger import get_logger
+from .sqlite_writer import BatchedSQLiteWriter
 
 logger = get_logger(__name__)
 
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS messages (
+        message_id TEXT PRIMARY KEY,
+        provider TEXT NOT NULL,
+        target TEXT NOT NULL,
+        content_hash TEXT NOT NULL,
+        status TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        sent_at TEXT,
+        delivered_at TEXT,
+        error TEXT,
+        retry_count INTEGER DEFAULT 0,
+        metadata TEXT
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_provider ON messages(provider)",
+    "CREATE INDEX IF NOT EXISTS idx_status ON messages(status)",
+    "CREATE INDEX IF NOT EXISTS idx_created_at ON messages(created_at)",
+)
+
+_UPSERT = """
+    INSERT OR REPLACE INTO messages
+    (message_id, provider, target, content_hash, status, created_at,
+     updated_at, sent_at, delivered_at, error, retry_count, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
 
 class MessageStatus(str, Enum):
     """Message delivery status enumeration."""
@@ -93,13 +124,28 @@ class TrackedMessage:
 
 
 class MessageTracker:
-    """Thread-safe message tracking system with persistence support."""
+    """Thread-safe message tracking system with persistence support.
+
+    ``messages`` is kept in creation order, so the oldest message is always
+    first and eviction or age cleanup only looks at the front. Duplicate
+    checks use a secondary index of recent messages per (content hash,
+    target) guarded by its own lock, so they do not wait on scans holding
+    the main lock.
+
+    With ``db_path`` set, inserts, updates and deletes are queued to a
+    background writer that owns one WAL-mode connection and commits them in
+    groups; reads such as ``load_from_db`` run on the same thread after all
+    queued writes. Call ``flush`` before reading the database from elsewhere
+    and ``close`` on shutdown.
+    """
 
     def __init__(
         self,
         max_history: int = 10000,
         cleanup_interval: float = 3600.0,
         db_path: str | None = None,
+        flush_interval: float = 0.05,
+        max_batch: int = 500,
     ):
         """Initialize message tracker.
 
@@ -107,68 +153,40 @@ class MessageTracker:
             max_history: Maximum number of messages to keep in memory
             cleanup_interval: Interval in seconds for automatic cleanup (0 to disable)
             db_path: Optional SQLite database path for persistence
+            flush_interval: Maximum seconds a database write waits before being committed
+            max_batch: Maximum number of database writes committed together
         """
         self.messages: dict[str, TrackedMessage] = {}
         self.max_history = max_history
         self.cleanup_interval = cleanup_interval
         self.db_path = db_path
         self._lock = threading.RLock()
+        # (content_hash, target) -> messages in creation order; lock order is _lock, _dedup_lock
+        self._recent: dict[tuple[str, str], deque[TrackedMessage]] = {}
+        self._dedup_lock = threading.Lock()
         self._cleanup_thread: threading.Thread | None = None
         self._stop_cleanup = threading.Event()
+        self._writer: BatchedSQLiteWriter | None = None
 
         if db_path:
-            self._init_db(db_path)
+            self._init_db(db_path, flush_interval, max_batch)
 
         if cleanup_interval > 0:
             self._start_cleanup_thread()
 
-    def _init_db(self, db_path: str) -> None:
-        """Initialize SQLite database for persistence."""
+    def _init_db(self, db_path: str, flush_interval: float, max_batch: int) -> None:
+        """Open the SQLite database and start its background writer."""
         try:
-            path = Path(db_path)
-            path.parent.mkdir(parents=True, exist_ok=True)
-
-            with sqlite3.connect(db_path) as conn:
-                conn.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS messages (
-                        message_id TEXT PRIMARY KEY,
-                        provider TEXT NOT NULL,
-                        target TEXT NOT NULL,
-                        content_hash TEXT NOT NULL,
-                        status TEXT NOT NULL,
-                        created_at TEXT NOT NULL,
-                        updated_at TEXT NOT NULL,
-                        sent_at TEXT,
-                        delivered_at TEXT,
-                        error TEXT,
-                        retry_count INTEGER DEFAULT 0,
-                        metadata TEXT
-                    )
-                    """
-                )
-                conn.execute(
-                    """
-                    CREATE INDEX IF NOT EXISTS idx_provider
-                    ON messages(provider)
-                    """
-                )
-                conn.execute(
-                    """
-                    CREATE INDEX IF NOT EXISTS idx_status
-                    ON messages(status)
-                    """
-                )
-                conn.execute(
-                    """
-                    CREATE INDEX IF NOT EXISTS idx_created_at
-                    ON messages(created_at)
-                    """
-                )
-                conn.commit()
-            logger.info(f"Initialized message database at {db_path}")
+            self._writer = BatchedSQLiteWriter(
+                db_path,
+                schema=_SCHEMA,
+                flush_interval=flush_interval,
+                max_batch=max_batch,
+                name="MessageTrackerWriter",
+            )
+            logger.info("Initialized message database at %s", db_path)
         except Exception as e:
-            logger.error(f"Failed to initialize database: {e}", exc_info=True)
+            logger.error("Failed to initialize database: %s", e, exc_info=True)
 
     def _start_cleanup_thread(self) -> None:
         """Start background cleanup thread."""
@@ -229,14 +247,18 @@ class MessageTracker:
         )
 
         with self._lock:
+            previous = self.messages.pop(message_id, None)
+            if previous is not None:
+                self._unindex(previous)
             self.messages[message_id] = message
+            self._index(message)
 
             # Enforce max history
-            if len(self.messages) > self.max_history:
+            while len(self.messages) > self.max_history:
                 self._evict_oldest()
 
             # Persist if database enabled
-            if self.db_path:
+            if self._writer is not None:
                 self._save_to_db(message)
 
         logger.debug(f"Tracked message {message_id} for {provider}:{target}")
@@ -286,7 +308,7 @@ class MessageTracker:
                 message.delivered_at = datetime.now()
 
             # Persist if database enabled
-            if self.db_path:
+            if self._writer is not None:
                 self._update_db(message)
 
             logger.debug(
@@ -359,20 +381,24 @@ class MessageTracker:
             Number of messages removed
         """
         cutoff_time = datetime.now() - timedelta(seconds=max_age_seconds)
-        removed = 0
 
         with self._lock:
-            to_remove = [
-                msg_id for msg_id, msg in self.messages.items() if msg.created_at < cutoff_time
-            ]
-
-            for msg_id in to_remove:
+            removed_ids: list[str] = []
+            # Messages are in creation order, so stop at the first one young enough
+            while self.messages:
+                msg_id, msg = next(iter(self.messages.items()))
+                if msg.created_at >= cutoff_time:
+                    break
                 del self.messages[msg_id]
-                removed += 1
-
-                # Also remove from database if enabled
-                if self.db_path:
-                    self._delete_from_db(msg_id)
+                self._unindex(msg)
+                removed_ids.append(msg_id)
+            removed = len(removed_ids)
+
+            # Also remove from database if enabled
+            if removed_ids and self._writer is not None:
+                self._write_many(
+                    "DELETE FROM messages WHERE message_id = ?", [(i,) for i in removed_ids]
+                )
 
         if removed > 0:
             logger.info(f"Cleaned up {removed} messages older than {max_age_seconds}s")
@@ -414,7 +440,9 @@ class MessageTracker:
                 stats["oldest_message"] = oldest.isoformat()
                 stats["newest_message"] = newest.isoformat()
 
-            return stats
+        if self._writer is not None:
+            stats["persistence"] = self._writer.get_stats()
+        return stats
 
     def is_duplicate(self, content_hash: str, target: str, within_seconds: float = 60.0) -> bool:
         """Check if a message with the same content hash was recently sent to the same target.
@@ -429,22 +457,58 @@ class MessageTracker:
         """
         cutoff_time = datetime.now() - timedelta(seconds=within_seconds)
 
-        with self._lock:
-            for msg in self.messages.values():
-                if (
-                    msg.content_hash == content_hash
-                    and msg.target == target
-                    and msg.created_at > cutoff_time
-                    and msg.status != MessageStatus.FAILED
-                ):
+        with self._dedup_lock:
+            entries = self._recent.get((content_hash, target))
+            if not entries:
+                return False
+            # Newest first; everything before an expired entry is older still
+            for msg in reversed(entries):
+                if msg.created_at <= cutoff_time:
+                    break
+                if msg.status != MessageStatus.FAILED:
                     logger.debug(
-                        f"Duplicate detected: hash={content_hash}, target={target}, "
-                        f"original_id={msg.message_id}"
+                        "Duplicate detected: hash=%s, target=%s, original_id=%s",
+                        content_hash,
+                        target,
+                        msg.message_id,
                     )
                     return True
 
         return False
 
+    def _index(self, message: TrackedMessage) -> None:
+        """Add a message to the duplicate index.
+
+        Must be called with lock held.
+        """
+        key = (message.content_hash, message.target)
+        with self._dedup_lock:
+            entries = self._recent.get(key)
+            if entries is None:
+                entries = self._recent[key] = deque()
+            entries.append(message)
+
+    def _unindex(self, message: TrackedMessage) -> None:
+        """Remove a message from the duplicate index.
+
+        Must be called with lock held. Removal is O(1) for the oldest entry,
+        which is the common case for eviction and cleanup.
+        """
+        key = (message.content_hash, message.target)
+        with self._dedup_lock:
+            entries = self._recent.get(key)
+            if not entries:
+                return
+            if entries[0] is message:
+                entries.popleft()
+            else:
+                for position, entry in enumerate(entries):
+                    if entry is message:
+                        del entries[position]
+                        break
+            if not entries:
+                del self._recent[key]
+
     def _calculate_hash(self, content: Any) -> str:
         """Calculate SHA256 hash of content.
 
@@ -471,52 +535,40 @@ class MessageTracker:
         if not self.messages:
             return
 
-        oldest_id = min(self.messages.keys(), key=lambda k: self.messages[k].created_at)
-        self.messages.pop(oldest_id)
+        oldest_id = next(iter(self.messages))
+        self._unindex(self.messages.pop(oldest_id))
 
-        if self.db_path:
+        if self._writer is not None:
             self._delete_from_db(oldest_id)
 
         logger.debug(f"Evicted oldest message {oldest_id} due to max_history limit")
 
     def _save_to_db(self, message: TrackedMessage) -> None:
-        """Save message to database.
+        """Queue an upsert of the message.
 
-        Must be called with lock held.
+        Must be called with lock held, so writes reach the writer in the
+        same order as the in-memory changes they mirror.
         """
-        if not self.db_path:
-            return
-
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute(
-                    """
-                    INSERT OR REPLACE INTO messages
-                    (message_id, provider, target, content_hash, status, created_at,
-                     updated_at, sent_at, delivered_at, error, retry_count, metadata)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """,
-                    (
-                        message.message_id,
-                        message.provider,
-                        message.target,
-                        message.content_hash,
-                        message.status.value,
-                        message.created_at.isoformat(),
-                        message.updated_at.isoformat(),
-                        message.sent_at.isoformat() if message.sent_at else None,
-                        message.delivered_at.isoformat() if message.delivered_at else None,
-                        message.error,
-                        message.retry_count,
-                        json.dumps(message.metadata),
-                    ),
-                )
-                conn.commit()
-        except Exception as e:
-            logger.error(f"Failed to save message to database: {e}", exc_info=True)
+        self._write(
+            _UPSERT,
+            (
+                message.message_id,
+                message.provider,
+                message.target,
+                message.content_hash,
+                message.status.value,
+                message.created_at.isoformat(),
+                message.updated_at.isoformat(),
+                message.sent_at.isoformat() if message.sent_at else None,
+                message.delivered_at.isoformat() if message.delivered_at else None,
+                message.error,
+                message.retry_count,
+                json.dumps(message.metadata),
+            ),
+        )
 
     def _update_db(self, message: TrackedMessage) -> None:
-        """Update message in database.
+        """Queue an update of the message in the database.
 
         Must be called with lock held.
         """
@@ -524,19 +576,74 @@ class MessageTracker:
         self._save_to_db(message)
 
     def _delete_from_db(self, message_id: str) -> None:
-        """Delete message from database.
+        """Queue deletion of a message from the database.
 
         Must be called with lock held.
         """
-        if not self.db_path:
+        self._write("DELETE FROM messages WHERE message_id = ?", (message_id,))
+
+    def _write(self, sql: str, params: tuple[Any, ...]) -> None:
+        """Queue a write statement, logging instead of raising on failure."""
+        if self._writer is None:
             return
+        try:
+            self._writer.execute(sql, params)
+        except Exception as e:
+            logger.error("Failed to queue message database write: %s", e)
 
+    def _write_many(self, sql: str, rows: list[tuple[Any, ...]]) -> None:
+        """Queue a write statement for many rows, logging instead of raising on failure."""
+        if self._writer is None:
+            return
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("DELETE FROM messages WHERE message_id = ?", (message_id,))
-                conn.commit()
+            self._writer.executemany(sql, rows)
         except Exception as e:
-            logger.error(f"Failed to delete message from database: {e}", exc_info=True)
+            logger.error("Failed to queue message database write: %s", e)
+
+    @staticmethod
+    def _from_row(row: sqlite3.Row) -> TrackedMessage:
+        """Build a message from a ``messages`` table row."""
+        return TrackedMessage(
+            message_id=row["message_id"],
+            provider=row["provider"],
+            target=row["target"],
+            content_hash=row["content_hash"],
+            status=MessageStatus(row["status"]),
+            created_at=datetime.fromisoformat(row["created_at"]),
+            updated_at=datetime.fromisoformat(row["updated_at"]),
+            sent_at=datetime.fromisoformat(row["sent_at"]) if row["sent_at"] else None,
+            delivered_at=(
+                datetime.fromisoformat(row["delivered_at"]) if row["delivered_at"] else None
+            ),
+            error=row["error"],
+            retry_count=row["retry_count"],
+            metadata=json.loads(row["metadata"]) if row["metadata"] else {},
+        )
+
+    def _query_db(
+        self, status: MessageStatus | None = None, limit: int | None = None
+    ) -> list[sqlite3.Row]:
+        """Read stored messages, newest first, after all queued writes.
+
+        Args:
+            status: Optional status to filter by
+            limit: Maximum number of rows (None for all)
+
+        Returns:
+            Matching rows
+        """
+        assert self._writer is not None
+        query = "SELECT * FROM messages"
+        params: list[Any] = []
+        if status is not None:
+            query += " WHERE status = ?"
+            params.append(status.value)
+        query += " ORDER BY created_at DESC"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+
+        return self._writer.query(lambda conn: conn.execute(query, params).fetchall())
 
     def load_from_db(self, limit: int | None = None) -> int:
         """Load messages from database into memory.
@@ -547,45 +654,31 @@ class MessageTracker:
         Returns:
             Number of messages loaded
         """
-        if not self.db_path:
+        if self._writer is None:
             logger.warning("Database not configured for loading")
             return 0
 
         loaded = 0
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                query = "SELECT * FROM messages ORDER BY created_at DESC"
-                if limit:
-                    query += f" LIMIT {limit}"
-
-                cursor = conn.execute(query)
-                for row in cursor.fetchall():
-                    try:
-                        message = TrackedMessage(
-                            message_id=row[0],
-                            provider=row[1],
-                            target=row[2],
-                            content_hash=row[3],
-                            status=MessageStatus(row[4]),
-                            created_at=datetime.fromisoformat(row[5]),
-                            updated_at=datetime.fromisoformat(row[6]),
-                            sent_at=datetime.fromisoformat(row[7]) if row[7] else None,
-                            delivered_at=datetime.fromisoformat(row[8]) if row[8] else None,
-                            error=row[9],
-                            retry_count=row[10],
-                            metadata=json.loads(row[11]) if row[11] else {},
-                        )
-
-                        with self._lock:
-                            self.messages[message.message_id] = message
-                            loaded += 1
-
-                            # Enforce max history during load
-                            if len(self.messages) > self.max_history:
-                                self._evict_oldest()
-
-                    except Exception as e:
-                        logger.error(f"Failed to load message from database: {e}")
+            rows = self._query_db(limit=limit)
+
+            loaded_messages: list[TrackedMessage] = []
+            for row in reversed(rows):
+                try:
+                    loaded_messages.append(self._from_row(row))
+                except Exception as e:
+                    logger.error(f"Failed to load message from database: {e}")
+
+            with self._lock:
+                for message in loaded_messages:
+                    self.messages.pop(message.message_id, None)
+                    self.messages[message.message_id] = message
+                loaded = len(loaded_messages)
+                self._reorder()
+
+                # Enforce max history after load
+                while len(self.messages) > self.max_history:
+                    self._evict_oldest()
 
             logger.info(f"Loaded {loaded} messages from database")
         except Exception as e:
@@ -593,15 +686,41 @@ class MessageTracker:
 
         return loaded
 
-    def export_messages(self, status: MessageStatus | None = None) -> list[dict[str, Any]]:
+    def _reorder(self) -> None:
+        """Restore creation order of ``messages`` and rebuild the duplicate index.
+
+        Must be called with lock held.
+        """
+        ordered = sorted(self.messages.values(), key=lambda m: m.created_at)
+        self.messages.clear()
+        with self._dedup_lock:
+            self._recent.clear()
+        for message in ordered:
+            self.messages[message.message_id] = message
+            self._index(message)
+
+    def export_messages(
+        self, status: MessageStatus | None = None, from_db: bool = False
+    ) -> list[dict[str, Any]]:
         """Export messages as dictionaries.
 
         Args:
             status: Optional status to filter by
+            from_db: Export every stored message (including those evicted from
+                memory) from the database instead of the in-memory history
 
         Returns:
             List of message dictionaries
         """
+        if from_db and self._writer is not None:
+            messages_from_db = []
+            for row in self._query_db(status=status):
+                try:
+                    messages_from_db.append(self._from_row(row).to_dict())
+                except Exception as e:
+                    logger.error("Failed to export message from database: %s", e)
+            return messages_from_db
+
         with self._lock:
             messages = (
                 [msg for msg in self.messages.values() if msg.status == status]
@@ -619,14 +738,25 @@ class MessageTracker:
         with self._lock:
             count = len(self.messages)
             self.messages.clear()
+            with self._dedup_lock:
+                self._recent.clear()
 
-            if self.db_path:
-                try:
-                    with sqlite3.connect(self.db_path) as conn:
-                        conn.execute("DELETE FROM messages")
-                        conn.commit()
-                except Exception as e:
-                    logger.error(f"Failed to clear database: {e}", exc_info=True)
+            self._write("DELETE FROM messages", ())
 
         logger.info(f"Cleared {count} tracked messages")
         return count
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until every queued database write has been committed.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+        """
+        if self._writer is not None and not self._writer.closed:
+            self._writer.flush(timeout=timeout)
+
+    def close(self) -> None:
+        """Stop the cleanup thread and commit and close the database."""
+        self.stop_cleanup()
+        if self._writer is not None:
+            self._writer.close()
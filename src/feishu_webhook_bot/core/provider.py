@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
@@ -159,6 +160,91 @@ class BaseProvider(ABC):
         return f"<{self.__class__.__name__} name={self.name} type={self.provider_type}>"
 
 
+class AsyncBaseProvider(ABC):
+    """Native asynchronous send interface for message providers.
+
+    Providers implementing it send without blocking the event loop. Coroutines
+    should go through ``send_async``, which uses this interface when available
+    and runs the sync method in a worker thread otherwise.
+    """
+
+    async def async_connect(self) -> None:
+        """Prepare the provider for async sends."""
+
+    async def async_disconnect(self) -> None:
+        """Release resources held for async sends."""
+
+    async def async_send_message(self, message: Message, target: str) -> SendResult:
+        """Send a message asynchronously with automatic type detection.
+
+        Args:
+            message: Message to send
+            target: Provider-specific target
+
+        Returns:
+            SendResult with status and message ID
+        """
+        if message.type == MessageType.TEXT:
+            return await self.async_send_text(message.content, target)
+        if message.type == MessageType.RICH_TEXT:
+            return await self.async_send_rich_text(
+                message.content.get("title", ""),
+                message.content.get("content", []),
+                target,
+                message.content.get("language", "zh_cn"),
+            )
+        if message.type == MessageType.CARD:
+            return await self.async_send_card(message.content, target)
+        if message.type == MessageType.IMAGE:
+            return await self.async_send_image(message.content, target)
+        return SendResult.fail(f"Unsupported message type: {message.type}")
+
+    @abstractmethod
+    async def async_send_text(self, text: str, target: str) -> SendResult:
+        pass
+
+    @abstractmethod
+    async def async_send_card(self, card: dict[str, Any], target: str) -> SendResult:
+        pass
+
+    @abstractmethod
+    async def async_send_rich_text(
+        self,
+        title: str,
+        content: list[list[dict[str, Any]]],
+        target: str,
+        language: str = "zh_cn",
+    ) -> SendResult:
+        pass
+
+    @abstractmethod
+    async def async_send_image(self, image_key: str, target: str) -> SendResult:
+        pass
+
+
+async def send_async(provider: Any, method: str, *args: Any, **kwargs: Any) -> Any:
+    """Call a provider send method from a coroutine without blocking the loop.
+
+    Providers implementing ``AsyncBaseProvider`` are called through their
+    native ``async_<method>``; any other provider runs the sync method in a
+    worker thread.
+
+    Args:
+        provider: Message provider
+        method: Name of the sync method, e.g. ``"send_text"``
+        *args: Positional arguments for the method
+        **kwargs: Keyword arguments for the method
+
+    Returns:
+        The method's result
+    """
+    if isinstance(provider, AsyncBaseProvider):
+        native = getattr(provider, f"async_{method}", None)
+        if native is not None:
+            return await native(*args, **kwargs)
+    return await asyncio.to_thread(getattr(provider, method), *args, **kwargs)
+
+
 class ProviderRegistry:
     """Registry for managing multiple provider instances.
 
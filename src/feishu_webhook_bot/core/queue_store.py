@@ -0,0 +1,248 @@
+"""Durable storage for MessageQueue so pending messages survive restarts.
+
+Queued messages are written to a SQLite database in WAL mode through a
+``BatchedSQLiteWriter``; the queue's hot path only serializes the message and
+hands the write to the background thread, which group-commits every
+``flush_interval`` seconds. Rows are deleted when a message is acknowledged
+(sent or permanently failed) and updated in place when it is scheduled for a
+retry, so the table always holds exactly the outstanding messages.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any
+
+from .logger import get_logger
+from .message_queue import QueuedMessage
+from .sqlite_writer import BatchedSQLiteWriter
+
+logger = get_logger(__name__)
+
+_SCHEMA = (
+    # Only takes effect for new databases; lets compaction return freed pages
+    "PRAGMA auto_vacuum=INCREMENTAL",
+    """
+    CREATE TABLE IF NOT EXISTS queued_messages (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        message_id TEXT NOT NULL UNIQUE,
+        provider_name TEXT NOT NULL,
+        target TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        not_before REAL
+    )
+    """,
+)
+
+_INSERT = """
+    INSERT OR REPLACE INTO queued_messages
+    (message_id, provider_name, target, payload, not_before)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+
+class MessageQueueStore:
+    """SQLite write-ahead store for queued messages.
+
+    Supports enqueue (``append``), acknowledgement (``ack``), retry
+    scheduling (``requeue``), replay on startup (``load_pending``) and
+    periodic compaction of the database file.
+    """
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        flush_interval: float = 0.05,
+        compact_interval: float = 300.0,
+    ) -> None:
+        """Open (or create) the queue database.
+
+        Args:
+            db_path: SQLite database path
+            flush_interval: Maximum seconds a write waits before being committed
+            compact_interval: Minimum seconds between compactions (0 to disable)
+        """
+        self.db_path = str(db_path)
+        self.compact_interval = compact_interval
+        self._writer = BatchedSQLiteWriter(
+            self.db_path,
+            schema=_SCHEMA,
+            flush_interval=flush_interval,
+            name="MessageQueueStore",
+        )
+        self._last_compact = time.monotonic()
+        self._stats = {
+            "appended": 0,
+            "acked": 0,
+            "requeued": 0,
+            "replayed": 0,
+            "skipped": 0,
+            "compactions": 0,
+        }
+        logger.info(f"Message queue store opened at {self.db_path}")
+
+    def _row(self, message: QueuedMessage, not_before: float | None) -> tuple[Any, ...] | None:
+        """Build the insert row for a message, or None if it cannot be serialized."""
+        try:
+            payload = json.dumps(message.to_dict(), ensure_ascii=False)
+        except (TypeError, ValueError) as exc:
+            self._stats["skipped"] += 1
+            logger.warning(
+                f"Message {message.id} is not JSON serializable and will not be persisted: {exc}"
+            )
+            return None
+        return (message.id, message.provider_name, message.target, payload, not_before)
+
+    def append(self, message: QueuedMessage) -> bool:
+        """Persist a newly enqueued message.
+
+        Args:
+            message: Message to persist
+
+        Returns:
+            True if the message was queued for writing, False if it could not be serialized
+        """
+        row = self._row(message, None)
+        if row is None:
+            return False
+        self._writer.execute(_INSERT, row)
+        self._stats["appended"] += 1
+        return True
+
+    def append_many(self, messages: Iterable[QueuedMessage]) -> int:
+        """Persist several newly enqueued messages in one statement.
+
+        Args:
+            messages: Messages to persist
+
+        Returns:
+            Number of messages queued for writing
+        """
+        rows = [row for row in (self._row(message, None) for message in messages) if row]
+        if rows:
+            self._writer.executemany(_INSERT, rows)
+            self._stats["appended"] += len(rows)
+        return len(rows)
+
+    def ack(self, message_id: str) -> None:
+        """Remove a message that no longer needs delivery.
+
+        Args:
+            message_id: ID of the sent or permanently failed message
+        """
+        self._writer.execute("DELETE FROM queued_messages WHERE message_id = ?", (message_id,))
+        self._stats["acked"] += 1
+        self.maybe_compact()
+
+    def requeue(self, message: QueuedMessage, not_before: float) -> None:
+        """Record a retry so its attempt count and backoff survive a restart.
+
+        Args:
+            message: Message scheduled for retry
+            not_before: Wall-clock time (epoch seconds) when the retry becomes eligible
+        """
+        row = self._row(message, not_before)
+        if row is None:
+            return
+        self._writer.execute(
+            "UPDATE queued_messages SET payload = ?, not_before = ? WHERE message_id = ?",
+            (row[3], not_before, message.id),
+        )
+        self._stats["requeued"] += 1
+
+    def load_pending(self) -> list[tuple[QueuedMessage, float | None]]:
+        """Read all outstanding messages in their original enqueue order.
+
+        Returns:
+            List of ``(message, not_before)`` pairs; ``not_before`` is the
+            wall-clock retry time, or None for messages never attempted
+        """
+
+        def read(conn: sqlite3.Connection) -> list[sqlite3.Row]:
+            return conn.execute(
+                "SELECT message_id, payload, not_before FROM queued_messages ORDER BY seq"
+            ).fetchall()
+
+        pending: list[tuple[QueuedMessage, float | None]] = []
+        for row in self._writer.query(read):
+            try:
+                message = QueuedMessage.from_dict(json.loads(row["payload"]))
+            except Exception as exc:
+                logger.error(f"Discarding unreadable queued message {row['message_id']}: {exc}")
+                self.ack(row["message_id"])
+                continue
+            pending.append((message, row["not_before"]))
+
+        self._stats["replayed"] += len(pending)
+        return pending
+
+    def clear(self) -> None:
+        """Remove every stored message."""
+        self._writer.execute("DELETE FROM queued_messages")
+
+    def maybe_compact(self) -> None:
+        """Compact the database if ``compact_interval`` has elapsed since the last run."""
+        if self.compact_interval <= 0:
+            return
+        if time.monotonic() - self._last_compact >= self.compact_interval:
+            self.compact()
+
+    def compact(self) -> None:
+        """Fold the WAL into the main database and release free pages.
+
+        Runs asynchronously on the writer thread.
+        """
+        self._last_compact = time.monotonic()
+
+        def compact(conn: sqlite3.Connection) -> None:
+            conn.execute("PRAGMA incremental_vacuum")
+            conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+        future = self._writer.submit(compact)
+        future.add_done_callback(self._on_compacted)
+
+    def _on_compacted(self, future: Any) -> None:
+        """Record the outcome of a compaction."""
+        exc = future.exception()
+        if exc is not None:
+            logger.warning(f"Message queue store compaction failed: {exc}")
+        else:
+            self._stats["compactions"] += 1
+
+    def count(self) -> int:
+        """Return the number of stored messages (after pending writes)."""
+        return int(
+            self._writer.query(
+                lambda conn: conn.execute("SELECT COUNT(*) FROM queued_messages").fetchone()[0]
+            )
+        )
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until all queued writes are committed.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+        """
+        self._writer.flush(timeout=timeout)
+
+    def close(self) -> None:
+        """Commit pending writes and close the database."""
+        if self._writer.closed:
+            return
+        self._writer.close()
+        logger.info(f"Message queue store closed at {self.db_path}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store statistics.
+
+        Returns:
+            Dictionary with operation counters plus writer commit statistics
+        """
+        stats: dict[str, Any] = dict(self._stats)
+        stats["db_path"] = self.db_path
+        stats["writer"] = self._writer.get_stats()
+        return stats
@@ -0,0 +1,312 @@
+"""Write-behind SQLite access on a single dedicated thread.
+
+This module provides ``BatchedSQLiteWriter``, which owns one long-lived SQLite
+connection in WAL mode and applies writes from any thread in group commits:
+
+- Writes are queued without blocking the caller
+- Pending writes are committed together every ``flush_interval`` seconds or
+  once ``max_batch`` statements have accumulated
+- Reads and maintenance run on the writer thread after all previously queued
+  writes, so callers always observe their own writes
+"""
+
+from __future__ import annotations
+
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, TypeVar
+
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Queue item kinds
+_WRITE = "write"
+_WRITE_MANY = "write_many"
+_CALL = "call"
+_STOP = "stop"
+
+
+class BatchedSQLiteWriter:
+    """Group-committing SQLite connection owned by a background thread."""
+
+    def __init__(
+        self,
+        db_path: str | Path,
+        schema: Sequence[str] = (),
+        flush_interval: float = 0.05,
+        max_batch: int = 500,
+        name: str = "sqlite-writer",
+    ) -> None:
+        """Open the database and start the writer thread.
+
+        Args:
+            db_path: SQLite database path (``":memory:"`` for a private in-memory database)
+            schema: Statements executed once at startup (e.g. ``CREATE TABLE IF NOT EXISTS``)
+            flush_interval: Maximum seconds a queued write waits before being committed
+            max_batch: Maximum number of statements committed in one transaction
+            name: Name of the writer thread
+
+        Raises:
+            ValueError: If flush_interval is negative or max_batch is less than 1
+            sqlite3.Error: If the database cannot be opened or the schema fails
+        """
+        if flush_interval < 0:
+            raise ValueError("flush_interval must be non-negative")
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+
+        self.db_path = str(db_path)
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+
+        self._queue: queue.SimpleQueue[tuple[str, Any, Future[Any] | None]] = queue.SimpleQueue()
+        self._closed = False
+        self._close_lock = threading.Lock()
+        self._stats = {
+            "statements": 0,
+            "commits": 0,
+            "errors": 0,
+        }
+
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        ready: Future[None] = Future()
+        self._thread = threading.Thread(
+            target=self._run, args=(list(schema), ready), daemon=True, name=name
+        )
+        self._thread.start()
+        ready.result()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection used by the writer thread."""
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        if self.db_path != ":memory:":
+            conn.execute("PRAGMA journal_mode=WAL")
+            # In WAL mode NORMAL only syncs at checkpoints; commits stay crash-safe
+            conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def execute(self, sql: str, params: Sequence[Any] = ()) -> None:
+        """Queue a write statement.
+
+        Args:
+            sql: SQL statement
+            params: Statement parameters
+
+        Raises:
+            RuntimeError: If the writer has been closed
+        """
+        self._put(_WRITE, (sql, tuple(params)), None)
+
+    def executemany(self, sql: str, rows: Iterable[Sequence[Any]]) -> None:
+        """Queue a write statement applied to many parameter rows.
+
+        Args:
+            sql: SQL statement
+            rows: Parameter rows
+
+        Raises:
+            RuntimeError: If the writer has been closed
+        """
+        self._put(_WRITE_MANY, (sql, [tuple(row) for row in rows]), None)
+
+    def submit(self, fn: Callable[[sqlite3.Connection], T]) -> Future[T]:
+        """Run ``fn`` on the writer thread after all previously queued writes.
+
+        Pending writes are committed first, so ``fn`` sees a consistent view.
+        ``fn`` runs outside any transaction; it may read, or perform its own
+        maintenance such as ``PRAGMA wal_checkpoint``.
+
+        Args:
+            fn: Callable receiving the writer's connection
+
+        Returns:
+            Future resolved with the result of ``fn``
+
+        Raises:
+            RuntimeError: If the writer has been closed
+        """
+        future: Future[T] = Future()
+        self._put(_CALL, fn, future)
+        return future
+
+    def query(self, fn: Callable[[sqlite3.Connection], T], timeout: float | None = None) -> T:
+        """Run ``fn`` on the writer thread and wait for its result.
+
+        Args:
+            fn: Callable receiving the writer's connection
+            timeout: Seconds to wait for the result (None waits indefinitely)
+
+        Returns:
+            Result of ``fn``
+        """
+        return self.submit(fn).result(timeout=timeout)
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Block until every write queued so far has been committed.
+
+        Args:
+            timeout: Seconds to wait (None waits indefinitely)
+        """
+        self.query(lambda conn: None, timeout=timeout)
+
+    def close(self, timeout: float | None = 10.0) -> None:
+        """Commit pending writes, stop the writer thread and close the database.
+
+        Safe to call more than once.
+
+        Args:
+            timeout: Seconds to wait for the writer thread to finish
+        """
+        with self._close_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put((_STOP, None, None))
+        self._thread.join(timeout=timeout)
+
+    @property
+    def closed(self) -> bool:
+        """Whether the writer has been closed."""
+        return self._closed
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get writer statistics.
+
+        Returns:
+            Dictionary with statements applied, commits, errors and pending items
+        """
+        stats: dict[str, Any] = dict(self._stats)
+        stats["pending"] = self._queue.qsize()
+        return stats
+
+    def _put(self, kind: str, payload: Any, future: Future[Any] | None) -> None:
+        """Enqueue an item for the writer thread."""
+        if self._closed:
+            raise RuntimeError(f"SQLite writer for {self.db_path} is closed")
+        self._queue.put((kind, payload, future))
+
+    def _run(self, schema: list[str], ready: Future[None]) -> None:
+        """Writer thread main loop."""
+        try:
+            conn = self._connect()
+            for statement in schema:
+                conn.execute(statement)
+        except Exception as exc:
+            ready.set_exception(exc)
+            return
+        ready.set_result(None)
+
+        try:
+            while True:
+                item = self._queue.get()
+                batch = [item]
+                if item[0] in (_WRITE, _WRITE_MANY):
+                    batch.extend(self._collect_batch())
+                if not self._process(conn, batch):
+                    break
+        finally:
+            conn.close()
+
+    def _collect_batch(self) -> list[tuple[str, Any, Future[Any] | None]]:
+        """Gather further writes for the current group commit.
+
+        Stops early at a call or stop item so it is handled right after the
+        commit, keeping ordering with respect to earlier writes.
+        """
+        items: list[tuple[str, Any, Future[Any] | None]] = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(items) + 1 < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                item = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                break
+            items.append(item)
+            if item[0] not in (_WRITE, _WRITE_MANY):
+                break
+        return items
+
+    def _process(
+        self, conn: sqlite3.Connection, batch: list[tuple[str, Any, Future[Any] | None]]
+    ) -> bool:
+        """Apply a batch of queued items.
+
+        Returns:
+            False once a stop item has been handled
+        """
+        writes = [item for item in batch if item[0] in (_WRITE, _WRITE_MANY)]
+        if writes:
+            self._commit(conn, writes)
+
+        for kind, payload, future in batch:
+            if kind == _CALL and future is not None:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(payload(conn))
+                except Exception as exc:
+                    future.set_exception(exc)
+            elif kind == _STOP:
+                # Drain anything that raced with close()
+                leftovers: list[tuple[str, Any, Future[Any] | None]] = []
+                while True:
+                    try:
+                        leftovers.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if leftovers:
+                    self._process(conn, leftovers)
+                return False
+        return True
+
+    def _commit(
+        self, conn: sqlite3.Connection, writes: list[tuple[str, Any, Future[Any] | None]]
+    ) -> None:
+        """Apply writes in one transaction, falling back to one-by-one on error."""
+        try:
+            conn.execute("BEGIN")
+            for kind, (sql, params), _ in writes:
+                if kind == _WRITE:
+                    conn.execute(sql, params)
+                else:
+                    conn.executemany(sql, params)
+            conn.execute("COMMIT")
+            self._stats["statements"] += len(writes)
+            self._stats["commits"] += 1
+            return
+        except sqlite3.Error as exc:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            logger.warning(f"Group commit failed, retrying statements individually: {exc}")
+
+        # Isolate the failing statement so one bad row does not drop the batch
+        for kind, (sql, params), _ in writes:
+            try:
+                if kind == _WRITE:
+                    conn.execute(sql, params)
+                else:
+                    conn.execute("BEGIN")
+                    conn.executemany(sql, params)
+                    conn.execute("COMMIT")
+                self._stats["statements"] += 1
+                self._stats["commits"] += 1
+            except sqlite3.Error as exc:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                self._stats["errors"] += 1
+                logger.error(f"SQLite write failed: {exc}; statement: {sql}")
@@ -0,0 +1,507 @@
+"""LRU cache with per-entry expiry and an optional SQLite tier.
+
+``TTLCache`` is the storage behind the search result cache, the AI response
+cache and the image key cache; each of those only adds its own keys, value
+types and statistics.
+
+Entries live in an ``OrderedDict`` kept in recency order: lookups move an
+entry to the end and eviction pops from the front, both O(1). Expiry is
+checked lazily when an entry is read. With a ``db_path`` every entry is also
+written through a ``BatchedSQLiteWriter`` into a ``(key, value, created_at,
+expires_at)`` table, so entries survive restarts and processes sharing the
+file can read each other's entries.
+
+``SharedCache`` holds the process-wide instance of such a cache and rebuilds
+it when its settings change.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, NamedTuple, Protocol
+
+from .logger import get_logger
+from .sqlite_writer import BatchedSQLiteWriter
+
+logger = get_logger("ttl_cache")
+
+
+class _Entry(NamedTuple):
+    """Cached value with its wall-clock expiry time."""
+
+    value: Any
+    expires_at: float
+
+
+class _Statements(NamedTuple):
+    """SQL used by a cache, specialized for its table."""
+
+    schema: tuple[str, ...]
+    upsert: str
+    prune: str
+    load: str
+    lookup: str
+
+
+def _statements(table: str) -> _Statements:
+    """Build the SQL of a cache table."""
+    return _Statements(
+        schema=(
+            f"""
+            CREATE TABLE IF NOT EXISTS {table} (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL
+            )
+            """,
+            f"CREATE INDEX IF NOT EXISTS idx_{table}_created ON {table} (created_at)",
+        ),
+        upsert=f"""
+            INSERT OR REPLACE INTO {table} (key, value, created_at, expires_at)
+            VALUES (?, ?, ?, ?)
+        """,
+        prune=f"""
+            DELETE FROM {table}
+            WHERE expires_at <= ?
+               OR key NOT IN (SELECT key FROM {table} ORDER BY created_at DESC LIMIT ?)
+        """,
+        load=f"""
+            SELECT key, value, expires_at FROM {table}
+            WHERE expires_at > ?
+            ORDER BY created_at DESC
+            LIMIT ?
+        """,
+        lookup=f"SELECT value, expires_at FROM {table} WHERE key = ? AND expires_at > ?",
+    )
+
+
+def _encode_text(value: Any) -> str | None:
+    """Store text values as-is; anything else stays in memory only."""
+    return value if isinstance(value, str) else None
+
+
+def _decode_text(payload: str) -> Any:
+    return payload
+
+
+def _normalize_path(db_path: str | Path | None) -> str | None:
+    return str(db_path) if db_path is not None else None
+
+
+class TTLCache:
+    """Thread-safe LRU cache with TTL expiry and optional SQLite persistence.
+
+    Values must not be None, which lookups use to signal a miss.
+
+    Example:
+        ```python
+        cache = TTLCache("image_keys", ttl_seconds=3600, max_size=1000, db_path="cache.db")
+        cache.set("key", "value")
+        cache.get("key")  # "value"
+        ```
+    """
+
+    def __init__(
+        self,
+        table: str,
+        ttl_seconds: float,
+        max_size: int,
+        db_path: str | Path | None = None,
+        *,
+        encode: Callable[[Any], str | None] = _encode_text,
+        decode: Callable[[str], Any] = _decode_text,
+        warm_start: bool = True,
+        read_through: bool = False,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            table: Database table holding the entries (a plain identifier)
+            ttl_seconds: Seconds an entry stays valid (0 expires entries at once)
+            max_size: Maximum number of entries kept in memory and in the database
+            db_path: SQLite file backing the cache (None for memory only)
+            encode: Serializes a value for the database; returning None keeps
+                the value in memory only
+            decode: Restores a value written by ``encode``; may raise ValueError
+            warm_start: Load the most recent unexpired entries when opening the database
+            read_through: Look up entries missing from memory in the database,
+                where other processes may have stored them
+
+        Raises:
+            ValueError: If table is not an identifier, ttl_seconds is negative
+                or max_size is less than 1
+        """
+        if not table.isidentifier():
+            raise ValueError(f"Invalid cache table name: {table!r}")
+        if ttl_seconds < 0:
+            raise ValueError("ttl_seconds must be non-negative")
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.table = table
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self.db_path = _normalize_path(db_path)
+        self.read_through = read_through
+        self._encode = encode
+        self._decode = decode
+        self._sql = _statements(table)
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._lock = threading.Lock()
+        self._writes_since_prune = 0
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "disk_hits": 0,
+            "evictions": 0,
+            "expired": 0,
+            "warm_loaded": 0,
+        }
+        self._writer: BatchedSQLiteWriter | None = None
+        if db_path is not None:
+            self._writer = BatchedSQLiteWriter(db_path, schema=self._sql.schema, name=table)
+            if warm_start:
+                self._load_from_disk()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def persistent(self) -> bool:
+        """Whether entries are written to a database."""
+        return self._writer is not None
+
+    def get(self, key: str) -> Any | None:
+        """Look up a live entry and mark it recently used.
+
+        With ``read_through`` the database is queried on a memory miss,
+        blocking until the writer thread answers.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            Cached value, or None if absent or expired
+        """
+        value = self._get_memory(key)
+        if value is None and self.read_through and self._writer is not None:
+            value = self._promote(key, self._query_row(key, time.time()))
+        return self._count(value)
+
+    async def aget(self, key: str) -> Any | None:
+        """Look up an entry like ``get`` without blocking the event loop on the database.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            Cached value, or None if absent or expired
+        """
+        value = self._get_memory(key)
+        if value is None and self.read_through and self._writer is not None:
+            now = time.time()
+            try:
+                row = await asyncio.wrap_future(
+                    self._writer.submit(
+                        lambda conn: conn.execute(self._sql.lookup, (key, now)).fetchone()
+                    )
+                )
+            except Exception as exc:
+                logger.warning("Failed to read %s database: %s", self.table, exc)
+                row = None
+            value = self._promote(key, row)
+        return self._count(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """Store an entry that expires ``ttl_seconds`` from now.
+
+        Args:
+            key: Entry key
+            value: Value to cache (not None)
+        """
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        with self._lock:
+            self._store(key, _Entry(value, expires_at))
+        if self._writer is None:
+            return
+        payload = self._encode(value)
+        if payload is None:
+            logger.debug("Value for %s is not serializable; kept in memory", self.table)
+            return
+        try:
+            self._writer.execute(self._sql.upsert, (key, payload, now, expires_at))
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= self.max_size:
+                self._writes_since_prune = 0
+                self._writer.execute(self._sql.prune, (now, self.max_size))
+        except RuntimeError as exc:
+            logger.warning("%s database unavailable: %s", self.table, exc)
+
+    def delete(self, key: str) -> bool:
+        """Remove an entry from memory and the database.
+
+        Args:
+            key: Entry key
+
+        Returns:
+            True if the entry was in memory
+        """
+        with self._lock:
+            removed = self._entries.pop(key, None) is not None
+        self._execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+        return removed
+
+    def clear(self) -> int:
+        """Remove every entry from memory and the database.
+
+        Returns:
+            Number of in-memory entries removed
+        """
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+        self._execute(f"DELETE FROM {self.table}")
+        return count
+
+    def reset_stats(self) -> None:
+        """Reset the hit, miss, eviction and expiry counters."""
+        with self._lock:
+            for name in ("hits", "misses", "disk_hits", "evictions", "expired"):
+                self._stats[name] = 0
+
+    def items(self) -> list[tuple[str, Any]]:
+        """Snapshot of the unexpired in-memory entries, least recently used first."""
+        now = time.time()
+        with self._lock:
+            return [
+                (key, entry.value) for key, entry in self._entries.items() if entry.expires_at > now
+            ]
+
+    def cleanup_expired(self) -> int:
+        """Remove expired entries from memory and the database.
+
+        Returns:
+            Number of in-memory entries removed
+        """
+        now = time.time()
+        with self._lock:
+            expired = [key for key, entry in self._entries.items() if entry.expires_at <= now]
+            for key in expired:
+                del self._entries[key]
+            self._stats["expired"] += len(expired)
+        self._execute(self._sql.prune, (now, self.max_size))
+        return len(expired)
+
+    def close(self) -> None:
+        """Commit pending database writes and close the database.
+
+        Safe to call more than once; the in-memory cache stays usable.
+        """
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def matches(self, ttl_seconds: float, max_size: int, db_path: str | Path | None) -> bool:
+        """Check whether the cache was created with the given settings.
+
+        Args:
+            ttl_seconds: Seconds an entry stays valid
+            max_size: Maximum number of entries
+            db_path: SQLite file backing the cache
+
+        Returns:
+            True if all settings are equal
+        """
+        return (
+            self.ttl_seconds == ttl_seconds
+            and self.max_size == max_size
+            and self.db_path == _normalize_path(db_path)
+        )
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with size, limits, hits (including those served from
+            the database), misses, hit rate, evictions, expired and
+            warm-loaded entries
+        """
+        with self._lock:
+            stats: dict[str, Any] = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate_percent"] = round(stats["hits"] / lookups * 100, 2) if lookups else 0.0
+        stats["size"] = len(self._entries)
+        stats["max_size"] = self.max_size
+        stats["ttl_seconds"] = self.ttl_seconds
+        stats["persistent"] = self._writer is not None
+        return stats
+
+    def _get_memory(self, key: str) -> Any | None:
+        """Return a live in-memory value and mark it recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.time():
+                del self._entries[key]
+                self._stats["expired"] += 1
+                return None
+            self._entries.move_to_end(key)
+            return entry.value
+
+    def _count(self, value: Any | None) -> Any | None:
+        """Record a lookup as a hit or a miss."""
+        with self._lock:
+            self._stats["hits" if value is not None else "misses"] += 1
+        return value
+
+    def _query_row(self, key: str, now: float) -> Any:
+        """Fetch an unexpired database row, or None."""
+        assert self._writer is not None
+        try:
+            return self._writer.query(
+                lambda conn: conn.execute(self._sql.lookup, (key, now)).fetchone()
+            )
+        except Exception as exc:
+            logger.warning("Failed to read %s database: %s", self.table, exc)
+            return None
+
+    def _promote(self, key: str, row: Any) -> Any | None:
+        """Decode a database row and keep it in memory."""
+        if row is None:
+            return None
+        try:
+            value = self._decode(row["value"])
+        except ValueError as exc:
+            logger.debug("Skipping unreadable %s entry: %s", self.table, exc)
+            return None
+        with self._lock:
+            self._store(key, _Entry(value, row["expires_at"]))
+            self._stats["disk_hits"] += 1
+        return value
+
+    def _store(self, key: str, entry: _Entry) -> None:
+        """Insert an entry, evicting the least recently used ones beyond the limit.
+
+        Must be called with the lock held.
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def _execute(self, sql: str, params: tuple[Any, ...] = ()) -> None:
+        """Queue a database write if the cache is persistent."""
+        if self._writer is None:
+            return
+        try:
+            self._writer.execute(sql, params)
+        except RuntimeError as exc:
+            logger.warning("%s database unavailable: %s", self.table, exc)
+
+    def _load_from_disk(self) -> None:
+        """Load the most recent unexpired entries from the database."""
+        assert self._writer is not None
+        try:
+            rows = self._writer.query(
+                lambda conn: conn.execute(self._sql.load, (time.time(), self.max_size)).fetchall()
+            )
+        except Exception as exc:
+            logger.warning("Failed to load %s database: %s", self.table, exc)
+            return
+
+        # Rows are newest first; insert oldest first so recency order is kept
+        with self._lock:
+            for row in reversed(rows):
+                try:
+                    value = self._decode(row["value"])
+                except ValueError as exc:
+                    logger.debug("Skipping unreadable %s entry: %s", self.table, exc)
+                    continue
+                self._store(row["key"], _Entry(value, row["expires_at"]))
+                self._stats["warm_loaded"] += 1
+        if self._stats["warm_loaded"]:
+            logger.info("Loaded %d %s entries from disk", self._stats["warm_loaded"], self.table)
+
+
+class _ConfigurableCache(Protocol):
+    def matches(self, *args: Any, **kwargs: Any) -> bool: ...
+
+    def close(self) -> None: ...
+
+
+class SharedCache[C: _ConfigurableCache]:
+    """Process-wide cache instance, rebuilt when its settings change.
+
+    Settings are passed as keyword arguments to both the factory and the
+    cache's ``matches`` method.
+
+    Example:
+        ```python
+        _shared = SharedCache(SearchCache)
+        cache = _shared.configure(ttl_minutes=30, max_size=200, db_path=None)
+        ```
+    """
+
+    def __init__(self, factory: Callable[..., C]) -> None:
+        """Initialize an empty slot.
+
+        Args:
+            factory: Creates the cache from keyword settings
+        """
+        self._factory = factory
+        self._cache: C | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def current(self) -> C | None:
+        """The current cache, or None if none was created."""
+        return self._cache
+
+    def get(self, **settings: Any) -> C:
+        """Return the current cache, creating it from ``settings`` if there is none.
+
+        Args:
+            **settings: Settings used only when the cache is created
+
+        Returns:
+            The shared cache
+        """
+        with self._lock:
+            if self._cache is None:
+                self._cache = self._factory(**settings)
+            return self._cache
+
+    def configure(self, **settings: Any) -> C:
+        """Replace the cache unless it already uses these settings.
+
+        The previous cache is closed when it is replaced.
+
+        Args:
+            **settings: Cache settings
+
+        Returns:
+            The shared cache
+        """
+        with self._lock:
+            previous = self._cache
+            if previous is not None and previous.matches(**settings):
+                return previous
+            self._cache = cache = self._factory(**settings)
+        if previous is not None:
+            previous.close()
+        return cache
+
+    def reset(self) -> None:
+        """Close and drop the cache."""
+        with self._lock:
+            cache, self._cache = self._cache, None
+        if cache is not None:
+            cache.close()
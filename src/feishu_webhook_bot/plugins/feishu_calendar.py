@@ -14,7 +14,6 @@ This plugin provides comprehensive calendar integration with Feishu:
 from __future__ import annotations
 
 import contextlib
-import time
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta, timezone
 from enum import Enum
@@ -23,6 +22,8 @@ from typing import Any
 import httpx
 
 from ..core.client import CardBuilder
+from ..core.feishu_token import FeishuTokenError, get_token_service
+from ..core.http_pool import get_http_pool
 from ..core.logger import get_logger
 from .base import BasePlugin, PluginMetadata
 from .config_schema import (
@@ -38,6 +39,9 @@ from .manifest import (
 
 logger = get_logger("plugin.feishu-calendar")
 
+# Timeout for Feishu Open Platform calls, sent through the shared HTTP pool
+_HTTP_TIMEOUT = 10.0
+
 
 # ========== Configuration Schema for Feishu Calendar Plugin ==========
 
@@ -688,9 +692,6 @@ class FeishuCalendarPlugin(BasePlugin):
     # Feishu Open Platform API base URL
     FEISHU_API_BASE = "https://open.feishu.cn/open-apis"
 
-    # Token cache: (token, expiry_timestamp)
-    _token_cache: tuple[str, float] | None = None
-
     # Color mapping for card templates
     COLOR_MAP = {
         "blue": "blue",
@@ -1041,46 +1042,25 @@ class FeishuCalendarPlugin(BasePlugin):
         return config
 
     def _get_tenant_access_token(self) -> str | None:
-        """Get tenant_access_token from Feishu API.
+        """Get tenant_access_token from the shared token service.
 
-        Uses caching to avoid unnecessary API calls (tokens typically valid for 2 hours).
+        Tokens are shared with other components using the same app and are
+        refreshed in the background before they expire.
 
         Returns:
             Tenant access token or None if failed
         """
-        # Check cache first
-        if self._token_cache is not None:
-            token, expiry = self._token_cache
-            if time.time() < expiry - 300:  # Refresh 5 minutes before expiry
-                return token
-
         if not self._app_id or not self._app_secret:
             logger.error("app_id or app_secret not configured")
             return None
 
         try:
-            url = f"{self.FEISHU_API_BASE}/auth/v3/tenant_access_token/internal"
-            payload = {"app_id": self._app_id, "app_secret": self._app_secret}
-
-            with httpx.Client(timeout=10.0) as client:
-                response = client.post(url, json=payload)
-                response.raise_for_status()
-
-            data = response.json()
-            if data.get("code") != 0:
-                logger.error("Failed to get tenant access token: %s", data.get("msg"))
-                return None
-
-            token = data.get("tenant_access_token")
-            expires_in = data.get("expire", 7200)
-
-            # Cache the token
-            expiry = time.time() + expires_in
-            self._token_cache = (token, expiry)
-
-            logger.debug("Got new tenant access token, expires in %d seconds", expires_in)
-            return token
-
+            return get_token_service().get_token(
+                self._app_id, self._app_secret, base_url=self.FEISHU_API_BASE
+            )
+        except FeishuTokenError as e:
+            logger.error("Failed to get tenant access token: %s", e.msg)
+            return None
         except httpx.HTTPError as e:
             logger.error("HTTP error getting tenant access token: %s", e, exc_info=True)
             return None
@@ -1118,9 +1098,9 @@ class FeishuCalendarPlugin(BasePlugin):
                 "page_size": "100",
             }
 
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url, headers=headers, params=params)
-                response.raise_for_status()
+            client = get_http_pool().sync_client()
+            response = client.get(url, headers=headers, params=params, timeout=_HTTP_TIMEOUT)
+            response.raise_for_status()
 
             data = response.json()
             if data.get("code") != 0:
@@ -1252,27 +1232,27 @@ class FeishuCalendarPlugin(BasePlugin):
 
             calendars: list[CalendarInfo] = []
 
-            with httpx.Client(timeout=10.0) as client:
-                while True:
-                    response = client.get(url, headers=headers, params=params)
-                    response.raise_for_status()
-                    data = response.json()
+            client = get_http_pool().sync_client()
+            while True:
+                response = client.get(url, headers=headers, params=params, timeout=_HTTP_TIMEOUT)
+                response.raise_for_status()
+                data = response.json()
 
-                    if data.get("code") != 0:
-                        logger.warning("Failed to get calendar list: %s", data.get("msg"))
-                        break
+                if data.get("code") != 0:
+                    logger.warning("Failed to get calendar list: %s", data.get("msg"))
+                    break
 
-                    items = data.get("data", {}).get("calendar_list", [])
-                    for item in items:
-                        cal_info = CalendarInfo.from_api_response(item)
-                        calendars.append(cal_info)
-                        self._calendar_cache[cal_info.calendar_id] = cal_info
+                items = data.get("data", {}).get("calendar_list", [])
+                for item in items:
+                    cal_info = CalendarInfo.from_api_response(item)
+                    calendars.append(cal_info)
+                    self._calendar_cache[cal_info.calendar_id] = cal_info
 
-                    # Check for pagination
-                    page_token = data.get("data", {}).get("page_token")
-                    if not page_token:
-                        break
-                    params["page_token"] = page_token
+                # Check for pagination
+                page_token = data.get("data", {}).get("page_token")
+                if not page_token:
+                    break
+                params["page_token"] = page_token
 
             logger.info("Retrieved %d calendars", len(calendars))
             return calendars
@@ -1330,30 +1310,30 @@ class FeishuCalendarPlugin(BasePlugin):
 
             events: list[CalendarEvent] = []
 
-            with httpx.Client(timeout=10.0) as client:
-                while True:
-                    response = client.get(url, headers=headers, params=params)
-                    response.raise_for_status()
-                    data = response.json()
-
-                    if data.get("code") != 0:
-                        logger.warning(
-                            "Failed to get events from calendar %s: %s",
-                            calendar_id,
-                            data.get("msg"),
-                        )
-                        break
-
-                    items = data.get("data", {}).get("items", [])
-                    for item in items:
-                        event = CalendarEvent.from_api_response(item, calendar_id)
-                        events.append(event)
-
-                    # Check for pagination
-                    page_token = data.get("data", {}).get("page_token")
-                    if not page_token:
-                        break
-                    params["page_token"] = page_token
+            client = get_http_pool().sync_client()
+            while True:
+                response = client.get(url, headers=headers, params=params, timeout=_HTTP_TIMEOUT)
+                response.raise_for_status()
+                data = response.json()
+
+                if data.get("code") != 0:
+                    logger.warning(
+                        "Failed to get events from calendar %s: %s",
+                        calendar_id,
+                        data.get("msg"),
+                    )
+                    break
+
+                items = data.get("data", {}).get("items", [])
+                for item in items:
+                    event = CalendarEvent.from_api_response(item, calendar_id)
+                    events.append(event)
+
+                # Check for pagination
+                page_token = data.get("data", {}).get("page_token")
+                if not page_token:
+                    break
+                params["page_token"] = page_token
 
             # Sort by start time
             events.sort(key=lambda e: e.start_time or datetime.min.replace(tzinfo=UTC))
@@ -1406,9 +1386,9 @@ class FeishuCalendarPlugin(BasePlugin):
                 "Content-Type": "application/json",
             }
 
-            with httpx.Client(timeout=10.0) as client:
-                response = client.get(url, headers=headers)
-                response.raise_for_status()
+            client = get_http_pool().sync_client()
+            response = client.get(url, headers=headers, timeout=_HTTP_TIMEOUT)
+            response.raise_for_status()
 
             data = response.json()
             if data.get("code") != 0:
@@ -26,6 +26,7 @@ import httpx
 from pydantic import Field
 
 from ..core.client import CardBuilder
+from ..core.http_pool import PooledClient
 from ..core.logger import get_logger
 from .base import BasePlugin, PluginMetadata
 from .config_schema import PluginConfigSchema
@@ -447,7 +448,17 @@ class RSSSubscriptionPlugin(BasePlugin):
         self._command_handler: CommandHandler | None = None
 
         # HTTP client
-        self._http_client: httpx.AsyncClient | None = None
+        self._http_client: PooledClient | None = None
+
+    @staticmethod
+    def _create_http_client() -> PooledClient:
+        """Create the feed client, which sends through the shared HTTP pool."""
+        return PooledClient(
+            headers={"User-Agent": "FeishuBot-RSS/1.0"},
+            timeout=30.0,
+            follow_redirects=True,
+            asynchronous=True,
+        )
 
     def metadata(self) -> PluginMetadata:
         """Return plugin metadata."""
@@ -492,11 +503,7 @@ class RSSSubscriptionPlugin(BasePlugin):
         self.logger.info("Enabling RSS subscription plugin")
 
         # Initialize HTTP client
-        self._http_client = httpx.AsyncClient(
-            timeout=30.0,
-            follow_redirects=True,
-            headers={"User-Agent": "FeishuBot-RSS/1.0"},
-        )
+        self._http_client = self._create_http_client()
 
         # Register feed check job
         check_interval = self.get_config_value("default_check_interval_minutes", 30)
@@ -559,13 +566,8 @@ class RSSSubscriptionPlugin(BasePlugin):
         # Save history
         self._save_history()
 
-        # Close HTTP client
-        if self._http_client:
-            import contextlib
-
-            with contextlib.suppress(Exception):
-                asyncio.run(self._http_client.aclose())
-            self._http_client = None
+        # Release HTTP client (the shared pool stays open)
+        self._http_client = None
 
         # Cleanup jobs
         self.cleanup_jobs()
@@ -595,7 +597,7 @@ class RSSSubscriptionPlugin(BasePlugin):
         try:
             # Fetch feed content
             if not self._http_client:
-                self._http_client = httpx.AsyncClient(timeout=30.0)
+                self._http_client = self._create_http_client()
 
             response = await self._http_client.get(feed.url)
             response.raise_for_status()
@@ -715,7 +717,7 @@ class RSSSubscriptionPlugin(BasePlugin):
         # Validate URL by fetching
         try:
             if not self._http_client:
-                self._http_client = httpx.AsyncClient(timeout=30.0)
+                self._http_client = self._create_http_client()
             response = await self._http_client.get(url)
             response.raise_for_status()
             parsed = feedparser.parse(response.text)
@@ -951,7 +953,7 @@ class RSSSubscriptionPlugin(BasePlugin):
         )
 
         try:
-            result = await self._ai_agent.chat(prompt, user_id="rss-plugin")
+            result = await self._ai_agent.complete(prompt)
             return result.strip()
         except Exception as e:
             self.logger.error("AI summary error: %s", e)
@@ -976,7 +978,7 @@ class RSSSubscriptionPlugin(BasePlugin):
         )
 
         try:
-            result = await self._ai_agent.chat(prompt, user_id="rss-plugin")
+            result = await self._ai_agent.complete(prompt)
             categories = [c.strip() for c in result.split(",")]
             return [c for c in categories if c][:3]
         except Exception as e:
@@ -1002,7 +1004,7 @@ class RSSSubscriptionPlugin(BasePlugin):
         )
 
         try:
-            result = await self._ai_agent.chat(prompt, user_id="rss-plugin")
+            result = await self._ai_agent.complete(prompt)
             keywords = [k.strip() for k in result.split(",")]
             return [k for k in keywords if k][:5]
         except Exception as e:
@@ -1652,7 +1654,7 @@ class RSSSubscriptionPlugin(BasePlugin):
         # Generate AI summary
         try:
             prompt = DAILY_SUMMARY_PROMPT.format(content=content)
-            report.ai_summary = await self._ai_agent.chat(prompt, user_id="rss-daily-report")
+            report.ai_summary = await self._ai_agent.complete(prompt)
             report.ai_summary = report.ai_summary.strip()
         except Exception as e:
             self.logger.error("AI summary generation failed: %s", e)
@@ -1661,7 +1663,7 @@ class RSSSubscriptionPlugin(BasePlugin):
         if self.get_config_value("daily_report_include_trends", True):
             try:
                 prompt = TREND_ANALYSIS_PROMPT.format(content=content)
-                trends_text = await self._ai_agent.chat(prompt, user_id="rss-daily-report")
+                trends_text = await self._ai_agent.complete(prompt)
                 report.trends = [t.strip() for t in trends_text.strip().split("\n") if t.strip()][
                     :5
                 ]
@@ -1670,7 +1672,7 @@ class RSSSubscriptionPlugin(BasePlugin):
 
             try:
                 prompt = HOT_TOPICS_PROMPT.format(content=content)
-                topics_text = await self._ai_agent.chat(prompt, user_id="rss-daily-report")
+                topics_text = await self._ai_agent.complete(prompt)
                 report.hot_topics = [t.strip() for t in topics_text.split(",") if t.strip()][:8]
             except Exception as e:
                 self.logger.error("Hot topics extraction failed: %s", e)
@@ -57,6 +57,7 @@ class AsyncHTTPProviderMixin:
         response_validator: Callable[[dict[str, Any]], None] | None = None,
         method: str = "POST",
         headers: dict[str, str] | None = None,
+        timeout: float | None = None,
     ) -> dict[str, Any]:
         """Make async HTTP request with exponential backoff retry.
 
@@ -71,6 +72,7 @@ class AsyncHTTPProviderMixin:
                 Should raise ValueError if response is invalid.
             method: HTTP method (default: POST).
             headers: Additional headers for the request.
+            timeout: Per-request timeout in seconds (client default if None).
 
         Returns:
             Response JSON data.
@@ -90,20 +92,25 @@ class AsyncHTTPProviderMixin:
         delay = config.backoff_seconds
         last_error: Exception | None = None
 
+        # Passing timeout=None to httpx disables the timeout, so only set it when given
+        extra: dict[str, Any] = {"headers": headers}
+        if timeout is not None:
+            extra["timeout"] = timeout
+
         for attempt in range(config.max_attempts):
             try:
                 if method.upper() == "POST":
-                    response = await client.post(url, json=payload, headers=headers)
+                    response = await client.post(url, json=payload, **extra)
                 elif method.upper() == "GET":
-                    response = await client.get(url, params=payload, headers=headers)
+                    response = await client.get(url, params=payload, **extra)
                 elif method.upper() == "DELETE":
-                    response = await client.delete(url, headers=headers)
+                    response = await client.delete(url, **extra)
                 elif method.upper() == "PUT":
-                    response = await client.put(url, json=payload, headers=headers)
+                    response = await client.put(url, json=payload, **extra)
                 elif method.upper() == "PATCH":
-                    response = await client.patch(url, json=payload, headers=headers)
+                    response = await client.patch(url, json=payload, **extra)
                 else:
-                    response = await client.request(method, url, json=payload, headers=headers)
+                    response = await client.request(method, url, json=payload, **extra)
 
                 response.raise_for_status()
                 result = response.json()
@@ -6,6 +6,7 @@ used across all provider implementations.
 
 from __future__ import annotations
 
+import time
 import uuid
 from typing import TYPE_CHECKING, Any
 
@@ -107,6 +108,7 @@ class EnhancedBaseProvider(BaseProvider, HTTPProviderMixin):
             SendResult with status and message ID.
         """
         message_id = self._generate_message_id()
+        started = time.perf_counter()
 
         try:
             # Track message if tracker enabled
@@ -133,6 +135,7 @@ class EnhancedBaseProvider(BaseProvider, HTTPProviderMixin):
                 target=target,
                 provider_name=self.name,
                 provider_type=self.provider_type,
+                latency_ms=(time.perf_counter() - started) * 1000,
             )
 
             return SendResult.ok(message_id, result)
@@ -149,6 +152,7 @@ class EnhancedBaseProvider(BaseProvider, HTTPProviderMixin):
                 provider_name=self.name,
                 provider_type=self.provider_type,
                 error=error_msg,
+                latency_ms=(time.perf_counter() - started) * 1000,
             )
 
             # Update tracking status
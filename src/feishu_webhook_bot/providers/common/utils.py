@@ -5,10 +5,11 @@ This module provides shared utility functions used across provider implementatio
 
 from __future__ import annotations
 
+import logging
 from collections.abc import Callable
 from typing import Any
 
-from ...core.logger import get_logger
+from ...core.logger import get_logger, log_fields
 
 logger = get_logger(__name__)
 
@@ -86,10 +87,12 @@ def log_message_result(
     provider_name: str,
     provider_type: str,
     error: str | None = None,
+    latency_ms: float | None = None,
 ) -> None:
     """Log message send result with structured fields.
 
-    Provides consistent logging format across all providers.
+    Provides consistent logging format across all providers. Successful
+    sends log at DEBUG and are skipped entirely when DEBUG is disabled.
 
     Args:
         success: Whether the send was successful.
@@ -99,20 +102,34 @@ def log_message_result(
         provider_name: Name of the provider instance.
         provider_type: Type of provider.
         error: Error message if failed.
+        latency_ms: Send latency in milliseconds.
     """
-    extra = {
-        "provider": provider_name,
-        "provider_type": provider_type,
-        "message_type": message_type,
-        "message_id": message_id,
-        "target": target,
-    }
-
     if success:
-        logger.debug("Message sent successfully", extra=extra)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Message sent successfully",
+                extra=log_fields(
+                    provider_name,
+                    target,
+                    message_id,
+                    latency_ms,
+                    provider_type=provider_type,
+                    message_type=message_type,
+                ),
+            )
     else:
-        extra["error"] = error
-        logger.error("Message send failed", extra=extra)
+        logger.error(
+            "Message send failed",
+            extra=log_fields(
+                provider_name,
+                target,
+                message_id,
+                latency_ms,
+                provider_type=provider_type,
+                message_type=message_type,
+                error=error,
+            ),
+        )
 
 
 def parse_target(target: str, separator: str = ":") -> tuple[str, str]:
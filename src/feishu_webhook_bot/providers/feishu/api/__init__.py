@@ -20,7 +20,7 @@ Components:
 
 from .auth import FeishuAuthMixin
 from .chat import FeishuChatMixin
-from .client import FeishuOpenAPI, create_feishu_api
+from .client import FeishuOpenAPI, create_feishu_api, parse_receive_target
 from .media import FeishuMediaMixin
 from .message import FeishuMessageMixin
 from .models import FeishuAPIError, MessageSendResult, TokenInfo, UserToken
@@ -30,6 +30,7 @@ __all__ = [
     # Main client
     "FeishuOpenAPI",
     "create_feishu_api",
+    "parse_receive_target",
     # Models
     "FeishuAPIError",
     "TokenInfo",
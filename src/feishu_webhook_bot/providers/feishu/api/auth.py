@@ -11,15 +11,16 @@ from __future__ import annotations
 
 import asyncio
 import time
-from typing import TYPE_CHECKING, Any
+from typing import Any
 from urllib.parse import urlencode
 
+import httpx
+
+from ....core.feishu_token import FeishuTokenError, get_token_service
+from ....core.http_pool import PooledClient
 from ....core.logger import get_logger
 from .models import FeishuAPIError, TokenInfo, UserToken
 
-if TYPE_CHECKING:
-    import httpx
-
 logger = get_logger("feishu_api.auth")
 
 
@@ -29,11 +30,11 @@ class FeishuAuthMixin:
     This mixin should be used with a class that has:
     - self.app_id: str
     - self.app_secret: str
-    - self._client: httpx.AsyncClient
+    - self._client: PooledClient (async)
+    - self.base_url: str
     - self._token_lock: asyncio.Lock
-    - self._tenant_token: TokenInfo | None
     - self._app_token: TokenInfo | None
-    - self._ensure_client() -> httpx.AsyncClient
+    - self._ensure_client() -> PooledClient (async)
     """
 
     # API endpoints
@@ -46,9 +47,9 @@ class FeishuAuthMixin:
     # These will be set by the main class
     app_id: str
     app_secret: str
-    _client: httpx.AsyncClient | None
+    base_url: str
+    _client: PooledClient | None
     _token_lock: asyncio.Lock
-    _tenant_token: TokenInfo | None
     _app_token: TokenInfo | None
 
     def _ensure_client(self) -> Any:
@@ -56,7 +57,10 @@ class FeishuAuthMixin:
         raise NotImplementedError
 
     async def get_tenant_access_token(self, force_refresh: bool = False) -> str:
-        """Get tenant access token, refreshing if needed.
+        """Get tenant access token from the shared token service.
+
+        Tokens are cached per app_id across all API clients, the image
+        uploader and plugins, and are refreshed before they expire.
 
         Args:
             force_refresh: Force token refresh even if not expired.
@@ -67,39 +71,17 @@ class FeishuAuthMixin:
         Raises:
             FeishuAPIError: If token request fails.
         """
-        async with self._token_lock:
-            if not force_refresh and self._tenant_token and not self._tenant_token.is_expired():
-                return self._tenant_token.token
-
-            logger.debug("Requesting new tenant_access_token")
-
-            client = self._ensure_client()
-            response = await client.post(
-                self.TENANT_TOKEN_URL,
-                json={
-                    "app_id": self.app_id,
-                    "app_secret": self.app_secret,
-                },
+        try:
+            return await get_token_service().aget_token(
+                self.app_id,
+                self.app_secret,
+                base_url=self.base_url,
+                force_refresh=force_refresh,
             )
-
-            data = response.json()
-            if data.get("code") != 0:
-                raise FeishuAPIError(
-                    code=data.get("code", -1),
-                    msg=data.get("msg", "Unknown error"),
-                )
-
-            token = data["tenant_access_token"]
-            expire = data.get("expire", 7200)
-
-            self._tenant_token = TokenInfo(
-                token=token,
-                expires_at=time.time() + expire,
-                token_type="tenant",
-            )
-
-            logger.info("Obtained tenant_access_token (expires in %d seconds)", expire)
-            return token
+        except FeishuTokenError as e:
+            raise FeishuAPIError(code=e.code, msg=e.msg) from e
+        except httpx.HTTPError as e:
+            raise FeishuAPIError(code=-1, msg=f"Token request failed: {e}") from e
 
     async def get_app_access_token(self, force_refresh: bool = False) -> str:
         """Get app access token, refreshing if needed.
@@ -9,18 +9,62 @@ from __future__ import annotations
 import asyncio
 from typing import Any
 
-import httpx
-
+from ....core.http_pool import PooledClient
 from ....core.logger import get_logger
+from ....core.provider import AsyncBaseProvider, SendResult
 from .auth import FeishuAuthMixin
 from .chat import FeishuChatMixin
 from .media import FeishuMediaMixin
 from .message import FeishuMessageMixin
-from .models import TokenInfo
+from .models import MessageSendResult, ReceiveIdType, TokenInfo
 from .user import FeishuUserMixin
 
 logger = get_logger("feishu_api")
 
+# ID prefixes identifying the receive_id_type of a bare target ID
+_RECEIVE_ID_PREFIXES: dict[str, ReceiveIdType] = {
+    "oc_": "chat_id",
+    "ou_": "open_id",
+    "on_": "union_id",
+}
+_RECEIVE_ID_TYPES: tuple[ReceiveIdType, ...] = (
+    "open_id",
+    "user_id",
+    "union_id",
+    "email",
+    "chat_id",
+)
+
+
+def parse_receive_target(target: str) -> tuple[str, ReceiveIdType]:
+    """Split a provider target into a receive ID and its type.
+
+    Targets are either ``"<receive_id_type>:<id>"`` (e.g. ``"open_id:ou_xxx"``)
+    or a bare ID whose type is inferred: ``oc_`` chat IDs, ``ou_`` open IDs,
+    ``on_`` union IDs and addresses containing ``@`` are emails. Anything else
+    is treated as a chat ID.
+
+    Args:
+        target: Provider target string.
+
+    Returns:
+        Tuple of (receive_id, receive_id_type).
+
+    Raises:
+        ValueError: If the target is empty.
+    """
+    if not target:
+        raise ValueError("Feishu API target must not be empty")
+    kind, sep, receive_id = target.partition(":")
+    if sep and kind in _RECEIVE_ID_TYPES and receive_id:
+        return receive_id, kind  # type: ignore[return-value]
+    for prefix, receive_id_type in _RECEIVE_ID_PREFIXES.items():
+        if target.startswith(prefix):
+            return target, receive_id_type
+    if "@" in target:
+        return target, "email"
+    return target, "chat_id"
+
 
 class FeishuOpenAPI(
     FeishuAuthMixin,
@@ -28,6 +72,7 @@ class FeishuOpenAPI(
     FeishuUserMixin,
     FeishuChatMixin,
     FeishuMediaMixin,
+    AsyncBaseProvider,
 ):
     """Feishu Open Platform API client.
 
@@ -40,7 +85,9 @@ class FeishuOpenAPI(
     - Chat management
 
     The client handles token management automatically, refreshing tokens
-    before they expire.
+    before they expire. It also implements ``AsyncBaseProvider``, so it can be
+    used wherever an async message provider is expected; targets are parsed
+    by ``parse_receive_target``.
 
     Example:
         ```python
@@ -85,8 +132,7 @@ class FeishuOpenAPI(
         self.timeout = timeout
         self.base_url = base_url or self.BASE_URL
 
-        self._client: httpx.AsyncClient | None = None
-        self._tenant_token: TokenInfo | None = None
+        self._client: PooledClient | None = None
         self._app_token: TokenInfo | None = None
         self._token_lock = asyncio.Lock()
 
@@ -100,22 +146,107 @@ class FeishuOpenAPI(
         await self.close()
 
     async def connect(self) -> None:
-        """Initialize HTTP client."""
+        """Initialize the HTTP client, which sends through the shared connection pool."""
         if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=self.timeout,
+            self._client = PooledClient(
                 base_url=self.base_url,
+                timeout=self.timeout,
+                asynchronous=True,
             )
             logger.debug("FeishuOpenAPI client connected")
 
     async def close(self) -> None:
-        """Close HTTP client."""
+        """Release the HTTP client; the shared connection pool stays open."""
         if self._client:
-            await self._client.aclose()
             self._client = None
             logger.debug("FeishuOpenAPI client closed")
 
-    def _ensure_client(self) -> httpx.AsyncClient:
+    async def async_connect(self) -> None:
+        """Initialize HTTP client (AsyncBaseProvider interface)."""
+        await self.connect()
+
+    async def async_disconnect(self) -> None:
+        """Close HTTP client (AsyncBaseProvider interface)."""
+        await self.close()
+
+    async def async_send_text(self, text: str, target: str) -> SendResult:
+        """Send a text message to a provider target.
+
+        Args:
+            text: Text content.
+            target: Receive target (see ``parse_receive_target``).
+
+        Returns:
+            SendResult with status and message ID.
+        """
+        return await self._send_to_target(target, "text", {"text": text})
+
+    async def async_send_card(self, card: dict[str, Any], target: str) -> SendResult:
+        """Send an interactive card to a provider target.
+
+        Args:
+            card: Card JSON structure.
+            target: Receive target (see ``parse_receive_target``).
+
+        Returns:
+            SendResult with status and message ID.
+        """
+        return await self._send_to_target(target, "interactive", card)
+
+    async def async_send_rich_text(
+        self,
+        title: str,
+        content: list[list[dict[str, Any]]],
+        target: str,
+        language: str = "zh_cn",
+    ) -> SendResult:
+        """Send a rich text (post) message to a provider target.
+
+        Args:
+            title: Post title.
+            content: Post content (list of paragraphs with elements).
+            target: Receive target (see ``parse_receive_target``).
+            language: Language code (default: zh_cn).
+
+        Returns:
+            SendResult with status and message ID.
+        """
+        post = {language: {"title": title, "content": content}}
+        return await self._send_to_target(target, "post", post)
+
+    async def async_send_image(self, image_key: str, target: str) -> SendResult:
+        """Send an uploaded image to a provider target.
+
+        Args:
+            image_key: Feishu image key (from ``upload_image``).
+            target: Receive target (see ``parse_receive_target``).
+
+        Returns:
+            SendResult with status and message ID.
+        """
+        return await self._send_to_target(target, "image", {"image_key": image_key})
+
+    async def _send_to_target(
+        self, target: str, msg_type: str, content: dict[str, Any]
+    ) -> SendResult:
+        """Send a message to a provider target and convert the result."""
+        try:
+            receive_id, receive_id_type = parse_receive_target(target)
+            await self.connect()
+            result: MessageSendResult = await self.send_message(
+                receive_id=receive_id,
+                receive_id_type=receive_id_type,
+                msg_type=msg_type,
+                content=content,
+            )
+        except Exception as e:
+            logger.error("Failed to send %s message to %s: %s", msg_type, target, e)
+            return SendResult.fail(str(e))
+        if not result.success:
+            return SendResult.fail(f"Feishu API error {result.error_code}: {result.error_msg}")
+        return SendResult.ok(result.message_id)
+
+    def _ensure_client(self) -> PooledClient:
         """Ensure HTTP client is initialized."""
         if self._client is None:
             raise RuntimeError(
@@ -24,7 +24,7 @@ class FeishuMediaMixin:
     """Mixin providing file/media functionality for Feishu API.
 
     This mixin should be used with a class that has:
-    - self._ensure_client() -> httpx.AsyncClient
+    - self._ensure_client() -> PooledClient (async)
     - self.get_tenant_access_token() -> str
     """
 
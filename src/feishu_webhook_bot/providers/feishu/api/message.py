@@ -28,7 +28,7 @@ class FeishuMessageMixin:
     """Mixin providing message API functionality for Feishu.
 
     This mixin should be used with a class that has:
-    - self._ensure_client() -> httpx.AsyncClient
+    - self._ensure_client() -> PooledClient (async)
     - self.get_tenant_access_token() -> str
     """
 
@@ -6,14 +6,15 @@ via Feishu webhook API.
 
 from __future__ import annotations
 
+import uuid
 from typing import Any
 
-import httpx
-
 from ...core.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from ...core.http_pool import PooledClient, get_http_pool
 from ...core.logger import get_logger
 from ...core.message_tracker import MessageStatus, MessageTracker
-from ...core.provider import BaseProvider, Message, MessageType, SendResult
+from ...core.provider import AsyncBaseProvider, BaseProvider, Message, MessageType, SendResult
+from ..common.async_http import AsyncHTTPProviderMixin
 from ..common.http import HTTPProviderMixin
 from ..common.utils import create_response_validator, log_message_result
 from .config import FeishuProviderConfig
@@ -22,7 +23,7 @@ from .signature import generate_feishu_sign
 logger = get_logger(__name__)
 
 
-class FeishuProvider(BaseProvider, HTTPProviderMixin):
+class FeishuProvider(BaseProvider, AsyncBaseProvider, HTTPProviderMixin, AsyncHTTPProviderMixin):
     """Feishu message provider implementation.
 
     Supports sending:
@@ -31,6 +32,9 @@ class FeishuProvider(BaseProvider, HTTPProviderMixin):
     - Interactive cards (JSON v2.0)
     - Images
 
+    Every ``send_*`` method has a native ``async_send_*`` counterpart that
+    sends through the shared pooled async client instead of blocking.
+
     Example:
         ```python
         config = FeishuProviderConfig(
@@ -64,7 +68,7 @@ class FeishuProvider(BaseProvider, HTTPProviderMixin):
         """
         super().__init__(config)
         self.config: FeishuProviderConfig = config
-        self._client: httpx.Client | None = None
+        self._client: PooledClient | None = None
         self._message_tracker = message_tracker
         self._circuit_breaker = CircuitBreaker(
             f"feishu_{config.name}",
@@ -77,14 +81,9 @@ class FeishuProvider(BaseProvider, HTTPProviderMixin):
             return
 
         try:
-            headers = {
-                "Content-Type": "application/json",
-                **(self.config.headers or {}),
-            }
-            timeout = self.config.timeout or 10.0
-            self._client = httpx.Client(
-                timeout=timeout,
-                headers=headers,
+            self._client = PooledClient(
+                headers=self._request_headers(),
+                timeout=self.config.timeout or 10.0,
             )
             self._connected = True
             self.logger.info(f"Connected to Feishu webhook: {self.config.name}")
@@ -94,8 +93,7 @@ class FeishuProvider(BaseProvider, HTTPProviderMixin):
 
     def disconnect(self) -> None:
         """Disconnect from Feishu API."""
-        if self._client:
-            self._client.close()
+        self._client = None
         self._connected = False
         self.logger.info(f"Disconnected from Feishu: {self.config.name}")
 
@@ -135,56 +133,7 @@ class FeishuProvider(BaseProvider, HTTPProviderMixin):
         Returns:
             SendResult with status and message ID.
         """
-        import uuid
-
-        message_id = str(uuid.uuid4())
-        url = target or self.config.url
-
-        try:
-            # Track message if tracker enabled
-            if self._message_tracker:
-                self._message_tracker.track(message_id, self.provider_type, url, text)
-
-            payload = {
-                "msg_type": "text",
-                "content": {
-                    "text": text,
-                },
-            }
-
-            result = self._send_request(url, payload)
-
-            if self._message_tracker:
-                self._message_tracker.update_status(message_id, MessageStatus.SENT)
-
-            log_message_result(
-                success=True,
-                message_type="text",
-                message_id=message_id,
-                target=url,
-                provider_name=self.name,
-                provider_type=self.provider_type,
-            )
-            return SendResult.ok(message_id, result)
-
-        except Exception as e:
-            error_msg = str(e)
-            log_message_result(
-                success=False,
-                message_type="text",
-                message_id=message_id,
-                target=url,
-                provider_name=self.name,
-                provider_type=self.provider_type,
-                error=error_msg,
-            )
-
-            if self._message_tracker:
-                self._message_tracker.update_status(
-                    message_id, MessageStatus.FAILED, error=error_msg
-                )
-
-            return SendResult.fail(error_msg)
+        return self._deliver("text", target, text, self._text_payload(text))
 
     def send_card(self, card: dict[str, Any], target: str) -> SendResult:
         """Send an interactive card message.
@@ -196,54 +145,7 @@ class FeishuProvider(BaseProvider, HTTPProviderMixin):
         Returns:
             SendResult with status and message ID.
         """
-        import uuid
-
-        message_id = str(uuid.uuid4())
-        url = target or self.config.url
-
-        try:
-            # Track message if tracker enabled
-            if self._message_tracker:
-                self._message_tracker.track(message_id, self.provider_type, url, card)
-
-            payload = {
-                "msg_type": "interactive",
-                "card": card,
-            }
-
-            result = self._send_request(url, payload)
-
-            if self._message_tracker:
-                self._message_tracker.update_status(message_id, MessageStatus.SENT)
-
-            log_message_result(
-                success=True,
-                message_type="card",
-                message_id=message_id,
-                target=url,
-                provider_name=self.name,
-                provider_type=self.provider_type,
-            )
-            return SendResult.ok(message_id, result)
-
-        except Exception as e:
-            error_msg = str(e)
-            log_message_result(
-                success=False,
-                message_type="card",
-                message_id=message_id,
-                target=url,
-                provider_name=self.name,
-                provider_type=self.provider_type,
-                error=error_msg,
-            )
-
-            if self._message_tracker:
-                self._message_tracker.update_status(
-                    message_id, MessageStatus.FAILED, error=error_msg
-                )
-
-            return SendResult.fail(error_msg)
+        return self._deliver("card", target, card, self._card_payload(card))
 
     def send_rich_text(
         self,
@@ -263,64 +165,68 @@ class FeishuProvider(BaseProvider, HTTPProviderMixin):
         Returns:
             SendResult with status and message ID.
         """
-        import uuid
+        payload = self._rich_text_payload(title, content, language)
+        return self._deliver("rich_text", target, content, payload)
 
-        message_id = str(uuid.uuid4())
-        url = target or self.config.url
+    def send_image(self, image_key: str, target: str) -> SendResult:
+        """Send an image message.
 
-        try:
-            # Track message if tracker enabled
-            if self._message_tracker:
-                self._message_tracker.track(message_id, self.provider_type, url, content)
-
-            payload = {
-                "msg_type": "post",
-                "content": {
-                    "post": {
-                        language: {
-                            "title": title,
-                            "content": content,
-                        }
-                    }
-                },
-            }
+        Args:
+            image_key: Feishu image key (from file upload API).
+            target: Target webhook URL or identifier.
 
-            result = self._send_request(url, payload)
+        Returns:
+            SendResult with status and message ID.
+        """
+        return self._deliver("image", target, image_key, self._image_payload(image_key))
 
-            if self._message_tracker:
-                self._message_tracker.update_status(message_id, MessageStatus.SENT)
+    async def async_send_text(self, text: str, target: str) -> SendResult:
+        """Send a text message without blocking the event loop.
 
-            log_message_result(
-                success=True,
-                message_type="rich_text",
-                message_id=message_id,
-                target=url,
-                provider_name=self.name,
-                provider_type=self.provider_type,
-            )
-            return SendResult.ok(message_id, result)
+        Args:
+            text: Text content.
+            target: Target webhook URL or identifier.
 
-        except Exception as e:
-            error_msg = str(e)
-            log_message_result(
-                success=False,
-                message_type="rich_text",
-                message_id=message_id,
-                target=url,
-                provider_name=self.name,
-                provider_type=self.provider_type,
-                error=error_msg,
-            )
+        Returns:
+            SendResult with status and message ID.
+        """
+        return await self._async_deliver("text", target, text, self._text_payload(text))
 
-            if self._message_tracker:
-                self._message_tracker.update_status(
-                    message_id, MessageStatus.FAILED, error=error_msg
-                )
+    async def async_send_card(self, card: dict[str, Any], target: str) -> SendResult:
+        """Send an interactive card message without blocking the event loop.
 
-            return SendResult.fail(error_msg)
+        Args:
+            card: Card JSON structure (v2.0 format).
+            target: Target webhook URL or identifier.
 
-    def send_image(self, image_key: str, target: str) -> SendResult:
-        """Send an image message.
+        Returns:
+            SendResult with status and message ID.
+        """
+        return await self._async_deliver("card", target, card, self._card_payload(card))
+
+    async def async_send_rich_text(
+        self,
+        title: str,
+        content: list[list[dict[str, Any]]],
+        target: str,
+        language: str = "zh_cn",
+    ) -> SendResult:
+        """Send a rich text (post) message without blocking the event loop.
+
+        Args:
+            title: Post title.
+            content: Post content (list of paragraphs with elements).
+            target: Target webhook URL or identifier.
+            language: Language code (default: zh_cn).
+
+        Returns:
+            SendResult with status and message ID.
+        """
+        payload = self._rich_text_payload(title, content, language)
+        return await self._async_deliver("rich_text", target, content, payload)
+
+    async def async_send_image(self, image_key: str, target: str) -> SendResult:
+        """Send an image message without blocking the event loop.
 
         Args:
             image_key: Feishu image key (from file upload API).
@@ -329,56 +235,111 @@ class FeishuProvider(BaseProvider, HTTPProviderMixin):
         Returns:
             SendResult with status and message ID.
         """
-        import uuid
+        payload = self._image_payload(image_key)
+        return await self._async_deliver("image", target, image_key, payload)
+
+    @staticmethod
+    def _text_payload(text: str) -> dict[str, Any]:
+        """Build the webhook payload of a text message."""
+        return {"msg_type": "text", "content": {"text": text}}
+
+    @staticmethod
+    def _card_payload(card: dict[str, Any]) -> dict[str, Any]:
+        """Build the webhook payload of an interactive card."""
+        return {"msg_type": "interactive", "card": card}
+
+    @staticmethod
+    def _rich_text_payload(
+        title: str, content: list[list[dict[str, Any]]], language: str
+    ) -> dict[str, Any]:
+        """Build the webhook payload of a post message."""
+        return {
+            "msg_type": "post",
+            "content": {"post": {language: {"title": title, "content": content}}},
+        }
 
-        message_id = str(uuid.uuid4())
-        url = target or self.config.url
+    @staticmethod
+    def _image_payload(image_key: str) -> dict[str, Any]:
+        """Build the webhook payload of an image message."""
+        return {"msg_type": "image", "content": {"image_key": image_key}}
 
-        try:
-            # Track message if tracker enabled
-            if self._message_tracker:
-                self._message_tracker.track(message_id, self.provider_type, url, image_key)
+    def _deliver(
+        self, message_type: str, target: str, content: Any, payload: dict[str, Any]
+    ) -> SendResult:
+        """Send a payload and track and log the outcome.
 
-            payload = {
-                "msg_type": "image",
-                "content": {
-                    "image_key": image_key,
-                },
-            }
+        Args:
+            message_type: Message type used for logging.
+            target: Target webhook URL (config URL if empty).
+            content: Message content recorded by the message tracker.
+            payload: Webhook payload.
 
+        Returns:
+            SendResult with status and message ID.
+        """
+        message_id = str(uuid.uuid4())
+        url = target or self.config.url
+        try:
+            self._track(message_id, url, content)
             result = self._send_request(url, payload)
+        except Exception as e:
+            return self._send_failed(message_type, message_id, url, e)
+        return self._send_succeeded(message_type, message_id, url, result)
 
-            if self._message_tracker:
-                self._message_tracker.update_status(message_id, MessageStatus.SENT)
+    async def _async_deliver(
+        self, message_type: str, target: str, content: Any, payload: dict[str, Any]
+    ) -> SendResult:
+        """Async counterpart of ``_deliver``."""
+        message_id = str(uuid.uuid4())
+        url = target or self.config.url
+        try:
+            self._track(message_id, url, content)
+            result = await self._async_send_request(url, payload)
+        except Exception as e:
+            return self._send_failed(message_type, message_id, url, e)
+        return self._send_succeeded(message_type, message_id, url, result)
 
-            log_message_result(
-                success=True,
-                message_type="image",
-                message_id=message_id,
-                target=url,
-                provider_name=self.name,
-                provider_type=self.provider_type,
-            )
-            return SendResult.ok(message_id, result)
+    def _track(self, message_id: str, url: str, content: Any) -> None:
+        """Record an outgoing message if tracking is enabled."""
+        if self._message_tracker:
+            self._message_tracker.track(message_id, self.provider_type, url, content)
 
-        except Exception as e:
-            error_msg = str(e)
-            log_message_result(
-                success=False,
-                message_type="image",
-                message_id=message_id,
-                target=url,
-                provider_name=self.name,
-                provider_type=self.provider_type,
-                error=error_msg,
-            )
+    def _send_succeeded(
+        self, message_type: str, message_id: str, url: str, result: dict[str, Any]
+    ) -> SendResult:
+        """Mark a message as sent and build its result."""
+        if self._message_tracker:
+            self._message_tracker.update_status(message_id, MessageStatus.SENT)
+
+        log_message_result(
+            success=True,
+            message_type=message_type,
+            message_id=message_id,
+            target=url,
+            provider_name=self.name,
+            provider_type=self.provider_type,
+        )
+        return SendResult.ok(message_id, result)
 
-            if self._message_tracker:
-                self._message_tracker.update_status(
-                    message_id, MessageStatus.FAILED, error=error_msg
-                )
+    def _send_failed(
+        self, message_type: str, message_id: str, url: str, error: Exception
+    ) -> SendResult:
+        """Mark a message as failed and build its result."""
+        error_msg = str(error)
+        log_message_result(
+            success=False,
+            message_type=message_type,
+            message_id=message_id,
+            target=url,
+            provider_name=self.name,
+            provider_type=self.provider_type,
+            error=error_msg,
+        )
 
-            return SendResult.fail(error_msg)
+        if self._message_tracker:
+            self._message_tracker.update_status(message_id, MessageStatus.FAILED, error=error_msg)
+
+        return SendResult.fail(error_msg)
 
     def _send_request(self, url: str, payload: dict[str, Any]) -> dict[str, Any]:
         """Send HTTP request with circuit breaker and retry logic.
@@ -397,10 +358,7 @@ class FeishuProvider(BaseProvider, HTTPProviderMixin):
             raise RuntimeError("Provider not connected. Call connect() first.")
 
         # Add signature if secret is configured
-        if self.config.secret:
-            sign, timestamp = generate_feishu_sign(self.config.secret)
-            payload["timestamp"] = str(timestamp)
-            payload["sign"] = sign
+        self._sign_payload(payload)
 
         # Wrap with circuit breaker
         def _make_request() -> dict[str, Any]:
@@ -436,6 +394,46 @@ class FeishuProvider(BaseProvider, HTTPProviderMixin):
             response_validator=validator,
         )
 
+    async def _async_send_request(self, url: str, payload: dict[str, Any]) -> dict[str, Any]:
+        """Send HTTP request asynchronously with circuit breaker and retry logic.
+
+        Uses the shared pooled async client, so no ``connect()`` is needed.
+
+        Args:
+            url: Target webhook URL.
+            payload: Request payload.
+
+        Returns:
+            Response data.
+
+        Raises:
+            Exception: If request fails or circuit breaker is open.
+        """
+        self._sign_payload(payload)
+        return await self._circuit_breaker.acall(
+            self._async_http_request_with_retry,
+            client=get_http_pool().async_client(),
+            url=url,
+            payload=payload,
+            retry_policy=self.config.retry,
+            provider_name=self.name,
+            provider_type=self.provider_type,
+            response_validator=create_response_validator("code", 0, "msg"),
+            headers=self._request_headers(),
+            timeout=self.config.timeout or 10.0,
+        )
+
+    def _sign_payload(self, payload: dict[str, Any]) -> None:
+        """Add timestamp and signature to a payload if a secret is configured."""
+        if self.config.secret:
+            sign, timestamp = generate_feishu_sign(self.config.secret)
+            payload["timestamp"] = str(timestamp)
+            payload["sign"] = sign
+
+    def _request_headers(self) -> dict[str, str]:
+        """Headers sent with every webhook request."""
+        return {"Content-Type": "application/json", **(self.config.headers or {})}
+
     def get_capabilities(self) -> dict[str, bool]:
         """Get supported message types.
 
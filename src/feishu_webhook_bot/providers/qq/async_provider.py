@@ -5,29 +5,35 @@ This module provides async versions of NapcatProvider methods.
 
 from __future__ import annotations
 
+import asyncio
 import uuid
-from typing import Any
-
-import httpx
+from typing import TYPE_CHECKING, Any
 
+from ...core.http_pool import PooledClient
 from ...core.logger import get_logger
 from ...core.message_tracker import MessageStatus
-from ...core.provider import SendResult
+from ...core.provider import AsyncBaseProvider, SendResult
 from ..common.async_http import AsyncHTTPProviderMixin
 
+if TYPE_CHECKING:
+    from .ws_transport import OneBotWebSocketTransport
+
 logger = get_logger(__name__)
 
 
-class AsyncNapcatMixin(AsyncHTTPProviderMixin):
+class AsyncNapcatMixin(AsyncBaseProvider, AsyncHTTPProviderMixin):
     """Mixin providing async operations for NapcatProvider.
 
-    This mixin adds async versions of all message sending and API methods.
+    This mixin adds async versions of all message sending and API methods
+    and implements the ``AsyncBaseProvider`` interface.
     It should be used with NapcatProvider.
     """
 
     # These will be set by the main class
     config: Any
-    _async_client: httpx.AsyncClient | None
+    _async_client: PooledClient | None
+    _ws: OneBotWebSocketTransport | None = None
+    _connected: bool
     _message_tracker: Any
     name: str
     provider_type: str
@@ -36,8 +42,19 @@ class AsyncNapcatMixin(AsyncHTTPProviderMixin):
         """Parse target. To be implemented by main class."""
         raise NotImplementedError
 
+    def _convert_rich_text_to_segments(
+        self, title: str, content: list[list[dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        """Convert rich text to message segments. To be implemented by main class."""
+        raise NotImplementedError
+
     async def async_connect(self) -> None:
         """Initialize async HTTP client."""
+        if self.config.websocket is not None:
+            # The WebSocket transport serves sync and async callers alike
+            if not self._connected:
+                await asyncio.to_thread(self.connect)
+            return
         if self._async_client is not None:
             return
 
@@ -45,20 +62,21 @@ class AsyncNapcatMixin(AsyncHTTPProviderMixin):
         if self.config.access_token:
             headers["Authorization"] = f"Bearer {self.config.access_token}"
 
-        timeout = self.config.timeout or 10.0
-        self._async_client = httpx.AsyncClient(
-            timeout=timeout,
-            headers=headers,
+        self._async_client = PooledClient(
             base_url=self.config.http_url,
+            headers=headers,
+            timeout=self.config.timeout or 10.0,
+            asynchronous=True,
         )
         logger.debug("Async Napcat client connected")
 
     async def async_disconnect(self) -> None:
         """Close async HTTP client."""
         if self._async_client:
-            await self._async_client.aclose()
             self._async_client = None
             logger.debug("Async Napcat client disconnected")
+        if self._ws:
+            await asyncio.to_thread(self.disconnect)
 
     async def _async_call_api(
         self,
@@ -78,15 +96,18 @@ class AsyncNapcatMixin(AsyncHTTPProviderMixin):
             RuntimeError: If client not initialized.
             Exception: If request fails.
         """
-        if not self._async_client:
-            await self.async_connect()
+        if self._ws:
+            result = await self._ws.acall(endpoint, payload)
+        else:
+            if not self._async_client:
+                await self.async_connect()
 
-        if not self._async_client:
-            raise RuntimeError("Async client not initialized")
+            if not self._async_client:
+                raise RuntimeError("Async client not initialized")
 
-        response = await self._async_client.post(endpoint, json=payload)
-        response.raise_for_status()
-        result = response.json()
+            response = await self._async_client.post(endpoint, json=payload)
+            response.raise_for_status()
+            result = response.json()
 
         if result.get("status") != "ok":
             raise ValueError(f"API error: {result.get('msg', 'Unknown error')}")
@@ -166,6 +187,58 @@ class AsyncNapcatMixin(AsyncHTTPProviderMixin):
         except Exception as e:
             return SendResult.fail(str(e))
 
+    async def async_send_card(self, card: dict[str, Any], target: str) -> SendResult:
+        """Card messages are not supported by OneBot11.
+
+        Args:
+            card: Card data.
+            target: Target identifier.
+
+        Returns:
+            SendResult with failure status.
+        """
+        return SendResult.fail("Card messages not supported by OneBot11/Napcat protocol")
+
+    async def async_send_rich_text(
+        self,
+        title: str,
+        content: list[list[dict[str, Any]]],
+        target: str,
+        language: str = "zh_cn",
+    ) -> SendResult:
+        """Send rich text converted to message segments asynchronously.
+
+        Args:
+            title: Text title/header.
+            content: Content structure (converted to formatted text).
+            target: Target in format "private:QQ号" or "group:群号".
+            language: Language code (ignored for OneBot11).
+
+        Returns:
+            SendResult with status and message ID.
+        """
+        message_id = str(uuid.uuid4())
+
+        try:
+            user_id, group_id = self._parse_target(target)
+            if not user_id and not group_id:
+                return SendResult.fail("Invalid target format")
+
+            message_segments = self._convert_rich_text_to_segments(title, content)
+
+            if user_id:
+                endpoint = "/send_private_msg"
+                payload = {"user_id": user_id, "message": message_segments}
+            else:
+                endpoint = "/send_group_msg"
+                payload = {"group_id": group_id, "message": message_segments}
+
+            result = await self._async_call_api(endpoint, payload)
+            return SendResult.ok(message_id, result)
+
+        except Exception as e:
+            return SendResult.fail(str(e))
+
     async def async_send_reply(
         self,
         reply_to_id: int,
@@ -5,8 +5,9 @@ This module contains all configuration classes used by QQ providers.
 
 from __future__ import annotations
 
-from pydantic import Field
+from pydantic import Field, model_validator
 
+from ...core.config import OneBotWebSocketConfig
 from ...core.provider import ProviderConfig
 
 
@@ -19,6 +20,7 @@ class NapcatProviderConfig(ProviderConfig):
         access_token: Optional API access token for authentication.
         bot_qq: Bot's QQ number for @mention detection.
         enable_ai_voice: Enable NapCat AI voice features.
+        websocket: OneBot11 WebSocket transport used instead of HTTP.
 
     Example:
         ```python
@@ -32,8 +34,8 @@ class NapcatProviderConfig(ProviderConfig):
     """
 
     provider_type: str = Field(default="napcat", description="Provider type")
-    http_url: str = Field(
-        ...,
+    http_url: str | None = Field(
+        default=None,
         description="Napcat HTTP API base URL (e.g., http://127.0.0.1:3000)",
     )
     access_token: str | None = Field(
@@ -48,3 +50,14 @@ class NapcatProviderConfig(ProviderConfig):
         default=False,
         description="Enable NapCat AI voice features",
     )
+    websocket: OneBotWebSocketConfig | None = Field(
+        default=None,
+        description="Use a OneBot11 WebSocket instead of HTTP for API calls and events",
+    )
+
+    @model_validator(mode="after")
+    def validate_transport(self) -> NapcatProviderConfig:
+        """Ensure an HTTP URL or a WebSocket transport is configured."""
+        if not self.http_url and self.websocket is None:
+            raise ValueError("Napcat provider requires 'http_url' or 'websocket'")
+        return self
@@ -6,12 +6,13 @@ all API functionality through mixins.
 
 from __future__ import annotations
 
+import asyncio
 import uuid
+from collections.abc import Callable
 from typing import Any
 
-import httpx
-
 from ...core.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from ...core.http_pool import PooledClient
 from ...core.logger import get_logger
 from ...core.message_tracker import MessageStatus, MessageTracker
 from ...core.provider import BaseProvider, Message, MessageType, SendResult
@@ -34,6 +35,7 @@ from .napcat import (
     NapcatMessageExtMixin,
     NapcatPokeMixin,
 )
+from .ws_transport import OneBotWebSocketTransport
 
 logger = get_logger(__name__)
 
@@ -111,8 +113,10 @@ class NapcatProvider(
         """
         super().__init__(config)
         self.config: NapcatProviderConfig = config
-        self._client: httpx.Client | None = None
-        self._async_client: httpx.AsyncClient | None = None
+        self._client: PooledClient | None = None
+        self._async_client: PooledClient | None = None
+        self._ws: OneBotWebSocketTransport | None = None
+        self._event_handler: Callable[[dict[str, Any]], Any] | None = None
         self._message_tracker = message_tracker
         self._circuit_breaker = CircuitBreaker(
             f"napcat_{config.name}",
@@ -125,16 +129,19 @@ class NapcatProvider(
         if self._connected:
             return
 
+        if self.config.websocket is not None:
+            self._connect_websocket()
+            return
+
         try:
             headers = {"Content-Type": "application/json"}
             if self.config.access_token:
                 headers["Authorization"] = f"Bearer {self.config.access_token}"
 
-            timeout = self.config.timeout or 10.0
-            self._client = httpx.Client(
-                timeout=timeout,
-                headers=headers,
+            self._client = PooledClient(
                 base_url=self.config.http_url,
+                headers=headers,
+                timeout=self.config.timeout or 10.0,
             )
             self._connected = True
             self.logger.info(f"Connected to Napcat: {self.config.name}")
@@ -142,13 +149,57 @@ class NapcatProvider(
             self.logger.error(f"Failed to connect to Napcat: {e}", exc_info=True)
             raise
 
+    def _connect_websocket(self) -> None:
+        """Start the OneBot WebSocket transport used instead of HTTP."""
+        self._ws = OneBotWebSocketTransport(
+            self.config.websocket,
+            access_token=self.config.access_token,
+            event_handler=self._event_handler,
+            name=self.name,
+        )
+        try:
+            self._ws.start()
+        except Exception as e:
+            self._ws = None
+            self.logger.error(f"Failed to start Napcat WebSocket transport: {e}", exc_info=True)
+            raise
+        self._connected = True
+        self.logger.info(
+            f"Connected to Napcat over WebSocket ({self.config.websocket.mode}): {self.name}"
+        )
+
     def disconnect(self) -> None:
         """Disconnect from Napcat API."""
-        if self._client:
-            self._client.close()
+        self._client = None
+        if self._ws:
+            self._ws.stop()
+            self._ws = None
         self._connected = False
         self.logger.info(f"Disconnected from Napcat: {self.config.name}")
 
+    def set_event_handler(self, handler: Callable[[dict[str, Any]], Any] | None) -> None:
+        """Receive OneBot events from the WebSocket transport.
+
+        Only used with ``websocket`` configured; over HTTP, events arrive
+        through the event server instead.
+
+        Args:
+            handler: Sync or async callable receiving each event payload.
+        """
+        self._event_handler = handler
+        if self._ws:
+            self._ws.set_event_handler(handler)
+
+    @property
+    def event_loop(self) -> asyncio.AbstractEventLoop | None:
+        """Loop delivering WebSocket events, for scheduling follow-up coroutines."""
+        return self._ws.loop if self._ws else None
+
+    @property
+    def transport(self) -> OneBotWebSocketTransport | None:
+        """The WebSocket transport, if one is connected."""
+        return self._ws
+
     def send_message(self, message: Message, target: str) -> SendResult:
         """Send a message with automatic type detection.
 
@@ -574,7 +625,7 @@ class NapcatProvider(
         Raises:
             Exception: If request fails.
         """
-        if not self._client:
+        if not self._client and not self._ws:
             raise RuntimeError("Provider not connected. Call connect() first.")
 
         if user_id:
@@ -604,11 +655,17 @@ class NapcatProvider(
         Raises:
             Exception: If all retries fail.
         """
+        validator = create_response_validator("status", "ok", "msg")
+
+        if self._ws:
+            # One multiplexed frame on the open WebSocket; no HTTP retries
+            result = self._ws.call(endpoint, payload)
+            validator(result)
+            return result
+
         if not self._client:
             raise RuntimeError("HTTP client not initialized")
 
-        validator = create_response_validator("status", "ok", "msg")
-
         return self._http_request_with_retry(
             client=self._client,
             url=endpoint,
@@ -0,0 +1,566 @@
+"""OneBot11 WebSocket transport for the Napcat provider.
+
+Over HTTP every OneBot action is its own POST and events arrive through a
+separate callback server. A WebSocket carries both on one long-lived
+connection:
+
+- API calls are JSON frames ``{"action", "params", "echo"}``; responses carry
+  the same ``echo`` and resolve the matching pending call, so any number of
+  calls share the connection concurrently
+- Events (messages, notices, requests, meta events) arrive on the same
+  connection and are passed to the event handler
+- Napcat's ``heartbeat`` meta events are watched; a silent connection is
+  closed and, in forward mode, reopened with exponential backoff
+
+``forward`` mode connects to Napcat's WebSocket server; ``reverse`` mode
+listens and lets Napcat connect. The transport runs its own event loop on a
+daemon thread, so synchronous provider methods can call ``call()`` from any
+other thread and coroutines can ``await acall()`` from any loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hmac
+import inspect
+import itertools
+import json
+import random
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any
+from urllib.parse import parse_qs, urlsplit
+
+from ...core.logger import get_logger
+
+if TYPE_CHECKING:
+    from ...core.config import OneBotWebSocketConfig
+
+logger = get_logger("qq.ws_transport")
+
+EventHandler = Callable[[dict[str, Any]], Any]
+
+# Napcat sends base64 media and forward messages as single frames
+MAX_FRAME_SIZE = 32 * 1024 * 1024
+
+# Missed heartbeats before a connection is considered dead
+HEARTBEAT_MISSES = 3
+
+# Threads running synchronous event handlers
+_HANDLER_WORKERS = 4
+
+
+def _import_websockets() -> tuple[Any, Any]:
+    """Import the websockets client and server modules.
+
+    Raises:
+        ImportError: If the websockets package is not installed
+    """
+    try:
+        from websockets.asyncio import client, server
+    except ImportError as exc:
+        raise ImportError(
+            "The OneBot WebSocket transport requires the 'websockets' package. "
+            "Install it with: pip install 'websockets>=13'"
+        ) from exc
+    return client, server
+
+
+class OneBotWebSocketTransport:
+    """Multiplexed OneBot11 API calls and events over one WebSocket.
+
+    Example:
+        ```python
+        transport = OneBotWebSocketTransport(
+            OneBotWebSocketConfig(url="ws://127.0.0.1:3001"),
+            access_token="token",
+            event_handler=handle_event,
+        )
+        transport.start()
+        result = transport.call("send_group_msg", {"group_id": 1, "message": "hi"})
+        transport.stop()
+        ```
+    """
+
+    def __init__(
+        self,
+        config: OneBotWebSocketConfig,
+        access_token: str | None = None,
+        event_handler: EventHandler | None = None,
+        name: str = "napcat",
+    ) -> None:
+        """Initialize the transport; nothing connects until ``start``.
+
+        Args:
+            config: WebSocket transport configuration
+            access_token: OneBot access token sent (forward) or required (reverse)
+            event_handler: Sync or async callable receiving each event
+            name: Provider name used in logs and thread names
+        """
+        self.config = config
+        self.access_token = access_token
+        self.name = name
+        self.self_id: int | None = None
+        self._event_handler = event_handler
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._started = threading.Event()
+        self._start_error: BaseException | None = None
+        self._main_task: asyncio.Task[None] | None = None
+        self._stopping: asyncio.Event | None = None
+        self._connected: asyncio.Event | None = None
+        self._connection: Any = None
+        self._pending: dict[str, tuple[asyncio.Future[dict[str, Any]], Any]] = {}
+        self._echo = itertools.count(1)
+        self._handler_tasks: set[asyncio.Task[None]] = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self._listen_port: int | None = None
+        self._last_heartbeat = 0.0
+        self._heartbeat_interval: float | None = None
+        self._stats = {
+            "calls": 0,
+            "failed_calls": 0,
+            "timeouts": 0,
+            "events": 0,
+            "connects": 0,
+            "connect_failures": 0,
+            "heartbeat_timeouts": 0,
+        }
+
+    @property
+    def connected(self) -> bool:
+        """Whether a WebSocket connection is currently open."""
+        return self._connection is not None
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop | None:
+        """Event loop of the transport thread while it is running."""
+        return self._loop
+
+    @property
+    def listen_port(self) -> int | None:
+        """Port the reverse-mode server is bound to, if listening."""
+        return self._listen_port
+
+    def set_event_handler(self, handler: EventHandler | None) -> None:
+        """Set the callable that receives events.
+
+        Synchronous handlers run in a small thread pool so they may call
+        ``call()``; async handlers run on the transport loop.
+
+        Args:
+            handler: Sync or async callable receiving each event dict
+        """
+        self._event_handler = handler
+
+    def start(self) -> None:
+        """Start the transport thread.
+
+        Forward mode returns immediately and connects in the background;
+        reverse mode returns once the server is listening.
+
+        Raises:
+            ImportError: If the websockets package is not installed
+            OSError: If the reverse-mode server cannot bind its port
+        """
+        if self._thread is not None:
+            return
+        _import_websockets()
+        self._started.clear()
+        self._start_error = None
+        self._thread = threading.Thread(
+            target=self._run, name=f"onebot-ws-{self.name}", daemon=True
+        )
+        self._thread.start()
+        self._started.wait()
+        if self._start_error is not None:
+            error = self._start_error
+            self.stop()
+            raise error
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Close the connection, fail pending calls and stop the thread.
+
+        Safe to call more than once.
+
+        Args:
+            timeout: Seconds to wait for the thread to finish
+        """
+        thread, loop = self._thread, self._loop
+        if thread is None:
+            return
+        if loop is not None and loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(self._shutdown(), loop)
+            with contextlib.suppress(Exception):
+                future.result(timeout)
+        thread.join(timeout)
+        self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def wait_connected(self, timeout: float | None = None) -> bool:
+        """Block until a connection is open.
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            True if connected before the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.connected:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def call(
+        self, action: str, params: dict[str, Any] | None = None, timeout: float | None = None
+    ) -> dict[str, Any]:
+        """Call a OneBot action and wait for its response.
+
+        Args:
+            action: Action name, with or without a leading "/"
+            params: Action parameters
+            timeout: Seconds to wait (default: ``request_timeout``)
+
+        Returns:
+            Raw OneBot response with ``status``, ``retcode`` and ``data``
+
+        Raises:
+            ConnectionError: If the transport is not running or not connected
+            TimeoutError: If no response arrives in time
+            RuntimeError: If called from the transport thread
+        """
+        loop = self._require_loop()
+        if threading.current_thread() is self._thread:
+            raise RuntimeError("call() would block the transport thread; await acall() instead")
+        future = asyncio.run_coroutine_threadsafe(self._request(action, params, timeout), loop)
+        return future.result()
+
+    async def acall(
+        self, action: str, params: dict[str, Any] | None = None, timeout: float | None = None
+    ) -> dict[str, Any]:
+        """Call a OneBot action from any event loop.
+
+        Args:
+            action: Action name, with or without a leading "/"
+            params: Action parameters
+            timeout: Seconds to wait (default: ``request_timeout``)
+
+        Returns:
+            Raw OneBot response with ``status``, ``retcode`` and ``data``
+
+        Raises:
+            ConnectionError: If the transport is not running or not connected
+            TimeoutError: If no response arrives in time
+        """
+        loop = self._require_loop()
+        if asyncio.get_running_loop() is loop:
+            return await self._request(action, params, timeout)
+        future = asyncio.run_coroutine_threadsafe(self._request(action, params, timeout), loop)
+        return await asyncio.wrap_future(future)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get transport statistics.
+
+        Returns:
+            Dictionary with call, event and connection counters
+        """
+        idle = time.monotonic() - self._last_heartbeat if self._last_heartbeat else None
+        return {
+            **self._stats,
+            "mode": self.config.mode,
+            "connected": self.connected,
+            "pending": len(self._pending),
+            "self_id": self.self_id,
+            "heartbeat_interval": self._heartbeat_interval,
+            "seconds_since_heartbeat": round(idle, 3) if idle is not None else None,
+        }
+
+    # ------------------------------------------------------------------
+    # Transport thread
+    # ------------------------------------------------------------------
+
+    def _require_loop(self) -> asyncio.AbstractEventLoop:
+        """Return the running transport loop."""
+        loop = self._loop
+        if loop is None or not loop.is_running():
+            raise ConnectionError("OneBot WebSocket transport is not running")
+        return loop
+
+    def _run(self) -> None:
+        """Thread target running the transport loop until stopped."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        self._stopping = asyncio.Event()
+        self._connected = asyncio.Event()
+        self._main_task = loop.create_task(
+            self._serve() if self.config.mode == "reverse" else self._connect_forever()
+        )
+        try:
+            loop.run_until_complete(self._main_task)
+        except asyncio.CancelledError:
+            pass
+        except Exception as exc:
+            logger.error("OneBot WebSocket transport '%s' failed: %s", self.name, exc)
+        finally:
+            self._started.set()
+            self._loop = None
+            with contextlib.suppress(Exception):
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    async def _shutdown(self) -> None:
+        """Stop reconnecting, close the connection and end the main task."""
+        assert self._stopping is not None
+        self._stopping.set()
+        connection = self._connection
+        if connection is not None:
+            with contextlib.suppress(Exception):
+                await connection.close()
+        for task in list(self._handler_tasks):
+            task.cancel()
+        if self._main_task is not None and not self._main_task.done():
+            self._main_task.cancel()
+
+    async def _connect_forever(self) -> None:
+        """Forward mode: keep a connection to Napcat open, reconnecting with backoff."""
+        assert self._stopping is not None
+        client, _ = _import_websockets()
+        headers = {"Authorization": f"Bearer {self.access_token}"} if self.access_token else None
+        delay = self.config.reconnect_initial_delay
+        self._started.set()
+
+        while not self._stopping.is_set():
+            try:
+                connection = await client.connect(
+                    self.config.url,
+                    additional_headers=headers,
+                    max_size=MAX_FRAME_SIZE,
+                    open_timeout=self.config.request_timeout,
+                    close_timeout=5,
+                )
+            except Exception as exc:
+                self._stats["connect_failures"] += 1
+                logger.warning(
+                    "Failed to connect to OneBot WebSocket %s: %s (retrying in %.1fs)",
+                    self.config.url,
+                    exc,
+                    delay,
+                )
+            else:
+                delay = self.config.reconnect_initial_delay
+                logger.info("Connected to OneBot WebSocket %s", self.config.url)
+                await self._session(connection)
+                if self._stopping.is_set():
+                    break
+                logger.warning("OneBot WebSocket %s disconnected; reconnecting", self.config.url)
+
+            # Jitter keeps several bots from reconnecting in lockstep
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._stopping.wait(), delay * random.uniform(0.5, 1.0))
+            delay = min(delay * 2, self.config.reconnect_max_delay)
+
+    async def _serve(self) -> None:
+        """Reverse mode: accept Napcat's connection until stopped."""
+        assert self._stopping is not None
+        _, server_module = _import_websockets()
+        try:
+            server = await server_module.serve(
+                self._accept,
+                self.config.host,
+                self.config.port,
+                process_request=self._check_request,
+                max_size=MAX_FRAME_SIZE,
+                close_timeout=5,
+            )
+        except OSError as exc:
+            self._start_error = exc
+            self._started.set()
+            return
+
+        self._listen_port = server.sockets[0].getsockname()[1]
+        logger.info(
+            "Waiting for OneBot reverse WebSocket on %s:%d%s",
+            self.config.host,
+            self._listen_port,
+            self.config.path,
+        )
+        self._started.set()
+        try:
+            await self._stopping.wait()
+        finally:
+            server.close()
+            await server.wait_closed()
+            self._listen_port = None
+
+    def _check_request(self, connection: Any, request: Any) -> Any:
+        """Reject handshakes on other paths or without the access token."""
+        url = urlsplit(request.path)
+        if url.path.rstrip("/") != self.config.path.rstrip("/"):
+            return connection.respond(HTTPStatus.NOT_FOUND, "Not Found\n")
+        if self.access_token:
+            header = request.headers.get("Authorization", "")
+            query = parse_qs(url.query).get("access_token", [""])[0]
+            expected = self.access_token
+            if not (
+                hmac.compare_digest(header, f"Bearer {expected}")
+                or hmac.compare_digest(query, expected)
+            ):
+                return connection.respond(HTTPStatus.UNAUTHORIZED, "Unauthorized\n")
+        return None
+
+    async def _accept(self, connection: Any) -> None:
+        """Reverse mode: serve a connection from Napcat, replacing any older one."""
+        previous = self._connection
+        if previous is not None:
+            logger.info("New OneBot reverse WebSocket connection replaces the current one")
+            with contextlib.suppress(Exception):
+                await previous.close()
+        await self._session(connection)
+
+    async def _session(self, connection: Any) -> None:
+        """Read frames from one connection until it closes."""
+        assert self._connected is not None
+        self._connection = connection
+        self._stats["connects"] += 1
+        self._last_heartbeat = time.monotonic()
+        self._heartbeat_interval = None
+        self._connected.set()
+        watchdog = asyncio.create_task(self._watch_heartbeat(connection))
+        try:
+            async for frame in connection:
+                self._handle_frame(frame)
+        except Exception as exc:
+            logger.debug("OneBot WebSocket connection ended: %s", exc)
+        finally:
+            watchdog.cancel()
+            if self._connection is connection:
+                self._connection = None
+                self._connected.clear()
+            self._fail_pending(connection)
+
+    async def _watch_heartbeat(self, connection: Any) -> None:
+        """Close the connection when heartbeats stop arriving."""
+        while True:
+            timeout = self.config.heartbeat_timeout
+            if timeout is None and self._heartbeat_interval:
+                timeout = self._heartbeat_interval * HEARTBEAT_MISSES
+            if timeout is None:
+                # Napcat has not announced its heartbeat interval yet
+                await asyncio.sleep(1.0)
+                continue
+            idle = time.monotonic() - self._last_heartbeat
+            if idle >= timeout:
+                self._stats["heartbeat_timeouts"] += 1
+                logger.warning("No OneBot heartbeat for %.1fs; closing WebSocket connection", idle)
+                await connection.close(code=1011, reason="heartbeat timeout")
+                return
+            await asyncio.sleep(min(timeout - idle, 1.0))
+
+    def _handle_frame(self, frame: str | bytes) -> None:
+        """Route a frame to its pending call or to the event handler."""
+        try:
+            data = json.loads(frame)
+        except ValueError:
+            logger.warning("Ignoring non-JSON OneBot WebSocket frame")
+            return
+        if not isinstance(data, dict):
+            return
+
+        if "post_type" not in data:
+            entry = self._pending.get(str(data.get("echo")))
+            if entry is not None and not entry[0].done():
+                entry[0].set_result(data)
+            return
+
+        if data["post_type"] == "meta_event":
+            self._handle_meta_event(data)
+        self._stats["events"] += 1
+        self._dispatch(data)
+
+    def _handle_meta_event(self, event: dict[str, Any]) -> None:
+        """Track heartbeats and the bot account from meta events."""
+        meta_type = event.get("meta_event_type")
+        if meta_type == "heartbeat":
+            self._last_heartbeat = time.monotonic()
+            interval = event.get("interval")
+            if isinstance(interval, int | float) and interval > 0:
+                self._heartbeat_interval = interval / 1000
+        elif meta_type == "lifecycle" and event.get("self_id") is not None:
+            self.self_id = event["self_id"]
+
+    def _dispatch(self, event: dict[str, Any]) -> None:
+        """Hand an event to the handler without blocking the read loop."""
+        handler = self._event_handler
+        if handler is None:
+            return
+        event.setdefault("_provider", "napcat")
+        task = asyncio.create_task(self._run_handler(handler, event))
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_tasks.discard)
+
+    async def _run_handler(self, handler: EventHandler, event: dict[str, Any]) -> None:
+        """Await async handlers; run sync ones in the handler thread pool."""
+        try:
+            if inspect.iscoroutinefunction(handler):
+                await handler(event)
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=_HANDLER_WORKERS, thread_name_prefix=f"onebot-ws-{self.name}"
+                )
+            await asyncio.get_running_loop().run_in_executor(self._executor, handler, event)
+        except Exception as exc:
+            logger.error("OneBot event handler failed: %s", exc, exc_info=True)
+
+    async def _request(
+        self, action: str, params: dict[str, Any] | None, timeout: float | None
+    ) -> dict[str, Any]:
+        """Send one action frame and wait for the response with its echo."""
+        assert self._connected is not None
+        timeout = timeout or self.config.request_timeout
+        action = action.lstrip("/")
+        if self._connection is None:
+            try:
+                await asyncio.wait_for(self._connected.wait(), timeout)
+            except TimeoutError:
+                self._stats["failed_calls"] += 1
+                raise ConnectionError("OneBot WebSocket is not connected") from None
+        connection = self._connection
+        if connection is None:
+            self._stats["failed_calls"] += 1
+            raise ConnectionError("OneBot WebSocket is not connected")
+
+        echo = str(next(self._echo))
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[echo] = (future, connection)
+        self._stats["calls"] += 1
+        frame = {"action": action, "params": params or {}, "echo": echo}
+        try:
+            await connection.send(json.dumps(frame, ensure_ascii=False))
+            return await asyncio.wait_for(future, timeout)
+        except TimeoutError:
+            self._stats["timeouts"] += 1
+            raise TimeoutError(f"OneBot action '{action}' timed out after {timeout:.1f}s") from None
+        except ConnectionError:
+            self._stats["failed_calls"] += 1
+            raise
+        except Exception as exc:
+            self._stats["failed_calls"] += 1
+            raise ConnectionError(f"OneBot action '{action}' failed: {exc}") from exc
+        finally:
+            self._pending.pop(echo, None)
+
+    def _fail_pending(self, connection: Any) -> None:
+        """Fail calls still waiting for a response on a closed connection."""
+        for future, owner in list(self._pending.values()):
+            if owner is connection and not future.done():
+                future.set_exception(ConnectionError("OneBot WebSocket connection closed"))
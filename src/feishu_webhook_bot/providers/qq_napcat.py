@@ -10,23 +10,28 @@ Features:
 - Message forwarding and history retrieval
 - Group and friend management
 - Circuit breaker and retry support
+- Optional OneBot11 WebSocket transport (forward or reverse) for API calls and events
 """
 
 from __future__ import annotations
 
+import asyncio
 import uuid
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
-import httpx
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 
 from ..core.circuit_breaker import CircuitBreaker, CircuitBreakerConfig
+from ..core.config import OneBotWebSocketConfig
+from ..core.http_pool import PooledClient
 from ..core.logger import get_logger
 from ..core.message_tracker import MessageStatus, MessageTracker
 from ..core.provider import BaseProvider, Message, MessageType, ProviderConfig, SendResult
 from .base_http import HTTPProviderMixin
+from .qq.ws_transport import OneBotWebSocketTransport
 
 logger = get_logger(__name__)
 
@@ -111,8 +116,8 @@ class NapcatProviderConfig(ProviderConfig):
     """Configuration for QQ Napcat provider (OneBot11 protocol)."""
 
     provider_type: str = Field(default="napcat", description="Provider type")
-    http_url: str = Field(
-        ...,
+    http_url: str | None = Field(
+        default=None,
         description="Napcat HTTP API base URL (e.g., http://127.0.0.1:3000)",
     )
     access_token: str | None = Field(
@@ -127,6 +132,17 @@ class NapcatProviderConfig(ProviderConfig):
         default=False,
         description="Enable NapCat AI voice features",
     )
+    websocket: OneBotWebSocketConfig | None = Field(
+        default=None,
+        description="Use a OneBot11 WebSocket instead of HTTP for API calls and events",
+    )
+
+    @model_validator(mode="after")
+    def validate_transport(self) -> NapcatProviderConfig:
+        """Ensure an HTTP URL or a WebSocket transport is configured."""
+        if not self.http_url and self.websocket is None:
+            raise ValueError("Napcat provider requires 'http_url' or 'websocket'")
+        return self
 
 
 class NapcatProvider(BaseProvider, HTTPProviderMixin):
@@ -183,8 +199,10 @@ class NapcatProvider(BaseProvider, HTTPProviderMixin):
         """
         super().__init__(config)
         self.config: NapcatProviderConfig = config
-        self._client: httpx.Client | None = None
-        self._async_client: httpx.AsyncClient | None = None
+        self._client: PooledClient | None = None
+        self._async_client: PooledClient | None = None
+        self._ws: OneBotWebSocketTransport | None = None
+        self._event_handler: Callable[[dict[str, Any]], Any] | None = None
         self._message_tracker = message_tracker
         self._circuit_breaker = CircuitBreaker(
             f"napcat_{config.name}",
@@ -197,16 +215,19 @@ class NapcatProvider(BaseProvider, HTTPProviderMixin):
         if self._connected:
             return
 
+        if self.config.websocket is not None:
+            self._connect_websocket(self.config.websocket)
+            return
+
         try:
             headers = {"Content-Type": "application/json"}
             if self.config.access_token:
                 headers["Authorization"] = f"Bearer {self.config.access_token}"
 
-            timeout = self.config.timeout or 10.0
-            self._client = httpx.Client(
-                timeout=timeout,
-                headers=headers,
+            self._client = PooledClient(
                 base_url=self.config.http_url,
+                headers=headers,
+                timeout=self.config.timeout or 10.0,
             )
             self._connected = True
             self.logger.info(f"Connected to Napcat: {self.config.name}")
@@ -214,13 +235,55 @@ class NapcatProvider(BaseProvider, HTTPProviderMixin):
             self.logger.error(f"Failed to connect to Napcat: {e}", exc_info=True)
             raise
 
+    def _connect_websocket(self, ws_config: OneBotWebSocketConfig) -> None:
+        """Start the OneBot WebSocket transport used instead of HTTP."""
+        self._ws = OneBotWebSocketTransport(
+            ws_config,
+            access_token=self.config.access_token,
+            event_handler=self._event_handler,
+            name=self.name,
+        )
+        try:
+            self._ws.start()
+        except Exception as e:
+            self._ws = None
+            self.logger.error(f"Failed to start Napcat WebSocket transport: {e}", exc_info=True)
+            raise
+        self._connected = True
+        self.logger.info(f"Connected to Napcat over WebSocket ({ws_config.mode}): {self.name}")
+
     def disconnect(self) -> None:
         """Disconnect from Napcat API."""
-        if self._client:
-            self._client.close()
+        self._client = None
+        if self._ws:
+            self._ws.stop()
+            self._ws = None
         self._connected = False
         self.logger.info(f"Disconnected from Napcat: {self.config.name}")
 
+    def set_event_handler(self, handler: Callable[[dict[str, Any]], Any] | None) -> None:
+        """Receive OneBot events from the WebSocket transport.
+
+        Only used with ``websocket`` configured; over HTTP, events arrive
+        through the event server instead.
+
+        Args:
+            handler: Sync or async callable receiving each event payload
+        """
+        self._event_handler = handler
+        if self._ws:
+            self._ws.set_event_handler(handler)
+
+    @property
+    def event_loop(self) -> asyncio.AbstractEventLoop | None:
+        """Loop delivering WebSocket events, for scheduling follow-up coroutines."""
+        return self._ws.loop if self._ws else None
+
+    @property
+    def transport(self) -> OneBotWebSocketTransport | None:
+        """The WebSocket transport, if one is connected."""
+        return self._ws
+
     def send_message(self, message: Message, target: str) -> SendResult:
         """Send a message with automatic type detection.
 
@@ -563,7 +626,7 @@ class NapcatProvider(BaseProvider, HTTPProviderMixin):
         Raises:
             Exception: If request fails
         """
-        if not self._client:
+        if not self._client and not self._ws:
             raise RuntimeError("Provider not connected. Call connect() first.")
 
         # Determine endpoint based on target type
@@ -601,6 +664,13 @@ class NapcatProvider(BaseProvider, HTTPProviderMixin):
         Raises:
             Exception: If all retries fail
         """
+        if self._ws:
+            # One multiplexed frame on the open WebSocket; no HTTP retries
+            result = self._ws.call(endpoint, payload)
+            if result.get("status") != "ok":
+                raise ValueError(f"OneBot API error: {result.get('msg', 'Unknown error')}")
+            return result
+
         if not self._client:
             raise RuntimeError("HTTP client not initialized")
 
@@ -2213,6 +2283,11 @@ class NapcatProvider(BaseProvider, HTTPProviderMixin):
 
     async def async_connect(self) -> None:
         """Connect async client to Napcat API."""
+        if self.config.websocket is not None:
+            # The transport serves sync and async callers alike
+            if not self._connected:
+                await asyncio.to_thread(self.connect)
+            return
         if self._async_client is not None:
             return
 
@@ -2221,11 +2296,11 @@ class NapcatProvider(BaseProvider, HTTPProviderMixin):
             if self.config.access_token:
                 headers["Authorization"] = f"Bearer {self.config.access_token}"
 
-            timeout = self.config.timeout or 10.0
-            self._async_client = httpx.AsyncClient(
-                timeout=timeout,
-                headers=headers,
+            self._async_client = PooledClient(
                 base_url=self.config.http_url,
+                headers=headers,
+                timeout=self.config.timeout or 10.0,
+                asynchronous=True,
             )
             self.logger.info(f"Async connected to Napcat: {self.config.name}")
         except Exception as e:
@@ -2235,8 +2310,9 @@ class NapcatProvider(BaseProvider, HTTPProviderMixin):
     async def async_disconnect(self) -> None:
         """Disconnect async client from Napcat API."""
         if self._async_client:
-            await self._async_client.aclose()
             self._async_client = None
+        if self._ws:
+            await asyncio.to_thread(self.disconnect)
         self.logger.info(f"Async disconnected from Napcat: {self.config.name}")
 
     async def __aenter__(self) -> NapcatProvider:
@@ -2261,12 +2337,15 @@ class NapcatProvider(BaseProvider, HTTPProviderMixin):
         Raises:
             Exception: If request fails
         """
-        if not self._async_client:
-            await self.async_connect()
+        if self._ws:
+            result = await self._ws.acall(endpoint, payload)
+        else:
+            if not self._async_client:
+                await self.async_connect()
 
-        response = await self._async_client.post(endpoint, json=payload)
-        response.raise_for_status()
-        result = response.json()
+            response = await self._async_client.post(endpoint, json=payload)
+            response.raise_for_status()
+            result = response.json()
 
         if result.get("status") != "ok":
             raise ValueError(f"OneBot API error: {result.get('msg', 'Unknown error')}")
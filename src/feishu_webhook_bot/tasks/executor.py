@@ -10,13 +10,12 @@ from datetime import datetime
 from datetime import time as dt_time
 from typing import TYPE_CHECKING, Any
 
-import httpx
-
 from ..core.config import (
     TaskActionConfig,
     TaskConditionConfig,
     TaskDefinitionConfig,
 )
+from ..core.http_pool import get_http_pool
 from ..core.logger import get_logger
 from ..core.provider import BaseProvider
 from ..core.templates import RenderedTemplate, TemplateRegistry
@@ -452,24 +451,25 @@ class TaskExecutor:
 
         request = action.request
 
-        with httpx.Client(timeout=request.timeout or 10.0) as client:
-            response = client.request(
-                request.method,
-                request.url,
-                headers=request.headers,
-                params=request.params,
-                json=request.json_body,
-                data=request.data_body,
-            )
-            response.raise_for_status()
+        client = get_http_pool().sync_client()
+        response = client.request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            params=request.params,
+            json=request.json_body,
+            data=request.data_body,
+            timeout=request.timeout or 10.0,
+        )
+        response.raise_for_status()
 
-            if request.save_as:
-                if "application/json" in response.headers.get("content-type", ""):
-                    self.context[request.save_as] = response.json()
-                else:
-                    self.context[request.save_as] = response.text
+        if request.save_as:
+            if "application/json" in response.headers.get("content-type", ""):
+                self.context[request.save_as] = response.json()
+            else:
+                self.context[request.save_as] = response.text
 
-            return response
+        return response
 
     # Safe builtins for sandboxed Python code execution
     _SAFE_BUILTINS: dict[str, Any] = {
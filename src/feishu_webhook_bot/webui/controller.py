@@ -1315,9 +1315,7 @@ class BotController:
 
             # Register with engine if available
             if self.bot.automation_engine:
-                self.bot.automation_engine._rules.append(rule)
-                if rule.enabled and rule.trigger.type == "schedule":
-                    self.bot.automation_engine._register_schedule(rule)
+                self.bot.automation_engine.add_rule(rule)
 
             return True
 
@@ -1345,15 +1343,7 @@ class BotController:
 
             # Remove from engine
             if self.bot.automation_engine:
-                self.bot.automation_engine._rules = [
-                    r for r in self.bot.automation_engine._rules if r.name != rule_name
-                ]
-                # Remove scheduled job if exists
-                job_id = f"automation.{rule_name}"
-                if job_id in self.bot.automation_engine._registered_jobs:
-                    with suppress(Exception):
-                        self.bot.scheduler.remove_job(job_id)
-                    self.bot.automation_engine._registered_jobs.discard(job_id)
+                self.bot.automation_engine.remove_rule(rule_name)
 
             return True
 
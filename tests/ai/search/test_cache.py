@@ -6,12 +6,17 @@ Tests cover:
 - Cache statistics
 - Cache eviction
 - Cache clearing
+- LRU order, lazy expiry and the on-disk tier
 """
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
+from feishu_webhook_bot.ai.search import cache as cache_module
 from feishu_webhook_bot.ai.search.base import SearchResponse, SearchResult
-from feishu_webhook_bot.ai.search.cache import SearchCache
+from feishu_webhook_bot.ai.search.cache import SearchCache, configure_search_cache
+from feishu_webhook_bot.core.ttl_cache import SharedCache
 
 # ==============================================================================
 # SearchCache Tests
@@ -119,3 +124,70 @@ class TestSearchCache:
         assert stats["misses"] == 2
         # hit_rate_percent is calculated as percentage
         assert stats["hit_rate_percent"] == 50.0
+
+    def test_eviction_follows_recent_use(self) -> None:
+        """Test the least recently used entry is evicted, not the oldest inserted."""
+        cache = SearchCache(ttl_minutes=60, max_size=2)
+        cache.set("a", 5, "result a")
+        cache.set("b", 5, "result b")
+        assert cache.get("a", 5) == "result a"
+
+        cache.set("c", 5, "result c")
+
+        assert cache.get("b", 5) is None
+        assert cache.get("a", 5) == "result a"
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_expired_entries_removed_on_lookup(self) -> None:
+        """Test expired entries are dropped when read."""
+        cache = SearchCache(ttl_minutes=1, max_size=10)
+        clock = "feishu_webhook_bot.core.ttl_cache.time.time"
+        with patch(clock, return_value=1000.0):
+            cache.set("test", 5, "result")
+        with patch(clock, return_value=1059.0):
+            assert cache.get("test", 5) == "result"
+        with patch(clock, return_value=1060.0):
+            assert cache.get("test", 5) is None
+
+        stats = cache.get_stats()
+        assert stats["expired"] == 1
+        assert stats["size"] == 0
+
+    def test_disk_tier_survives_restart(self, tmp_path) -> None:
+        """Test cached responses are loaded back from the database."""
+        db_path = tmp_path / "search.db"
+        cache = SearchCache(ttl_minutes=60, max_size=10, db_path=db_path)
+        response = SearchResponse(
+            results=[SearchResult(title="Test", url="https://test.com", snippet="Test")],
+            query="persisted",
+            provider="Test",
+        )
+        cache.set("persisted", 5, response)
+        cache.set("legacy", 5, '{"results": []}', provider="duckduckgo-legacy")
+        cache.close()
+
+        reopened = SearchCache(ttl_minutes=60, max_size=10, db_path=db_path)
+        try:
+            cached = reopened.get("persisted", 5)
+            assert cached is not None
+            assert cached.results[0].url == "https://test.com"
+            assert cached.cached is True
+            assert reopened.get("legacy", 5, "duckduckgo-legacy") == '{"results": []}'
+            stats = reopened.get_stats()
+            assert stats["warm_loaded"] == 2
+            assert stats["persistent"] is True
+
+            reopened.invalidate(provider="Test")
+            reopened.close()
+            restarted = SearchCache(ttl_minutes=60, max_size=10, db_path=db_path)
+            assert restarted.get("persisted", 5) is None
+            restarted.close()
+        finally:
+            reopened.close()
+
+    def test_configure_reuses_matching_cache(self) -> None:
+        """Test the global cache is only replaced when its settings change."""
+        with patch.object(cache_module, "_shared_cache", SharedCache(SearchCache)):
+            first = configure_search_cache(ttl_minutes=30, max_size=50)
+            assert configure_search_cache(ttl_minutes=30, max_size=50) is first
+            assert configure_search_cache(ttl_minutes=10, max_size=50) is not first
@@ -5,18 +5,27 @@ Tests cover:
 - Provider registration
 - Search operations
 - Failover handling
+- Hedged search and latency histograms
 - Statistics
 """
 
 from __future__ import annotations
 
+import asyncio
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from feishu_webhook_bot.ai.config import SearchProviderConfig, WebSearchConfig
-from feishu_webhook_bot.ai.search.base import SearchError
-from feishu_webhook_bot.ai.search.manager import SearchManager
+from feishu_webhook_bot.ai.search.base import (
+    SearchError,
+    SearchProvider,
+    SearchProviderType,
+    SearchResponse,
+    SearchResult,
+)
+from feishu_webhook_bot.ai.search.manager import LatencyHistogram, SearchManager
 from feishu_webhook_bot.ai.search.providers import (
     DuckDuckGoProvider,
     TavilySearchProvider,
@@ -109,6 +118,157 @@ class TestSearchManager:
         assert stats["provider_count"] == 2
 
 
+class FakeSearchProvider(SearchProvider):
+    """Provider answering after a fixed delay, or failing."""
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False) -> None:
+        super().__init__(api_key="key")
+        self._name = name
+        self.delay = delay
+        self.fail = fail
+        self.cancelled = False
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def provider_type(self) -> SearchProviderType:
+        return SearchProviderType.DUCKDUCKGO
+
+    async def search(self, query: str, max_results: int = 10, **options: Any) -> SearchResponse:
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        if self.fail:
+            raise SearchError("down", provider=self.name)
+        result = SearchResult(title=self.name, url=f"https://{self.name}.test", snippet="")
+        return SearchResponse(results=[result], query=query, provider=self.name)
+
+
+class TestHedgedSearch:
+    """Tests for hedged search."""
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self) -> None:
+        """Test a backup starts after the hedge delay and its answer wins."""
+        slow = FakeSearchProvider("slow", delay=5.0)
+        fast = FakeSearchProvider("fast", delay=0.0)
+        manager = SearchManager(
+            providers=[slow, fast], enable_cache=False, hedged_search=True, hedge_delay_ms=20
+        )
+
+        response = await asyncio.wait_for(manager.search("q"), timeout=2.0)
+
+        assert response.provider == "fast"
+        assert slow.cancelled is True
+        stats = manager.get_stats()
+        assert stats["hedged_requests"] == 1
+        assert stats["hedge_wins"] == 1
+        assert stats["failover_count"] == 1
+        assert stats["latency"]["fast"]["samples"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self) -> None:
+        """Test no backup starts when the primary answers within the delay."""
+        primary = FakeSearchProvider("primary")
+        backup = FakeSearchProvider("backup")
+        manager = SearchManager(providers=[primary, backup], enable_cache=False, hedged_search=True)
+
+        response = await manager.search("q")
+
+        assert response.provider == "primary"
+        assert manager.get_stats()["hedged_requests"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failure_starts_next_provider_immediately(self) -> None:
+        """Test a failing provider is followed without waiting for the delay."""
+        broken = FakeSearchProvider("broken", fail=True)
+        backup = FakeSearchProvider("backup")
+        manager = SearchManager(
+            providers=[broken, backup], enable_cache=False, hedged_search=True, hedge_delay_ms=5000
+        )
+
+        response = await asyncio.wait_for(manager.search("q"), timeout=1.0)
+
+        assert response.provider == "backup"
+        assert manager.get_stats()["hedge_wins"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_starts_next_provider_while_primary_runs(self) -> None:
+        """Test a failing hedge is replaced at once even though the primary is pending."""
+        slow = FakeSearchProvider("slow", delay=5.0)
+        broken = FakeSearchProvider("broken", fail=True)
+        backup = FakeSearchProvider("backup")
+        manager = SearchManager(
+            providers=[slow, broken, backup],
+            enable_cache=False,
+            hedged_search=True,
+            hedge_delay_ms=50,
+        )
+
+        response = await asyncio.wait_for(manager.search("q"), timeout=2.0)
+
+        assert response.provider == "backup"
+        assert slow.cancelled is True
+        # Only the slow primary was hedged; the backup replaced the failure directly,
+        # so its answer is not a hedge win
+        stats = manager.get_stats()
+        assert stats["hedged_requests"] == 1
+        assert stats["hedge_wins"] == 0
+
+    @pytest.mark.asyncio
+    async def test_all_providers_fail(self) -> None:
+        """Test SearchError is raised when every provider fails."""
+        manager = SearchManager(
+            providers=[FakeSearchProvider("a", fail=True), FakeSearchProvider("b", fail=True)],
+            enable_cache=False,
+            hedged_search=True,
+        )
+
+        with pytest.raises(SearchError):
+            await manager.search("q")
+        assert manager.get_stats()["failed_searches"] == 1
+
+    def test_hedge_delay_follows_latency_percentile(self) -> None:
+        """Test the hedge delay switches to the recorded percentile once sampled."""
+        provider = FakeSearchProvider("p")
+        manager = SearchManager(
+            providers=[provider], hedged_search=True, hedge_delay_ms=800, hedge_min_samples=10
+        )
+        assert manager._hedge_delay(provider) == 800
+
+        histogram = manager._latency.setdefault("p", LatencyHistogram())
+        for _ in range(19):
+            histogram.record(120)
+        histogram.record(2500)
+
+        assert manager._hedge_delay(provider) == 200
+        assert histogram.percentile(100) == 3000
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_percentiles_and_decay(self) -> None:
+        """Test percentile estimates and halving once the window fills."""
+        histogram = LatencyHistogram(window=10)
+        assert histogram.percentile(50) is None
+
+        for _ in range(8):
+            histogram.record(40)
+        histogram.record(900)
+        assert histogram.percentile(50) == 50
+        assert histogram.percentile(99) == 1000
+        assert histogram.get_stats()["max_ms"] == 900
+
+        histogram.record(45000)
+        assert histogram.count == 6
+        assert histogram.percentile(100) == 45000
+
+
 # ==============================================================================
 # WebSearchConfig Tests
 # ==============================================================================
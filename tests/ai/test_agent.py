@@ -11,14 +11,29 @@ Tests cover:
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from feishu_webhook_bot.ai.agent import AIAgent, AIAgentDependencies, AIResponse
 from feishu_webhook_bot.ai.config import AIConfig
 from feishu_webhook_bot.ai.conversation import ConversationManager
+from feishu_webhook_bot.ai.search import cache as search_cache_module
+from feishu_webhook_bot.ai.search.cache import SearchCache
 from feishu_webhook_bot.ai.tools import ToolRegistry
+from feishu_webhook_bot.core.ttl_cache import SharedCache
+
+
+def _turn(index: int) -> list:
+    """Build a user request and assistant reply."""
+    from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserPromptPart
+
+    return [
+        ModelRequest(parts=[UserPromptPart(f"question {index} " + "q" * 80)]),
+        ModelResponse(parts=[TextPart("a" * 200)]),
+    ]
+
 
 # ==============================================================================
 # AIResponse Tests
@@ -458,6 +473,97 @@ class TestAIAgentConversation:
         new_state = await agent.conversation_manager.get_conversation("user123")
         assert new_state.messages == []
 
+    @patch("feishu_webhook_bot.ai.multi_agent.planner.Agent")
+    @patch("feishu_webhook_bot.ai.agent.Agent")
+    @pytest.mark.anyio
+    async def test_history_outside_window_is_summarized(self, mock_agent_class, mock_planner_agent):
+        """Test turns beyond the token budget are folded into a background summary."""
+        config = AIConfig(
+            context_window={
+                "max_history_tokens": 200,
+                "summarization_enabled": True,
+                "summary_min_messages": 2,
+            }
+        )
+        agent = AIAgent(config)
+        agent.summarizer = MagicMock()
+        agent.summarizer.summarize = AsyncMock(return_value="Earlier questions 0-3")
+        state = await agent.conversation_manager.get_conversation("user123")
+        for i in range(6):
+            state.add_messages(_turn(i))
+
+        agent._schedule_summary(state)
+        await asyncio.gather(*agent._summary_tasks)
+
+        summarized = agent.summarizer.summarize.await_args.args[1]
+        assert len(summarized) == 8
+        assert state.summary == "Earlier questions 0-3"
+        assert len(state.messages) == 4
+        window = state.get_messages(max_tokens=200)
+        assert "Earlier questions 0-3" in window[0].parts[0].content
+
+    @patch("feishu_webhook_bot.ai.multi_agent.planner.Agent")
+    @patch("feishu_webhook_bot.ai.agent.Agent")
+    @pytest.mark.anyio
+    async def test_failed_summary_keeps_history(self, mock_agent_class, mock_planner_agent):
+        """Test a failing summarizer leaves history intact and can be retried."""
+        config = AIConfig(context_window={"max_history_tokens": 200, "summarization_enabled": True})
+        agent = AIAgent(config)
+        agent.summarizer = MagicMock()
+        agent.summarizer.summarize = AsyncMock(side_effect=RuntimeError("model down"))
+        state = await agent.conversation_manager.get_conversation("user123")
+        for i in range(6):
+            state.add_messages(_turn(i))
+
+        agent._schedule_summary(state)
+        await asyncio.gather(*agent._summary_tasks)
+
+        assert state.summary is None
+        assert len(state.messages) == 12
+        assert state.begin_summary(None, 200) is not None
+
+    @patch("feishu_webhook_bot.ai.multi_agent.planner.Agent")
+    @patch("feishu_webhook_bot.ai.agent.Agent")
+    @pytest.mark.anyio
+    async def test_chat_coalesces_burst_per_user(self, mock_agent_class, mock_planner_agent):
+        """Test a burst from one user becomes one turn while other users run alongside."""
+        config = AIConfig(concurrency={"coalesce_window_ms": 50, "max_concurrent_requests": 2})
+        agent = AIAgent(config)
+        turns: list[tuple[str, str]] = []
+
+        async def fake_turn(user_id: str, message: str) -> str:
+            turns.append((user_id, message))
+            return f"reply to {message!r}"
+
+        agent._chat_turn = fake_turn
+
+        replies = await asyncio.gather(
+            agent.chat("user1", "hi"),
+            agent.chat("user1", "how are you"),
+            agent.chat("user2", "hello"),
+        )
+
+        assert sorted(turns) == [("user1", "hi\nhow are you"), ("user2", "hello")]
+        assert replies == ["", "reply to 'hi\\nhow are you'", "reply to 'hello'"]
+        stats = await agent.get_stats()
+        assert stats["scheduler_stats"]["turns"] == 2
+        assert stats["scheduler_stats"]["max_concurrent"] == 2
+
+    @patch("feishu_webhook_bot.ai.multi_agent.planner.Agent")
+    @patch("feishu_webhook_bot.ai.agent.Agent")
+    @pytest.mark.anyio
+    async def test_summarization_disabled_by_default(self, mock_agent_class, mock_planner_agent):
+        """Test no summarizer runs unless enabled."""
+        agent = AIAgent(AIConfig())
+        state = await agent.conversation_manager.get_conversation("user123")
+        for i in range(60):
+            state.add_messages(_turn(i))
+
+        agent._schedule_summary(state)
+
+        assert agent.summarizer is None
+        assert agent._summary_tasks == set()
+
 
 # ==============================================================================
 # AIAgent Model Switching Tests
@@ -591,6 +697,74 @@ class TestAIAgentStatistics:
         assert stats["performance"]["total_input_tokens"] == 10000
         assert stats["performance"]["total_output_tokens"] == 5000
 
+    @patch("feishu_webhook_bot.ai.multi_agent.agents.Agent")
+    @patch("feishu_webhook_bot.ai.multi_agent.planner.Agent")
+    @patch("feishu_webhook_bot.ai.agent.Agent")
+    @pytest.mark.anyio
+    async def test_complete_uses_response_cache(
+        self, mock_agent_class, mock_planner_agent, mock_agents_agent
+    ):
+        """Test repeated one-shot prompts are answered from the response cache."""
+        agent = AIAgent(AIConfig(response_cache={"enabled": True}))
+        result = MagicMock(output="A short summary")
+        result.usage.return_value = MagicMock(input_tokens=10, output_tokens=5)
+        agent._agent.run = AsyncMock(return_value=result)
+
+        first = await agent.complete("Summarize:  the article")
+        second = await agent.complete("Summarize: the article\n")
+        other = await agent.complete("Summarize: the article", system_prompt="Be terse")
+
+        assert first == second == other == "A short summary"
+        assert agent._agent.run.await_count == 2
+        assert agent._agent.run.await_args.kwargs["deps"].config.system_prompt == "Be terse"
+        stats = await agent.get_stats()
+        assert stats["response_cache_stats"]["hits"] == 1
+        assert stats["response_cache_stats"]["misses"] == 2
+        assert stats["performance"]["total_requests"] == 2
+
+    @patch("feishu_webhook_bot.ai.multi_agent.agents.Agent")
+    @patch("feishu_webhook_bot.ai.multi_agent.planner.Agent")
+    @patch("feishu_webhook_bot.ai.agent.Agent")
+    @pytest.mark.anyio
+    async def test_stop_closes_search_cache(
+        self, mock_agent_class, mock_planner_agent, mock_agents_agent, tmp_path
+    ):
+        """Test stopping the agent closes the global search cache it configured."""
+        shared = SharedCache(SearchCache)
+        with patch.object(search_cache_module, "_shared_cache", shared):
+            agent = AIAgent(
+                AIConfig(
+                    web_search_enabled=True,
+                    web_search={"cache_db_path": str(tmp_path / "search.db")},
+                )
+            )
+            cache = shared.current
+            assert cache is not None
+            with patch.object(cache, "close", wraps=cache.close) as close:
+                await agent.stop()
+
+            close.assert_called_once()
+            assert shared.current is None
+
+    @patch("feishu_webhook_bot.ai.multi_agent.agents.Agent")
+    @patch("feishu_webhook_bot.ai.multi_agent.planner.Agent")
+    @patch("feishu_webhook_bot.ai.agent.Agent")
+    @pytest.mark.anyio
+    async def test_complete_without_cache_and_failures(
+        self, mock_agent_class, mock_planner_agent, mock_agents_agent
+    ):
+        """Test the cache is opt-in and failed completions raise without being cached."""
+        agent = AIAgent(AIConfig())
+        agent._agent.run = AsyncMock(side_effect=RuntimeError("model down"))
+
+        with pytest.raises(RuntimeError):
+            await agent.complete("prompt")
+
+        stats = await agent.get_stats()
+        assert agent.response_cache is None
+        assert stats["response_cache_stats"] == {"enabled": False}
+        assert stats["performance"]["failed_requests"] == 1
+
 
 # ==============================================================================
 # AIAgent Conversation Store Tests
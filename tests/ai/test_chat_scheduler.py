@@ -0,0 +1,256 @@
+"""Tests for per-conversation chat scheduling."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from feishu_webhook_bot.ai.chat_scheduler import ChatScheduler, FairLimiter
+
+
+class TestFairLimiter:
+    """Tests for FairLimiter."""
+
+    async def test_limits_concurrency(self) -> None:
+        """Test no more than ``limit`` slots are held at once."""
+        limiter = FairLimiter(2)
+        running = 0
+        peak = 0
+
+        async def work(key: str) -> None:
+            nonlocal running, peak
+            async with limiter.slot(key):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(work(f"user{i}") for i in range(6)))
+
+        assert peak == 2
+        assert limiter.active == 0
+
+    async def test_round_robin_across_keys(self) -> None:
+        """Test a key with many waiters cannot starve another key."""
+        limiter = FairLimiter(1)
+        order: list[str] = []
+        await limiter.acquire("holder")
+
+        async def work(key: str) -> None:
+            async with limiter.slot(key):
+                order.append(key)
+
+        tasks = [asyncio.create_task(work(key)) for key in ("a", "a", "a", "b")]
+        await asyncio.sleep(0)
+        limiter.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["a", "b", "a", "a"]
+
+    async def test_cancelled_waiter_is_removed(self) -> None:
+        """Test cancelling a waiter neither leaks nor consumes a slot."""
+        limiter = FairLimiter(1)
+        await limiter.acquire("holder")
+        waiter = asyncio.create_task(limiter.acquire("a"))
+        await asyncio.sleep(0)
+        assert limiter.waiting == 1
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release()
+
+        assert limiter.waiting == 0
+        assert limiter.active == 0
+
+    def test_invalid_limit(self) -> None:
+        """Test the limit must be positive."""
+        with pytest.raises(ValueError):
+            FairLimiter(0)
+
+
+class TestChatScheduler:
+    """Tests for ChatScheduler."""
+
+    async def test_turns_of_one_conversation_are_serialized(self) -> None:
+        """Test a conversation's turns run one at a time in arrival order."""
+        scheduler = ChatScheduler(max_concurrent=4)
+        running = 0
+        seen: list[str] = []
+
+        async def handler(text: str) -> str:
+            nonlocal running
+            running += 1
+            assert running == 1
+            seen.append(text)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return f"re: {text}"
+
+        replies = await asyncio.gather(
+            *(scheduler.run("user1", f"m{i}", handler) for i in range(3))
+        )
+
+        assert seen == ["m0", "m1", "m2"]
+        assert replies == ["re: m0", "re: m1", "re: m2"]
+        assert scheduler.get_stats()["conversations"] == 0
+
+    async def test_conversations_run_in_parallel_up_to_limit(self) -> None:
+        """Test different conversations share the global limit."""
+        scheduler = ChatScheduler(max_concurrent=2)
+        running = 0
+        peak = 0
+
+        async def handler(text: str) -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return text
+
+        await asyncio.gather(*(scheduler.run(f"user{i}", "hi", handler) for i in range(5)))
+
+        assert peak == 2
+
+    async def test_burst_is_coalesced_into_one_call(self) -> None:
+        """Test messages within the window are answered by one handler call."""
+        scheduler = ChatScheduler(coalesce_window=0.05)
+        calls: list[str] = []
+
+        async def handler(text: str) -> str:
+            calls.append(text)
+            return "reply"
+
+        first = asyncio.create_task(scheduler.run("user1", "hello", handler))
+        await asyncio.sleep(0.01)
+        rest = [
+            asyncio.create_task(scheduler.run("user1", text, handler))
+            for text in ("are you", "there?")
+        ]
+        replies = await asyncio.gather(first, *rest)
+
+        assert calls == ["hello\nare you\nthere?"]
+        assert replies == ["", "", "reply"]
+        assert scheduler.get_stats()["coalesced"] == 2
+
+    async def test_max_coalesced_splits_bursts(self) -> None:
+        """Test at most ``max_coalesced`` messages share a turn."""
+        scheduler = ChatScheduler(coalesce_window=0.02, max_coalesced=2)
+        calls: list[str] = []
+
+        async def handler(text: str) -> str:
+            calls.append(text)
+            return text
+
+        replies = await asyncio.gather(
+            *(scheduler.run("user1", f"m{i}", handler) for i in range(3))
+        )
+
+        assert calls == ["m0\nm1", "m2"]
+        assert replies == ["", "m0\nm1", "m2"]
+
+    async def test_errors_reach_every_merged_caller(self) -> None:
+        """Test a failing turn raises for every message it covered."""
+        scheduler = ChatScheduler(coalesce_window=0.02)
+
+        async def handler(text: str) -> str:
+            raise RuntimeError("model down")
+
+        results = await asyncio.gather(
+            scheduler.run("user1", "a", handler),
+            scheduler.run("user1", "b", handler),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+    async def test_cancelled_message_is_withdrawn(self) -> None:
+        """Test a message cancelled while queued is not answered later."""
+        scheduler = ChatScheduler()
+        release = asyncio.Event()
+        calls: list[str] = []
+
+        async def handler(text: str) -> str:
+            calls.append(text)
+            await release.wait()
+            return text
+
+        first = asyncio.create_task(scheduler.run("user1", "first", handler))
+        second = asyncio.create_task(scheduler.run("user1", "second", handler))
+        await asyncio.sleep(0)
+        second.cancel()
+        release.set()
+
+        assert await first == "first"
+        with pytest.raises(asyncio.CancelledError):
+            await second
+        assert calls == ["first"]
+
+    async def test_cancelled_merged_caller_leaves_reply_to_others(self) -> None:
+        """Test cancelling a caller mid-turn hands the reply to the newest live caller."""
+        scheduler = ChatScheduler(coalesce_window=0.05)
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def handler(text: str) -> str:
+            started.set()
+            await release.wait()
+            return "reply"
+
+        first = asyncio.create_task(scheduler.run("user1", "a", handler))
+        second = asyncio.create_task(scheduler.run("user1", "b", handler))
+        await started.wait()
+        second.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await first == "reply"
+        with pytest.raises(asyncio.CancelledError):
+            await second
+
+    async def test_cancelled_runner_hands_turn_to_next_caller(self) -> None:
+        """Test cancelling the caller running a merged turn re-runs the others' messages."""
+        scheduler = ChatScheduler(coalesce_window=0.05)
+        started = asyncio.Event()
+        calls: list[str] = []
+
+        async def handler(text: str) -> str:
+            calls.append(text)
+            if len(calls) == 1:
+                started.set()
+                await asyncio.Event().wait()
+            return text
+
+        first = asyncio.create_task(scheduler.run("user1", "a", handler))
+        second = asyncio.create_task(scheduler.run("user1", "b", handler))
+        await started.wait()
+        first.cancel()
+
+        assert await asyncio.wait_for(second, timeout=1.0) == "b"
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert calls == ["a\nb", "b"]
+
+    async def test_stream_turns_share_the_mailbox(self) -> None:
+        """Test ``turn`` holds the conversation like a regular turn."""
+        scheduler = ChatScheduler()
+        events: list[str] = []
+
+        async def stream() -> None:
+            async with scheduler.turn("user1"):
+                events.append("stream start")
+                await asyncio.sleep(0.01)
+                events.append("stream end")
+
+        async def handler(text: str) -> str:
+            events.append(text)
+            return text
+
+        task = asyncio.create_task(stream())
+        await asyncio.sleep(0)
+        await scheduler.run("user1", "chat", handler)
+        await task
+
+        assert events == ["stream start", "stream end", "chat"]
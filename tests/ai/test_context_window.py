@@ -0,0 +1,118 @@
+"""Tests for context window token estimates and conversation summaries."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+from pydantic_ai.messages import (
+    ModelRequest,
+    ModelResponse,
+    SystemPromptPart,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
+from pydantic_ai.models.function import AgentInfo, FunctionModel
+
+from feishu_webhook_bot.ai.context_window import (
+    MESSAGE_OVERHEAD_TOKENS,
+    ConversationSummarizer,
+    estimate_message_tokens,
+    estimate_text_tokens,
+    is_turn_start,
+    render_transcript,
+)
+
+
+class TestEstimateMessageTokens:
+    """Tests for estimate_message_tokens."""
+
+    def test_scales_with_text_length(self) -> None:
+        """Test longer messages are estimated at more tokens."""
+        short = ModelRequest(parts=[UserPromptPart("hi")])
+        long = ModelRequest(parts=[UserPromptPart("word " * 200)])
+
+        assert estimate_message_tokens(short) == MESSAGE_OVERHEAD_TOKENS + 1
+        assert estimate_message_tokens(long) == MESSAGE_OVERHEAD_TOKENS + 250
+
+    def test_cjk_text_counts_one_token_per_character(self) -> None:
+        """Test Chinese text is not estimated with the English four-characters rule."""
+        chinese = ModelRequest(parts=[UserPromptPart("你好世界" * 100)])
+        mixed = ModelResponse(parts=[TextPart("使用 Python 3")])
+
+        assert estimate_message_tokens(chinese) == MESSAGE_OVERHEAD_TOKENS + 400
+        assert estimate_text_tokens("使用 Python 3") == 2 + 3
+        assert estimate_message_tokens(mixed) == MESSAGE_OVERHEAD_TOKENS + 5
+
+    def test_counts_tool_calls_and_results(self) -> None:
+        """Test tool arguments and results contribute to the estimate."""
+        call = ModelResponse(parts=[ToolCallPart("search", {"query": "x" * 40})])
+        result = ModelRequest(parts=[ToolReturnPart("search", {"items": ["y" * 80]})])
+
+        assert estimate_message_tokens(call) > MESSAGE_OVERHEAD_TOKENS + 10
+        assert estimate_message_tokens(result) > MESSAGE_OVERHEAD_TOKENS + 20
+
+    def test_unknown_objects_cost_overhead_only(self) -> None:
+        """Test objects without message parts fall back to the overhead."""
+        assert estimate_message_tokens(Mock()) == MESSAGE_OVERHEAD_TOKENS
+
+
+def test_is_turn_start() -> None:
+    """Test only requests with a user prompt open a turn."""
+    assert is_turn_start(ModelRequest(parts=[UserPromptPart("hi")]))
+    assert not is_turn_start(ModelRequest(parts=[ToolReturnPart("t", "ok")]))
+    assert not is_turn_start(ModelResponse(parts=[TextPart("hello")]))
+
+
+def test_render_transcript() -> None:
+    """Test transcripts skip system prompts and shorten tool results."""
+    messages = [
+        ModelRequest(parts=[SystemPromptPart("secret"), UserPromptPart("weather?")]),
+        ModelResponse(parts=[ToolCallPart("weather", {"city": "Paris"})]),
+        ModelRequest(parts=[ToolReturnPart("weather", "z" * 1000)]),
+        ModelResponse(parts=[TextPart("Sunny")]),
+    ]
+
+    transcript = render_transcript(messages).splitlines()
+
+    assert transcript[0] == "User: weather?"
+    assert transcript[1] == 'Assistant called weather({"city": "Paris"})'
+    assert transcript[2].startswith("Tool weather returned: zzz")
+    assert transcript[2].endswith("...")
+    assert len(transcript[2]) < 600
+    assert transcript[3] == "Assistant: Sunny"
+
+
+class TestConversationSummarizer:
+    """Tests for ConversationSummarizer."""
+
+    async def test_summarize_merges_previous_summary(self) -> None:
+        """Test the model sees the previous summary and the new transcript."""
+        prompts: list[str] = []
+
+        def model(messages: list, info: AgentInfo) -> ModelResponse:
+            prompts.append(messages[-1].parts[-1].content)
+            return ModelResponse(parts=[TextPart("  User likes tea.  ")])
+
+        summarizer = ConversationSummarizer(FunctionModel(model))
+        summary = await summarizer.summarize(
+            "User is called Ann.",
+            [ModelRequest(parts=[UserPromptPart("I like tea")])],
+        )
+
+        assert summary == "User likes tea."
+        assert "User is called Ann." in prompts[0]
+        assert "User: I like tea" in prompts[0]
+
+    async def test_summary_is_truncated(self) -> None:
+        """Test summaries longer than max_chars are cut."""
+        summarizer = ConversationSummarizer(
+            FunctionModel(lambda messages, info: ModelResponse(parts=[TextPart("s" * 500)])),
+            max_chars=100,
+        )
+
+        summary = await summarizer.summarize(None, [])
+
+        assert len(summary) == 103
+        assert summary.endswith("...")
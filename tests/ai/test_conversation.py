@@ -19,9 +19,27 @@ from datetime import UTC, datetime, timedelta
 from unittest.mock import Mock
 
 import pytest
+from pydantic_ai.messages import (
+    ModelRequest,
+    ModelResponse,
+    SystemPromptPart,
+    TextPart,
+    ToolCallPart,
+    ToolReturnPart,
+    UserPromptPart,
+)
 
 from feishu_webhook_bot.ai.conversation import ConversationManager, ConversationState
 
+
+def _turn(index: int, system: bool = False) -> list:
+    """Build a user request and assistant reply."""
+    parts = [UserPromptPart(f"question {index}")]
+    if system:
+        parts.insert(0, SystemPromptPart("You are helpful."))
+    return [ModelRequest(parts=parts), ModelResponse(parts=[TextPart(f"answer {index}")])]
+
+
 # ==============================================================================
 # ConversationState Tests
 # ==============================================================================
@@ -213,6 +231,137 @@ class TestConversationStateSummary:
         assert state.summary == "Second summary"
 
 
+class TestConversationStateContextWindow:
+    """Tests for token-budgeted history and background summaries."""
+
+    @staticmethod
+    def _state(**kwargs) -> ConversationState:
+        """State whose messages cost 10 tokens each."""
+        return ConversationState("user123", token_counter=lambda message: 10, **kwargs)
+
+    def test_tokens_counted_once_per_message(self):
+        """Test token counts are cached when messages are added."""
+        counter = Mock(return_value=7)
+        state = ConversationState("user123", token_counter=counter)
+        state.add_messages(_turn(0) + _turn(1))
+
+        state.get_messages(max_tokens=20)
+        state.get_messages(max_tokens=100)
+
+        assert counter.call_count == 4
+        assert state.history_tokens == 28
+
+    def test_history_cut_to_token_budget(self):
+        """Test the oldest turns are left out to fit the budget."""
+        state = self._state()
+        for i in range(5):
+            state.add_messages(_turn(i, system=i == 0))
+
+        window = state.get_messages(max_turns=10, max_tokens=45)
+
+        assert len(window) == 4
+        assert window[0].parts[-1].content == "question 3"
+
+    def test_chinese_history_cut_to_token_budget(self):
+        """Test Chinese turns are budgeted at about one token per character."""
+        state = ConversationState("user123")
+        for i in range(10):
+            state.add_messages(
+                [
+                    ModelRequest(parts=[UserPromptPart(f"问题{i}" + "请" * 400)]),
+                    ModelResponse(parts=[TextPart("好的" * 100)]),
+                ]
+            )
+
+        window = state.get_messages(max_tokens=1000)
+
+        assert state.history_tokens > 6000
+        assert len(window) == 2
+        assert window[0].parts[-1].content.startswith("问题9")
+
+    def test_tool_calls_are_not_split(self):
+        """Test history is only cut in front of a user prompt."""
+        state = self._state()
+        state.add_messages(_turn(0))
+        state.add_messages(
+            [
+                ModelRequest(parts=[UserPromptPart("weather?")]),
+                ModelResponse(parts=[ToolCallPart("weather", {"city": "Paris"})]),
+                ModelRequest(parts=[ToolReturnPart("weather", "sunny")]),
+                ModelResponse(parts=[TextPart("It is sunny")]),
+            ]
+        )
+
+        assert len(state.get_messages(max_tokens=40)) == 4
+        assert state.get_messages(max_tokens=35) == []
+
+    def test_cut_history_keeps_system_prompt_and_summary(self):
+        """Test the first message of a cut history carries the system prompt and summary."""
+        state = self._state()
+        for i in range(3):
+            state.add_messages(_turn(i, system=i == 0))
+        state.set_summary("User asked about tea.")
+        original = state.messages[2]
+
+        window = state.get_messages(max_tokens=20)
+
+        contents = [part.content for part in window[0].parts]
+        assert contents[0] == "You are helpful."
+        assert "User asked about tea." in contents[1]
+        assert contents[2] == "question 2"
+        assert len(original.parts) == 1
+
+    def test_max_messages_drops_whole_turns(self):
+        """Test memory is capped per conversation without splitting turns."""
+        state = self._state(max_messages=5)
+        for i in range(4):
+            state.add_messages(_turn(i))
+
+        assert len(state.messages) == 4
+        assert state.messages[0].parts[0].content == "question 2"
+        assert state.message_count == 8
+
+    def test_summary_drops_summarized_messages(self):
+        """Test applying a summary keeps messages added while it was produced."""
+        state = self._state()
+        for i in range(4):
+            state.add_messages(_turn(i))
+
+        batch = state.begin_summary(None, max_tokens=20, min_messages=2)
+        assert batch is not None
+        assert len(batch.messages) == 6
+        assert state.begin_summary(None, max_tokens=20) is None
+
+        state.add_messages(_turn(4))
+        state.apply_summary(batch, "summary")
+
+        assert state.summary == "summary"
+        assert [m.parts[0].content for m in state.messages[::2]] == ["question 3", "question 4"]
+        assert state.begin_summary(None, max_tokens=20) is not None
+
+    def test_summary_needs_min_messages(self):
+        """Test nothing is summarized until enough messages fell out of the window."""
+        state = self._state()
+        for i in range(2):
+            state.add_messages(_turn(i))
+
+        assert state.begin_summary(None, max_tokens=20, min_messages=4) is None
+
+    def test_clear_discards_running_summary(self):
+        """Test a summary finishing after a clear is ignored."""
+        state = self._state()
+        for i in range(3):
+            state.add_messages(_turn(i))
+        batch = state.begin_summary(None, max_tokens=20)
+
+        state.clear()
+        state.add_messages(_turn(9))
+        state.apply_summary(batch, "stale")
+
+        assert state.summary is None
+        assert len(state.messages) == 2
+
+
 class TestConversationStateAnalytics:
     """Tests for conversation analytics."""
 
@@ -292,6 +292,15 @@ class TestConversationStore:
         assert conv is not None
         assert conv.active_persona_id == "developer"
 
+    async def test_get_active_persona_id_async(
+        self, manager: PersistentConversationManager
+    ) -> None:
+        """Test the awaitable persona lookup used on the chat path."""
+        manager.set_active_persona_id("user123", "developer", platform="feishu")
+
+        assert await manager.get_active_persona_id_async("user123") == "developer"
+        assert await manager.get_active_persona_id_async("missing") is None
+
     def test_import_duplicate_conversation(self, manager: PersistentConversationManager) -> None:
         """Test that importing duplicate conversation returns existing."""
         conv1 = manager.get_or_create("user789", "feishu", "chat000")
@@ -387,6 +396,128 @@ class TestConversationStore:
         assert parsed == {}
 
 
+class TestConversationStoreHistoryReads:
+    """Test SQL-limited history reads, the tail cache and keyset pagination."""
+
+    @staticmethod
+    def _count_message_selects(manager: PersistentConversationManager) -> list[str]:
+        from sqlalchemy import event
+
+        statements: list[str] = []
+
+        @event.listens_for(manager.engine, "before_cursor_execute")
+        def record(conn, cursor, statement, parameters, context, executemany):  # noqa: ARG001
+            if statement.lstrip().upper().startswith("SELECT") and "FROM messages" in statement:
+                statements.append(statement)
+
+        return statements
+
+    def test_composite_index_created(self, manager: PersistentConversationManager) -> None:
+        """Test the (conversation_id, timestamp) index exists."""
+        from sqlalchemy import inspect
+
+        indexes = {i["name"]: i for i in inspect(manager.engine).get_indexes("messages")}
+        index = indexes["ix_messages_conversation_timestamp"]
+        assert index["column_names"][:2] == ["conversation_id", "timestamp"]
+
+    def test_load_history_limits_in_sql(self, temp_db_dir: Path) -> None:
+        """Test only the requested tail is read when the cache is disabled."""
+        manager = PersistentConversationManager(
+            db_url=f"sqlite:///{temp_db_dir / 'test.db'}", history_cache_size=0
+        )
+        conv = manager.get_or_create("user123", "feishu")
+        for i in range(30):
+            manager.save_message(conv.id, "user", f"Message {i}")
+        statements = self._count_message_selects(manager)
+
+        history = manager.load_history(conv.id, max_turns=2)
+
+        assert [m["content"] for m in history] == [f"Message {i}" for i in range(26, 30)]
+        assert "LIMIT" in statements[0].upper()
+
+    def test_load_history_served_from_cache(self, manager: PersistentConversationManager) -> None:
+        """Test repeated loads hit the cache, which save_message keeps current."""
+        conv = manager.get_or_create("user123", "feishu")
+        manager.save_message(conv.id, "user", "Hello")
+        manager.load_history(conv.id)
+        statements = self._count_message_selects(manager)
+
+        manager.save_message(conv.id, "assistant", "Hi")
+        history = manager.load_history(conv.id)
+
+        assert [m["content"] for m in history] == ["Hello", "Hi"]
+        assert statements == []
+
+    def test_cached_and_database_history_match(self, temp_db_dir: Path) -> None:
+        """Test a cache hit returns the same timestamps as a database read."""
+        db_url = f"sqlite:///{temp_db_dir / 'test.db'}"
+        manager = PersistentConversationManager(db_url=db_url)
+        conv = manager.get_or_create("user123", "feishu")
+        manager.load_history(conv.id)
+        manager.save_message(conv.id, "user", "Hello")
+
+        cached = manager.load_history(conv.id)
+        from_db = PersistentConversationManager(db_url=db_url).load_history(conv.id)
+
+        assert cached == from_db
+        assert datetime.fromisoformat(cached[0]["timestamp"]).tzinfo is None
+
+    def test_load_history_cache_misses_when_tail_too_short(self, temp_db_dir: Path) -> None:
+        """Test requests longer than the cached tail go back to the database."""
+        manager = PersistentConversationManager(
+            db_url=f"sqlite:///{temp_db_dir / 'test.db'}", history_cache_size=4
+        )
+        conv = manager.get_or_create("user123", "feishu")
+        for i in range(10):
+            manager.save_message(conv.id, "user", f"Message {i}")
+
+        assert len(manager.load_history(conv.id, max_turns=2)) == 4
+        assert len(manager.load_history(conv.id, max_turns=4)) == 8
+
+    def test_clear_and_delete_reset_cache(self, manager: PersistentConversationManager) -> None:
+        """Test clearing or deleting a conversation is reflected in cached history."""
+        conv = manager.get_or_create("user123", "feishu")
+        manager.save_message(conv.id, "user", "Hello")
+        manager.load_history(conv.id)
+
+        manager.clear_conversation(conv.id)
+        assert manager.load_history(conv.id) == []
+
+        manager.delete_conversation(conv.id)
+        with pytest.raises(ValueError):
+            manager.load_history(conv.id)
+
+    def test_get_messages_page_keyset(self, manager: PersistentConversationManager) -> None:
+        """Test pages follow each other without gaps, in both directions."""
+        conv = manager.get_or_create("user123", "feishu")
+        for i in range(5):
+            manager.save_message(conv.id, "user", f"Message {i}")
+
+        first, cursor = manager.get_messages_page(conv.id, limit=2)
+        second, cursor = manager.get_messages_page(conv.id, limit=2, after=cursor)
+        third, cursor = manager.get_messages_page(conv.id, limit=2, after=cursor)
+
+        contents = [m["content"] for m in first + second + third]
+        assert contents == [f"Message {i}" for i in range(5)]
+        assert cursor is None
+
+        newest, cursor = manager.get_messages_page(conv.id, limit=2, newest_first=True)
+        older, _ = manager.get_messages_page(conv.id, limit=2, after=cursor, newest_first=True)
+        assert [m["content"] for m in newest + older] == [f"Message {i}" for i in (4, 3, 2, 1)]
+
+    def test_iter_messages_pages_through_export(
+        self, manager: PersistentConversationManager
+    ) -> None:
+        """Test iter_messages yields every message across pages."""
+        conv = manager.get_or_create("user123", "feishu")
+        for i in range(7):
+            manager.save_message(conv.id, "user", f"Message {i}")
+
+        messages = list(manager.iter_messages(conv.id, page_size=3))
+
+        assert [m["content"] for m in messages] == [f"Message {i}" for i in range(7)]
+
+
 class TestConversationStoreThreadSafety:
     """Test thread safety of conversation store."""
 
@@ -0,0 +1,133 @@
+"""Tests for the content-addressed response cache."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from feishu_webhook_bot.ai.response_cache import (
+    ResponseCache,
+    make_cache_key,
+    normalize_prompt,
+)
+
+
+class TestCacheKey:
+    """Tests for cache key construction."""
+
+    def test_normalize_prompt(self) -> None:
+        """Test insignificant whitespace is normalized but line breaks are kept."""
+        assert normalize_prompt("  Summarize\t this \r\n  article  \n") == (
+            "Summarize this\narticle"
+        )
+
+    def test_key_covers_request_inputs(self) -> None:
+        """Test every input that changes the answer changes the key."""
+        base = make_cache_key("openai:gpt-4o", "sys", "Hello  world", ["b", "a"])
+
+        assert base == make_cache_key("openai:gpt-4o", "sys", "Hello world ", ["a", "b"])
+        assert base != make_cache_key("openai:gpt-4o-mini", "sys", "Hello world", ["a", "b"])
+        assert base != make_cache_key("openai:gpt-4o", "other", "Hello world", ["a", "b"])
+        assert base != make_cache_key("openai:gpt-4o", "sys", "Hello world", ["a"])
+        assert base != make_cache_key(
+            "openai:gpt-4o", "sys", "Hello world", ["a", "b"], {"temperature": 0.2}
+        )
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    @pytest.mark.anyio
+    async def test_ttl_expiry(self) -> None:
+        """Test entries expire after the TTL."""
+        cache = ResponseCache(ttl_seconds=10)
+        with patch("feishu_webhook_bot.core.ttl_cache.time.time", return_value=1000.0):
+            cache.set("k", "v")
+            assert await cache.get("k") == "v"
+        with patch("feishu_webhook_bot.core.ttl_cache.time.time", return_value=1010.0):
+            assert await cache.get("k") is None
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["expired"] == 1
+
+    @pytest.mark.anyio
+    async def test_lru_eviction(self) -> None:
+        """Test the least recently used entry is evicted when full."""
+        cache = ResponseCache(max_entries=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        assert await cache.get("a") == "1"
+        cache.set("c", "3")
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == "1"
+        assert len(cache) == 2
+        assert cache.get_stats()["evictions"] == 1
+
+    @pytest.mark.anyio
+    async def test_concurrent_misses_share_one_computation(self) -> None:
+        """Test identical in-flight requests wait for the first computation."""
+        cache = ResponseCache()
+        calls = 0
+
+        async def compute() -> str:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "answer"
+
+        results = await asyncio.gather(*(cache.get_or_compute("k", compute) for _ in range(3)))
+
+        assert results == ["answer"] * 3
+        assert calls == 1
+        assert cache.get_stats()["shared"] == 2
+
+    @pytest.mark.anyio
+    async def test_failures_are_not_cached(self) -> None:
+        """Test a failed computation is raised and retried on the next call."""
+        cache = ResponseCache()
+
+        async def fail() -> str:
+            raise RuntimeError("model down")
+
+        async def succeed() -> str:
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            await cache.get_or_compute("k", fail)
+
+        assert await cache.get_or_compute("k", succeed) == "ok"
+        assert await cache.get_or_compute("k", fail) == "ok"
+
+    @pytest.mark.anyio
+    async def test_sqlite_backing_survives_restart(self, tmp_path) -> None:
+        """Test responses are served from the database after a restart."""
+        db_path = tmp_path / "responses.db"
+        cache = ResponseCache(db_path=db_path)
+        cache.set("k", "persisted")
+        cache.close()
+
+        reopened = ResponseCache(db_path=db_path)
+        try:
+            assert await reopened.get("k") == "persisted"
+            assert await reopened.get("missing") is None
+            stats = reopened.get_stats()
+            assert stats["disk_hits"] == 1
+            assert stats["persistent"] is True
+
+            reopened.invalidate("k")
+            reopened.invalidate()
+            assert await reopened.get("k") is None
+        finally:
+            reopened.close()
+
+    def test_invalid_arguments(self) -> None:
+        """Test invalid limits are rejected."""
+        with pytest.raises(ValueError):
+            ResponseCache(ttl_seconds=0)
+        with pytest.raises(ValueError):
+            ResponseCache(max_entries=0)
@@ -242,6 +242,7 @@ class TestAITaskExecutorExecution:
         mock_action.ai_prompt = "Test prompt"
         mock_action.ai_user_id = None
         mock_action.ai_structured_output = False
+        mock_action.ai_cache_response = False
         mock_action.ai_save_response_as = None
         mock_action.ai_system_prompt = None
         mock_action.ai_temperature = None
@@ -263,6 +264,7 @@ class TestAITaskExecutorExecution:
         mock_action.ai_prompt = "Test"
         mock_action.ai_user_id = "custom_user"
         mock_action.ai_structured_output = False
+        mock_action.ai_cache_response = False
         mock_action.ai_save_response_as = None
         mock_action.ai_system_prompt = None
         mock_action.ai_temperature = None
@@ -283,6 +285,7 @@ class TestAITaskExecutorExecution:
         mock_action.ai_prompt = "Test"
         mock_action.ai_user_id = None
         mock_action.ai_structured_output = False
+        mock_action.ai_cache_response = False
         mock_action.ai_save_response_as = None
         mock_action.ai_system_prompt = None
         mock_action.ai_temperature = None
@@ -303,6 +306,7 @@ class TestAITaskExecutorExecution:
         mock_action.ai_prompt = "Test"
         mock_action.ai_user_id = None
         mock_action.ai_structured_output = False
+        mock_action.ai_cache_response = False
         mock_action.ai_save_response_as = "ai_result"
         mock_action.ai_system_prompt = None
         mock_action.ai_temperature = None
@@ -324,6 +328,7 @@ class TestAITaskExecutorExecution:
         mock_action.ai_prompt = "Hello ${name}, summarize ${topic}"
         mock_action.ai_user_id = None
         mock_action.ai_structured_output = False
+        mock_action.ai_cache_response = False
         mock_action.ai_save_response_as = None
         mock_action.ai_system_prompt = None
         mock_action.ai_temperature = None
@@ -350,6 +355,7 @@ class TestAITaskExecutorExecution:
         mock_action.ai_prompt = "Test"
         mock_action.ai_user_id = None
         mock_action.ai_structured_output = False
+        mock_action.ai_cache_response = False
         mock_action.ai_save_response_as = None
         mock_action.ai_system_prompt = None
         mock_action.ai_temperature = None
@@ -386,6 +392,7 @@ class TestAITaskExecutorStructuredOutput:
         mock_action.ai_prompt = "Test"
         mock_action.ai_user_id = None
         mock_action.ai_structured_output = True
+        mock_action.ai_cache_response = False
         mock_action.ai_save_response_as = None
         mock_action.ai_system_prompt = None
         mock_action.ai_temperature = None
@@ -410,6 +417,7 @@ class TestAITaskExecutorStructuredOutput:
         mock_action.ai_prompt = "Test"
         mock_action.ai_user_id = None
         mock_action.ai_structured_output = True
+        mock_action.ai_cache_response = False
         mock_action.ai_save_response_as = None
         mock_action.ai_system_prompt = None
         mock_action.ai_temperature = None
@@ -420,6 +428,32 @@ class TestAITaskExecutorStructuredOutput:
         assert result.success is True
         assert result.response == "Plain string response"
 
+    @pytest.mark.anyio
+    async def test_execute_cached_response(self):
+        """Test cacheable actions run as one-shot completions."""
+        mock_agent = MagicMock()
+        mock_agent.chat = AsyncMock(return_value="Chat response")
+        mock_agent.complete = AsyncMock(return_value="Cached response")
+        executor = AITaskExecutor(ai_agent=mock_agent)
+
+        mock_action = MagicMock()
+        mock_action.ai_prompt = "Daily digest for ${date}"
+        mock_action.ai_user_id = None
+        mock_action.ai_structured_output = False
+        mock_action.ai_cache_response = True
+        mock_action.ai_save_response_as = None
+        mock_action.ai_system_prompt = "Be brief"
+        mock_action.ai_temperature = None
+        mock_action.ai_max_tokens = None
+
+        result = await executor.execute_ai_action(mock_action, {"date": "2025-01-01"})
+
+        assert result.response == "Cached response"
+        mock_agent.complete.assert_awaited_once_with(
+            "Daily digest for 2025-01-01", system_prompt="Be brief"
+        )
+        mock_agent.chat.assert_not_called()
+
 
 # ==============================================================================
 # AITaskExecutor Config Override Tests
@@ -523,6 +557,7 @@ class TestExecuteAITaskAction:
         mock_action.ai_prompt = "Test"
         mock_action.ai_user_id = None
         mock_action.ai_structured_output = False
+        mock_action.ai_cache_response = False
         mock_action.ai_save_response_as = None
         mock_action.ai_system_prompt = None
         mock_action.ai_temperature = None
@@ -14,7 +14,7 @@ Tests cover:
 from __future__ import annotations
 
 import json
-from datetime import datetime, timedelta
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -85,8 +85,9 @@ class TestSearchCache:
         """Test SearchCache creation."""
         cache = SearchCache(ttl_minutes=30, max_size=50)
 
-        assert cache._max_size == 50
-        assert cache._ttl == timedelta(minutes=30)
+        stats = cache.get_stats()
+        assert stats["max_size"] == 50
+        assert stats["ttl_minutes"] == 30
 
     def test_cache_set_and_get(self):
         """Test setting and getting cache values."""
@@ -136,12 +137,12 @@ class TestSearchCache:
         cache.clear()
 
         # After clear, cache is empty and stats are reset
-        assert len(cache._cache) == 0
-        assert cache._hits == 0
+        assert len(cache) == 0
+        assert cache.get_stats()["hits"] == 0
         # Note: get() after clear will increment misses
         result = cache.get("test", 5)
         assert result is None
-        assert cache._misses == 1  # One miss from the get() call
+        assert cache.get_stats()["misses"] == 1  # One miss from the get() call
 
     def test_cache_stats(self):
         """Test cache statistics."""
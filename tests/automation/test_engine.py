@@ -21,8 +21,10 @@ from unittest.mock import Mock, patch
 import pytest
 
 from feishu_webhook_bot.automation.engine import AutomationEngine
+from feishu_webhook_bot.automation.rule_index import CompiledCondition
 from feishu_webhook_bot.core.config import (
     AutomationActionConfig,
+    AutomationEventFilterCondition,
     AutomationEventTriggerConfig,
     AutomationRule,
     AutomationScheduleConfig,
@@ -501,6 +503,76 @@ class TestEventHandling:
 
         send_text_func.assert_not_called()
 
+    def test_handle_event_indexes_rules_without_event_type(self, engine, send_text_func):
+        """Test rules keyed on an equality condition only fire for that value."""
+        rule = AutomationRule(
+            name="chat-rule",
+            trigger=AutomationTriggerConfig(
+                type="event",
+                event=AutomationEventTriggerConfig(
+                    conditions=[{"path": "event.message.chat_id", "equals": "oc_1"}]
+                ),
+            ),
+            actions=[AutomationActionConfig(type="send_text", text="Hi")],
+            default_webhooks=["default"],
+        )
+        engine.add_rule(rule)
+
+        engine.handle_event({"event": {"message": {"chat_id": "oc_2"}}})
+        send_text_func.assert_not_called()
+
+        engine.handle_event({"event": {"message": {"chat_id": "oc_1"}}})
+        send_text_func.assert_called_once()
+
+    def test_handle_event_uses_envelope_event_type(self, engine, event_rule, send_text_func):
+        """Test the envelope's event type is used to look up rules."""
+        engine.add_rule(event_rule)
+        envelope = Mock(event_type="im.message.receive_v1")
+
+        engine.handle_event({}, envelope=envelope)
+
+        send_text_func.assert_called_once()
+
+    def test_handle_event_respects_runtime_disable(self, engine, event_rule, send_text_func):
+        """Test disabling a rule takes effect without reloading the index."""
+        engine.add_rule(event_rule)
+        engine.disable_rule("event-rule")
+
+        engine.handle_event({"header": {"event_type": "im.message.receive_v1"}})
+
+        send_text_func.assert_not_called()
+
+    def test_remove_rule(self, engine, event_rule, send_text_func):
+        """Test removed rules no longer receive events."""
+        engine.add_rule(event_rule)
+
+        assert engine.remove_rule("event-rule") is True
+        assert engine.remove_rule("event-rule") is False
+        engine.handle_event({"header": {"event_type": "im.message.receive_v1"}})
+
+        send_text_func.assert_not_called()
+
+    def test_reload_rules_recompiles_edited_trigger(self, engine, event_rule, send_text_func):
+        """Test reload_rules picks up a trigger edited in place."""
+        engine.add_rule(event_rule)
+        event_rule.trigger.event.event_type = "im.chat.updated_v1"
+
+        engine.reload_rules()
+        engine.handle_event({"header": {"event_type": "im.message.receive_v1"}})
+        send_text_func.assert_not_called()
+
+        engine.handle_event({"header": {"event_type": "im.chat.updated_v1"}})
+        send_text_func.assert_called_once()
+
+    def test_add_rule_registers_schedule(self, engine, simple_rule, mock_scheduler):
+        """Test add_rule registers schedule-triggered rules with the scheduler."""
+        rule = simple_rule.model_copy(update={"name": "added-rule"})
+
+        engine.add_rule(rule)
+
+        mock_scheduler.add_job.assert_called_once()
+        assert engine.get_rule("added-rule") is rule
+
 
 # ==============================================================================
 # Action Execution Tests
@@ -683,7 +755,7 @@ class TestActionExecution:
 class TestHTTPRequestAction:
     """Tests for HTTP request actions."""
 
-    @patch("httpx.Client")
+    @patch("feishu_webhook_bot.automation.engine.get_http_pool")
     def test_http_request_action(
         self,
         mock_httpx_client,
@@ -702,9 +774,7 @@ class TestHTTPRequestAction:
 
         mock_client_instance = Mock()
         mock_client_instance.request.return_value = mock_response
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=None)
-        mock_httpx_client.return_value = mock_client_instance
+        mock_httpx_client.return_value.sync_client.return_value = mock_client_instance
 
         rule = AutomationRule(
             name="http-rule",
@@ -736,7 +806,7 @@ class TestHTTPRequestAction:
 
         mock_client_instance.request.assert_called_once()
 
-    @patch("httpx.Client")
+    @patch("feishu_webhook_bot.automation.engine.get_http_pool")
     def test_http_request_saves_response(
         self,
         mock_httpx_client,
@@ -755,9 +825,7 @@ class TestHTTPRequestAction:
 
         mock_client_instance = Mock()
         mock_client_instance.request.return_value = mock_response
-        mock_client_instance.__enter__ = Mock(return_value=mock_client_instance)
-        mock_client_instance.__exit__ = Mock(return_value=None)
-        mock_httpx_client.return_value = mock_client_instance
+        mock_httpx_client.return_value.sync_client.return_value = mock_client_instance
 
         rule = AutomationRule(
             name="http-save-rule",
@@ -856,66 +924,61 @@ class TestConditionMatching:
         result = engine._extract(payload, "missing.path")
         assert result is None
 
-    def test_conditions_match_equals(self, engine):
-        """Test _conditions_match with equals condition."""
-
-        class MockCondition:
-            path = "status"
-            equals = "active"
-            contains = None
-
-        conditions = [MockCondition()]
-        payload = {"status": "active"}
-
-        result = engine._conditions_match(conditions, payload)
-        assert result is True
-
-    def test_conditions_match_equals_fail(self, engine):
-        """Test _conditions_match fails with non-matching equals."""
-
-        class MockCondition:
-            path = "status"
-            equals = "active"
-            contains = None
-
-        conditions = [MockCondition()]
-        payload = {"status": "inactive"}
-
-        result = engine._conditions_match(conditions, payload)
-        assert result is False
-
-    def test_conditions_match_contains(self, engine):
-        """Test _conditions_match with contains condition."""
-
-        class MockCondition:
-            path = "message"
-            equals = None
-            contains = "hello"
-
-        conditions = [MockCondition()]
+    @staticmethod
+    def _triggers(engine, send_text_func, conditions, payload) -> bool:
+        """Load one event rule with the given filters and report whether it fired."""
+        rule = AutomationRule(
+            name="filtered-rule",
+            enabled=True,
+            trigger=create_event_trigger("test.event", conditions),
+            actions=[AutomationActionConfig(type="send_text", text="Matched")],
+            default_webhooks=["default"],
+        )
+        engine.reload_rules([rule])
+        engine.handle_event({"header": {"event_type": "test.event"}, **payload})
+        return send_text_func.called
+
+    def test_conditions_match_equals(self, engine, send_text_func):
+        """Test an equals filter lets a matching event through."""
+        conditions = [AutomationEventFilterCondition(path="status", equals="active")]
+        assert self._triggers(engine, send_text_func, conditions, {"status": "active"}) is True
+
+    def test_conditions_match_equals_fail(self, engine, send_text_func):
+        """Test an equals filter rejects a different value."""
+        conditions = [AutomationEventFilterCondition(path="status", equals="active")]
+        assert self._triggers(engine, send_text_func, conditions, {"status": "inactive"}) is False
+
+    def test_conditions_match_contains(self, engine, send_text_func):
+        """Test a contains filter matches a substring."""
+        conditions = [AutomationEventFilterCondition(path="message", contains="hello")]
         payload = {"message": "say hello world"}
+        assert self._triggers(engine, send_text_func, conditions, payload) is True
 
-        result = engine._conditions_match(conditions, payload)
-        assert result is True
-
-    def test_conditions_match_contains_fail(self, engine):
-        """Test _conditions_match fails with non-matching contains."""
-
-        class MockCondition:
-            path = "message"
-            equals = None
-            contains = "hello"
-
-        conditions = [MockCondition()]
+    def test_conditions_match_contains_fail(self, engine, send_text_func):
+        """Test a contains filter rejects text without the substring."""
+        conditions = [AutomationEventFilterCondition(path="message", contains="hello")]
         payload = {"message": "goodbye world"}
+        assert self._triggers(engine, send_text_func, conditions, payload) is False
 
-        result = engine._conditions_match(conditions, payload)
-        assert result is False
+    def test_conditions_match_empty(self, engine, send_text_func):
+        """Test a rule without filters matches on event type alone."""
+        assert self._triggers(engine, send_text_func, [], {"any": "data"}) is True
+
+    def test_compile_filter_condition(self):
+        """Test from_filter keeps equals and contains of the filter model."""
+        equals = CompiledCondition.from_filter(
+            AutomationEventFilterCondition(path="event.chat_id", equals="oc_1")
+        )
+        contains = CompiledCondition.from_filter(
+            AutomationEventFilterCondition(path="event.text", contains="ping")
+        )
 
-    def test_conditions_match_empty(self, engine):
-        """Test _conditions_match with empty conditions."""
-        result = engine._conditions_match([], {"any": "data"})
-        assert result is True
+        assert equals.indexable is True
+        assert equals.matches({"event": {"chat_id": "oc_1"}}) is True
+        assert equals.matches({"event": {"chat_id": "oc_2"}}) is False
+        assert contains.indexable is False
+        assert contains.matches({"event": {"text": "ping pong"}}) is True
+        assert contains.matches({"event": {"text": 42}}) is False
 
 
 # ==============================================================================
@@ -0,0 +1,172 @@
+"""Tests for the compiled automation rule index."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from feishu_webhook_bot.automation.rule_index import (
+    CompiledCondition,
+    RuleIndex,
+    extract_path,
+    split_path,
+)
+from feishu_webhook_bot.automation.triggers import EventTrigger
+
+
+class TestCompiledCondition:
+    """Tests for CompiledCondition."""
+
+    def test_extract_path(self) -> None:
+        """Test extracting values with a pre-split path."""
+        payload = {"event": {"message": {"chat_id": "oc_1"}}, "text": "x"}
+        assert extract_path(payload, split_path("event.message.chat_id")) == "oc_1"
+        assert extract_path(payload, split_path("event.missing.chat_id")) is None
+        assert extract_path(payload, split_path("text.length")) is None
+
+    @pytest.mark.parametrize(
+        ("condition", "payload", "expected"),
+        [
+            ({"path": "a", "equals": 1}, {"a": 1}, True),
+            ({"path": "a", "equals": None}, {}, True),
+            ({"path": "a", "contains": "ell"}, {"a": "hello"}, True),
+            ({"path": "a", "contains": "ell"}, {"a": 5}, False),
+            ({"path": "a", "regex": r"^\d+$"}, {"a": "123"}, True),
+            ({"path": "a", "regex": r"^\d+$"}, {"a": "12a"}, False),
+            ({"path": "a", "regex": "("}, {"a": "("}, False),
+            ({"path": "a", "exists": False}, {}, True),
+            ({"path": "a", "greater_than": 5, "less_than": 10}, {"a": "7"}, True),
+            ({"path": "a", "greater_than": 5}, {"a": "n/a"}, False),
+            ({"path": "a", "in_list": ["x", "y"]}, {"a": "y"}, True),
+            ({"path": "a", "in_list": ["x", "y"]}, {"a": {"un": "hashable"}}, False),
+        ],
+    )
+    def test_matches_same_as_event_trigger(self, condition, payload, expected) -> None:
+        """Test compiled conditions agree with the documented trigger operators."""
+        assert CompiledCondition.from_mapping(condition).matches(payload) is expected
+
+    def test_event_trigger_compiles_conditions_once(self) -> None:
+        """Test EventTrigger precompiles its regex conditions."""
+        trigger = EventTrigger(
+            "rule", {"conditions": [{"path": "text", "regex": "^hi"}]}, lambda ctx: None
+        )
+
+        assert trigger.compiled_conditions[0].regex is not None
+        assert trigger.matches({"text": "hi all"})
+        assert not trigger.matches({"text": "oh hi"})
+
+
+class TestRuleIndex:
+    """Tests for RuleIndex."""
+
+    def test_only_candidate_buckets_are_evaluated(self) -> None:
+        """Test events only visit rules keyed on their type or equality values."""
+        index: RuleIndex[str] = RuleIndex()
+        index.add("typed", "im.message.receive_v1")
+        index.add("other-type", "im.chat.updated_v1")
+        index.add("keyed", None, [CompiledCondition.from_mapping({"path": "chat", "equals": 1})])
+        index.add("any", None, [CompiledCondition.from_mapping({"path": "text", "contains": "a"})])
+
+        candidates = [e.rule for e in index.candidates({"chat": 2}, "im.message.receive_v1")]
+
+        assert candidates == ["typed", "any"]
+
+    def test_match_preserves_insertion_order(self) -> None:
+        """Test matches come back in the order rules were added."""
+        index: RuleIndex[str] = RuleIndex()
+        chat = CompiledCondition.from_mapping({"path": "chat", "equals": "c1"})
+        index.add("first", None, [chat])
+        index.add("second", "t")
+        index.add("third", None)
+        index.add("fourth", None, [chat])
+
+        assert index.match({"chat": "c1"}, "t") == ["first", "second", "third", "fourth"]
+        assert len(index) == 4
+
+    def test_unhashable_values_are_not_indexed(self) -> None:
+        """Test unhashable equality operands and payload values fall back safely."""
+        index: RuleIndex[str] = RuleIndex()
+        index.add("list", None, [CompiledCondition.from_mapping({"path": "a", "equals": [1]})])
+        index.add("scalar", None, [CompiledCondition.from_mapping({"path": "b", "equals": 1})])
+
+        assert index.match({"a": [1], "b": {"x": 1}}) == ["list"]
+        assert index.match({"a": [2], "b": 1}, event_type=["unhashable"]) == ["scalar"]
+
+    def test_remaining_conditions_are_checked(self) -> None:
+        """Test indexed rules still evaluate all of their conditions."""
+        index: RuleIndex[str] = RuleIndex()
+        index.add(
+            "rule",
+            None,
+            [
+                CompiledCondition.from_mapping({"path": "chat", "equals": "c1"}),
+                CompiledCondition.from_mapping({"path": "text", "regex": "^/help"}),
+            ],
+        )
+
+        assert index.match({"chat": "c1", "text": "/help me"}) == ["rule"]
+        assert index.match({"chat": "c1", "text": "help"}) == []
+
+
+def _linear_scan(triggers: list[EventTrigger], payload: dict) -> list[str]:
+    """Reference dispatch: evaluate every trigger the way the registry used to."""
+    matched = []
+    for trigger in triggers:
+        if trigger.event_type:
+            event_type = trigger._extract(payload, "header.event_type")
+            if event_type != trigger.event_type:
+                continue
+        if all(trigger._check_condition(c, payload) for c in trigger.conditions):
+            matched.append(trigger.rule_name)
+    return matched
+
+
+@pytest.mark.slow
+def test_benchmark_indexed_dispatch_vs_linear_scan() -> None:
+    """Microbenchmark: 400 rules, indexed dispatch against a full linear scan."""
+    triggers = []
+    for i in range(400):
+        if i % 2:
+            config = {
+                "event_type": f"custom.event_{i % 50}",
+                "conditions": [{"path": "event.message.content", "regex": rf"^/cmd{i}\b"}],
+            }
+        else:
+            config = {
+                "conditions": [
+                    {"path": "event.message.chat_id", "equals": f"oc_{i}"},
+                    {"path": "event.message.content", "contains": "deploy"},
+                ]
+            }
+        triggers.append(EventTrigger(f"rule-{i}", config, lambda ctx: None))
+
+    index: RuleIndex[EventTrigger] = RuleIndex()
+    for trigger in triggers:
+        index.add(trigger, trigger.event_type, trigger.compiled_conditions)
+
+    payload = {
+        "header": {"event_type": "custom.event_7"},
+        "event": {"message": {"chat_id": "oc_42", "content": "/cmd7 deploy now"}},
+    }
+    event_type = payload["header"]["event_type"]
+    expected = _linear_scan(triggers, payload)
+    assert [t.rule_name for t in index.match(payload, event_type)] == expected
+    assert len(list(index.candidates(payload, event_type))) < 10
+
+    rounds = 500
+    start = time.perf_counter()
+    for _ in range(rounds):
+        _linear_scan(triggers, payload)
+    linear = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        index.match(payload, event_type)
+    indexed = time.perf_counter() - start
+
+    print(
+        f"\n400 rules x {rounds} events: linear {linear * 1e6 / rounds:.1f} us/event, "
+        f"indexed {indexed * 1e6 / rounds:.1f} us/event ({linear / indexed:.0f}x)"
+    )
+    assert indexed < linear
@@ -321,3 +321,38 @@ class TestTriggerRegistry:
         triggered = registry.handle_event({"type": "test.event"})
         # Result depends on event matching logic
         assert isinstance(triggered, list)
+
+    def test_handle_event_dispatches_matching_triggers_in_order(self) -> None:
+        """Test only matching event triggers fire, in registration order."""
+        registry = TriggerRegistry()
+        callback = MagicMock()
+        registry.register(
+            "typed", {"type": "event", "event": {"event_type": "test.event"}}, callback
+        )
+        registry.register(
+            "keyed",
+            {"type": "event", "event": {"conditions": [{"path": "chat", "equals": "c1"}]}},
+            callback,
+        )
+        registry.register(
+            "regex",
+            {"type": "event", "event": {"conditions": [{"path": "text", "regex": "^hi"}]}},
+            callback,
+        )
+
+        payload = {"header": {"event_type": "test.event"}, "chat": "c1", "text": "hi there"}
+        assert registry.handle_event(payload) == ["typed", "keyed", "regex"]
+        assert registry.handle_event({"chat": "c2", "text": "bye"}) == []
+        assert callback.call_count == 3
+
+    def test_unregister_removes_event_trigger_from_index(self) -> None:
+        """Test unregistered event triggers no longer receive events."""
+        registry = TriggerRegistry()
+        callback = MagicMock()
+        registry.register(
+            "event_rule", {"type": "event", "event": {"event_type": "test.event"}}, callback
+        )
+
+        assert registry.unregister("event_rule") is True
+        assert registry.handle_event({"header": {"event_type": "test.event"}}) == []
+        callback.assert_not_called()
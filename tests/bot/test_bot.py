@@ -60,7 +60,9 @@ def test_bot_initialization(simple_config, mock_dependencies):
 
     # Verify client pooling
     assert "default" in bot.clients
-    mock_dependencies["client_class"].assert_called_once_with(simple_config.webhooks[0])
+    mock_dependencies["client_class"].assert_called_once_with(
+        simple_config.webhooks[0], http_client=bot.http_pool.sync_client()
+    )
     assert bot.client == bot.clients["default"]
 
     # Verify scheduler initialization
@@ -223,6 +225,51 @@ def test_handle_incoming_event_with_ai_chat(simple_config, mock_dependencies, mo
     mock_create_task.assert_called_once()
 
 
+def test_schedule_coroutine_from_handler_thread(simple_config, mock_dependencies):
+    """Test event follow-ups run on the event server loop when called off-loop."""
+    import threading
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        bot = FeishuBot(simple_config)
+        bot.event_server = MagicMock(loop=loop)
+
+        async def follow_up() -> threading.Thread:
+            return threading.current_thread()
+
+        future = bot._schedule_coroutine(follow_up())
+        assert future.result(timeout=2) is thread
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=2)
+        loop.close()
+
+
+def test_schedule_coroutine_on_provider_loop(simple_config, mock_dependencies):
+    """Test follow-ups use a provider's event loop when there is no event server."""
+    import threading
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        bot = FeishuBot(simple_config)
+        bot.event_server = None
+        bot.providers = {"qq": MagicMock(event_loop=loop)}
+
+        async def follow_up() -> threading.Thread:
+            return threading.current_thread()
+
+        future = bot._schedule_coroutine(follow_up())
+        assert future.result(timeout=2) is thread
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=2)
+        loop.close()
+
+
 def test_handle_incoming_event_with_plugin_manager(simple_config, mock_dependencies):
     """Test that incoming events are dispatched to plugin manager."""
     bot = FeishuBot(simple_config)
@@ -231,9 +278,11 @@ def test_handle_incoming_event_with_plugin_manager(simple_config, mock_dependenc
 
     bot._handle_incoming_event(payload)
 
-    mock_dependencies["plugin_manager_instance"].dispatch_event.assert_called_once_with(
-        payload, context={}
-    )
+    dispatch_event = mock_dependencies["plugin_manager_instance"].dispatch_event
+    dispatch_event.assert_called_once()
+    args, kwargs = dispatch_event.call_args
+    assert args == (payload,)
+    assert kwargs["context"]["envelope"].payload is payload
 
 
 def test_handle_incoming_event_with_automation_engine(simple_config, mock_dependencies, mocker):
@@ -251,7 +300,38 @@ def test_handle_incoming_event_with_automation_engine(simple_config, mock_depend
 
     bot._handle_incoming_event(payload)
 
-    mock_automation_engine.handle_event.assert_called_once_with(payload)
+    mock_automation_engine.handle_event.assert_called_once()
+    args, kwargs = mock_automation_engine.handle_event.call_args
+    assert args == (payload,)
+    assert kwargs["envelope"].event_type == "test_event"
+
+
+def test_handle_incoming_event_parses_message_once(simple_config, mock_dependencies, mocker):
+    """Test chat controller and bridge share one parsed IncomingMessage."""
+    mocker.patch("asyncio.create_task")
+    bot = FeishuBot(simple_config)
+    bot.chat_controller = MagicMock()
+    bot.message_bridge = MagicMock()
+    bot.message_bridge.is_running.return_value = True
+    parse = mocker.spy(bot, "_parse_legacy_message")
+    feishu_parse = mocker.patch(
+        "feishu_webhook_bot.core.message_parsers.FeishuMessageParser.parse",
+        return_value=None,
+    )
+
+    payload = {
+        "type": "message",
+        "_provider": "feishu",
+        "event": {"message": {"text": "hi"}, "sender": {"sender_id": {"user_id": "u1"}}},
+    }
+    bot._handle_incoming_event(payload)
+
+    assert feishu_parse.call_count == 1
+    assert parse.call_count == 1
+    chat_message = bot.chat_controller.handle_incoming.call_args.args[0]
+    bridge_message = bot.message_bridge.handle_message.call_args.args[0]
+    assert chat_message is bridge_message
+    assert chat_message.content == "hi"
 
 
 def test_is_chat_message_with_type_message(simple_config, mock_dependencies):
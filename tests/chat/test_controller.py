@@ -9,7 +9,8 @@ import pytest
 from feishu_webhook_bot.ai.commands import CommandResult
 from feishu_webhook_bot.chat.controller import ChatConfig, ChatController
 from feishu_webhook_bot.core.message_handler import IncomingMessage
-from feishu_webhook_bot.core.provider import SendResult
+from feishu_webhook_bot.core.provider import AsyncBaseProvider, SendResult
+from tests.mocks import FakeFeishuAPI
 
 
 class StubProvider:
@@ -51,6 +52,11 @@ class StubAIAgent:
         self.calls.append((user_key, content))
         return self.reply
 
+    async def chat_stream(self, user_key: str, content: str):
+        self.calls.append((user_key, content))
+        for word in self.reply.split(" "):
+            yield word + " "
+
 
 @pytest.mark.anyio
 async def test_middleware_can_stop_processing():
@@ -159,3 +165,159 @@ def test_conversation_store_injected_into_components():
     assert controller.conversation_store is store
     assert ai_agent.conversation_store is store
     assert handler.conversation_store is store
+
+
+@pytest.mark.anyio
+async def test_streamed_reply_updates_feishu_card():
+    provider = StubProvider()
+    api = FakeFeishuAPI()
+    ai_agent = StubAIAgent(reply="streamed answer")
+    controller = ChatController(
+        ai_agent=ai_agent,
+        providers={"feishu": provider},
+        config=ChatConfig(stream_replies=True),
+        feishu_api=api,
+    )
+
+    message = IncomingMessage(
+        id="om_1",
+        platform="feishu",
+        chat_type="private",
+        chat_id="oc_1",
+        sender_id="u3",
+        sender_name="User",
+        content="hello",
+    )
+
+    await controller.handle_incoming(message)
+
+    assert api.sent == [("reply", "om_1")]
+    assert api.updates[-1] == "streamed answer "
+    assert provider.sent == []
+
+
+@pytest.mark.anyio
+async def test_stream_start_failure_falls_back_to_normal_reply():
+    provider = StubProvider()
+    api = FakeFeishuAPI()
+    api.connect = AsyncMock(side_effect=RuntimeError("token fetch failed"))
+    ai_agent = StubAIAgent(reply="plain answer")
+    controller = ChatController(
+        ai_agent=ai_agent,
+        providers={"feishu": provider},
+        config=ChatConfig(stream_replies=True),
+        feishu_api=api,
+    )
+
+    message = IncomingMessage(
+        id="om_2",
+        platform="feishu",
+        chat_type="private",
+        chat_id="oc_1",
+        sender_id="u5",
+        sender_name="User",
+        content="hello",
+    )
+
+    await controller.handle_incoming(message)
+
+    assert api.sent == []
+    assert provider.sent == [("plain answer", "oc_1")]
+
+
+@pytest.mark.anyio
+async def test_streamed_reply_sent_to_qq_in_sentences():
+    provider = StubProvider()
+    ai_agent = StubAIAgent(reply="First sentence here. Second one follows.")
+    controller = ChatController(
+        ai_agent=ai_agent,
+        providers={"qq": provider},
+        config=ChatConfig(stream_replies=True, stream_chunk_chars=5),
+    )
+
+    message = IncomingMessage(
+        id="42",
+        platform="qq",
+        chat_type="group",
+        chat_id="1001",
+        sender_id="2002",
+        sender_name="User",
+        content="hello",
+        is_at_bot=True,
+    )
+
+    await controller.handle_incoming(message)
+
+    assert provider.sent == [
+        ("First sentence here.", "group:1001"),
+        ("Second one follows.", "group:1001"),
+    ]
+
+
+@pytest.mark.anyio
+async def test_streaming_without_feishu_api_sends_complete_reply():
+    provider = StubProvider()
+    ai_agent = StubAIAgent(reply="whole reply")
+    controller = ChatController(
+        ai_agent=ai_agent,
+        providers={"feishu": provider},
+        config=ChatConfig(stream_replies=True),
+    )
+
+    message = IncomingMessage(
+        id="",
+        platform="feishu",
+        chat_type="private",
+        chat_id="",
+        sender_id="u4",
+        sender_name="User",
+        content="hello",
+    )
+
+    await controller.handle_incoming(message)
+
+    assert provider.sent == [("whole reply", "u4")]
+
+
+class StubAsyncProvider(AsyncBaseProvider, StubProvider):
+    """Provider stub with a native async send path."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.async_sent: list[tuple[str, str]] = []
+
+    async def async_send_text(self, text: str, target: str) -> SendResult:
+        self.async_sent.append((text, target))
+        return SendResult.ok("msg_async")
+
+    async def async_send_card(self, card, target: str) -> SendResult:
+        return SendResult.fail("unsupported")
+
+    async def async_send_rich_text(self, title, content, target, language="zh_cn"):
+        return SendResult.fail("unsupported")
+
+    async def async_send_image(self, image_key: str, target: str) -> SendResult:
+        return SendResult.fail("unsupported")
+
+
+@pytest.mark.anyio
+async def test_reply_uses_native_async_provider():
+    provider = StubAsyncProvider()
+    controller = ChatController(providers={"feishu": provider})
+
+    message = IncomingMessage(
+        id="m1",
+        platform="feishu",
+        chat_type="group",
+        chat_id="oc_1",
+        sender_id="u4",
+        sender_name="User",
+        content="hello",
+    )
+
+    result = await controller.send_reply(message, "hi")
+    await controller.broadcast("news", platforms=["feishu"], targets={"feishu": ["oc_2"]})
+
+    assert result is not None and result.message_id == "msg_async"
+    assert provider.async_sent == [("hi", "oc_1"), ("news", "oc_2")]
+    assert provider.sent == []
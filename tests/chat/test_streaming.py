@@ -0,0 +1,117 @@
+"""Tests for progressive delivery of streamed AI replies."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+
+from feishu_webhook_bot.chat.streaming import ChunkedTextStream, FeishuCardStream
+from feishu_webhook_bot.core.message_handler import IncomingMessage
+from tests.mocks import FakeFeishuAPI
+
+
+def _message(**overrides) -> IncomingMessage:
+    fields = {
+        "id": "om_user",
+        "platform": "feishu",
+        "chat_type": "group",
+        "chat_id": "oc_1",
+        "sender_id": "ou_1",
+        "sender_name": "User",
+        "content": "hi",
+    }
+    fields.update(overrides)
+    return IncomingMessage(**fields)
+
+
+class TestFeishuCardStream:
+    """Tests for FeishuCardStream."""
+
+    @pytest.mark.anyio
+    async def test_updates_are_coalesced_by_interval(self) -> None:
+        """Test the card is patched at most once per interval and always finishes complete."""
+        api = FakeFeishuAPI()
+        stream = FeishuCardStream(api, _message(), update_interval=1.0)
+        clock = "feishu_webhook_bot.chat.streaming.time.monotonic"
+
+        with patch(clock, return_value=100.0):
+            await stream.start()
+        for now, text in [(100.2, "Hel"), (100.5, "Hello"), (101.1, "Hello wor"), (101.5, "x")]:
+            with patch(clock, return_value=now):
+                await stream.update(text)
+        with patch(clock, return_value=101.6):
+            assert await stream.finish("Hello world") is True
+
+        assert api.connected is True
+        assert api.sent == [("reply", "om_user")]
+        assert api.updates == ["Hello wor", "Hello world"]
+        assert stream.first_output_at == 100.0
+
+    @pytest.mark.anyio
+    async def test_falls_back_to_chat_when_reply_fails(self) -> None:
+        """Test the card is sent to the chat when replying is rejected."""
+        api = FakeFeishuAPI(reply_ok=False)
+        stream = FeishuCardStream(api, _message())
+
+        await stream.start()
+
+        assert api.sent == [("reply", "om_user"), ("send", "oc_1")]
+        assert stream.message_id == "om_card"
+
+    @pytest.mark.anyio
+    async def test_finish_reports_undelivered_reply(self) -> None:
+        """Test finish returns False when no card could be sent."""
+        api = FakeFeishuAPI(reply_ok=False)
+        stream = FeishuCardStream(api, _message(chat_id=""))
+
+        await stream.start()
+
+        assert await stream.finish("answer") is False
+        assert api.updates == []
+
+
+class TestChunkedTextStream:
+    """Tests for ChunkedTextStream."""
+
+    @pytest.mark.anyio
+    async def test_chunks_end_at_sentence_boundaries(self) -> None:
+        """Test chunks are sent as sentences complete, never splitting decimals."""
+        sent: list[str] = []
+
+        async def send(piece: str) -> None:
+            sent.append(piece)
+
+        stream = ChunkedTextStream(send, min_chars=10)
+        text = ""
+        tokens = ["Pi is about ", "3.14. It", " is irrational", "。下一句话", "没有结束"]
+        for token in tokens:
+            text += token
+            await stream.update(text)
+
+        assert sent == ["Pi is about 3.14.", "It is irrational。"]
+        assert await stream.finish(text) is True
+        assert sent[-1] == "下一句话没有结束"
+
+    @pytest.mark.anyio
+    async def test_long_text_without_sentence_end_is_split(self) -> None:
+        """Test text without sentence ends is split at spaces within max_chars."""
+        sent: list[str] = []
+
+        async def send(piece: str) -> None:
+            sent.append(piece)
+
+        stream = ChunkedTextStream(send, min_chars=5, max_chars=12)
+        await stream.finish("alpha beta gamma delta")
+
+        assert sent == ["alpha beta", "gamma delta"]
+        assert all(len(piece) <= 12 for piece in sent)
+
+    def test_invalid_limits(self) -> None:
+        """Test min_chars must not exceed max_chars."""
+
+        async def send(piece: str) -> None:
+            pass
+
+        with pytest.raises(ValueError):
+            ChunkedTextStream(send, min_chars=10, max_chars=5)
@@ -5,6 +5,10 @@ from pathlib import Path
 import httpx
 import pytest
 
+from feishu_webhook_bot.core.feishu_token import reset_token_service
+from feishu_webhook_bot.core.http_pool import close_http_pool
+from feishu_webhook_bot.core.image_cache import reset_image_key_cache
+
 
 # Configure anyio to only use asyncio backend (skip trio tests)
 @pytest.fixture(scope="session")
@@ -13,6 +17,24 @@ def anyio_backend():
     return "asyncio"
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_caches():
+    """Give every test empty tenant token and image key caches."""
+    reset_token_service()
+    reset_image_key_cache()
+    yield
+    reset_token_service()
+    reset_image_key_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_http_pool():
+    """Give every test a fresh global HTTP pool, so patched httpx clients take effect."""
+    close_http_pool()
+    yield
+    close_http_pool()
+
+
 if not hasattr(pytest, "httpx"):
 
     class _PytestHttpxNamespace:
@@ -2,15 +2,18 @@
 
 import time
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
 import yaml
 
-from feishu_webhook_bot.core.config import BotConfig
+from feishu_webhook_bot.automation.engine import AutomationEngine
+from feishu_webhook_bot.core.config import BotConfig, HTTPClientConfig
 from feishu_webhook_bot.core.config_watcher import (
     ConfigFileHandler,
     ConfigWatcher,
+    create_config_watcher,
 )
 
 
@@ -304,3 +307,38 @@ class TestIntegration:
 
         # Observer should be stopped
         assert not observer.is_alive()
+
+
+class TestBotReload:
+    """Test the reload callback built by create_config_watcher."""
+
+    def test_reload_recompiles_automation_rules(self, temp_config_file):
+        """Test that reloaded event rules fire and removed ones stop firing."""
+
+        def rule(name: str, event_type: str) -> dict:
+            return {
+                "name": name,
+                "trigger": {"type": "event", "event": {"event_type": event_type}},
+                "actions": [{"type": "send_text", "text": name}],
+            }
+
+        old_config = BotConfig(automations=[rule("old", "old.event")])
+        engine = AutomationEngine(
+            rules=old_config.automations,
+            scheduler=None,
+            clients={},
+            template_registry=None,
+            http_defaults=HTTPClientConfig(),
+            send_text=MagicMock(),
+            send_rendered=MagicMock(),
+        )
+        engine.execute_rule = MagicMock()
+        bot = SimpleNamespace(config=old_config, automation_engine=engine)
+        watcher = create_config_watcher(temp_config_file, bot)
+
+        watcher.reload_callback(BotConfig(automations=[rule("new", "new.event")]))
+        engine.handle_event({"header": {"event_type": "old.event"}})
+        engine.handle_event({"header": {"event_type": "new.event"}})
+
+        fired = [call.args[0].name for call in engine.execute_rule.call_args_list]
+        assert fired == ["new"]
@@ -0,0 +1,113 @@
+"""Tests for event deduplication."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from feishu_webhook_bot.core.event_dedup import EventDeduplicator, extract_event_key
+
+
+class TestExtractEventKey:
+    """Tests for extract_event_key."""
+
+    def test_feishu_v2_event_id(self):
+        payload = {"schema": "2.0", "header": {"event_id": "ev_1"}, "event": {}}
+        assert extract_event_key("feishu", payload) == "feishu:event:ev_1"
+
+    def test_feishu_v1_uuid(self):
+        assert extract_event_key("feishu", {"uuid": "u-1", "event": {}}) == "feishu:event:u-1"
+
+    def test_feishu_message_id_fallback(self):
+        payload = {"event": {"message": {"message_id": "om_1"}}}
+        assert extract_event_key("feishu", payload) == "feishu:msg:om_1"
+
+    def test_onebot_message_and_request(self):
+        message = {"post_type": "message", "self_id": 10, "message_id": 99}
+        request = {"post_type": "request", "self_id": 10, "flag": "abc"}
+        assert extract_event_key("napcat", message) == "napcat:10:msg:99"
+        assert extract_event_key("napcat", request) == "napcat:10:req:abc"
+
+    def test_events_without_id(self):
+        heartbeat = {"post_type": "meta_event", "meta_event_type": "heartbeat"}
+        assert extract_event_key("napcat", heartbeat) is None
+        assert extract_event_key("feishu", {"type": "message"}) is None
+
+
+class TestEventDeduplicator:
+    """Tests for EventDeduplicator."""
+
+    def test_check_and_add(self):
+        dedup = EventDeduplicator()
+        assert dedup.check_and_add("a") is False
+        assert dedup.check_and_add("a") is True
+        assert dedup.check_and_add("b") is False
+        assert dedup.get_stats()["duplicates"] == 1
+
+    def test_entries_expire_after_ttl(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        dedup = EventDeduplicator(ttl=10.0)
+        dedup.add("a")
+
+        now[0] += 5
+        assert dedup.contains("a")
+        now[0] += 6
+        assert not dedup.contains("a")
+
+        dedup.add("b")
+        assert len(dedup) == 1
+
+    def test_max_entries_evicts_oldest(self):
+        dedup = EventDeduplicator(max_entries=3)
+        for key in "abcd":
+            dedup.add(key)
+
+        assert len(dedup) == 3
+        assert not dedup.contains("a")
+        assert dedup.contains("d")
+        assert dedup.get_stats()["evicted"] == 1
+
+    def test_discard(self):
+        dedup = EventDeduplicator()
+        dedup.add("a")
+        dedup.discard("a")
+        assert not dedup.contains("a")
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            EventDeduplicator(ttl=0)
+        with pytest.raises(ValueError):
+            EventDeduplicator(max_entries=0)
+
+    def test_persistence_survives_restart(self, tmp_path):
+        db_path = tmp_path / "dedup.db"
+        dedup = EventDeduplicator(db_path=db_path)
+        dedup.add("a")
+        dedup.add("b")
+        dedup.discard("b")
+        dedup.close()
+
+        restored = EventDeduplicator(db_path=db_path)
+        try:
+            assert restored.contains("a")
+            assert not restored.contains("b")
+            assert restored.get_stats()["persistent"] is True
+        finally:
+            restored.close()
+
+    def test_persistence_skips_expired(self, tmp_path, monkeypatch):
+        db_path = tmp_path / "dedup.db"
+        now = [1000.0]
+        monkeypatch.setattr(time, "time", lambda: now[0])
+        dedup = EventDeduplicator(ttl=10.0, db_path=db_path)
+        dedup.add("old")
+        dedup.close()
+
+        now[0] += 60
+        restored = EventDeduplicator(ttl=10.0, db_path=db_path)
+        try:
+            assert len(restored) == 0
+        finally:
+            restored.close()
@@ -0,0 +1,105 @@
+"""Tests for the inbound event envelope."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from feishu_webhook_bot.core.event_envelope import EventEnvelope
+from feishu_webhook_bot.core.message_handler import IncomingMessage
+from feishu_webhook_bot.core.message_parsers import FeishuMessageParser, QQMessageParser
+
+FEISHU_PAYLOAD = {
+    "_provider": "feishu",
+    "schema": "2.0",
+    "header": {"event_id": "ev_1", "event_type": "im.message.receive_v1"},
+    "event": {
+        "sender": {"sender_id": {"open_id": "ou_1"}},
+        "message": {
+            "message_id": "om_1",
+            "chat_id": "oc_1",
+            "chat_type": "group",
+            "message_type": "text",
+            "content": '{"text": "hello"}',
+        },
+    },
+}
+
+QQ_PAYLOAD = {
+    "_provider": "napcat",
+    "post_type": "message",
+    "message_type": "group",
+    "self_id": 1,
+    "message_id": 7,
+    "group_id": 100,
+    "user_id": 200,
+    "message": "hi",
+    "sender": {"nickname": "Bob"},
+}
+
+
+class TestEventEnvelope:
+    """Tests for EventEnvelope."""
+
+    def test_feishu_fields(self):
+        envelope = EventEnvelope(FEISHU_PAYLOAD, parsers=[FeishuMessageParser()])
+
+        assert envelope.provider == "feishu"
+        assert envelope.event_type == "im.message.receive_v1"
+        assert envelope.is_chat_message
+        assert envelope.event_key == "feishu:event:ev_1"
+        assert envelope.message is not None
+        assert envelope.message.content == "hello"
+        assert envelope.user_key == "feishu:group:ou_1"
+
+    def test_qq_fields(self):
+        envelope = EventEnvelope(QQ_PAYLOAD, parsers=[QQMessageParser()])
+
+        assert envelope.event_type == "message.group"
+        assert envelope.is_chat_message
+        assert envelope.message is not None
+        assert envelope.message.platform == "qq"
+        assert envelope.chat_key is not None
+
+    def test_message_parsed_once(self):
+        parser = MagicMock()
+        parser.can_parse.return_value = True
+        parser.parse.return_value = MagicMock(spec=IncomingMessage)
+        envelope = EventEnvelope(FEISHU_PAYLOAD, parsers=[parser])
+
+        first = envelope.message
+        second = envelope.message
+
+        assert first is second
+        parser.parse.assert_called_once_with(FEISHU_PAYLOAD)
+
+    def test_message_not_parsed_until_needed(self):
+        parser = MagicMock()
+        envelope = EventEnvelope(FEISHU_PAYLOAD, parsers=[parser])
+
+        assert envelope.event_type == "im.message.receive_v1"
+        assert envelope.is_chat_message
+        parser.can_parse.assert_not_called()
+
+    def test_falls_back_to_parse_function(self):
+        failing = MagicMock()
+        failing.can_parse.return_value = True
+        failing.parse.side_effect = ValueError("bad payload")
+        fallback = MagicMock(return_value=None)
+
+        envelope = EventEnvelope({"type": "message"}, parsers=[failing], parse=fallback)
+
+        assert envelope.message is None
+        fallback.assert_called_once_with({"type": "message"})
+        assert envelope.user_key is None
+
+    def test_non_message_events(self):
+        heartbeat = EventEnvelope({"post_type": "meta_event", "meta_event_type": "heartbeat"})
+        notice = EventEnvelope({"post_type": "notice", "notice_type": "group_increase"})
+        custom = EventEnvelope({"type": "custom_event"}, provider="custom")
+
+        assert heartbeat.event_type == "meta_event.heartbeat"
+        assert notice.event_type == "notice.group_increase"
+        assert not notice.is_chat_message
+        assert custom.event_type == "custom_event"
+        assert custom.provider == "custom"
+        assert custom.message is None
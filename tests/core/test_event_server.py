@@ -4,7 +4,9 @@ import base64
 import hashlib
 import hmac
 import json
-from unittest.mock import MagicMock
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi.testclient import TestClient
@@ -21,15 +23,37 @@ def event_handler():
 
 @pytest.fixture
 def basic_config():
-    """Basic event server config."""
+    """Basic event server config with inline dispatch (handlers run within the request)."""
     return EventServerConfig(
         enabled=True,
         host="127.0.0.1",
         port=8000,
         feishu_path="/webhook",
+        ingress_workers=0,
     )
 
 
+@pytest.fixture
+def queued_config():
+    """Event server config using the queued ingress pipeline."""
+    return EventServerConfig(
+        enabled=True,
+        host="127.0.0.1",
+        port=8000,
+        feishu_path="/webhook",
+        ingress_workers=2,
+        ingress_queue_size=4,
+    )
+
+
+def _wait_until(predicate, timeout: float = 2.0) -> None:
+    """Poll until predicate() is true or fail after timeout."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
 @pytest.fixture
 def config_with_auth(basic_config):
     """Config with authentication."""
@@ -483,3 +507,199 @@ def test_qq_event_invalid_json(basic_config, event_handler):
     assert response.status_code == 400
     assert "Invalid JSON" in response.json()["detail"]
     event_handler.assert_not_called()
+
+
+# ==============================================================================
+# Queued ingress pipeline
+# ==============================================================================
+
+
+def test_queued_event_acknowledged_then_processed(queued_config, event_handler):
+    """Test events are acknowledged immediately and handled by a worker."""
+    server = EventServer(queued_config, event_handler)
+    payload = {"type": "message", "event": {"text": "Hello"}}
+
+    with TestClient(server._app) as client:
+        response = client.post("/webhook", json=payload)
+        assert response.status_code == 200
+        _wait_until(lambda: event_handler.call_count == 1)
+
+    event_handler.assert_called_once_with({**payload, "_provider": "feishu"})
+    stats = server.get_ingress_stats()
+    assert stats["accepted"] == 1
+    assert stats["processed"] == 1
+
+
+def test_queued_slow_handler_does_not_block_ack(queued_config):
+    """Test a slow synchronous handler runs off the event loop."""
+    release = threading.Event()
+    handled = []
+
+    def slow_handler(payload):
+        release.wait(timeout=5)
+        handled.append(payload)
+
+    server = EventServer(queued_config, slow_handler)
+
+    with TestClient(server._app) as client:
+        started = time.monotonic()
+        for i in range(3):
+            assert client.post("/webhook", json={"n": i}).status_code == 200
+        # Both workers are blocked in the handler, yet every callback was answered
+        assert time.monotonic() - started < 2.0
+        release.set()
+        _wait_until(lambda: len(handled) == 3)
+
+
+def test_queued_async_handlers_awaited(queued_config):
+    """Test coroutine handlers are awaited on the server loop."""
+    handler = AsyncMock()
+    provider_handler = AsyncMock()
+    server = EventServer(queued_config, handler, provider_handler=provider_handler)
+
+    with TestClient(server._app) as client:
+        client.post("/provider/custom/events", json={"x": 1})
+        _wait_until(lambda: handler.await_count == 1)
+
+    provider_handler.assert_awaited_once_with("custom", {"x": 1, "_provider": "custom"})
+    handler.assert_awaited_once_with({"x": 1, "_provider": "custom"})
+
+
+def test_queued_handler_failure_is_counted(queued_config):
+    """Test handler errors do not fail the already-acknowledged request."""
+    handler = MagicMock(side_effect=Exception("Handler error"))
+    server = EventServer(queued_config, handler)
+
+    with TestClient(server._app) as client:
+        response = client.post("/webhook", json={"type": "message"})
+        assert response.status_code == 200
+        _wait_until(lambda: server.get_ingress_stats()["failed"] == 1)
+
+
+def test_queue_full_returns_backpressure_status(queued_config):
+    """Test a full queue answers 503 with Retry-After."""
+    release = threading.Event()
+    server = EventServer(queued_config, lambda payload: release.wait(timeout=5))
+
+    with TestClient(server._app) as client:
+        statuses = [client.post("/webhook", json={"n": i}).status_code for i in range(10)]
+        rejected = client.post("/webhook", json={"n": "last"})
+        release.set()
+
+    assert 503 in statuses
+    assert rejected.status_code == 503
+    assert rejected.headers["Retry-After"] == "1"
+    stats = server.get_ingress_stats()
+    assert stats["rejected"] >= 2
+    assert stats["max_depth"] == queued_config.ingress_queue_size
+
+
+def test_queue_full_status_configurable(queued_config):
+    """Test the overflow status can be set to 429."""
+    queued_config.ingress_overflow_status = 429
+    queued_config.ingress_queue_size = 1
+    release = threading.Event()
+    server = EventServer(queued_config, lambda payload: release.wait(timeout=5))
+
+    with TestClient(server._app) as client:
+        statuses = [client.post("/webhook", json={"n": i}).status_code for i in range(6)]
+        release.set()
+
+    assert 429 in statuses
+
+
+def test_ingress_metrics_endpoint(queued_config, event_handler):
+    """Test queue metrics are exposed over HTTP."""
+    server = EventServer(queued_config, event_handler)
+
+    with TestClient(server._app) as client:
+        client.post("/webhook", json={"type": "message"})
+        _wait_until(lambda: event_handler.call_count == 1)
+        metrics = client.get("/metrics/ingress").json()
+
+    assert metrics["queue_size"] == 4
+    assert metrics["workers"] == 2
+    assert metrics["accepted"] == 1
+    assert metrics["queue_depth"] == 0
+
+
+def test_shutdown_drains_queue(queued_config):
+    """Test queued events are finished when the server shuts down."""
+    handled = []
+    server = EventServer(queued_config, lambda payload: handled.append(payload))
+
+    with TestClient(server._app) as client:
+        for i in range(3):
+            client.post("/webhook", json={"n": i})
+
+    assert len(handled) == 3
+    assert server.loop is None
+
+
+# ==============================================================================
+# Duplicate delivery suppression
+# ==============================================================================
+
+
+def test_duplicate_feishu_event_dispatched_once(basic_config, event_handler):
+    """Test a redelivered Feishu event is acknowledged but not dispatched again."""
+    server = EventServer(basic_config, event_handler)
+    client = TestClient(server._app)
+    payload = {"schema": "2.0", "header": {"event_id": "ev_dup"}, "event": {}}
+
+    first = client.post("/webhook", json=payload)
+    second = client.post("/webhook", json=payload)
+
+    assert first.status_code == second.status_code == 200
+    event_handler.assert_called_once()
+    assert server.get_ingress_stats()["duplicates"] == 1
+
+
+def test_duplicate_qq_message_dispatched_once(queued_config, event_handler):
+    """Test a resent OneBot message is dropped in queued mode."""
+    server = EventServer(queued_config, event_handler)
+    payload = {"post_type": "message", "self_id": 1, "message_id": 42, "message": "hi"}
+
+    with TestClient(server._app) as client:
+        client.post("/qq/events", json=payload)
+        client.post("/qq/events", json=payload)
+        _wait_until(lambda: server.get_ingress_stats()["processed"] == 1)
+
+    event_handler.assert_called_once()
+
+
+def test_failed_inline_event_is_retried(basic_config):
+    """Test an event whose handler failed is processed again on redelivery."""
+    handler = MagicMock(side_effect=[Exception("boom"), None])
+    server = EventServer(basic_config, handler)
+    client = TestClient(server._app)
+    payload = {"header": {"event_id": "ev_retry"}}
+
+    assert client.post("/webhook", json=payload).status_code == 500
+    assert client.post("/webhook", json=payload).status_code == 200
+    assert handler.call_count == 2
+
+
+def test_events_without_id_not_deduplicated(basic_config, event_handler):
+    """Test events lacking an ID are always dispatched."""
+    server = EventServer(basic_config, event_handler)
+    client = TestClient(server._app)
+
+    client.post("/webhook", json={"type": "message"})
+    client.post("/webhook", json={"type": "message"})
+
+    assert event_handler.call_count == 2
+
+
+def test_dedup_disabled(basic_config, event_handler):
+    """Test deduplication can be turned off."""
+    basic_config.dedup_enabled = False
+    server = EventServer(basic_config, event_handler)
+    client = TestClient(server._app)
+    payload = {"header": {"event_id": "ev_same"}}
+
+    client.post("/webhook", json=payload)
+    client.post("/webhook", json=payload)
+
+    assert event_handler.call_count == 2
+    assert "dedup" not in server.get_ingress_stats()
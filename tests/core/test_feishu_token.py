@@ -0,0 +1,222 @@
+"""Tests for the shared Feishu tenant token service."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from feishu_webhook_bot.core import feishu_token as feishu_token_module
+from feishu_webhook_bot.core.config import FeishuTokenConfig
+from feishu_webhook_bot.core.feishu_token import (
+    FeishuTokenError,
+    FeishuTokenService,
+    configure_token_service,
+    get_token_service,
+)
+
+TOKEN_URL = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
+
+
+@pytest.fixture
+def service() -> Iterator[FeishuTokenService]:
+    """Create a service without background refreshes."""
+    s = FeishuTokenService(proactive_refresh=False)
+    yield s
+    s.close()
+
+
+def _issuer(
+    httpx_mock: HTTPXMock,
+    delay: float = 0.0,
+    expire: float = 7200,
+    first_expire: float | None = None,
+) -> list[str]:
+    """Answer token requests with numbered tokens; returns the issued tokens."""
+    issued: list[str] = []
+    lock = threading.Lock()
+
+    def callback(request: httpx.Request) -> httpx.Response:
+        time.sleep(delay)
+        with lock:
+            issued.append(f"t-{len(issued) + 1}")
+            token = issued[-1]
+            lifetime = first_expire if first_expire is not None and len(issued) == 1 else expire
+        return httpx.Response(
+            200, json={"code": 0, "tenant_access_token": token, "expire": lifetime}
+        )
+
+    httpx_mock.add_callback(callback, url=TOKEN_URL, is_reusable=True)
+    return issued
+
+
+class TestFeishuTokenService:
+    """Tests for FeishuTokenService."""
+
+    def test_token_is_cached(self, service: FeishuTokenService, httpx_mock: HTTPXMock) -> None:
+        """Test a valid token is served from the cache."""
+        issued = _issuer(httpx_mock)
+
+        assert service.get_token("cli_a", "secret") == "t-1"
+        assert service.get_token("cli_a", "secret") == "t-1"
+
+        assert issued == ["t-1"]
+        stats = service.get_stats()
+        assert stats["fetches"] == 1
+        assert stats["hits"] == 1
+        assert stats["expires_in"]["cli_a"] > 7100
+
+    def test_concurrent_callers_share_one_request(
+        self, service: FeishuTokenService, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test concurrent cache misses and forced refreshes trigger one request each."""
+        issued = _issuer(httpx_mock, delay=0.05)
+
+        def run_concurrently(**kwargs: bool) -> set[str]:
+            barrier = threading.Barrier(8)
+            tokens: list[str] = []
+
+            def worker() -> None:
+                barrier.wait()
+                tokens.append(service.get_token("cli_a", "secret", **kwargs))
+
+            threads = [threading.Thread(target=worker) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            return set(tokens)
+
+        assert run_concurrently() == {"t-1"}
+        assert run_concurrently(force_refresh=True) == {"t-2"}
+        assert issued == ["t-1", "t-2"]
+
+    def test_rejected_credentials(self, service: FeishuTokenService, httpx_mock: HTTPXMock) -> None:
+        """Test Feishu error codes raise FeishuTokenError, a ValueError."""
+        httpx_mock.add_response(url=TOKEN_URL, json={"code": 10003, "msg": "invalid app"})
+
+        with pytest.raises(ValueError, match="Failed to get token: invalid app") as exc_info:
+            service.get_token("cli_a", "wrong")
+
+        assert isinstance(exc_info.value, FeishuTokenError)
+        assert exc_info.value.code == 10003
+        assert service.get_stats()["failures"] == 1
+
+    def test_changed_secret_fetches_new_token(
+        self, service: FeishuTokenService, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test rotating the app secret discards the cached token."""
+        issued = _issuer(httpx_mock)
+
+        service.get_token("cli_a", "old")
+        token = service.get_token("cli_a", "new")
+
+        assert token == "t-2"
+        assert issued == ["t-1", "t-2"]
+
+    def test_background_refresh(
+        self, httpx_mock: HTTPXMock, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test tokens are replaced before they expire without a caller waiting."""
+        monkeypatch.setattr(feishu_token_module, "_RETRY_DELAY", 0.01)
+        issued = _issuer(httpx_mock, first_expire=5.1)
+        service = FeishuTokenService(refresh_ahead=5.0, min_validity=0.0)
+
+        try:
+            assert service.get_token("cli_a", "secret") == "t-1"
+            deadline = time.monotonic() + 5
+            while service.get_stats()["background_refreshes"] < 1 and time.monotonic() < deadline:
+                time.sleep(0.02)
+
+            assert service.get_stats()["background_refreshes"] >= 1
+            assert service.get_token("cli_a", "secret") == "t-2"
+            assert len(issued) == 2
+        finally:
+            service.close()
+
+    @pytest.mark.anyio
+    async def test_aget_token(self, service: FeishuTokenService, httpx_mock: HTTPXMock) -> None:
+        """Test the async variant fetches in a thread and then hits the cache."""
+        issued = _issuer(httpx_mock)
+
+        assert await service.aget_token("cli_a", "secret") == "t-1"
+        assert await service.aget_token("cli_a", "secret") == "t-1"
+        assert issued == ["t-1"]
+
+    def test_invalid_timing(self) -> None:
+        """Test min_validity must not exceed refresh_ahead."""
+        with pytest.raises(ValueError):
+            FeishuTokenService(refresh_ahead=10, min_validity=20)
+        with pytest.raises(ValueError):
+            FeishuTokenConfig(refresh_ahead_seconds=10, min_validity_seconds=20)
+
+
+class TestPersistentTokens:
+    """Tests for tokens shared between processes through SQLite."""
+
+    def test_second_process_reuses_stored_token(
+        self, tmp_path: Path, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test a fresh service adopts a stored token instead of requesting one."""
+        issued = _issuer(httpx_mock)
+        path = tmp_path / "tokens.db"
+        first = FeishuTokenService(proactive_refresh=False, persist_path=path)
+        second = FeishuTokenService(proactive_refresh=False, persist_path=path)
+
+        assert first.get_token("cli_a", "secret") == "t-1"
+        assert second.get_token("cli_a", "secret") == "t-1"
+
+        assert issued == ["t-1"]
+        assert second.get_stats()["shared"] == 1
+        assert path.stat().st_mode & 0o077 == 0
+
+    def test_forced_refresh_skips_rejected_token(
+        self, tmp_path: Path, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test a forced refresh fetches again when the stored token is the rejected one."""
+        issued = _issuer(httpx_mock)
+        path = tmp_path / "tokens.db"
+        first = FeishuTokenService(proactive_refresh=False, persist_path=path)
+        second = FeishuTokenService(proactive_refresh=False, persist_path=path)
+        first.get_token("cli_a", "secret")
+        second.get_token("cli_a", "secret")
+
+        assert second.get_token("cli_a", "secret", force_refresh=True) == "t-2"
+        assert first.get_token("cli_a", "secret", force_refresh=True) == "t-2"
+        assert issued == ["t-1", "t-2"]
+
+
+class TestGlobalService:
+    """Tests for the module-level service helpers."""
+
+    def test_configure_reuses_matching_service(self) -> None:
+        """Test configuring with unchanged settings keeps cached tokens."""
+        config = FeishuTokenConfig(refresh_ahead_seconds=120)
+
+        first = configure_token_service(config)
+
+        assert configure_token_service(config) is first
+        assert get_token_service() is first
+        assert first.refresh_ahead == 120
+
+    def test_configure_replaces_changed_service(self) -> None:
+        """Test new settings close the previous service."""
+        first = configure_token_service(FeishuTokenConfig())
+
+        second = configure_token_service(FeishuTokenConfig(proactive_refresh=False))
+
+        assert second is not first
+        assert first.closed
+        assert get_token_service() is second
+
+    def test_closed_service_is_replaced(self) -> None:
+        """Test a stopped global service is recreated on next access."""
+        first = get_token_service()
+        first.close()
+
+        assert get_token_service() is not first
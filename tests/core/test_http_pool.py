@@ -0,0 +1,208 @@
+"""Tests for the shared HTTP client pool."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from feishu_webhook_bot.core import http_pool as http_pool_module
+from feishu_webhook_bot.core.client import FeishuWebhookClient, WebhookConfig
+from feishu_webhook_bot.core.config import HTTPClientConfig, HTTPPoolConfig
+from feishu_webhook_bot.core.http_pool import (
+    HTTPClientPool,
+    PooledClient,
+    close_http_pool,
+    configure_http_pool,
+    get_http_pool,
+)
+
+
+@pytest.fixture
+def pool() -> Iterator[HTTPClientPool]:
+    """Create a pool that is closed after the test."""
+    p = HTTPClientPool(per_host_limits={"open.feishu.cn": 5})
+    yield p
+    p.close()
+
+
+@pytest.fixture(autouse=True)
+def reset_global_pool() -> Iterator[None]:
+    """Start and end every test without a global pool."""
+    close_http_pool()
+    yield
+    close_http_pool()
+
+
+class TestHTTPClientPool:
+    """Tests for HTTPClientPool."""
+
+    def test_sync_client_is_shared(self, pool: HTTPClientPool) -> None:
+        """Test the same client is returned until the pool is closed."""
+        client = pool.sync_client()
+
+        assert pool.sync_client() is client
+        pool.close()
+        assert client.is_closed
+        with pytest.raises(RuntimeError, match="closed"):
+            pool.sync_client()
+
+    def test_per_host_limits_are_mounted(self, pool: HTTPClientPool) -> None:
+        """Test hosts with their own limit get a dedicated transport."""
+        client = pool.sync_client()
+
+        mounted = [transport for transport in client._mounts.values() if transport is not None]
+        assert len(mounted) == 1
+        assert mounted[0]._pool._max_connections == 5
+        assert client._transport._pool._max_connections == 100
+
+    def test_requests_are_counted(self, pool: HTTPClientPool, httpx_mock: HTTPXMock) -> None:
+        """Test statistics count requests per host."""
+        httpx_mock.add_response(url="https://open.feishu.cn/a", json={})
+        httpx_mock.add_response(url="https://open.feishu.cn/b", json={})
+        httpx_mock.add_response(url="https://example.com/", json={})
+
+        client = pool.sync_client()
+        client.get("https://open.feishu.cn/a")
+        client.get("https://open.feishu.cn/b")
+        client.get("https://example.com/")
+
+        stats = pool.get_stats()
+        assert stats["requests"] == 3
+        assert stats["requests_by_host"] == {"open.feishu.cn": 2, "example.com": 1}
+        assert stats["per_host_limits"] == {"open.feishu.cn": 5}
+        assert stats["closed"] is False
+
+    def test_http2_requires_h2(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test HTTP/2 falls back to HTTP/1.1 when h2 is not installed."""
+        monkeypatch.setattr(http_pool_module.importlib.util, "find_spec", lambda name: None)
+
+        p = HTTPClientPool(http2=True)
+
+        assert p.http2 is False
+
+    @pytest.mark.anyio
+    async def test_async_client_per_loop(self, pool: HTTPClientPool) -> None:
+        """Test the running loop reuses one async client until aclose."""
+        client = pool.async_client()
+
+        assert pool.async_client() is client
+        assert pool.get_stats()["async_clients"] == 1
+        await pool.aclose()
+        assert client.is_closed
+        assert pool.closed
+
+    def test_async_client_needs_running_loop(self, pool: HTTPClientPool) -> None:
+        """Test async clients can only be requested inside an event loop."""
+        with pytest.raises(RuntimeError):
+            pool.async_client()
+
+
+class TestGlobalPool:
+    """Tests for the module-level pool helpers."""
+
+    def test_get_http_pool_recreates_closed_pool(self) -> None:
+        """Test a closed global pool is replaced on next access."""
+        first = get_http_pool()
+        first.close()
+
+        second = get_http_pool()
+
+        assert second is not first
+        assert not second.closed
+
+    def test_configure_reuses_matching_pool(self) -> None:
+        """Test configuring with unchanged settings keeps the open pool."""
+        config = HTTPClientConfig(pool=HTTPPoolConfig(max_connections=10))
+
+        first = configure_http_pool(config)
+        client = first.sync_client()
+
+        assert configure_http_pool(config) is first
+        assert not client.is_closed
+
+    def test_configure_replaces_changed_pool(self) -> None:
+        """Test configuring with new settings closes the previous pool."""
+        first = configure_http_pool(HTTPClientConfig())
+        client = first.sync_client()
+
+        second = configure_http_pool(HTTPClientConfig(pool=HTTPPoolConfig(max_connections=5)))
+
+        assert second is not first
+        assert first.closed
+        assert client.is_closed
+        assert get_http_pool() is second
+        assert second.limits.max_connections == 5
+
+
+class TestInjectedClient:
+    """Tests for FeishuWebhookClient using a borrowed client."""
+
+    def test_borrowed_client_is_not_closed(
+        self, pool: HTTPClientPool, httpx_mock: HTTPXMock
+    ) -> None:
+        """Test the webhook client sends through the pool and leaves it open."""
+        httpx_mock.add_response(url="https://example.com/webhook", json={"code": 0})
+        shared = pool.sync_client()
+        client = FeishuWebhookClient(
+            WebhookConfig(url="https://example.com/webhook", name="test"), http_client=shared
+        )
+
+        client.send_text("hello")
+        client.close()
+
+        assert not shared.is_closed
+        assert pool.get_stats()["requests"] == 1
+
+
+class TestPooledClient:
+    """Tests for PooledClient request defaults."""
+
+    def test_relative_url_uses_base_url_and_defaults(self, httpx_mock: HTTPXMock) -> None:
+        """Test relative URLs are joined and default headers are sent."""
+        httpx_mock.add_response(url="http://127.0.0.1:3000/send_group_msg", json={"status": "ok"})
+        client = PooledClient(
+            base_url="http://127.0.0.1:3000/", headers={"Authorization": "Bearer t"}, timeout=5.0
+        )
+
+        response = client.post("/send_group_msg", json={"group_id": 1})
+
+        assert response.json() == {"status": "ok"}
+        request = httpx_mock.get_request()
+        assert request.headers["Authorization"] == "Bearer t"
+        assert request.extensions["timeout"]["read"] == 5.0
+        assert get_http_pool().get_stats()["requests"] == 1
+
+    def test_absolute_url_and_request_headers_win(self, httpx_mock: HTTPXMock) -> None:
+        """Test absolute URLs bypass base_url and per-request headers override defaults."""
+        httpx_mock.add_response(url="https://example.com/other")
+        client = PooledClient(base_url="http://127.0.0.1:3000", headers={"X-Token": "a"})
+
+        client.get("https://example.com/other", headers={"X-Token": "b"})
+
+        assert httpx_mock.get_request().headers["X-Token"] == "b"
+
+    def test_survives_pool_replacement(self, httpx_mock: HTTPXMock) -> None:
+        """Test requests keep working after the global pool is closed."""
+        httpx_mock.add_response(url="https://example.com/a")
+        httpx_mock.add_response(url="https://example.com/a")
+        client = PooledClient(base_url="https://example.com")
+
+        client.get("a")
+        close_http_pool()
+        client.get("a")
+
+        assert len(httpx_mock.get_requests()) == 2
+
+    @pytest.mark.anyio
+    async def test_asynchronous_uses_loop_client(self, httpx_mock: HTTPXMock) -> None:
+        """Test the async variant sends through the running loop's client."""
+        httpx_mock.add_response(url="https://open.feishu.cn/open-apis/im/v1/chats", json={})
+        client = PooledClient(base_url="https://open.feishu.cn/open-apis", asynchronous=True)
+
+        response = await client.get("/im/v1/chats")
+
+        assert response.status_code == 200
+        assert client.client is get_http_pool().async_client()
+        await get_http_pool().aclose()
@@ -0,0 +1,107 @@
+"""Tests for the uploaded image key cache."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from feishu_webhook_bot.core.config import ImageCacheConfig
+from feishu_webhook_bot.core.image_cache import (
+    ImageKeyCache,
+    configure_image_key_cache,
+    get_image_key_cache,
+)
+
+
+class TestImageKeyCache:
+    """Tests for ImageKeyCache."""
+
+    def test_get_set_and_lru_eviction(self) -> None:
+        """Test keys are reused and the least recently used one is evicted."""
+        cache = ImageKeyCache(max_size=2)
+        first = ImageKeyCache.make_key("cli_a", "message", "aa")
+        second = ImageKeyCache.make_key("cli_a", "message", "bb")
+        third = ImageKeyCache.make_key("cli_a", "message", "cc")
+
+        cache.set(first, "img_1")
+        cache.set(second, "img_2")
+        assert cache.get(first) == "img_1"
+        cache.set(third, "img_3")
+
+        assert cache.get(second) is None
+        assert cache.get(first) == "img_1"
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    def test_entries_expire(self) -> None:
+        """Test keys older than the TTL are not reused."""
+        cache = ImageKeyCache(ttl_seconds=60)
+        key = ImageKeyCache.make_key("cli_a", "message", "aa")
+        cache.set(key, "img_1")
+
+        with patch("feishu_webhook_bot.core.ttl_cache.time.time", return_value=time.time() + 61):
+            assert cache.get(key) is None
+
+        assert cache.get_stats()["expired"] == 1
+
+    def test_keys_are_scoped_by_app_and_type(self) -> None:
+        """Test the same content gets different keys per app and image type."""
+        keys = {
+            ImageKeyCache.make_key("cli_a", "message", "aa"),
+            ImageKeyCache.make_key("cli_b", "message", "aa"),
+            ImageKeyCache.make_key("cli_a", "avatar", "aa"),
+        }
+
+        assert len(keys) == 3
+
+
+class TestPersistentImageKeyCache:
+    """Tests for the SQLite tier."""
+
+    def test_keys_survive_restart(self, tmp_path: Path) -> None:
+        """Test a new cache loads keys written by a closed one."""
+        path = tmp_path / "images.db"
+        key = ImageKeyCache.make_key("cli_a", "message", "aa")
+        cache = ImageKeyCache(db_path=path)
+        cache.set(key, "img_1")
+        cache.close()
+
+        reloaded = ImageKeyCache(db_path=path)
+
+        assert reloaded.get(key) == "img_1"
+        assert reloaded.get_stats()["warm_loaded"] == 1
+        reloaded.close()
+
+    def test_other_process_entries_are_found(self, tmp_path: Path) -> None:
+        """Test a memory miss falls back to keys another cache stored."""
+        path = tmp_path / "images.db"
+        key = ImageKeyCache.make_key("cli_a", "message", "aa")
+        reader = ImageKeyCache(db_path=path)
+        writer = ImageKeyCache(db_path=path)
+        writer.set(key, "img_1")
+        writer.close()
+
+        assert reader.get(key) == "img_1"
+        assert reader.get_stats()["disk_hits"] == 1
+        reader.invalidate(key)
+        assert reader.get(key) is None
+        reader.close()
+
+
+class TestGlobalImageKeyCache:
+    """Tests for the module-level cache helpers."""
+
+    def test_configure_reuses_matching_cache(self) -> None:
+        """Test unchanged settings keep the cache and new settings replace it."""
+        config = ImageCacheConfig(ttl_seconds=3600)
+
+        first = configure_image_key_cache(config)
+
+        assert configure_image_key_cache(config) is first
+        assert get_image_key_cache() is first
+        second = configure_image_key_cache(ImageCacheConfig(max_size=10))
+        assert second is not first
+        assert get_image_key_cache() is second
@@ -5,6 +5,7 @@ Tests cover:
 - FeishuImageUploader initialization
 - Token management
 - Image upload operations
+- image_key reuse, streaming and batch uploads
 - Permission error handling
 - Helper functions
 """
@@ -13,11 +14,16 @@ from __future__ import annotations
 
 import base64
 import tempfile
+import threading
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
+from pytest_httpx import HTTPXMock
 
+from feishu_webhook_bot.core import image_uploader as image_uploader_module
+from feishu_webhook_bot.core.client import CardBuilder
 from feishu_webhook_bot.core.image_uploader import (
     FeishuImageUploader,
     FeishuPermissionChecker,
@@ -28,6 +34,10 @@ from feishu_webhook_bot.core.image_uploader import (
     PermissionError as FeishuPermissionError,
 )
 
+PNG_BYTES = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
+)
+
 # ==============================================================================
 # FeishuPermissionChecker Tests
 # ==============================================================================
@@ -440,6 +450,120 @@ class TestPermissionErrorHandling:
         mock_open_auth.assert_called_once()
 
 
+# ==============================================================================
+# Image Key Cache and Streaming Upload Tests
+# ==============================================================================
+
+TOKEN_URL = "https://open.feishu.cn/open-apis/auth/v3/tenant_access_token/internal"
+UPLOAD_URL = "https://open.feishu.cn/open-apis/im/v1/images"
+
+
+def _mock_feishu(httpx_mock: HTTPXMock) -> list[bytes]:
+    """Answer token and upload requests; returns the uploaded request bodies."""
+    bodies: list[bytes] = []
+    lock = threading.Lock()
+
+    def upload(request: httpx.Request) -> httpx.Response:
+        with lock:
+            bodies.append(request.read())
+            key = f"img_{len(bodies)}"
+        return httpx.Response(200, json={"code": 0, "data": {"image_key": key}})
+
+    httpx_mock.add_response(
+        url=TOKEN_URL, json={"code": 0, "tenant_access_token": "t-1", "expire": 7200}
+    )
+    httpx_mock.add_callback(upload, url=UPLOAD_URL, is_reusable=True)
+    return bodies
+
+
+class TestImageKeyReuse:
+    """Tests for content-hash image_key reuse and streaming uploads."""
+
+    def test_identical_images_upload_once(self, tmp_path: Path, httpx_mock: HTTPXMock):
+        """Test the same content is uploaded once, whether sent as file, bytes or base64."""
+        bodies = _mock_feishu(httpx_mock)
+        image = tmp_path / "chart.png"
+        image.write_bytes(PNG_BYTES)
+        uploader = FeishuImageUploader("cli_test", "secret")
+
+        keys = {
+            uploader.upload_image(image),
+            uploader.upload_image_bytes(PNG_BYTES),
+            uploader.upload_image_base64(base64.b64encode(PNG_BYTES).decode()),
+        }
+
+        assert keys == {"img_1"}
+        assert len(bodies) == 1
+        assert PNG_BYTES in bodies[0]
+
+    def test_image_type_and_opt_out(self, httpx_mock: HTTPXMock):
+        """Test avatars are cached separately and use_cache=False always uploads."""
+        bodies = _mock_feishu(httpx_mock)
+        uploader = FeishuImageUploader("cli_test", "secret", use_cache=False)
+        cached = FeishuImageUploader("cli_test", "secret")
+
+        uploader.upload_image_bytes(PNG_BYTES)
+        uploader.upload_image_bytes(PNG_BYTES)
+        cached.upload_image_bytes(PNG_BYTES)
+        cached.upload_image_bytes(PNG_BYTES, image_type="avatar")
+        cached.upload_image_bytes(PNG_BYTES, image_type="avatar")
+
+        assert len(bodies) == 4
+        assert uploader.cache is None
+
+    def test_base64_decoded_in_chunks(self, httpx_mock: HTTPXMock, monkeypatch):
+        """Test chunked base64 decoding handles whitespace across chunk borders."""
+        monkeypatch.setattr(image_uploader_module, "_BASE64_CHUNK_CHARS", 7)
+        bodies = _mock_feishu(httpx_mock)
+        payload = bytes(range(256)) * 3
+        encoded = base64.encodebytes(payload).decode()  # wrapped every 76 characters
+
+        FeishuImageUploader("cli_test", "secret").upload_image_base64(encoded, "data.bin")
+
+        assert payload in bodies[0]
+
+    def test_upload_images_keeps_order(self, tmp_path: Path, httpx_mock: HTTPXMock):
+        """Test batch uploads dedupe identical images and return keys in input order."""
+        bodies = _mock_feishu(httpx_mock)
+        first = tmp_path / "first.png"
+        first.write_bytes(b"first image")
+        uploader = FeishuImageUploader("cli_test", "secret")
+
+        keys = uploader.upload_images([first, b"second image", b"first image", str(first)])
+
+        assert len(bodies) == 2
+        assert keys[0] == keys[2] == keys[3]
+        assert keys[1] != keys[0]
+        card = CardBuilder().add_image_combination(keys[:2]).build()
+        assert keys[1] in str(card)
+
+    def test_upload_images_missing_file(self, tmp_path: Path):
+        """Test a missing file fails the batch before anything is uploaded."""
+        uploader = FeishuImageUploader("cli_test", "secret")
+
+        with pytest.raises(FileNotFoundError):
+            uploader.upload_images([b"image", tmp_path / "missing.png"])
+        with pytest.raises(ValueError):
+            uploader.upload_images([b"image"], max_concurrency=0)
+
+    @pytest.mark.anyio
+    async def test_aupload_image_stream(self, httpx_mock: HTTPXMock):
+        """Test async byte sources are spooled, uploaded and cached."""
+        bodies = _mock_feishu(httpx_mock)
+        uploader = FeishuImageUploader("cli_test", "secret")
+
+        async def chunks():
+            for offset in range(0, len(PNG_BYTES), 16):
+                yield PNG_BYTES[offset : offset + 16]
+
+        key = await uploader.aupload_image_stream(chunks(), "stream.png")
+        keys = await uploader.aupload_images([PNG_BYTES])
+
+        assert keys == [key]
+        assert len(bodies) == 1
+        assert PNG_BYTES in bodies[0]
+
+
 # ==============================================================================
 # Helper Function Tests
 # ==============================================================================
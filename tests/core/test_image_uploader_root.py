@@ -176,11 +176,21 @@ class TestFeishuImageUploader:
     @patch("feishu_webhook_bot.core.image_uploader.httpx.Client")
     def test_get_tenant_access_token_cached(self, mock_client_class, uploader):
         """Test that token is cached."""
-        uploader._token = "cached_token"
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "code": 0,
+            "tenant_access_token": "cached_token",
+            "expire": 7200,
+        }
+        mock_client = MagicMock()
+        mock_client.post.return_value = mock_response
+        uploader._client = mock_client
+        uploader._get_tenant_access_token()
 
         token = uploader._get_tenant_access_token()
 
         assert token == "cached_token"
+        mock_client.post.assert_called_once()
 
     @patch("feishu_webhook_bot.core.image_uploader.httpx.Client")
     def test_get_tenant_access_token_failure(self, mock_client_class, uploader):
@@ -5,20 +5,31 @@ Tests cover:
 - setup_logging function
 - log_exception function
 - CloseOnEmitFileHandler
+- Buffered file handlers and the background writer
+- Structured JSON output and lazy formatting helpers
 - Logger configuration
 """
 
 from __future__ import annotations
 
+import json
 import logging
+import sys
 import tempfile
+import time
 from pathlib import Path
 
 from feishu_webhook_bot.core.config import LoggingConfig
 from feishu_webhook_bot.core.logger import (
+    BufferedRotatingFileHandler,
+    BufferedTimedRotatingFileHandler,
     CloseOnEmitFileHandler,
+    JsonFormatter,
+    LazyStr,
+    flush_logging,
     get_logger,
     log_exception,
+    log_fields,
     setup_logging,
 )
 
@@ -258,6 +269,274 @@ class TestCloseOnEmitFileHandler:
                 assert f"Message {i}" in content
 
 
+# ==============================================================================
+# Buffered File Handler Tests
+# ==============================================================================
+
+
+def _record(msg: str, level: int = logging.INFO) -> logging.LogRecord:
+    return logging.LogRecord(
+        name="test", level=level, pathname="", lineno=0, msg=msg, args=(), exc_info=None
+    )
+
+
+class TestBufferedFileHandlers:
+    """Tests for the buffered rotating file handlers."""
+
+    def test_batches_flushes_until_threshold(self, tmp_path):
+        """Test records are held in the buffer until flush_records is reached."""
+        log_file = tmp_path / "buffered.log"
+        handler = BufferedRotatingFileHandler(log_file, flush_interval=60.0, flush_records=3)
+        try:
+            handler.emit(_record("first"))
+            handler.emit(_record("second"))
+            assert log_file.read_text() == ""
+
+            handler.emit(_record("third"))
+            assert log_file.read_text().splitlines() == ["first", "second", "third"]
+        finally:
+            handler.close()
+
+    def test_errors_flush_immediately(self, tmp_path):
+        """Test ERROR records are flushed without waiting for the batch."""
+        log_file = tmp_path / "errors.log"
+        handler = BufferedRotatingFileHandler(log_file, flush_interval=60.0, flush_records=100)
+        try:
+            handler.emit(_record("boom", logging.ERROR))
+            assert "boom" in log_file.read_text()
+        finally:
+            handler.close()
+
+    def test_keeps_file_open_between_emits(self, tmp_path):
+        """Test the stream persists across emits and close flushes it."""
+        log_file = tmp_path / "open.log"
+        handler = BufferedRotatingFileHandler(log_file, flush_interval=60.0)
+        handler.emit(_record("one"))
+        stream = handler.stream
+        handler.emit(_record("two"))
+        assert handler.stream is stream
+
+        handler.close()
+        assert log_file.read_text().splitlines() == ["one", "two"]
+
+    def test_size_rotation(self, tmp_path):
+        """Test files rotate once max_bytes would be exceeded."""
+        log_file = tmp_path / "rotate.log"
+        handler = BufferedRotatingFileHandler(log_file, maxBytes=50, backupCount=2, flush_records=1)
+        try:
+            for i in range(10):
+                handler.emit(_record(f"message number {i:02d}"))
+        finally:
+            handler.close()
+
+        assert (tmp_path / "rotate.log.1").exists()
+        assert (tmp_path / "rotate.log.2").exists()
+        assert not (tmp_path / "rotate.log.3").exists()
+        assert log_file.stat().st_size <= 50
+
+    def test_size_rotation_counts_encoded_bytes(self, tmp_path):
+        """Test non-ASCII records are measured in bytes, not characters."""
+        log_file = tmp_path / "utf8.log"
+        handler = BufferedRotatingFileHandler(
+            log_file, maxBytes=1000, backupCount=20, flush_records=1
+        )
+        try:
+            for i in range(30):
+                handler.emit(_record(f"{i:02d} 日志消息内容" * 5))
+        finally:
+            handler.close()
+
+        files = sorted(tmp_path.glob("utf8.log*"))
+        assert len(files) > 2
+        assert all(path.stat().st_size <= 1000 for path in files)
+
+    def test_size_counter_includes_existing_file(self, tmp_path):
+        """Test rotation accounts for content written before the handler opened."""
+        log_file = tmp_path / "existing.log"
+        log_file.write_text("x" * 45 + "\n")
+        handler = BufferedRotatingFileHandler(log_file, maxBytes=50, backupCount=1)
+        try:
+            handler.emit(_record("overflow"))
+        finally:
+            handler.close()
+
+        assert (tmp_path / "existing.log.1").exists()
+        assert log_file.read_text() == "overflow\n"
+
+    def test_time_rotation(self, tmp_path):
+        """Test the timed handler rotates when the rollover time has passed."""
+        log_file = tmp_path / "timed.log"
+        handler = BufferedTimedRotatingFileHandler(
+            log_file, when="S", interval=1, backupCount=3, flush_records=1
+        )
+        try:
+            handler.emit(_record("before"))
+            handler.rolloverAt = time.time() - 1
+            handler.emit(_record("after"))
+        finally:
+            handler.close()
+
+        assert log_file.read_text() == "after\n"
+        rotated = [p for p in tmp_path.iterdir() if p.name.startswith("timed.log.")]
+        assert len(rotated) == 1
+        assert rotated[0].read_text() == "before\n"
+
+
+class TestBufferedLoggingPipeline:
+    """Tests for the background writer set up by setup_logging."""
+
+    def teardown_method(self):
+        from feishu_webhook_bot.core import logger as logger_module
+
+        logger_module._stop_listener()
+        logging.getLogger().handlers.clear()
+
+    def test_records_written_by_background_thread(self, tmp_path):
+        """Test buffered records reach the file once flushed."""
+        log_file = tmp_path / "pipeline.log"
+        setup_logging(LoggingConfig(log_file=str(log_file), flush_interval=60.0))
+
+        logger = get_logger("pipeline")
+        logger.info("value=%s", 42)
+
+        assert flush_logging()
+        assert "value=42" in log_file.read_text()
+
+    def test_exception_traceback_written(self, tmp_path):
+        """Test tracebacks are rendered before handing records to the writer."""
+        log_file = tmp_path / "traceback.log"
+        setup_logging(LoggingConfig(log_file=str(log_file)))
+
+        logger = get_logger("pipeline_exc")
+        try:
+            raise ValueError("bad value")
+        except ValueError as exc:
+            log_exception(logger, exc, "Parsing")
+
+        assert flush_logging()
+        content = log_file.read_text()
+        assert "Parsing: bad value" in content
+        assert "Traceback (most recent call last)" in content
+
+    def test_reconfigure_drains_previous_writer(self, tmp_path):
+        """Test setup_logging stops the old writer after writing its records."""
+        first = tmp_path / "first.log"
+        setup_logging(LoggingConfig(log_file=str(first), flush_interval=60.0))
+        get_logger("reconfigure").info("queued before reconfigure")
+
+        setup_logging(LoggingConfig(log_file=str(tmp_path / "second.log")))
+
+        assert "queued before reconfigure" in first.read_text()
+
+    def test_time_rotation_config(self, tmp_path):
+        """Test rotation='time' selects the timed handler."""
+        from feishu_webhook_bot.core import logger as logger_module
+
+        setup_logging(
+            LoggingConfig(log_file=str(tmp_path / "timed.log"), rotation="time", rotation_when="H")
+        )
+
+        handler = logger_module._listener.handlers[0]
+        assert isinstance(handler, BufferedTimedRotatingFileHandler)
+        assert handler.when == "H"
+
+    def test_flush_logging_without_file(self):
+        """Test flush_logging is a no-op without a background writer."""
+        setup_logging(LoggingConfig())
+        assert flush_logging()
+
+
+# ==============================================================================
+# Structured Logging Tests
+# ==============================================================================
+
+
+class TestStructuredLogging:
+    """Tests for JSON output and lazy formatting helpers."""
+
+    def test_json_formatter_fixed_fields(self):
+        """Test JSON lines always carry the structured fields."""
+        record = _record("plain message")
+        data = json.loads(JsonFormatter().format(record))
+
+        assert data["message"] == "plain message"
+        assert data["level"] == "INFO"
+        assert data["logger"] == "test"
+        assert "ts" in data
+        for field in ("provider", "target", "message_id", "latency_ms"):
+            assert data[field] is None
+
+    def test_json_formatter_includes_extra(self):
+        """Test extra fields from log_fields appear as top-level keys."""
+        logger = logging.getLogger("feishu_bot.test_json_extra")
+        records: list[logging.LogRecord] = []
+        handler = logging.Handler()
+        handler.emit = records.append  # type: ignore[method-assign]
+        logger.addHandler(handler)
+        try:
+            logger.warning(
+                "Sent %s",
+                "msg-1",
+                extra=log_fields("feishu", "oc_1", "msg-1", 12.34567, attempt=2),
+            )
+        finally:
+            logger.removeHandler(handler)
+
+        data = json.loads(JsonFormatter().format(records[0]))
+        assert data["message"] == "Sent msg-1"
+        assert data["provider"] == "feishu"
+        assert data["target"] == "oc_1"
+        assert data["message_id"] == "msg-1"
+        assert data["latency_ms"] == 12.346
+        assert data["attempt"] == 2
+
+    def test_json_formatter_exception(self):
+        """Test exceptions are rendered into the exc_info field."""
+        try:
+            raise RuntimeError("kaput")
+        except RuntimeError:
+            record = logging.LogRecord("test", logging.ERROR, "", 0, "failed", (), sys.exc_info())
+
+        data = json.loads(JsonFormatter().format(record))
+        assert "RuntimeError: kaput" in data["exc_info"]
+
+    def test_lazy_str_only_evaluated_when_emitted(self):
+        """Test LazyStr defers work for disabled levels."""
+        calls: list[int] = []
+
+        def expensive() -> str:
+            calls.append(1)
+            return "computed"
+
+        logger = logging.getLogger("feishu_bot.test_lazy")
+        logger.setLevel(logging.INFO)
+        logger.debug("value: %s", LazyStr(expensive))
+        assert calls == []
+
+        assert str(LazyStr(expensive)) == "computed"
+        assert calls == [1]
+
+    def test_setup_logging_json_file(self, tmp_path):
+        """Test json_format writes one JSON object per line to the log file."""
+        from feishu_webhook_bot.core import logger as logger_module
+
+        log_file = tmp_path / "structured.log"
+        setup_logging(LoggingConfig(log_file=str(log_file), json_format=True))
+        try:
+            get_logger("json_test").info(
+                "Delivered %s", "m-9", extra=log_fields("qq", "group:1", "m-9", 3.0)
+            )
+            assert flush_logging()
+            lines = [json.loads(line) for line in log_file.read_text().splitlines()]
+        finally:
+            logger_module._stop_listener()
+            logging.getLogger().handlers.clear()
+
+        delivered = [line for line in lines if line["message"] == "Delivered m-9"]
+        assert delivered[0]["provider"] == "qq"
+        assert delivered[0]["latency_ms"] == 3.0
+
+
 # ==============================================================================
 # LoggingConfig Tests
 # ==============================================================================
@@ -297,6 +576,14 @@ class TestLoggingConfig:
         assert config.max_bytes == 5 * 1024 * 1024
         assert config.backup_count == 10
 
+    def test_config_file_mode_defaults(self):
+        """Test file logging defaults to the buffered writer with size rotation."""
+        config = LoggingConfig()
+
+        assert config.file_mode == "buffered"
+        assert config.rotation == "size"
+        assert config.flush_records >= 1
+
 
 # ==============================================================================
 # Integration Tests
@@ -326,6 +613,7 @@ class TestLoggingIntegration:
             logger.error("Error message")
 
             # Verify file contains messages
+            assert flush_logging()
             content = log_file.read_text()
             assert "Debug message" in content or "Info message" in content
 
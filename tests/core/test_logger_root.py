@@ -1,13 +1,17 @@
 """Tests for the logger module."""
 
 import logging
+from logging.handlers import QueueHandler
 
 import pytest
 from rich.logging import RichHandler
 
+from feishu_webhook_bot.core import logger as logger_module
 from feishu_webhook_bot.core.config import LoggingConfig
 from feishu_webhook_bot.core.logger import (
+    BufferedRotatingFileHandler,
     CloseOnEmitFileHandler,
+    flush_logging,
     get_logger,
     log_exception,
     setup_logging,
@@ -24,11 +28,12 @@ def reset_logging():
     yield
 
     # After test: restore original state
+    from feishu_webhook_bot.core import logger
+
+    logger._stop_listener()
     logging.root.handlers = original_handlers
     logging.root.setLevel(original_level)
     # Clear the internal logger cache in our module
-    from feishu_webhook_bot.core import logger
-
     logger._loggers.clear()
     logger._configured = False
 
@@ -75,7 +80,15 @@ class TestSetupLogging:
         root_handlers = logging.getLogger().handlers
         assert len(root_handlers) == 2
         assert any(isinstance(h, RichHandler) for h in root_handlers)
+        assert any(isinstance(h, QueueHandler) for h in root_handlers)
+        assert isinstance(logger_module._listener.handlers[0], BufferedRotatingFileHandler)
+
+        # 3. Test with the opt-in close-on-emit file handler
+        setup_logging(LoggingConfig(log_file=str(log_file), file_mode="close_on_emit"))
+        root_handlers = logging.getLogger().handlers
+        assert len(root_handlers) == 2
         assert any(isinstance(h, CloseOnEmitFileHandler) for h in root_handlers)
+        assert logger_module._listener is None
 
     def test_file_logging_writes_to_file(self, tmp_path):
         """Test that file logging actually writes messages to the specified file."""
@@ -87,7 +100,8 @@ class TestSetupLogging:
         test_message = "This is a test message for the log file."
         logger.info(test_message)
 
-        # The custom file handler closes the file after emit, so we can read it.
+        # Records are written by a background thread; wait for them to land
+        assert flush_logging()
         assert log_file.exists()
         log_content = log_file.read_text()
         assert test_message in log_content
@@ -291,6 +291,7 @@ class TestQueueProcessing:
     async def test_process_failed_message_retries(self, queue, mock_provider):
         """Test failed messages are retried until exhausted."""
         mock_provider.send_text.return_value = SendResult.fail("Error")
+        queue.retry_delay = 0.0
 
         msg = QueuedMessage(content="Hello", target="user123", max_retries=2)
         await queue.enqueue(msg)
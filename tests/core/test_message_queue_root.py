@@ -3,10 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import threading
+import time
 
 import pytest
 
-from feishu_webhook_bot.core.message_queue import MessageQueue, QueuedMessage
+from feishu_webhook_bot.core.config import MessageQueueConfig
+from feishu_webhook_bot.core.message_queue import (
+    DeliveryRateLimiter,
+    MessagePriority,
+    MessageQueue,
+    QueuedMessage,
+    TokenBucket,
+)
 from feishu_webhook_bot.core.provider import (
     BaseProvider,
     MessageType,
@@ -251,6 +260,7 @@ class TestMessageQueue:
         queue = MessageQueue(
             providers={"feishu": failing_provider},
             max_batch_size=5,
+            retry_delay=0.0,
             max_retries=1,
         )
 
@@ -269,7 +279,7 @@ class TestMessageQueue:
         results = await queue.process_queue()
 
         # Both messages failed on first attempt and are retried
-        # process_queue processes all retries in one call
+        # with no backoff, so process_queue handles all retries in one call
         assert results["sent"] == 0
         assert results["failed"] == 2  # Both messages exhausted retries in one call
         assert results["retried"] == 2  # Both retried once
@@ -369,6 +379,7 @@ class TestMessageQueue:
 
     async def test_rich_text_invalid_content(self, message_queue: MessageQueue) -> None:
         """Test sending rich text with invalid content format."""
+        message_queue.retry_delay = 0.0
         msg = QueuedMessage(
             content="Invalid format",
             target="webhook-1",
@@ -532,3 +543,424 @@ class TestMessageQueue:
         assert results["sent"] == 2
         assert len(provider1.sent_messages) == 1
         assert len(provider2.sent_messages) == 1
+
+
+class SlowProvider(MockProvider):
+    """Mock provider whose sends block the calling thread."""
+
+    def __init__(self, name: str = "slow", delay: float = 0.1):
+        """Initialize slow provider."""
+        super().__init__(name, succeed=True)
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._counter_lock = threading.Lock()
+
+    def send_text(self, text: str, target: str) -> SendResult:
+        """Send text message after a blocking delay."""
+        with self._counter_lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            with self._counter_lock:
+                return super().send_text(text, target)
+        finally:
+            with self._counter_lock:
+                self.in_flight -= 1
+
+
+class AsyncMockProvider(MockProvider):
+    """Mock provider exposing a native async send path."""
+
+    def __init__(self, name: str = "async"):
+        """Initialize async provider."""
+        super().__init__(name, succeed=True)
+        self.async_calls = 0
+
+    async def async_send_text(self, text: str, target: str) -> SendResult:
+        """Send text message natively on the event loop."""
+        self.async_calls += 1
+        await asyncio.sleep(0)
+        return super().send_text(text, target)
+
+
+class TestDeliveryEngine:
+    """Tests for the concurrent, per-target-ordered delivery engine."""
+
+    async def test_invalid_concurrency(self) -> None:
+        """Test that max_concurrency must be positive."""
+        with pytest.raises(ValueError, match="max_concurrency"):
+            MessageQueue(providers={"slow": MockProvider()}, max_concurrency=0)
+
+    async def test_distinct_targets_delivered_in_parallel(self) -> None:
+        """Test that sends to different targets overlap."""
+        provider = SlowProvider("slow", delay=0.1)
+        queue = MessageQueue(providers={"slow": provider}, max_batch_size=50, max_concurrency=8)
+        await queue.enqueue_batch(
+            [
+                QueuedMessage(content=f"m{i}", target=f"group-{i}", provider_name="slow")
+                for i in range(8)
+            ]
+        )
+
+        started = time.monotonic()
+        results = await queue.process_queue()
+        elapsed = time.monotonic() - started
+
+        assert results["sent"] == 8
+        assert provider.max_in_flight > 1
+        # Serial delivery would take 0.8s
+        assert elapsed < 0.5
+
+    async def test_concurrency_is_bounded(self) -> None:
+        """Test that no more than max_concurrency sends are in flight."""
+        provider = SlowProvider("slow", delay=0.02)
+        queue = MessageQueue(providers={"slow": provider}, max_batch_size=50, max_concurrency=3)
+        await queue.enqueue_batch(
+            [
+                QueuedMessage(content=f"m{i}", target=f"group-{i}", provider_name="slow")
+                for i in range(12)
+            ]
+        )
+
+        results = await queue.process_queue()
+
+        assert results["sent"] == 12
+        assert provider.max_in_flight <= 3
+
+    async def test_order_preserved_per_target(self) -> None:
+        """Test that messages to the same target keep their enqueue order."""
+        provider = SlowProvider("slow", delay=0.005)
+        queue = MessageQueue(providers={"slow": provider}, max_batch_size=4, max_concurrency=4)
+        await queue.enqueue_batch(
+            [
+                QueuedMessage(content=f"{target}-{i}", target=target, provider_name="slow")
+                for i in range(10)
+                for target in ("a", "b", "c")
+            ]
+        )
+
+        results = await queue.process_queue()
+
+        assert results["sent"] == 30
+        for target in ("a", "b", "c"):
+            sent = [text for _, t, text in provider.sent_messages if t == target]
+            assert sent == [f"{target}-{i}" for i in range(10)]
+
+    async def test_same_target_is_serialized(self) -> None:
+        """Test that one lane never has two sends in flight."""
+        provider = SlowProvider("slow", delay=0.01)
+        queue = MessageQueue(providers={"slow": provider}, max_batch_size=10, max_concurrency=8)
+        await queue.enqueue_batch(
+            [
+                QueuedMessage(content=f"m{i}", target="group-1", provider_name="slow")
+                for i in range(5)
+            ]
+        )
+
+        await queue.process_queue()
+
+        assert provider.max_in_flight == 1
+
+    async def test_async_provider_path_used(self) -> None:
+        """Test that native async send methods are awaited directly."""
+        provider = AsyncMockProvider("async")
+        queue = MessageQueue(providers={"async": provider})
+        await queue.enqueue(QueuedMessage(content="hi", target="group-1", provider_name="async"))
+
+        results = await queue.process_queue()
+
+        assert results["sent"] == 1
+        assert provider.async_calls == 1
+
+    async def test_cancel_returns_pending_messages(self) -> None:
+        """Test that cancelling processing puts undelivered messages back."""
+        provider = SlowProvider("slow", delay=0.05)
+        queue = MessageQueue(providers={"slow": provider}, max_batch_size=10, max_concurrency=1)
+        await queue.enqueue_batch(
+            [
+                QueuedMessage(content=f"m{i}", target="group-1", provider_name="slow")
+                for i in range(5)
+            ]
+        )
+
+        task = asyncio.create_task(queue.process_queue())
+        await asyncio.sleep(0.02)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        stats = queue.get_queue_stats()
+        assert stats["in_flight"] == 0
+        assert stats["active_workers"] == 0
+        assert len(queue) + len(provider.sent_messages) >= 5
+        queue.close()
+
+
+class TestRetryBackoff:
+    """Tests for delayed retries and the processor wake-up signal."""
+
+    async def test_failed_message_waits_for_backoff(self) -> None:
+        """Test that a failed message is not resent before its delay elapses."""
+        provider = MockProvider("feishu", succeed=False)
+        queue = MessageQueue(providers={"feishu": provider}, retry_delay=10.0, max_retries=3)
+        msg = QueuedMessage(content="Hello", target="webhook-1", provider_name="feishu")
+        await queue.enqueue(msg)
+
+        results = await queue.process_queue()
+
+        assert results["retried"] == 1
+        assert results["failed"] == 0
+        assert msg.retry_count == 1
+        stats = queue.get_queue_stats()
+        assert stats["current_size"] == 0
+        assert stats["delayed"] == 1
+        assert 9.0 < stats["next_retry_in"] <= 10.0
+        assert len(queue) == 1
+
+        # Nothing is due yet, so a second run does not touch the provider
+        results = await queue.process_queue()
+        assert results["processed"] == 0
+
+    async def test_backoff_grows_exponentially(self) -> None:
+        """Test that each attempt doubles the retry delay."""
+        provider = MockProvider("feishu", succeed=False)
+        queue = MessageQueue(providers={"feishu": provider}, retry_delay=0.05, max_retries=3)
+        await queue.enqueue(QueuedMessage(content="Hi", target="webhook-1", provider_name="feishu"))
+
+        await queue.process_queue()
+        assert queue.next_retry_delay() <= 0.05
+
+        await asyncio.sleep(0.06)
+        await queue.process_queue()
+        assert 0.05 < queue.next_retry_delay() <= 0.1
+
+    async def test_due_retry_is_delivered(self) -> None:
+        """Test that a retry is sent once its backoff has elapsed."""
+        provider = MockProvider("feishu", succeed=False)
+        queue = MessageQueue(providers={"feishu": provider}, retry_delay=0.05)
+        await queue.enqueue(QueuedMessage(content="Hi", target="webhook-1", provider_name="feishu"))
+        await queue.process_queue()
+
+        provider.succeed = True
+        assert await queue.wait_for_work(timeout=1.0) is True
+        results = await queue.process_queue()
+
+        assert results["sent"] == 1
+        assert len(queue) == 0
+        assert queue.next_retry_delay() is None
+
+    async def test_wait_for_work_wakes_on_enqueue(self) -> None:
+        """Test that an idle wait ends as soon as a message is enqueued."""
+        queue = MessageQueue(providers={"feishu": MockProvider("feishu")})
+
+        waiter = asyncio.create_task(queue.wait_for_work(timeout=5.0))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        await queue.enqueue(QueuedMessage(content="Hi", target="webhook-1", provider_name="feishu"))
+
+        assert await asyncio.wait_for(waiter, timeout=1.0) is True
+
+    async def test_wait_for_work_times_out(self) -> None:
+        """Test that an idle wait honours its timeout."""
+        queue = MessageQueue(providers={"feishu": MockProvider("feishu")})
+
+        assert await queue.wait_for_work(timeout=0.01) is False
+
+    async def test_clear_queue_drops_delayed(self) -> None:
+        """Test that clearing the queue also discards pending retries."""
+        provider = MockProvider("feishu", succeed=False)
+        queue = MessageQueue(providers={"feishu": provider}, retry_delay=10.0)
+        await queue.enqueue(QueuedMessage(content="Hi", target="webhook-1", provider_name="feishu"))
+        await queue.process_queue()
+
+        assert queue.clear_queue() == 1
+        assert queue.get_queue_stats()["delayed"] == 0
+
+
+class TestPriorityAndRateShaping:
+    """Tests for priority lanes and token-bucket rate shaping."""
+
+    def test_default_priority(self) -> None:
+        """Test that messages default to normal priority."""
+        msg = QueuedMessage(content="Hi", target="webhook-1")
+        assert msg.priority == MessagePriority.NORMAL
+
+    def test_priority_coerced_from_int(self) -> None:
+        """Test that integer priorities are converted to MessagePriority."""
+        msg = QueuedMessage(content="Hi", target="webhook-1", priority=0)
+        assert msg.priority is MessagePriority.ALERT
+
+    async def test_alert_overtakes_bulk_backlog(self) -> None:
+        """Test that a high-priority message is sent before queued bulk messages."""
+        provider = MockProvider("feishu")
+        queue = MessageQueue(providers={"feishu": provider}, max_batch_size=100, max_concurrency=1)
+        await queue.enqueue_batch(
+            [
+                QueuedMessage(
+                    content=f"digest-{i}",
+                    target="webhook-1",
+                    provider_name="feishu",
+                    priority=MessagePriority.BULK,
+                )
+                for i in range(20)
+            ]
+        )
+        await queue.enqueue(
+            QueuedMessage(
+                content="alert",
+                target="webhook-1",
+                provider_name="feishu",
+                priority=MessagePriority.ALERT,
+            )
+        )
+
+        await queue.process_queue()
+
+        texts = [text for _, _, text in provider.sent_messages]
+        assert texts[0] == "alert"
+        assert texts[1:] == [f"digest-{i}" for i in range(20)]
+
+    async def test_alert_enqueued_during_bulk_flood_sent_next(self) -> None:
+        """Test that an alert enqueued mid-flood does not wait for the backlog."""
+        provider = SlowProvider("feishu", delay=0.002)
+        queue = MessageQueue(providers={"feishu": provider}, max_batch_size=50, max_concurrency=2)
+        await queue.enqueue_batch(
+            [
+                QueuedMessage(
+                    content=f"digest-{i}",
+                    target=f"webhook-{i % 4}",
+                    provider_name="feishu",
+                    priority=MessagePriority.BULK,
+                )
+                for i in range(200)
+            ]
+        )
+
+        processing = asyncio.create_task(queue.process_queue())
+        while len(provider.sent_messages) < 20:
+            await asyncio.sleep(0.001)
+        sent_before_alert = len(provider.sent_messages)
+        await queue.enqueue(
+            QueuedMessage(
+                content="alert",
+                target="webhook-9",
+                provider_name="feishu",
+                priority=MessagePriority.ALERT,
+            )
+        )
+        results = await processing
+
+        texts = [text for _, _, text in provider.sent_messages]
+        assert results["sent"] == 201
+        # Only sends already in flight on the two workers may finish first
+        assert texts.index("alert") <= sent_before_alert + 4
+
+    async def test_per_target_rate_limit_spaces_sends(self) -> None:
+        """Test that a per-target bucket spaces out sends to one target."""
+        provider = MockProvider("feishu")
+        limiter = DeliveryRateLimiter(target_limits={"feishu": (20.0, 1)})
+        queue = MessageQueue(providers={"feishu": provider}, rate_limiter=limiter)
+        await queue.enqueue_batch(
+            [
+                QueuedMessage(content=f"m{i}", target="webhook-1", provider_name="feishu")
+                for i in range(4)
+            ]
+        )
+
+        started = time.monotonic()
+        results = await queue.process_queue()
+        elapsed = time.monotonic() - started
+
+        assert results["sent"] == 4
+        # First send uses the burst token, the next three wait ~50ms each
+        assert elapsed >= 0.14
+        assert queue.get_queue_stats()["total_throttled"] > 0
+
+    async def test_throttled_target_does_not_block_others(self) -> None:
+        """Test that other targets are served while one target is throttled."""
+        provider = MockProvider("feishu")
+        limiter = DeliveryRateLimiter(target_limits={"feishu": (5.0, 1)})
+        queue = MessageQueue(
+            providers={"feishu": provider}, max_concurrency=1, rate_limiter=limiter
+        )
+        await queue.enqueue_batch(
+            [
+                QueuedMessage(
+                    content=f"busy-{i}",
+                    target="busy",
+                    provider_name="feishu",
+                    priority=MessagePriority.HIGH,
+                )
+                for i in range(3)
+            ]
+            + [
+                QueuedMessage(content=f"quiet-{i}", target=f"quiet-{i}", provider_name="feishu")
+                for i in range(3)
+            ]
+        )
+
+        await queue.process_queue()
+
+        texts = [text for _, _, text in provider.sent_messages]
+        assert texts[0] == "busy-0"
+        # While "busy" waits for tokens the lower-priority targets go out
+        assert texts[1:4] == ["quiet-0", "quiet-1", "quiet-2"]
+        assert texts[4:] == ["busy-1", "busy-2"]
+
+    async def test_provider_rate_limit(self) -> None:
+        """Test that the provider-wide bucket applies across targets."""
+        provider = MockProvider("feishu")
+        limiter = DeliveryRateLimiter(provider_limits={"feishu": (20.0, 2)})
+        queue = MessageQueue(providers={"feishu": provider}, rate_limiter=limiter)
+        await queue.enqueue_batch(
+            [
+                QueuedMessage(content=f"m{i}", target=f"t{i}", provider_name="feishu")
+                for i in range(4)
+            ]
+        )
+
+        started = time.monotonic()
+        await queue.process_queue()
+
+        # Two sends fit in the burst, the other two wait ~50ms each
+        assert time.monotonic() - started >= 0.09
+
+    def test_token_bucket(self) -> None:
+        """Test token bucket accounting."""
+        bucket = TokenBucket(rate=10.0, capacity=2)
+        now = time.monotonic()
+
+        assert bucket.wait_time(now) == 0.0
+        bucket.consume()
+        bucket.consume()
+        assert bucket.wait_time(now) == pytest.approx(0.1, abs=0.01)
+        assert bucket.wait_time(now + 0.11) == 0.0
+
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+    def test_limiter_only_consumes_when_all_buckets_allow(self) -> None:
+        """Test that a blocked target does not spend provider tokens."""
+        limiter = DeliveryRateLimiter(
+            provider_limits={"feishu": (1.0, 2)}, target_limits={"feishu": (1.0, 1)}
+        )
+
+        assert limiter.acquire("feishu", "a") == 0.0
+        assert limiter.acquire("feishu", "a") > 0
+        # Provider bucket still has its second token for another target
+        assert limiter.acquire("feishu", "b") == 0.0
+        assert limiter.acquire("other", "a") == 0.0
+
+    def test_limiter_from_config(self) -> None:
+        """Test building a limiter from MessageQueueConfig."""
+        config = MessageQueueConfig(
+            rate_limits={"feishu": {"rate": 5, "burst": 5, "per_target_rate": 1}}
+        )
+
+        limiter = DeliveryRateLimiter.from_config(config.rate_limits)
+
+        assert limiter.acquire("feishu", "a") == 0.0
+        assert limiter.acquire("feishu", "a") > 0
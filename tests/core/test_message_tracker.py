@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import platform
 import tempfile
+import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -416,6 +417,45 @@ class TestDuplicateDetection:
 
         assert is_dup is False
 
+    def test_is_duplicate_sees_newer_message_after_failure(self, tracker):
+        """Test a later non-failed message is found behind a failed one."""
+        msg = tracker.track("msg1", "feishu", "user1", "Hello")
+        tracker.update_status("msg1", MessageStatus.FAILED)
+        tracker.track("msg2", "feishu", "user1", "Hello")
+
+        assert tracker.is_duplicate(msg.content_hash, "user1", within_seconds=60) is True
+
+    def test_is_duplicate_forgets_evicted_messages(self):
+        """Test evicted and cleaned-up messages leave the duplicate index."""
+        tracker = MessageTracker(max_history=1, cleanup_interval=0)
+        msg = tracker.track("msg1", "feishu", "user1", "Hello")
+        tracker.track("msg2", "feishu", "user2", "Other")
+
+        assert tracker.is_duplicate(msg.content_hash, "user1", within_seconds=60) is False
+        assert tracker._recent.keys() == {(tracker.messages["msg2"].content_hash, "user2")}
+
+    def test_is_duplicate_does_not_wait_for_main_lock(self, tracker):
+        """Test dedup checks proceed while another thread holds the tracker lock."""
+        msg = tracker.track("msg1", "feishu", "user1", "Hello")
+        result: list[bool] = []
+
+        with tracker._lock:
+            thread = threading.Thread(
+                target=lambda: result.append(tracker.is_duplicate(msg.content_hash, "user1"))
+            )
+            thread.start()
+            thread.join(timeout=2)
+
+        assert result == [True]
+
+    def test_retrack_same_id_replaces_index_entry(self, tracker):
+        """Test tracking an existing ID again re-indexes it under the new content."""
+        old = tracker.track("msg1", "feishu", "user1", "Hello")
+        new = tracker.track("msg1", "feishu", "user1", "Bye")
+
+        assert tracker.is_duplicate(old.content_hash, "user1") is False
+        assert tracker.is_duplicate(new.content_hash, "user1") is True
+
 
 # ==============================================================================
 # Statistics Tests
@@ -588,6 +628,7 @@ class TestDatabasePersistence:
             tracker1 = MessageTracker(db_path=db_path, cleanup_interval=0)
             tracker1.track("msg1", "feishu", "user1", "Hello")
             tracker1.update_status("msg1", MessageStatus.SENT)
+            tracker1.flush()
 
             # Create new tracker and load from database
             tracker2 = MessageTracker(db_path=db_path, cleanup_interval=0)
@@ -610,8 +651,31 @@ class TestDatabasePersistence:
             tracker1 = MessageTracker(db_path=db_path, cleanup_interval=0)
             for i in range(10):
                 tracker1.track(f"msg{i}", "feishu", f"user{i}", f"Hello {i}")
+            tracker1.flush()
 
             tracker2 = MessageTracker(db_path=db_path, cleanup_interval=0)
             loaded = tracker2.load_from_db(limit=5)
 
             assert loaded == 5
+
+    @pytest.mark.skipif(
+        platform.system() == "Windows",
+        reason="Windows file locking prevents cleanup of temp db files",
+    )
+    def test_load_keeps_creation_order(self):
+        """Test loaded messages are ordered oldest first and indexed for dedup."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = str(Path(tmpdir) / "messages.db")
+
+            tracker1 = MessageTracker(db_path=db_path, cleanup_interval=0)
+            for i in range(3):
+                tracker1.track(f"msg{i}", "feishu", "user", f"Hello {i}")
+                time.sleep(0.01)
+            tracker1.flush()
+
+            tracker2 = MessageTracker(db_path=db_path, max_history=2, cleanup_interval=0)
+            tracker2.load_from_db()
+
+            assert list(tracker2.messages) == ["msg1", "msg2"]
+            msg = tracker2.get_message("msg2")
+            assert tracker2.is_duplicate(msg.content_hash, "user") is True
@@ -423,6 +423,7 @@ class TestMessageTrackerWithDatabase:
         tracker.track("msg-2", "feishu", "webhook-2", "content2")
 
         tracker.update_status("msg-1", MessageStatus.DELIVERED)
+        tracker.flush()
 
         # Create new tracker and load from database
         tracker2 = MessageTracker(db_path=temp_db_path, cleanup_interval=0)
@@ -444,6 +445,7 @@ class TestMessageTrackerWithDatabase:
         msg.created_at = old_time
 
         tracker.cleanup_old_messages(max_age_seconds=3600)
+        tracker.flush()
 
         # Verify message is gone from database
         with sqlite3.connect(temp_db_path) as conn:
@@ -461,6 +463,7 @@ class TestMessageTrackerWithDatabase:
         tracker.track("msg-2", "feishu", "webhook-2", "content2")
 
         tracker.clear()
+        tracker.flush()
 
         # Verify database is empty
         with sqlite3.connect(temp_db_path) as conn:
@@ -470,6 +473,49 @@ class TestMessageTrackerWithDatabase:
 
         tracker.stop_cleanup()
 
+    def test_writes_are_group_committed(self, temp_db_path: str) -> None:
+        """Test tracking and status updates share commits on one connection."""
+        tracker = MessageTracker(db_path=temp_db_path, cleanup_interval=0, flush_interval=0.2)
+
+        for i in range(20):
+            tracker.track(f"msg-{i}", "feishu", "webhook-1", f"content{i}")
+            tracker.update_status(f"msg-{i}", MessageStatus.SENT)
+        tracker.flush()
+
+        persistence = tracker.get_statistics()["persistence"]
+        assert persistence["statements"] == 40
+        assert persistence["commits"] < 40
+        with sqlite3.connect(temp_db_path) as conn:
+            rows = conn.execute("SELECT DISTINCT status FROM messages").fetchall()
+            assert rows == [("sent",)]
+
+        tracker.close()
+
+    def test_export_from_db_includes_evicted(self, temp_db_path: str) -> None:
+        """Test exporting from the database sees messages evicted from memory."""
+        tracker = MessageTracker(max_history=1, db_path=temp_db_path, cleanup_interval=0)
+
+        tracker.track("msg-1", "feishu", "webhook-1", "content1")
+        tracker.track("msg-2", "feishu", "webhook-1", "content2")
+        tracker.update_status("msg-2", MessageStatus.FAILED, error="boom")
+
+        # Eviction deletes msg-1 from the database as well
+        assert [m["message_id"] for m in tracker.export_messages(from_db=True)] == ["msg-2"]
+        failed = tracker.export_messages(status=MessageStatus.FAILED, from_db=True)
+        assert failed[0]["error"] == "boom"
+
+        tracker.close()
+
+    def test_close_commits_pending_writes(self, temp_db_path: str) -> None:
+        """Test close flushes writes still waiting for a group commit."""
+        tracker = MessageTracker(db_path=temp_db_path, cleanup_interval=0, flush_interval=5.0)
+        tracker.track("msg-1", "feishu", "webhook-1", "content1")
+
+        tracker.close()
+
+        with sqlite3.connect(temp_db_path) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0] == 1
+
 
 class TestMessageTrackerCleanupThread:
     """Tests for background cleanup thread."""
@@ -6,22 +6,26 @@ Tests cover:
 - SendResult dataclass
 - ProviderConfig model
 - BaseProvider abstract class
+- AsyncBaseProvider and send_async
 - ProviderRegistry (deprecated)
 """
 
 from __future__ import annotations
 
+import threading
 from typing import Any
 
 import pytest
 
 from feishu_webhook_bot.core.provider import (
+    AsyncBaseProvider,
     BaseProvider,
     Message,
     MessageType,
     ProviderConfig,
     ProviderRegistry,
     SendResult,
+    send_async,
 )
 
 # ==============================================================================
@@ -392,6 +396,81 @@ class TestBaseProvider:
         assert "feishu" in repr_str
 
 
+# ==============================================================================
+# AsyncBaseProvider Tests
+# ==============================================================================
+
+
+class ConcreteAsyncProvider(AsyncBaseProvider, ConcreteProvider):
+    """Provider with both sync and native async send paths."""
+
+    async def async_send_text(self, text: str, target: str) -> SendResult:
+        return SendResult.ok(f"async_text_{target}")
+
+    async def async_send_card(self, card: dict[str, Any], target: str) -> SendResult:
+        return SendResult.ok(f"async_card_{target}")
+
+    async def async_send_rich_text(
+        self,
+        title: str,
+        content: list[list[dict[str, Any]]],
+        target: str,
+        language: str = "zh_cn",
+    ) -> SendResult:
+        return SendResult.ok(f"async_rich_{target}")
+
+    async def async_send_image(self, image_key: str, target: str) -> SendResult:
+        return SendResult.ok(f"async_img_{target}")
+
+
+class TestAsyncBaseProvider:
+    """Tests for AsyncBaseProvider and send_async."""
+
+    def test_cannot_instantiate_incomplete_provider(self):
+        """Test async send methods are abstract."""
+        with pytest.raises(TypeError):
+            AsyncBaseProvider()
+
+    @pytest.mark.anyio
+    async def test_async_send_message_dispatch(self):
+        """Test async_send_message routes by message type."""
+        provider = ConcreteAsyncProvider(ProviderConfig(provider_type="test"))
+
+        text = await provider.async_send_message(Message(MessageType.TEXT, "hi"), "t")
+        card = await provider.async_send_message(Message(MessageType.CARD, {}), "t")
+        video = await provider.async_send_message(Message(MessageType.VIDEO, "v"), "t")
+
+        assert text.message_id == "async_text_t"
+        assert card.message_id == "async_card_t"
+        assert video.success is False
+
+    @pytest.mark.anyio
+    async def test_send_async_prefers_native_path(self):
+        """Test send_async awaits the native async method."""
+        provider = ConcreteAsyncProvider(ProviderConfig(provider_type="test"))
+
+        result = await send_async(provider, "send_text", "hi", "t")
+
+        assert result.message_id == "async_text_t"
+
+    @pytest.mark.anyio
+    async def test_send_async_runs_sync_provider_in_thread(self):
+        """Test sync-only providers are called off the event loop thread."""
+        threads: list[int] = []
+
+        class RecordingProvider(ConcreteProvider):
+            def send_text(self, text: str, target: str) -> SendResult:
+                threads.append(threading.get_ident())
+                return super().send_text(text, target)
+
+        provider = RecordingProvider(ProviderConfig(provider_type="test"))
+
+        result = await send_async(provider, "send_text", "hi", "t")
+
+        assert result.message_id == "text_t"
+        assert threads and threads[0] != threading.get_ident()
+
+
 # ==============================================================================
 # ProviderRegistry Tests (Deprecated)
 # ==============================================================================
@@ -0,0 +1,258 @@
+"""Tests for the durable message queue store."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from feishu_webhook_bot.core.message_queue import MessageQueue, QueuedMessage
+from feishu_webhook_bot.core.provider import MessageType, SendResult
+from feishu_webhook_bot.core.queue_store import MessageQueueStore
+
+pytestmark = pytest.mark.anyio(backends=["asyncio"])
+
+
+class RecordingProvider:
+    """Minimal provider recording sent texts."""
+
+    def __init__(self, succeed: bool = True):
+        """Initialize provider."""
+        self.is_connected = True
+        self.succeed = succeed
+        self.sent: list[tuple[str, str]] = []
+
+    def send_text(self, text: str, target: str) -> SendResult:
+        """Record and acknowledge a text message."""
+        if not self.succeed:
+            return SendResult.fail("Mock error")
+        self.sent.append((text, target))
+        return SendResult.ok(f"msg-{len(self.sent)}")
+
+    def send_rich_text(self, title, content, target, language="zh_cn") -> SendResult:
+        """Record a rich text message."""
+        self.sent.append((title, target))
+        return SendResult.ok(f"msg-{len(self.sent)}")
+
+
+@pytest.fixture
+def db_path(tmp_path: Path) -> Path:
+    """Path for the queue database."""
+    return tmp_path / "queue.db"
+
+
+class TestQueuedMessageSerialization:
+    """Tests for QueuedMessage round-tripping."""
+
+    def test_round_trip(self) -> None:
+        """Test that to_dict/from_dict preserve all fields."""
+        msg = QueuedMessage(
+            content={"header": {"title": "x"}},
+            target="chat-1",
+            provider_name="feishu",
+            retry_count=2,
+            max_retries=5,
+            error="boom",
+            message_type=MessageType.CARD,
+        )
+
+        restored = QueuedMessage.from_dict(msg.to_dict())
+
+        assert restored == msg
+
+    def test_rich_text_content_restored_as_tuple(self) -> None:
+        """Test that rich text content survives JSON as a tuple."""
+        msg = QueuedMessage(
+            content=("Title", [[{"tag": "text", "text": "hi"}]], "en_us"),
+            target="chat-1",
+            message_type=MessageType.RICH_TEXT,
+        )
+        restored = QueuedMessage.from_dict(json.loads(json.dumps(msg.to_dict())))
+        assert restored.content == msg.content
+
+
+class TestMessageQueueStore:
+    """Tests for MessageQueueStore operations."""
+
+    def test_append_and_load(self, db_path: Path) -> None:
+        """Test that appended messages are loaded in order."""
+        store = MessageQueueStore(db_path)
+        messages = [QueuedMessage(content=f"m{i}", target="t") for i in range(5)]
+        store.append(messages[0])
+        assert store.append_many(messages[1:]) == 4
+
+        pending = store.load_pending()
+
+        assert [m.id for m, _ in pending] == [m.id for m in messages]
+        assert all(not_before is None for _, not_before in pending)
+        store.close()
+
+    def test_ack_removes_message(self, db_path: Path) -> None:
+        """Test that acknowledged messages are no longer pending."""
+        store = MessageQueueStore(db_path)
+        msg = QueuedMessage(content="hi", target="t")
+        store.append(msg)
+        store.ack(msg.id)
+
+        assert store.count() == 0
+        store.close()
+
+    def test_requeue_records_backoff(self, db_path: Path) -> None:
+        """Test that retry state is persisted."""
+        store = MessageQueueStore(db_path)
+        msg = QueuedMessage(content="hi", target="t")
+        store.append(msg)
+        msg.increment_retry()
+        msg.error = "timeout"
+        not_before = time.time() + 30
+        store.requeue(msg, not_before)
+
+        [(loaded, loaded_not_before)] = store.load_pending()
+
+        assert loaded.retry_count == 1
+        assert loaded.error == "timeout"
+        assert loaded_not_before == pytest.approx(not_before)
+        store.close()
+
+    def test_unserializable_content_skipped(self, db_path: Path) -> None:
+        """Test that non-JSON content is kept out of the store."""
+        store = MessageQueueStore(db_path)
+        msg = QueuedMessage(content=object(), target="t")
+
+        assert store.append(msg) is False
+        assert store.count() == 0
+        assert store.get_stats()["skipped"] == 1
+        store.close()
+
+    def test_survives_reopen(self, db_path: Path) -> None:
+        """Test that pending messages persist across store instances."""
+        store = MessageQueueStore(db_path, flush_interval=10.0)
+        store.append(QueuedMessage(content="hi", target="t"))
+        store.close()
+
+        reopened = MessageQueueStore(db_path)
+        assert len(reopened.load_pending()) == 1
+        reopened.close()
+
+    def test_compaction(self, db_path: Path) -> None:
+        """Test that compaction runs on the writer thread."""
+        store = MessageQueueStore(db_path, compact_interval=0)
+        for i in range(50):
+            msg = QueuedMessage(content=f"m{i}", target="t")
+            store.append(msg)
+            store.ack(msg.id)
+
+        store.compact()
+        store.flush()
+
+        assert store.get_stats()["compactions"] == 1
+        assert store.count() == 0
+        store.close()
+
+
+class TestDurableMessageQueue:
+    """Tests for MessageQueue with a durable store attached."""
+
+    async def test_pending_messages_replayed(self, db_path: Path) -> None:
+        """Test that unsent messages are replayed by a new queue."""
+        provider = RecordingProvider()
+        queue = MessageQueue({"p": provider}, store=MessageQueueStore(db_path))
+        await queue.enqueue_batch(
+            [QueuedMessage(content=f"m{i}", target="t", provider_name="p") for i in range(3)]
+        )
+        queue.close()  # simulated restart before processing
+
+        restarted = MessageQueue({"p": provider}, store=MessageQueueStore(db_path))
+        assert len(restarted) == 3
+
+        results = await restarted.process_queue()
+
+        assert results["sent"] == 3
+        assert [text for text, _ in provider.sent] == ["m0", "m1", "m2"]
+        restarted.store.flush()
+        assert restarted.store.count() == 0
+        restarted.close()
+
+    async def test_retry_backoff_replayed(self, db_path: Path) -> None:
+        """Test that a message awaiting retry comes back into the delay heap."""
+        provider = RecordingProvider(succeed=False)
+        queue = MessageQueue({"p": provider}, retry_delay=60.0, store=MessageQueueStore(db_path))
+        await queue.enqueue(QueuedMessage(content="hi", target="t", provider_name="p"))
+        await queue.process_queue()
+        queue.close()
+
+        restarted = MessageQueue({"p": provider}, store=MessageQueueStore(db_path))
+        stats = restarted.get_queue_stats()
+
+        assert stats["current_size"] == 0
+        assert stats["delayed"] == 1
+        assert stats["next_retry_in"] > 50
+        restarted.close()
+
+    async def test_failed_messages_dropped_from_store(self, db_path: Path) -> None:
+        """Test that permanently failed messages are acknowledged."""
+        provider = RecordingProvider(succeed=False)
+        queue = MessageQueue({"p": provider}, store=MessageQueueStore(db_path))
+        await queue.enqueue(
+            QueuedMessage(content="hi", target="t", provider_name="p", max_retries=0)
+        )
+
+        results = await queue.process_queue()
+
+        assert results["failed"] == 1
+        queue.store.flush()
+        assert queue.store.count() == 0
+        queue.close()
+
+    async def test_unknown_provider_skipped_on_replay(self, db_path: Path) -> None:
+        """Test that messages for removed providers are not replayed."""
+        store = MessageQueueStore(db_path)
+        store.append(QueuedMessage(content="hi", target="t", provider_name="gone"))
+        store.close()
+
+        queue = MessageQueue({"p": RecordingProvider()}, store=MessageQueueStore(db_path))
+
+        assert len(queue) == 0
+        queue.close()
+
+    async def test_unknown_provider_expired_from_store(self, db_path: Path) -> None:
+        """Test that undeliverable messages are removed instead of replayed every start."""
+        store = MessageQueueStore(db_path)
+        store.append(QueuedMessage(content="hi", target="t", provider_name="gone"))
+        store.append(QueuedMessage(content="ok", target="t", provider_name="p"))
+        store.close()
+
+        queue = MessageQueue({"p": RecordingProvider()}, store=MessageQueueStore(db_path))
+        queue.store.flush()
+
+        assert queue.store.count() == 1
+        assert queue.get_queue_stats()["total_failed"] == 1
+        queue.close()
+
+        restarted = MessageQueue({"p": RecordingProvider()}, store=MessageQueueStore(db_path))
+        assert len(restarted) == 1
+        assert restarted.get_queue_stats()["total_failed"] == 0
+        restarted.close()
+
+    async def test_stats_include_store(self, db_path: Path) -> None:
+        """Test that queue stats expose store statistics."""
+        queue = MessageQueue({"p": RecordingProvider()}, store=MessageQueueStore(db_path))
+        await queue.enqueue(QueuedMessage(content="hi", target="t", provider_name="p"))
+
+        stats = queue.get_queue_stats()
+
+        assert stats["persistent"] is True
+        assert stats["store"]["appended"] == 1
+        assert stats["store"]["db_path"] == str(db_path)
+        queue.close()
+
+    async def test_in_memory_queue_not_persistent(self) -> None:
+        """Test that queues without a store report as non-persistent."""
+        queue = MessageQueue({"p": RecordingProvider()})
+
+        stats = queue.get_queue_stats()
+
+        assert stats["persistent"] is False
+        assert "store" not in stats
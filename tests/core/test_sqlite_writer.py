@@ -0,0 +1,101 @@
+"""Tests for the group-committing SQLite writer."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+import pytest
+
+from feishu_webhook_bot.core.sqlite_writer import BatchedSQLiteWriter
+
+SCHEMA = ("CREATE TABLE IF NOT EXISTS items (id INTEGER PRIMARY KEY, name TEXT UNIQUE)",)
+
+
+def _count(conn: sqlite3.Connection) -> int:
+    return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+
+@pytest.fixture
+def writer(tmp_path: Path):
+    """Create a writer on a temporary database."""
+    w = BatchedSQLiteWriter(tmp_path / "test.db", schema=SCHEMA, flush_interval=0.01)
+    yield w
+    w.close()
+
+
+class TestBatchedSQLiteWriter:
+    """Tests for BatchedSQLiteWriter."""
+
+    def test_invalid_arguments(self, tmp_path: Path) -> None:
+        """Test that invalid tuning values are rejected."""
+        with pytest.raises(ValueError, match="flush_interval"):
+            BatchedSQLiteWriter(tmp_path / "a.db", flush_interval=-1)
+        with pytest.raises(ValueError, match="max_batch"):
+            BatchedSQLiteWriter(tmp_path / "b.db", max_batch=0)
+
+    def test_schema_error_raised(self, tmp_path: Path) -> None:
+        """Test that a failing schema statement surfaces at construction."""
+        with pytest.raises(sqlite3.Error):
+            BatchedSQLiteWriter(tmp_path / "c.db", schema=("NOT VALID SQL",))
+
+    def test_wal_mode_enabled(self, writer: BatchedSQLiteWriter) -> None:
+        """Test that file databases use WAL journaling."""
+        mode = writer.query(lambda conn: conn.execute("PRAGMA journal_mode").fetchone()[0])
+        assert mode == "wal"
+
+    def test_query_sees_queued_writes(self, writer: BatchedSQLiteWriter) -> None:
+        """Test that reads observe every previously queued write."""
+        for i in range(10):
+            writer.execute("INSERT INTO items (name) VALUES (?)", (f"item-{i}",))
+        writer.executemany("INSERT INTO items (name) VALUES (?)", [("a",), ("b",)])
+
+        assert writer.query(_count) == 12
+
+    def test_writes_are_group_committed(self, writer: BatchedSQLiteWriter) -> None:
+        """Test that many writes share few commits."""
+        for i in range(200):
+            writer.execute("INSERT INTO items (name) VALUES (?)", (f"item-{i}",))
+        writer.flush()
+
+        stats = writer.get_stats()
+        assert stats["statements"] == 200
+        assert stats["commits"] < 200
+
+    def test_failing_statement_isolated(self, writer: BatchedSQLiteWriter) -> None:
+        """Test that one bad statement does not discard the rest of its batch."""
+        writer.execute("INSERT INTO items (name) VALUES (?)", ("dup",))
+        writer.execute("INSERT INTO items (name) VALUES (?)", ("dup",))
+        writer.execute("INSERT INTO items (name) VALUES (?)", ("other",))
+
+        assert writer.query(_count) == 2
+        assert writer.get_stats()["errors"] == 1
+
+    def test_writes_from_many_threads(self, writer: BatchedSQLiteWriter) -> None:
+        """Test that writes may be queued from any thread."""
+
+        def insert(prefix: str) -> None:
+            for i in range(50):
+                writer.execute("INSERT INTO items (name) VALUES (?)", (f"{prefix}-{i}",))
+
+        threads = [threading.Thread(target=insert, args=(f"t{n}",)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert writer.query(_count) == 200
+
+    def test_close_commits_pending_writes(self, tmp_path: Path) -> None:
+        """Test that close flushes outstanding writes to disk."""
+        path = tmp_path / "close.db"
+        writer = BatchedSQLiteWriter(path, schema=SCHEMA, flush_interval=10.0)
+        writer.execute("INSERT INTO items (name) VALUES (?)", ("kept",))
+        writer.close()
+        writer.close()  # idempotent
+
+        with sqlite3.connect(path) as conn:
+            assert _count(conn) == 1
+        with pytest.raises(RuntimeError, match="closed"):
+            writer.execute("INSERT INTO items (name) VALUES (?)", ("late",))
@@ -0,0 +1,136 @@
+"""Tests for the shared LRU/TTL cache."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from feishu_webhook_bot.core.ttl_cache import SharedCache, TTLCache
+
+CLOCK = "feishu_webhook_bot.core.ttl_cache.time.time"
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_lru_eviction_and_stats(self) -> None:
+        """Test the least recently used entry is evicted and lookups are counted."""
+        cache = TTLCache("entries", ttl_seconds=60, max_size=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        assert cache.get("a") == "1"
+        cache.set("c", "3")
+
+        assert cache.get("b") is None
+        assert [key for key, _ in cache.items()] == ["a", "c"]
+        stats = cache.get_stats()
+        assert stats["evictions"] == 1
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate_percent"] == 50.0
+
+    def test_expiry(self) -> None:
+        """Test entries expire lazily on lookup and in cleanup_expired."""
+        cache = TTLCache("entries", ttl_seconds=10, max_size=10)
+        with patch(CLOCK, return_value=1000.0):
+            cache.set("a", "1")
+            cache.set("b", "2")
+        with patch(CLOCK, return_value=1010.0):
+            assert cache.get("a") is None
+            assert cache.cleanup_expired() == 1
+
+        assert len(cache) == 0
+        assert cache.get_stats()["expired"] == 2
+
+    def test_invalid_arguments(self) -> None:
+        """Test invalid table names and limits are rejected."""
+        with pytest.raises(ValueError):
+            TTLCache("bad table", ttl_seconds=10, max_size=10)
+        with pytest.raises(ValueError):
+            TTLCache("entries", ttl_seconds=-1, max_size=10)
+        with pytest.raises(ValueError):
+            TTLCache("entries", ttl_seconds=10, max_size=0)
+
+
+class TestPersistentTTLCache:
+    """Tests for the SQLite tier."""
+
+    def test_warm_start_and_custom_codec(self, tmp_path: Path) -> None:
+        """Test encoded entries are loaded back in recency order after a restart."""
+        path = tmp_path / "cache.db"
+        cache = TTLCache("entries", 60, 10, db_path=path, encode=json.dumps, decode=json.loads)
+        cache.set("a", {"n": 1})
+        cache.set("b", [1, 2])
+        cache.close()
+
+        reopened = TTLCache("entries", 60, 10, db_path=path, encode=json.dumps, decode=json.loads)
+        try:
+            assert [key for key, _ in reopened.items()] == ["a", "b"]
+            assert reopened.get("a") == {"n": 1}
+            assert reopened.get_stats()["warm_loaded"] == 2
+        finally:
+            reopened.close()
+
+    def test_unserializable_values_stay_in_memory(self, tmp_path: Path) -> None:
+        """Test values the encoder rejects are cached but not persisted."""
+        path = tmp_path / "cache.db"
+        cache = TTLCache("entries", 60, 10, db_path=path)
+        cache.set("a", object())
+        cache.close()
+
+        assert cache.get("a") is not None
+        reopened = TTLCache("entries", 60, 10, db_path=path)
+        assert len(reopened) == 0
+        reopened.close()
+
+    @pytest.mark.anyio
+    async def test_read_through(self, tmp_path: Path) -> None:
+        """Test memory misses fall back to entries another cache stored."""
+        path = tmp_path / "cache.db"
+        reader = TTLCache("entries", 60, 10, db_path=path, warm_start=False, read_through=True)
+        writer = TTLCache("entries", 60, 10, db_path=path)
+        writer.set("a", "1")
+        writer.set("b", "2")
+        writer.close()
+
+        try:
+            assert reader.get("a") == "1"
+            assert await reader.aget("b") == "2"
+            assert await reader.aget("missing") is None
+            assert reader.get_stats()["disk_hits"] == 2
+
+            reader.delete("a")
+            assert reader.get("a") is None
+        finally:
+            reader.close()
+
+
+class TestSharedCache:
+    """Tests for SharedCache."""
+
+    def test_configure_replaces_only_on_change(self) -> None:
+        """Test unchanged settings keep the cache and new settings close the old one."""
+        shared = SharedCache(lambda **settings: TTLCache("entries", **settings))
+        first = shared.get(ttl_seconds=60, max_size=10)
+
+        assert shared.configure(ttl_seconds=60, max_size=10, db_path=None) is first
+        second = shared.configure(ttl_seconds=30, max_size=10, db_path=None)
+        assert second is not first
+        assert shared.current is second
+
+        shared.reset()
+        assert shared.current is None
+
+    def test_matches_uses_cache_settings(self, tmp_path: Path) -> None:
+        """Test matches compares TTL, size and normalized database path."""
+        path = tmp_path / "cache.db"
+        cache = TTLCache("entries", 60, 10, db_path=str(path))
+        try:
+            assert cache.matches(60, 10, path)
+            assert not cache.matches(60, 10, None)
+            assert not cache.matches(61, 10, path)
+        finally:
+            cache.close()
@@ -1,6 +1,8 @@
 """Mock objects for testing."""
 
+from .mock_feishu_api import FakeFeishuAPI
+from .mock_onebot_ws import FakeOneBot
 from .mock_plugin import MockPlugin
 from .mock_scheduler import MockScheduler
 
-__all__ = ["MockPlugin", "MockScheduler"]
+__all__ = ["FakeFeishuAPI", "FakeOneBot", "MockPlugin", "MockScheduler"]
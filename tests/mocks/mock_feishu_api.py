@@ -0,0 +1,38 @@
+"""Mock Feishu Open Platform client for testing."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from feishu_webhook_bot.providers.feishu.api import MessageSendResult
+
+
+class FakeFeishuAPI:
+    """Open Platform client stub recording sent and updated cards."""
+
+    def __init__(self, reply_ok: bool = True) -> None:
+        self.reply_ok = reply_ok
+        self.connected = False
+        self.sent: list[tuple[str, str]] = []
+        self.updates: list[str] = []
+
+    async def connect(self) -> None:
+        self.connected = True
+
+    async def reply_message(
+        self, message_id: str, msg_type: str, content: dict[str, Any]
+    ) -> MessageSendResult:
+        self.sent.append(("reply", message_id))
+        if not self.reply_ok:
+            return MessageSendResult.fail(230002, "reply not allowed")
+        return MessageSendResult.ok("om_card")
+
+    async def send_message(
+        self, receive_id: str, receive_id_type: str, msg_type: str, content: dict[str, Any]
+    ) -> MessageSendResult:
+        self.sent.append(("send", receive_id))
+        return MessageSendResult.ok("om_card")
+
+    async def update_message(self, message_id: str, msg_type: str, content: dict[str, Any]) -> bool:
+        self.updates.append(content["elements"][0]["content"])
+        return True
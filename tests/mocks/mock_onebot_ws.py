@@ -0,0 +1,163 @@
+"""Local OneBot11 WebSocket peer standing in for Napcat in tests."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from typing import Any
+
+from websockets.asyncio.client import connect
+from websockets.asyncio.server import serve
+
+
+class FakeOneBot:
+    """Napcat stand-in answering OneBot actions and pushing events.
+
+    Serves forward-mode clients via ``serve()`` or dials a reverse-mode bot
+    via ``connect_to()``. Runs its own event loop on a daemon thread, so tests
+    drive it synchronously.
+    """
+
+    def __init__(self, access_token: str | None = None) -> None:
+        self.access_token = access_token
+        self.actions: list[tuple[str, dict[str, Any]]] = []
+        self.request_headers: list[Any] = []
+        self.connection_count = 0
+        # Seconds to wait before answering an action, to force out-of-order replies
+        self.delays: dict[str, float] = {}
+        # Custom responses per action: dict or callable(params) -> response
+        self.responses: dict[str, Any] = {}
+        self._connections: set[Any] = set()
+        self._server: Any = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+        self._thread.start()
+
+    @property
+    def url(self) -> str:
+        """Forward-mode URL of the running server."""
+        port = self._server.sockets[0].getsockname()[1]
+        return f"ws://127.0.0.1:{port}"
+
+    @property
+    def connected(self) -> bool:
+        """Whether any bot connection is open."""
+        return bool(self._connections)
+
+    def serve(self) -> FakeOneBot:
+        """Listen for forward-mode connections on a free port."""
+
+        async def start() -> Any:
+            return await serve(self._serve_connection, "127.0.0.1", 0)
+
+        self._server = self._run(start())
+        return self
+
+    def connect_to(self, url: str, token: str | None = None) -> None:
+        """Dial a reverse-mode bot the way Napcat does.
+
+        Raises:
+            websockets.exceptions.InvalidStatus: If the bot rejects the handshake
+        """
+        headers = {"Authorization": f"Bearer {token}"} if token else None
+
+        async def dial() -> None:
+            connection = await connect(url, additional_headers=headers)
+            self._loop.create_task(self._handle(connection))
+
+        self._run(dial())
+
+    def push_event(self, event: dict[str, Any]) -> None:
+        """Send an event to every connected bot."""
+
+        async def push() -> None:
+            for connection in list(self._connections):
+                await connection.send(json.dumps(event))
+
+        self._run(push())
+
+    def heartbeat(self, interval_ms: int = 5000) -> None:
+        """Send a heartbeat meta event."""
+        self.push_event(
+            {
+                "post_type": "meta_event",
+                "meta_event_type": "heartbeat",
+                "self_id": 10001,
+                "interval": interval_ms,
+                "status": {"online": True, "good": True},
+            }
+        )
+
+    def drop_connections(self) -> None:
+        """Close every connection, as if Napcat restarted."""
+
+        async def drop() -> None:
+            for connection in list(self._connections):
+                await connection.close()
+
+        self._run(drop())
+
+    def close(self) -> None:
+        """Close connections, stop the server and the loop thread."""
+
+        async def shutdown() -> None:
+            for connection in list(self._connections):
+                await connection.close()
+            if self._server is not None:
+                self._server.close()
+                await self._server.wait_closed()
+
+        self._run(shutdown())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+        self._loop.close()
+
+    def _run(self, coro: Any) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout=5)
+
+    async def _serve_connection(self, connection: Any) -> None:
+        self.request_headers.append(connection.request.headers)
+        if self.access_token:
+            expected = f"Bearer {self.access_token}"
+            if connection.request.headers.get("Authorization") != expected:
+                await connection.close(code=1008, reason="unauthorized")
+                return
+        await self._handle(connection)
+
+    async def _handle(self, connection: Any) -> None:
+        self._connections.add(connection)
+        self.connection_count += 1
+        try:
+            await connection.send(
+                json.dumps(
+                    {
+                        "post_type": "meta_event",
+                        "meta_event_type": "lifecycle",
+                        "sub_type": "connect",
+                        "self_id": 10001,
+                    }
+                )
+            )
+            async for frame in connection:
+                request = json.loads(frame)
+                asyncio.create_task(self._answer(connection, request))
+        except Exception:
+            pass
+        finally:
+            self._connections.discard(connection)
+
+    async def _answer(self, connection: Any, request: dict[str, Any]) -> None:
+        action = request["action"]
+        params = request.get("params", {})
+        self.actions.append((action, params))
+        await asyncio.sleep(self.delays.get(action, 0))
+        response = self.responses.get(action)
+        if callable(response):
+            response = response(params)
+        if response is None:
+            response = {"status": "ok", "retcode": 0, "data": {"message_id": len(self.actions)}}
+        try:
+            await connection.send(json.dumps({**response, "echo": request.get("echo")}))
+        except Exception:
+            pass
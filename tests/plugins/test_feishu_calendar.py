@@ -8,6 +8,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from feishu_webhook_bot.core.config import BotConfig
+from feishu_webhook_bot.core.feishu_token import get_token_service
 from feishu_webhook_bot.plugins.feishu_calendar import (
     AttendeeStatus,
     CalendarEvent,
@@ -144,48 +145,47 @@ class TestAccessTokenManagement:
 
     def test_get_token_success(self, plugin):
         """Test successful token retrieval."""
-        with patch("feishu_webhook_bot.plugins.feishu_calendar.httpx.Client") as mock_http:
+        with patch("feishu_webhook_bot.core.feishu_token.get_http_pool") as mock_http:
             mock_response = MagicMock()
             mock_response.json.return_value = {
                 "code": 0,
                 "tenant_access_token": "test_token_123",
                 "expire": 7200,
             }
-            mock_http.return_value.__enter__.return_value.post.return_value = mock_response
+            mock_http.return_value.sync_client.return_value.post.return_value = mock_response
 
             token = plugin._get_tenant_access_token()
 
             assert token == "test_token_123"
-            assert plugin._token_cache is not None
-            assert plugin._token_cache[0] == "test_token_123"
+            assert get_token_service().get_stats()["expires_in"]["test_app_id"] > 7000
 
     def test_get_token_caching(self, plugin):
         """Test that tokens are cached."""
-        with patch("feishu_webhook_bot.plugins.feishu_calendar.httpx.Client") as mock_http:
+        with patch("feishu_webhook_bot.core.feishu_token.get_http_pool") as mock_http:
             mock_response = MagicMock()
             mock_response.json.return_value = {
                 "code": 0,
                 "tenant_access_token": "test_token_123",
                 "expire": 7200,
             }
-            mock_http.return_value.__enter__.return_value.post.return_value = mock_response
+            mock_http.return_value.sync_client.return_value.post.return_value = mock_response
 
             token1 = plugin._get_tenant_access_token()
             token2 = plugin._get_tenant_access_token()
 
             assert token1 == token2
             # Should only call API once due to caching
-            assert mock_http.return_value.__enter__.return_value.post.call_count == 1
+            assert mock_http.return_value.sync_client.return_value.post.call_count == 1
 
     def test_get_token_api_error(self, plugin):
         """Test handling of API errors when getting token."""
-        with patch("feishu_webhook_bot.plugins.feishu_calendar.httpx.Client") as mock_http:
+        with patch("feishu_webhook_bot.core.feishu_token.get_http_pool") as mock_http:
             mock_response = MagicMock()
             mock_response.json.return_value = {
                 "code": -1,
                 "msg": "Invalid credentials",
             }
-            mock_http.return_value.__enter__.return_value.post.return_value = mock_response
+            mock_http.return_value.sync_client.return_value.post.return_value = mock_response
 
             token = plugin._get_tenant_access_token()
 
@@ -193,10 +193,10 @@ class TestAccessTokenManagement:
 
     def test_get_token_http_error(self, plugin):
         """Test handling of HTTP errors when getting token."""
-        with patch("feishu_webhook_bot.plugins.feishu_calendar.httpx.Client") as mock_http:
+        with patch("feishu_webhook_bot.core.feishu_token.get_http_pool") as mock_http:
             import httpx
 
-            mock_http.return_value.__enter__.return_value.post.side_effect = httpx.HTTPError(
+            mock_http.return_value.sync_client.return_value.post.side_effect = httpx.HTTPError(
                 "Connection failed"
             )
 
@@ -929,7 +929,10 @@ class TestCalendarAPIethods:
 
     def test_get_calendar_list(self, plugin):
         """Test fetching calendar list."""
-        with patch("feishu_webhook_bot.plugins.feishu_calendar.httpx.Client") as mock_http:
+        with (
+            patch("feishu_webhook_bot.plugins.feishu_calendar.get_http_pool") as mock_http,
+            patch("feishu_webhook_bot.core.feishu_token.get_http_pool", mock_http),
+        ):
             # Mock token response
             mock_token_response = MagicMock()
             mock_token_response.json.return_value = {
@@ -953,7 +956,7 @@ class TestCalendarAPIethods:
             mock_client = MagicMock()
             mock_client.post.return_value = mock_token_response
             mock_client.get.return_value = mock_list_response
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value.sync_client.return_value = mock_client
 
             calendars = plugin.get_calendar_list()
 
@@ -964,7 +967,10 @@ class TestCalendarAPIethods:
         """Test fetching events."""
         now = datetime.now(tz=UTC)
 
-        with patch("feishu_webhook_bot.plugins.feishu_calendar.httpx.Client") as mock_http:
+        with (
+            patch("feishu_webhook_bot.plugins.feishu_calendar.get_http_pool") as mock_http,
+            patch("feishu_webhook_bot.core.feishu_token.get_http_pool", mock_http),
+        ):
             mock_token_response = MagicMock()
             mock_token_response.json.return_value = {
                 "code": 0,
@@ -989,7 +995,7 @@ class TestCalendarAPIethods:
             mock_client = MagicMock()
             mock_client.post.return_value = mock_token_response
             mock_client.get.return_value = mock_events_response
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value.sync_client.return_value = mock_client
 
             events = plugin.get_events("primary")
 
@@ -1000,7 +1006,10 @@ class TestCalendarAPIethods:
         """Test fetching event detail."""
         now = datetime.now(tz=UTC)
 
-        with patch("feishu_webhook_bot.plugins.feishu_calendar.httpx.Client") as mock_http:
+        with (
+            patch("feishu_webhook_bot.plugins.feishu_calendar.get_http_pool") as mock_http,
+            patch("feishu_webhook_bot.core.feishu_token.get_http_pool", mock_http),
+        ):
             mock_token_response = MagicMock()
             mock_token_response.json.return_value = {
                 "code": 0,
@@ -1023,7 +1032,7 @@ class TestCalendarAPIethods:
             mock_client = MagicMock()
             mock_client.post.return_value = mock_token_response
             mock_client.get.return_value = mock_event_response
-            mock_http.return_value.__enter__.return_value = mock_client
+            mock_http.return_value.sync_client.return_value = mock_client
 
             event = plugin.get_event_detail("primary", "event_123")
 
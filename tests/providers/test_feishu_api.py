@@ -7,6 +7,9 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from feishu_webhook_bot.core.provider import SendResult
+from feishu_webhook_bot.providers.feishu.api import FeishuOpenAPI as ProviderFeishuOpenAPI
+from feishu_webhook_bot.providers.feishu.api import parse_receive_target
 from feishu_webhook_bot.providers.feishu_api import (
     FeishuAPIError,
     FeishuOpenAPI,
@@ -460,3 +463,62 @@ class TestCreateFeishuApi:
         assert isinstance(api, FeishuOpenAPI)
         assert api.app_id == "cli_xxx"
         assert api.timeout == 60.0
+
+
+class TestFeishuOpenAPIProvider:
+    """Tests for FeishuOpenAPI as an AsyncBaseProvider."""
+
+    @pytest.mark.parametrize(
+        ("target", "expected"),
+        [
+            ("oc_123", ("oc_123", "chat_id")),
+            ("ou_123", ("ou_123", "open_id")),
+            ("on_123", ("on_123", "union_id")),
+            ("user@example.com", ("user@example.com", "email")),
+            ("user_id:abc", ("abc", "user_id")),
+            ("custom", ("custom", "chat_id")),
+        ],
+    )
+    def test_parse_receive_target(self, target: str, expected: tuple[str, str]) -> None:
+        """Test receive ID types are parsed or inferred from the target."""
+        assert parse_receive_target(target) == expected
+
+    def test_parse_empty_target(self) -> None:
+        """Test an empty target is rejected."""
+        with pytest.raises(ValueError):
+            parse_receive_target("")
+
+    @pytest.mark.anyio
+    async def test_async_send_text(self) -> None:
+        """Test async_send_text sends to the parsed target and returns a SendResult."""
+        api = ProviderFeishuOpenAPI(app_id="cli_xxx", app_secret="secret_xxx")
+        api.get_tenant_access_token = AsyncMock(return_value="t-xxx")
+        mock_client = AsyncMock()
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"code": 0, "data": {"message_id": "om_xxx"}}
+        mock_client.post.return_value = mock_response
+        api._client = mock_client
+
+        result = await api.async_send_text("Hello!", "ou_123")
+
+        assert isinstance(result, SendResult)
+        assert result.message_id == "om_xxx"
+        call = mock_client.post.call_args
+        assert call.kwargs["params"] == {"receive_id_type": "open_id"}
+        assert call.kwargs["json"]["receive_id"] == "ou_123"
+
+    @pytest.mark.anyio
+    async def test_async_send_api_error(self) -> None:
+        """Test API errors are returned as failed SendResults."""
+        api = ProviderFeishuOpenAPI(app_id="cli_xxx", app_secret="secret_xxx")
+        api.get_tenant_access_token = AsyncMock(return_value="t-xxx")
+        mock_client = AsyncMock()
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"code": 230001, "msg": "invalid receive_id"}
+        mock_client.post.return_value = mock_response
+        api._client = mock_client
+
+        result = await api.async_send_card({"elements": []}, "oc_123")
+
+        assert result.success is False
+        assert "230001" in (result.error or "")
@@ -8,12 +8,17 @@ Tests cover:
 - Signature generation integration
 - Circuit breaker integration
 - Message tracker integration
+- Native async sends
 """
 
 from __future__ import annotations
 
+import json
 from unittest.mock import MagicMock, patch
 
+import pytest
+from pytest_httpx import HTTPXMock
+
 from feishu_webhook_bot.core.circuit_breaker import CircuitBreakerConfig
 from feishu_webhook_bot.core.message_tracker import MessageStatus, MessageTracker
 from feishu_webhook_bot.core.provider import Message, MessageType
@@ -551,3 +556,56 @@ class TestFeishuProviderTrackerIntegration:
         assert "error" in call_args[1]
 
         provider.disconnect()
+
+
+class TestFeishuProviderAsync:
+    """Tests for the native async send path."""
+
+    @pytest.mark.anyio
+    async def test_async_send_text_without_connect(self, httpx_mock: HTTPXMock) -> None:
+        """Test async sends use the shared client and sign the payload."""
+        httpx_mock.add_response(url="https://example.com/hook", json={"code": 0, "msg": "ok"})
+        config = FeishuProviderConfig(
+            url="https://example.com/hook", secret="s", headers={"X-Custom": "v"}
+        )
+        tracker = MagicMock(spec=MessageTracker)
+        provider = FeishuProvider(config, message_tracker=tracker)
+
+        result = await provider.async_send_text("Hello!", "")
+
+        assert result.success is True
+        request = httpx_mock.get_request()
+        body = json.loads(request.content)
+        assert body["content"] == {"text": "Hello!"}
+        assert "sign" in body and "timestamp" in body
+        assert request.headers["X-Custom"] == "v"
+        assert tracker.update_status.call_args[0][1] == MessageStatus.SENT
+
+    @pytest.mark.anyio
+    async def test_async_send_message_card(self, httpx_mock: HTTPXMock) -> None:
+        """Test async_send_message sends cards as interactive messages."""
+        httpx_mock.add_response(url="https://example.com/hook", json={"code": 0})
+        provider = FeishuProvider(FeishuProviderConfig(url="https://example.com/hook"))
+
+        result = await provider.async_send_message(Message(MessageType.CARD, {"a": 1}), "")
+
+        assert result.success is True
+        assert json.loads(httpx_mock.get_request().content)["msg_type"] == "interactive"
+
+    @pytest.mark.anyio
+    async def test_async_send_failure_trips_circuit_breaker(self, httpx_mock: HTTPXMock) -> None:
+        """Test API errors fail the send and count towards the circuit breaker."""
+        httpx_mock.add_response(url="https://example.com/hook", json={"code": 9499, "msg": "bad"})
+        provider = FeishuProvider(
+            FeishuProviderConfig(url="https://example.com/hook"),
+            circuit_breaker_config=CircuitBreakerConfig(failure_threshold=1),
+        )
+
+        first = await provider.async_send_text("Hello!", "")
+        second = await provider.async_send_text("Hello!", "")
+
+        assert first.success is False
+        assert "bad" in (first.error or "")
+        assert second.success is False
+        assert "open" in (second.error or "")
+        assert len(httpx_mock.get_requests()) == 1
@@ -1083,7 +1083,7 @@ class TestNapcatProvider:
 
         assert result.success is True
         call_args = mock_client.post.call_args
-        assert call_args[0][0] == "/send_private_msg"
+        assert call_args[0][0] == "http://127.0.0.1:3000/send_private_msg"
         payload = call_args[1]["json"]
         assert payload["user_id"] == 123456
 
@@ -1105,7 +1105,7 @@ class TestNapcatProvider:
 
         assert result.success is True
         call_args = mock_client.post.call_args
-        assert call_args[0][0] == "/send_group_msg"
+        assert call_args[0][0] == "http://127.0.0.1:3000/send_group_msg"
         payload = call_args[1]["json"]
         assert payload["group_id"] == 654321
 
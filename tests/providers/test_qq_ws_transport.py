@@ -0,0 +1,307 @@
+"""Tests for the OneBot11 WebSocket transport and NapcatProvider over WebSocket."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import pytest
+from websockets.exceptions import InvalidStatus
+
+from feishu_webhook_bot.core.config import OneBotWebSocketConfig, ProviderConfigBase
+from feishu_webhook_bot.providers.qq.ws_transport import OneBotWebSocketTransport
+from feishu_webhook_bot.providers.qq_napcat import NapcatProvider, NapcatProviderConfig
+from tests.mocks import FakeOneBot
+
+
+def _wait_for(condition: Any, timeout: float = 5.0) -> bool:
+    """Poll until condition() is true or the timeout passes."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+@pytest.fixture
+def onebot() -> Iterator[FakeOneBot]:
+    """Run a fake Napcat WebSocket server."""
+    server = FakeOneBot(access_token="secret").serve()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def transport(onebot: FakeOneBot) -> Iterator[OneBotWebSocketTransport]:
+    """Start a forward-mode transport connected to the fake server."""
+    t = OneBotWebSocketTransport(
+        OneBotWebSocketConfig(url=onebot.url, request_timeout=2.0, reconnect_initial_delay=0.05),
+        access_token="secret",
+    )
+    t.start()
+    assert t.wait_connected(5)
+    yield t
+    t.stop()
+
+
+class TestForwardTransport:
+    """Tests for forward-mode connections."""
+
+    def test_call_round_trip(self, onebot: FakeOneBot, transport: OneBotWebSocketTransport) -> None:
+        """Test an action is sent as a frame and its echoed response returned."""
+        onebot.responses["get_login_info"] = {
+            "status": "ok",
+            "retcode": 0,
+            "data": {"user_id": 10001, "nickname": "bot"},
+        }
+
+        result = transport.call("/get_login_info")
+
+        assert result["data"] == {"user_id": 10001, "nickname": "bot"}
+        assert onebot.actions == [("get_login_info", {})]
+        assert onebot.request_headers[0]["Authorization"] == "Bearer secret"
+
+    def test_concurrent_calls_share_connection(
+        self, onebot: FakeOneBot, transport: OneBotWebSocketTransport
+    ) -> None:
+        """Test out-of-order responses reach the right callers on one connection."""
+        onebot.delays["slow"] = 0.3
+        onebot.responses["slow"] = {"status": "ok", "data": "slow"}
+        onebot.responses["fast"] = lambda params: {"status": "ok", "data": params["n"]}
+
+        with ThreadPoolExecutor(max_workers=9) as pool:
+            slow = pool.submit(transport.call, "slow")
+            fast = [pool.submit(transport.call, "fast", {"n": n}) for n in range(8)]
+            fast_results = [future.result()["data"] for future in fast]
+            assert not slow.done()
+            assert slow.result()["data"] == "slow"
+
+        assert fast_results == list(range(8))
+        assert onebot.connection_count == 1
+        assert transport.get_stats()["calls"] == 9
+
+    @pytest.mark.anyio
+    async def test_acall_from_other_loop(
+        self, onebot: FakeOneBot, transport: OneBotWebSocketTransport
+    ) -> None:
+        """Test coroutines on another loop can await calls."""
+        results = await asyncio.gather(*(transport.acall("ping") for _ in range(5)))
+
+        assert all(result["status"] == "ok" for result in results)
+        assert len(onebot.actions) == 5
+
+    def test_events_and_heartbeats(
+        self, onebot: FakeOneBot, transport: OneBotWebSocketTransport
+    ) -> None:
+        """Test events reach the handler tagged as napcat and heartbeats are tracked."""
+        events: list[dict[str, Any]] = []
+        threads: list[str] = []
+
+        def handler(event: dict[str, Any]) -> None:
+            threads.append(threading.current_thread().name)
+            events.append(event)
+
+        transport.set_event_handler(handler)
+        onebot.heartbeat(interval_ms=5000)
+        onebot.push_event({"post_type": "message", "message_type": "group", "raw_message": "hi"})
+
+        assert _wait_for(lambda: len(events) == 2)
+        assert events[1]["raw_message"] == "hi"
+        assert events[1]["_provider"] == "napcat"
+        assert all(name.startswith("onebot-ws-") for name in threads)
+        stats = transport.get_stats()
+        assert stats["heartbeat_interval"] == 5.0
+        assert stats["self_id"] == 10001
+
+    def test_sync_handler_can_call_actions(
+        self, onebot: FakeOneBot, transport: OneBotWebSocketTransport
+    ) -> None:
+        """Test a synchronous handler may reply through the same transport."""
+        replies: list[dict[str, Any]] = []
+        transport.set_event_handler(lambda event: replies.append(transport.call("reply")))
+
+        onebot.push_event({"post_type": "message", "raw_message": "ping"})
+
+        assert _wait_for(lambda: len(replies) == 1)
+        assert replies[0]["status"] == "ok"
+
+    def test_reconnects_after_drop(
+        self, onebot: FakeOneBot, transport: OneBotWebSocketTransport
+    ) -> None:
+        """Test a dropped connection is reopened and calls work again."""
+        onebot.drop_connections()
+
+        assert _wait_for(lambda: onebot.connection_count == 2 and transport.connected)
+        assert transport.call("ping")["status"] == "ok"
+        assert transport.get_stats()["connects"] == 2
+
+    def test_heartbeat_timeout_reconnects(self, onebot: FakeOneBot) -> None:
+        """Test a connection without heartbeats is closed and reopened."""
+        t = OneBotWebSocketTransport(
+            OneBotWebSocketConfig(
+                url=onebot.url, heartbeat_timeout=0.2, reconnect_initial_delay=0.05
+            ),
+            access_token="secret",
+        )
+        t.start()
+        try:
+            assert _wait_for(lambda: t.get_stats()["heartbeat_timeouts"] >= 1)
+            assert _wait_for(lambda: onebot.connection_count >= 2)
+        finally:
+            t.stop()
+
+    def test_pending_calls_fail_on_disconnect(
+        self, onebot: FakeOneBot, transport: OneBotWebSocketTransport
+    ) -> None:
+        """Test calls waiting on a closed connection fail instead of hanging."""
+        onebot.delays["slow"] = 5.0
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(transport.call, "slow")
+            assert _wait_for(lambda: transport.get_stats()["pending"] == 1)
+            onebot.drop_connections()
+
+            with pytest.raises(ConnectionError):
+                future.result(timeout=5)
+
+    def test_call_without_connection(self) -> None:
+        """Test calls time out with ConnectionError while Napcat is unreachable."""
+        t = OneBotWebSocketTransport(
+            OneBotWebSocketConfig(url="ws://127.0.0.1:9", request_timeout=0.2)
+        )
+        with pytest.raises(ConnectionError, match="not running"):
+            t.call("ping")
+
+        t.start()
+        try:
+            with pytest.raises(ConnectionError, match="not connected"):
+                t.call("ping")
+            assert t.get_stats()["connect_failures"] >= 1
+        finally:
+            t.stop()
+
+
+class TestReverseTransport:
+    """Tests for reverse-mode connections from Napcat."""
+
+    @pytest.fixture
+    def reverse(self) -> Iterator[OneBotWebSocketTransport]:
+        """Listen for Napcat on a free port."""
+        t = OneBotWebSocketTransport(
+            OneBotWebSocketConfig(mode="reverse", host="127.0.0.1", port=0),
+            access_token="secret",
+        )
+        t.start()
+        yield t
+        t.stop()
+
+    def test_accepts_napcat(self, reverse: OneBotWebSocketTransport) -> None:
+        """Test Napcat connects with the token and serves calls."""
+        napcat = FakeOneBot()
+        try:
+            napcat.connect_to(f"ws://127.0.0.1:{reverse.listen_port}/onebot/v11/ws", "secret")
+
+            assert reverse.wait_connected(5)
+            assert reverse.call("send_group_msg", {"group_id": 1})["status"] == "ok"
+            assert napcat.actions == [("send_group_msg", {"group_id": 1})]
+        finally:
+            napcat.close()
+
+    def test_rejects_bad_token_and_path(self, reverse: OneBotWebSocketTransport) -> None:
+        """Test handshakes with a wrong token or path are refused."""
+        napcat = FakeOneBot()
+        base = f"ws://127.0.0.1:{reverse.listen_port}"
+        try:
+            with pytest.raises(InvalidStatus, match="401"):
+                napcat.connect_to(f"{base}/onebot/v11/ws", "wrong")
+            with pytest.raises(InvalidStatus, match="404"):
+                napcat.connect_to(f"{base}/other", "secret")
+            assert not reverse.connected
+        finally:
+            napcat.close()
+
+    def test_port_in_use(self, reverse: OneBotWebSocketTransport) -> None:
+        """Test start raises when the listen port is taken."""
+        t = OneBotWebSocketTransport(
+            OneBotWebSocketConfig(mode="reverse", host="127.0.0.1", port=reverse.listen_port)
+        )
+        with pytest.raises(OSError):
+            t.start()
+
+
+class TestNapcatProviderWebSocket:
+    """Tests for NapcatProvider using the WebSocket transport."""
+
+    @pytest.fixture
+    def provider(self, onebot: FakeOneBot) -> Iterator[NapcatProvider]:
+        """Connect a provider to the fake server over WebSocket."""
+        config = NapcatProviderConfig(
+            name="qq",
+            access_token="secret",
+            websocket=OneBotWebSocketConfig(url=onebot.url, request_timeout=2.0),
+        )
+        p = NapcatProvider(config)
+        p.connect()
+        assert p.transport is not None and p.transport.wait_connected(5)
+        yield p
+        p.disconnect()
+
+    def test_send_text(self, onebot: FakeOneBot, provider: NapcatProvider) -> None:
+        """Test messages are sent as WebSocket actions."""
+        result = provider.send_text("hello", "group:123")
+
+        assert result.success
+        action, params = onebot.actions[0]
+        assert action == "send_group_msg"
+        assert params["group_id"] == 123
+        assert params["message"][0]["data"]["text"] == "hello"
+
+    def test_api_error(self, onebot: FakeOneBot, provider: NapcatProvider) -> None:
+        """Test failed OneBot responses surface as send failures."""
+        onebot.responses["send_private_msg"] = {"status": "failed", "msg": "not friend"}
+
+        result = provider.send_text("hello", "private:42")
+
+        assert not result.success
+        assert "not friend" in result.error
+
+    @pytest.mark.anyio
+    async def test_async_api(self, onebot: FakeOneBot, provider: NapcatProvider) -> None:
+        """Test async API calls use the transport instead of HTTP."""
+        onebot.responses["get_group_info"] = {
+            "status": "ok",
+            "data": {"group_id": 123, "group_name": "g", "member_count": 3},
+        }
+
+        info = await provider.async_get_group_info(123)
+
+        assert info is not None
+        assert onebot.actions == [("get_group_info", {"group_id": 123, "no_cache": False})]
+
+    def test_events_forwarded(self, onebot: FakeOneBot, provider: NapcatProvider) -> None:
+        """Test events set through the provider reach the handler."""
+        events: list[dict[str, Any]] = []
+        provider.set_event_handler(events.append)
+
+        onebot.push_event({"post_type": "notice", "notice_type": "group_increase"})
+
+        assert _wait_for(lambda: len(events) == 1)
+        assert provider.event_loop is provider.transport.loop
+
+    def test_config_requires_transport(self) -> None:
+        """Test Napcat configs need an HTTP URL or a WebSocket."""
+        with pytest.raises(ValueError, match="http_url"):
+            NapcatProviderConfig(name="qq")
+        with pytest.raises(ValueError, match="url"):
+            OneBotWebSocketConfig(mode="forward")
+
+        config = ProviderConfigBase(
+            provider_type="napcat",
+            websocket=OneBotWebSocketConfig(mode="reverse"),
+        )
+        assert config.http_url is None
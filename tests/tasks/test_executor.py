@@ -451,7 +451,7 @@ class TestTaskActions:
         assert result["success"] is True
         plugin.check_health.assert_called_once_with(url="https://example.com", timeout=30)
 
-    @patch("httpx.Client")
+    @patch("feishu_webhook_bot.tasks.executor.get_http_pool")
     def test_http_request_action(self, mock_client_class, task_executor):
         """Test http_request action execution."""
         mock_response = MagicMock()
@@ -460,9 +460,7 @@ class TestTaskActions:
 
         mock_client = MagicMock()
         mock_client.request.return_value = mock_response
-        mock_client.__enter__.return_value = mock_client
-        mock_client.__exit__.return_value = False
-        mock_client_class.return_value = mock_client
+        mock_client_class.return_value.sync_client.return_value = mock_client
 
         task = TaskDefinitionConfig(
             name="test_task",
@@ -764,7 +762,7 @@ class TestExecutionEdgeCases:
         assert result["success"] is False
         assert "request configuration required" in result["error"]
 
-    @patch("httpx.Client")
+    @patch("feishu_webhook_bot.tasks.executor.get_http_pool")
     def test_http_request_saves_text_response(self, mock_client_class, mock_clients):
         mock_response = MagicMock()
         mock_response.status_code = 200
@@ -773,9 +771,7 @@ class TestExecutionEdgeCases:
 
         mock_client = MagicMock()
         mock_client.request.return_value = mock_response
-        mock_client.__enter__.return_value = mock_client
-        mock_client.__exit__.return_value = False
-        mock_client_class.return_value = mock_client
+        mock_client_class.return_value.sync_client.return_value = mock_client
 
         action = TaskActionConfig(
             type="http_request",
@@ -798,7 +794,7 @@ class TestExecutionEdgeCases:
         assert result["success"] is True
         assert executor.context["payload"] == "example"
 
-    @patch("httpx.Client")
+    @patch("feishu_webhook_bot.tasks.executor.get_http_pool")
     def test_http_request_handles_http_errors(self, mock_client_class, mock_clients):
         request = httpx.Request("GET", "https://api.example.com")
         response = httpx.Response(500, request=request)
@@ -806,9 +802,7 @@ class TestExecutionEdgeCases:
 
         mock_client = MagicMock()
         mock_client.request.return_value = MagicMock(raise_for_status=MagicMock(side_effect=error))
-        mock_client.__enter__.return_value = mock_client
-        mock_client.__exit__.return_value = False
-        mock_client_class.return_value = mock_client
+        mock_client_class.return_value.sync_client.return_value = mock_client
 
         action = TaskActionConfig(
             type="http_request",